@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Benchmark the admin project and user listings on a synthetic installation.
+
+Seeds a scratch database with N projects, N owners and M memberships per
+project, then compares, for every page of the admin listings:
+
+1. The previous project listing: ``count`` + ``skip``/``limit`` + one
+   membership ``count`` query per project on the page
+2. ``AdminService.list_projects`` in offset mode (one aggregation per page)
+3. ``AdminService.list_projects`` in keyset mode (cursor)
+4. ``AdminService.list_users`` in offset and keyset mode
+
+The scratch database is dropped afterwards; the configured ``MONGO_DB_NAME``
+database is never touched.
+
+Usage:
+    # From project root with docker compose running (1k projects, 10k memberships):
+    docker compose exec api python scripts/benchmark_admin_listings.py
+
+    python scripts/benchmark_admin_listings.py --projects 5000 --members 20 --page-size 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+SCRATCH_DB_NAME = "qdash_admin_listing_benchmark"
+
+
+def init_scratch_database() -> Any:
+    """Point Bunnet at an empty scratch database and return it."""
+    from bunnet import init_bunnet
+
+    from qdash.api.db.session import get_mongo_client
+    from qdash.dbmodel.document_models import document_models
+
+    client = get_mongo_client()
+    client.drop_database(SCRATCH_DB_NAME)
+    database = client[SCRATCH_DB_NAME]
+    init_bunnet(database=database, document_models=document_models())
+    return database
+
+
+def seed(n_projects: int, members_per_project: int) -> None:
+    """Insert owners, projects and memberships in bulk."""
+    from qdash.common.utils.datetime import now
+    from qdash.dbmodel.project import ProjectDocument
+    from qdash.dbmodel.project_membership import ProjectMembershipDocument
+    from qdash.dbmodel.user import UserDocument
+
+    timestamp = now()
+    users, projects, memberships = [], [], []
+    for i in range(n_projects):
+        users.append(
+            {
+                "user_id": f"uid-{i:06d}",
+                "username": f"user{i:06d}",
+                "hashed_password": "x",
+                "access_token": f"token-{i:06d}",
+                "disabled": False,
+                "system_role": "user",
+                "default_project_id": None,
+                "must_change_password": False,
+            }
+        )
+        projects.append(
+            {
+                "project_id": f"proj-{i:06d}",
+                "name": f"Project {i}",
+                "owner_user_id": f"uid-{i:06d}",
+                "owner_username": f"user{i:06d}",
+                "system_info": {"created_at": timestamp, "updated_at": timestamp},
+            }
+        )
+        for j in range(members_per_project):
+            k = (i + j) % n_projects
+            memberships.append(
+                {
+                    "project_id": f"proj-{i:06d}",
+                    "user_id": f"uid-{k:06d}",
+                    "username": f"user{k:06d}",
+                    "role": "viewer",
+                    "status": "active",
+                }
+            )
+    UserDocument.get_motor_collection().insert_many(users)
+    ProjectDocument.get_motor_collection().insert_many(projects)
+    ProjectMembershipDocument.get_motor_collection().insert_many(memberships)
+
+
+def legacy_list_projects(skip: int, limit: int) -> list[int]:
+    """The listing before aggregation: one membership count per project."""
+    from qdash.dbmodel.project import ProjectDocument
+    from qdash.dbmodel.project_membership import ProjectMembershipDocument
+
+    ProjectDocument.find_all().count()
+    projects = list(ProjectDocument.find_all().skip(skip).limit(limit).run())
+    return [
+        ProjectMembershipDocument.find({"project_id": p.project_id}).count() for p in projects
+    ]
+
+
+def walk_offset(list_page: Callable[[int], list[Any]], total: int, page_size: int) -> None:
+    for skip in range(0, total, page_size):
+        list_page(skip)
+
+
+def walk_keyset(list_page: Callable[[str], str | None]) -> None:
+    cursor: str | None = ""
+    while cursor is not None:
+        cursor = list_page(cursor)
+
+
+def measure(name: str, func: Callable[[], None], iterations: int, pages: int) -> None:
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(durations)
+    print(f"{name:<36} {median:>10.1f} {median / pages:>12.2f}")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark admin listing queries")
+    parser.add_argument("--projects", type=int, default=1000, help="Number of projects/owners")
+    parser.add_argument("--members", type=int, default=10, help="Memberships per project")
+    parser.add_argument("--page-size", type=int, default=100, help="Listing page size")
+    parser.add_argument("--iterations", type=int, default=3, help="Runs per strategy")
+    args = parser.parse_args()
+
+    from qdash.api.services.admin_service import AdminService
+
+    database = init_scratch_database()
+    try:
+        print(
+            f"Seeding {args.projects} projects, {args.projects * args.members} memberships..."
+        )
+        seed(args.projects, args.members)
+        service = AdminService()
+        size = args.page_size
+        pages = -(-args.projects // size)
+
+        # Both strategies must agree before their timings mean anything.
+        legacy = [c for s in range(0, args.projects, size) for c in legacy_list_projects(s, size)]
+        current = [
+            p.member_count
+            for s in range(0, args.projects, size)
+            for p in service.list_projects(skip=s, limit=size).projects
+        ]
+        assert legacy == current, "member counts differ between strategies"
+
+        print(f"\nFull walk, {pages} pages of {size}:")
+        print(f"{'Strategy':<36} {'Total (ms)':>10} {'Per page (ms)':>12}")
+        print("-" * 62)
+        measure(
+            "projects: per-project counts",
+            lambda: walk_offset(lambda s: legacy_list_projects(s, size), args.projects, size),
+            args.iterations,
+            pages,
+        )
+        measure(
+            "projects: aggregation, offset",
+            lambda: walk_offset(
+                lambda s: service.list_projects(skip=s, limit=size).projects, args.projects, size
+            ),
+            args.iterations,
+            pages,
+        )
+        measure(
+            "projects: aggregation, keyset",
+            lambda: walk_keyset(lambda c: service.list_projects(limit=size, cursor=c).next_cursor),
+            args.iterations,
+            pages,
+        )
+        measure(
+            "users: aggregation, offset",
+            lambda: walk_offset(
+                lambda s: service.list_users(skip=s, limit=size).users, args.projects, size
+            ),
+            args.iterations,
+            pages,
+        )
+        measure(
+            "users: aggregation, keyset",
+            lambda: walk_keyset(lambda c: service.list_users(limit=size, cursor=c).next_cursor),
+            args.iterations,
+            pages,
+        )
+    finally:
+        database.client.drop_database(SCRATCH_DB_NAME)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Benchmark JSON serialization and response compression for large API payloads.
+
+Builds synthetic payloads shaped like the largest API responses and
+reports, per payload:
+
+1. Serialization time of each strategy
+   - ``jsonable_encoder`` + ``json.dumps`` (Starlette ``JSONResponse``)
+   - ``jsonable_encoder`` + orjson (a custom default ``ORJSONResponse`` class)
+   - pydantic-core ``dump_json`` (FastAPI's path for typed routes)
+   - ``dumps_json`` (the ETag response cache / hand-built responses)
+2. Bytes on the wire and compression time for identity, gzip and brotli
+   (brotli only if the ``brotli`` package is installed)
+
+Payloads:
+- chip qubit list (``GET /chips/{chip_id}/qubits``)
+- execution detail (``GET /executions/{execution_id}``)
+- timeseries, rows vs ``format=columnar`` (``GET /task-results/timeseries``)
+
+Usage:
+    python scripts/benchmark_api_serialization.py
+    python scripts/benchmark_api_serialization.py --qubits 144 --metrics 40 --tasks 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from qdash.api.lib.columnar import ColumnarSeries
+from qdash.api.lib.json_response import dumps_json
+from qdash.api.middleware.compression import BROTLI_QUALITY, GZIP_LEVEL
+from qdash.api.schemas.chip import ListQubitsResponse, QubitResponse
+from qdash.api.schemas.execution import ExecutionResponseDetail, Task
+from qdash.api.schemas.task_result import TimeSeriesData
+from qdash.datamodel.task import ParameterModel
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _parameter(i: int, j: int) -> dict[str, Any]:
+    return {
+        "value": 1.2345 * (i + 1) * (j + 1),
+        "error": 0.01 * j,
+        "unit": "us",
+        "description": f"metric {j}",
+        "calibrated_at": (T0 + timedelta(minutes=i)).isoformat(),
+        "execution_id": f"20260101-{i:03d}",
+        "task_id": f"{i:08d}-0000-0000-0000-{j:012d}",
+    }
+
+
+def build_qubit_list(qubits: int, metrics: int) -> ListQubitsResponse:
+    """Chip qubit list with ``metrics`` calibrated parameters per qubit."""
+    return ListQubitsResponse(
+        qubits=[
+            QubitResponse(
+                qid=str(i),
+                chip_id="64Qv3",
+                status="calibrated",
+                data={f"metric_{j}": _parameter(i, j) for j in range(metrics)},
+            )
+            for i in range(qubits)
+        ],
+        total=qubits,
+        limit=qubits,
+        offset=0,
+    )
+
+
+def build_execution_detail(tasks: int) -> ExecutionResponseDetail:
+    """Execution detail with ``tasks`` task rows including parameters."""
+    return ExecutionResponseDetail(
+        name="full-calibration",
+        status="completed",
+        start_at=T0,
+        end_at=T0 + timedelta(hours=3),
+        elapsed_time=timedelta(hours=3),
+        task=[
+            Task(
+                task_id=f"task-{i}",
+                qid=str(i % 144),
+                name=f"Check{i % 12}",
+                status="completed",
+                input_parameters={"shots": 1024, "interval": 150.0},
+                output_parameters={f"p{j}": _parameter(i, j) for j in range(4)},
+                output_parameter_names=[f"p{j}" for j in range(4)],
+                figure_path=[f"/app/calib_data/task/{i}/fig_{j}.png" for j in range(2)],
+                start_at=T0 + timedelta(seconds=i),
+                end_at=T0 + timedelta(seconds=i + 5),
+                elapsed_time=timedelta(seconds=5),
+                task_type="qubit",
+            )
+            for i in range(tasks)
+        ],
+        note={},
+        chip_id="64Qv3",
+    )
+
+
+def build_timeseries(qubits: int, points: int) -> tuple[TimeSeriesData, dict[str, Any]]:
+    """Timeseries of one parameter as rows and as the columnar representation."""
+    rows: dict[str, list[ParameterModel]] = {}
+    columnar = ColumnarSeries()
+    for q in range(qubits):
+        qid = str(q)
+        rows[qid] = []
+        for i in range(points):
+            param = _parameter(i, q)
+            rows[qid].append(ParameterModel(**param))
+            columnar.add(
+                qid,
+                T0 + timedelta(minutes=i),
+                param["value"],
+                param["error"],
+                param["task_id"],
+            )
+            columnar.set_meta(qid, unit="us", description=param["description"])
+    return TimeSeriesData(data=rows), {"data": columnar.series}
+
+
+def _time_ms(func: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    result = func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def benchmark_payload(name: str, content: Any, repeat: int) -> None:
+    """Print serialization and compression results for one payload."""
+    print(f"\n{name}")
+    print("-" * 72)
+
+    strategies: list[tuple[str, Callable[[], bytes]]] = [
+        (
+            "jsonable_encoder + json.dumps",
+            lambda: json.dumps(
+                jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+            ).encode(),
+        ),
+        ("jsonable_encoder + orjson", lambda: orjson.dumps(jsonable_encoder(content))),
+        ("dumps_json", lambda: dumps_json(content)),
+    ]
+    if hasattr(content, "model_dump_json"):
+        strategies.insert(2, ("pydantic dump_json", lambda: content.model_dump_json().encode()))
+
+    body = b""
+    for label, func in strategies:
+        elapsed, body = _time_ms(func, repeat)
+        print(f"  {label:<34} {elapsed:>9.2f} ms")
+
+    encoders: list[tuple[str, Callable[[], bytes]]] = [
+        ("identity", lambda: body),
+        (f"gzip (level {GZIP_LEVEL})", lambda: _gzip(body, GZIP_LEVEL)),
+        ("gzip (level 1)", lambda: _gzip(body, 1)),
+    ]
+    if brotli is not None:
+        encoders.append(
+            (
+                f"brotli (quality {BROTLI_QUALITY})",
+                lambda: brotli.compress(body, quality=BROTLI_QUALITY),
+            )
+        )
+    for label, func in encoders:
+        elapsed, encoded = _time_ms(func, repeat)
+        ratio = len(body) / max(len(encoded), 1)
+        print(f"  {label:<34} {elapsed:>9.2f} ms  {len(encoded) / 1024:>10.1f} KB  x{ratio:.1f}")
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark API serialization and compression")
+    parser.add_argument("--qubits", type=int, default=144, help="Qubits in the chip payloads")
+    parser.add_argument("--metrics", type=int, default=40, help="Metrics per qubit")
+    parser.add_argument("--tasks", type=int, default=2000, help="Tasks in the execution detail")
+    parser.add_argument("--points", type=int, default=200, help="Timeseries points per qubit")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("API SERIALIZATION / COMPRESSION BENCHMARK")
+    print("=" * 72)
+    if brotli is None:
+        print("brotli is not installed; only gzip is measured")
+
+    benchmark_payload(
+        f"Chip qubit list ({args.qubits} qubits x {args.metrics} metrics)",
+        build_qubit_list(args.qubits, args.metrics),
+        args.repeat,
+    )
+    benchmark_payload(
+        f"Execution detail ({args.tasks} tasks)",
+        build_execution_detail(args.tasks),
+        args.repeat,
+    )
+    rows, columnar = build_timeseries(args.qubits, args.points)
+    benchmark_payload(
+        f"Timeseries rows ({args.qubits} qubits x {args.points} points)", rows, args.repeat
+    )
+    benchmark_payload(
+        f"Timeseries columnar ({args.qubits} qubits x {args.points} points)",
+        columnar,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ for chip data retrieval, comparing:
 2. Projection-based retrieval (summary only)
 3. Individual QubitDocument retrieval
 4. Aggregation Pipeline for metrics
+5. Page-N latency of offset (skip/limit) vs keyset (cursor) pagination
 
 Usage:
     # From project root with docker compose running:
@@ -14,6 +15,9 @@ Usage:
 
     # Or directly if running locally:
     python scripts/benchmark_chip_queries.py --chip-id <chip_id> --project-id <project_id>
+
+    # Page-N latency for qubits, couplings and executions (10 items per page):
+    python scripts/benchmark_chip_queries.py --page-size 10 --pages 1,5,20
 """
 
 import argparse
@@ -273,6 +277,89 @@ def benchmark_single_qubit(project_id: str, chip_id: str, qid: str = "0") -> Ben
     )
 
 
+def _cursor_for_page(list_page: Any, page: int) -> str | None:
+    """Walk keyset pages (untimed) and return the cursor that fetches ``page`` (1-based)."""
+    cursor: str | None = ""
+    for _ in range(page - 1):
+        cursor = list_page(cursor).next_cursor
+        if cursor is None:
+            return None
+    return cursor
+
+
+def benchmark_page_latency(
+    project_id: str, chip_id: str, page_size: int, pages: list[int], iterations: int
+) -> list[BenchmarkResult]:
+    """Benchmark: fetch page N with offset pagination vs keyset pagination.
+
+    Offset pages make MongoDB skip ``(N - 1) * page_size`` documents; keyset
+    pages seek straight to the cursor, so their latency stays flat with N.
+    """
+    from qdash.repository.chip import MongoChipRepository
+    from qdash.repository.execution_history import MongoExecutionHistoryRepository
+
+    chip_repo = MongoChipRepository()
+    execution_repo = MongoExecutionHistoryRepository()
+
+    def qubits(offset: int = 0, cursor: str | None = None) -> Any:
+        return chip_repo.list_qubits(
+            project_id, chip_id, limit=page_size, offset=offset, cursor=cursor, estimated_total=True
+        )
+
+    def couplings(offset: int = 0, cursor: str | None = None) -> Any:
+        return chip_repo.list_couplings(
+            project_id, chip_id, limit=page_size, offset=offset, cursor=cursor, estimated_total=True
+        )
+
+    def executions(offset: int = 0, cursor: str | None = None) -> Any:
+        return execution_repo.list_by_chip(
+            project_id=project_id, chip_id=chip_id, skip=offset, limit=page_size, cursor=cursor
+        )
+
+    results = []
+    listings = (("qubits", qubits), ("couplings", couplings), ("executions", executions))
+    for name, list_page in listings:
+        for page in pages:
+            cursor = _cursor_for_page(lambda c, lp=list_page: lp(cursor=c), page)
+            if cursor is None:
+                continue
+            offset = (page - 1) * page_size
+            modes = [
+                ("offset", lambda lp=list_page, o=offset: lp(offset=o)),
+                ("keyset", lambda lp=list_page, c=cursor: lp(cursor=c)),
+            ]
+            for mode, fetch in modes:
+                fetch()  # warm-up
+                durations = []
+                for _ in range(iterations):
+                    result, duration = measure_time(fetch)
+                    durations.append(duration)
+                results.append(
+                    BenchmarkResult(
+                        name=f"{name} page {page} ({mode})",
+                        duration_ms=sum(durations) / len(durations),
+                        document_count=len(result.items),
+                        data_size_kb=get_data_size(result.items),
+                        notes=f"offset={offset}" if mode == "offset" else "cursor",
+                    )
+                )
+    return results
+
+
+def print_page_latency(results: list[BenchmarkResult]) -> None:
+    """Print page-N latency results."""
+    print("\n" + "=" * 80)
+    print("PAGE-N LATENCY (offset vs keyset)")
+    print("=" * 80)
+    print(f"{'Query':<35} {'Time (ms)':<12} {'Docs':<8} {'Size (KB)':<12} {'Notes'}")
+    print("-" * 80)
+    for result in results:
+        print(
+            f"{result.name:<35} {result.duration_ms:<12.2f} {result.document_count:<8} "
+            f"{result.data_size_kb:<12.1f} {result.notes}"
+        )
+
+
 def run_benchmarks(project_id: str, chip_id: str, iterations: int = 5) -> list[BenchmarkResult]:
     """Run all benchmarks multiple times and return average results."""
     benchmarks = [
@@ -369,6 +456,14 @@ def main() -> None:
     parser.add_argument("--project-id", help="Project ID to filter chips")
     parser.add_argument("--iterations", type=int, default=5, help="Number of benchmark iterations")
     parser.add_argument("--list", action="store_true", help="List available chips and exit")
+    parser.add_argument(
+        "--page-size", type=int, default=10, help="Page size for the page-N latency benchmark"
+    )
+    parser.add_argument(
+        "--pages",
+        default="1,5,20",
+        help="Comma-separated page numbers for the page-N latency benchmark (empty to skip)",
+    )
     args = parser.parse_args()
 
     print("Initializing database connection...")
@@ -415,6 +510,18 @@ def main() -> None:
     # Print results
     print_results(results, chip_info)
 
+    pages = [int(p) for p in args.pages.split(",") if p.strip()]
+    if pages:
+        print_page_latency(
+            benchmark_page_latency(
+                project_id=chip_info["project_id"],
+                chip_id=chip_info["chip_id"],
+                page_size=args.page_size,
+                pages=pages,
+                iterations=args.iterations,
+            )
+        )
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark scheduler construction with the compiled wiring/topology index.
+
+Flows create a ``OneQubitScheduler`` or ``CRScheduler`` per stage and per
+parallel call. Each one needs the chip wiring (and, for CR scheduling, the
+topology). This script writes a synthetic wiring.yaml for a square-lattice
+chip (4 qubits per MUX), then times the creation and first schedule of a
+scheduler:
+
+1. Cold - the wiring index is dropped before every scheduler, so each one
+   parses wiring.yaml and builds its maps (previous behaviour; the topology
+   index stays cached, as the parsed topology was already cached before)
+2. Shared - every scheduler reuses the compiled indexes
+
+CR scheduling uses the built-in ``square-lattice-mux-<N>`` topology and an
+in-memory chip repository, so no database is needed.
+
+Usage:
+    python scripts/benchmark_scheduler_construction.py
+    python scripts/benchmark_scheduler_construction.py --qubits 144 --schedulers 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import yaml
+
+from qdash.workflow.engine.scheduler import topology_index
+from qdash.workflow.engine.scheduler.cr_scheduler import CRScheduler
+from qdash.workflow.engine.scheduler.one_qubit_scheduler import OneQubitScheduler
+from qdash.workflow.engine.scheduler.topology_index import clear_index_cache, get_topology_index
+
+CHIP_ID = "bench"
+
+
+class InMemoryChipRepository:
+    """Chip repository serving a fixed chip, its qubits and its couplings."""
+
+    def __init__(self, topology_id: str, coupling_ids: list[str]) -> None:
+        self.chip = SimpleNamespace(project_id="bench", topology_id=topology_id)
+        self.coupling_ids = coupling_ids
+
+    def get_current_chip(self, username: str) -> Any:
+        return self.chip
+
+    def get_all_qubit_models(self, project_id: str, chip_id: str) -> dict[str, Any]:
+        return {}
+
+    def get_coupling_ids(self, project_id: str, chip_id: str) -> list[str]:
+        return self.coupling_ids
+
+
+def write_wiring(path: Path, num_qubits: int) -> None:
+    """Write a wiring.yaml with alternating Box A / Box B control modules."""
+    muxes = []
+    for mux in range(num_qubits // 4):
+        box = "A" if mux % 3 else "B"
+        ctrl_module = f"C{mux // 2}{box}"
+        read_module = f"R{mux // 2}A"
+        muxes.append(
+            {
+                "mux": mux,
+                "ctrl": [f"{ctrl_module}-{(mux % 2) * 4 + i}" for i in range(4)],
+                "read_out": f"{read_module}-{(mux % 2) * 2}",
+                "read_in": f"{read_module}-{(mux % 2) * 2 + 1}",
+                "pump": f"{read_module}-{4 + mux % 2}",
+            }
+        )
+    path.write_text(yaml.dump({CHIP_ID: muxes}))
+
+
+def _time(run: Callable[[], Any], count: int, cold: bool) -> list[float]:
+    samples = []
+    for _ in range(count):
+        if cold:
+            topology_index._wiring_cache.clear()
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--qubits", type=int, default=144, help="Number of qubits (16/64/144/256)")
+    parser.add_argument("--schedulers", type=int, default=100, help="Schedulers per variant")
+    args = parser.parse_args()
+
+    topology_id = f"square-lattice-mux-{args.qubits}"
+    topology = get_topology_index(topology_id).topology
+    couplings = [f"{a}-{b}" for a, b in topology.couplings]
+    couplings += [f"{b}-{a}" for a, b in topology.couplings]
+    repo: Any = InMemoryChipRepository(topology_id, couplings)
+    qids = [str(i) for i in range(args.qubits)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        wiring_path = Path(tmp) / "wiring.yaml"
+        write_wiring(wiring_path, args.qubits)
+
+        def one_qubit() -> Any:
+            scheduler = OneQubitScheduler(chip_id=CHIP_ID, wiring_config_path=wiring_path)
+            return scheduler.generate(qids=qids)
+
+        def cross_resonance() -> Any:
+            scheduler = CRScheduler(
+                "bench", CHIP_ID, wiring_config_path=wiring_path, chip_repo=repo
+            )
+            return scheduler.generate(max_parallel_ops=10)
+
+        print(f"{args.qubits} qubits, {len(couplings)} coupling IDs, {args.schedulers} schedulers")
+        header = f"{'scheduler':<18} {'cold mean':>10} {'shared mean':>12} {'speedup':>8}"
+        print(header)
+        print("-" * len(header))
+        for name, run in (("OneQubitScheduler", one_qubit), ("CRScheduler", cross_resonance)):
+            cold = statistics.mean(_time(run, args.schedulers, cold=True))
+            clear_index_cache()
+            shared = statistics.mean(_time(run, args.schedulers, cold=False))
+            print(
+                f"{name:<18} {cold * 1000:>8.2f}ms {shared * 1000:>10.2f}ms {cold / shared:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
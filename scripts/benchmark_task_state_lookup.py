@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Benchmark task lookup in the task state manager.
+
+Replays the state manager calls of a full calibration workflow (1-qubit
+tasks on every qubit, 2-qubit tasks on every coupling of a square lattice)
+and times the replay and a pass of ``get_task`` over every recorded task
+with:
+
+1. Linear scan - the lookup functions without a ``TaskIndex`` (previous
+   behaviour: every call scans the qubit's task list)
+2. Indexed - ``TaskStateManager`` with its private ``TaskIndex``
+
+Each task goes through the executor's call sequence: ``start_task``,
+``put_input_parameters``, ``put_run_parameters``, ``put_output_parameters``,
+``update_task_status_to_completed``, ``end_task`` and
+``this_task_is_completed``. ``--stages`` repeats the workflow under
+stage-qualified task names, so each qubit accumulates
+``stages * len(FULL_1Q_TASKS)`` tasks. The replay also includes the
+parameter copies and model validation of every call, so its speedup is
+smaller than the lookup-only one. Runs alternate between the variants and
+the best of ``--repeat`` runs is reported.
+
+Usage:
+    python scripts/benchmark_task_state_lookup.py
+    python scripts/benchmark_task_state_lookup.py --qubits 144 --stages 8 --repeat 6
+"""
+
+import argparse
+import gc
+import math
+import os
+import sys
+import time
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from qdash.datamodel.task import BaseTaskResultModel, ParameterModel
+from qdash.workflow.engine.task.state_manager import lookup
+from qdash.workflow.engine.task.state_manager.manager import TaskStateManager
+from qdash.workflow.service.tasks import FULL_1Q_TASKS, FULL_2Q_TASKS
+
+
+class LinearTaskStateManager(TaskStateManager):
+    """Task state manager that scans task lists instead of using the index."""
+
+    def _find_task(self, task_name: str, task_type: str, qid: str) -> BaseTaskResultModel | None:
+        return lookup.find_task(self.task_result, task_name, task_type, qid)
+
+    def _add_task(self, task: BaseTaskResultModel, task_type: str, qid: str) -> None:
+        lookup.add_task(self.task_result, task, task_type, qid)
+
+    def _ensure_task_exists(self, task_name: str, task_type: str, qid: str) -> BaseTaskResultModel:
+        return lookup.ensure_task_exists(
+            self.task_result, task_name, task_type, qid, self._upstream_task_id
+        )
+
+    def get_task(self, task_name: str, task_type: str, qid: str) -> BaseTaskResultModel:
+        return lookup.get_task(self.task_result, task_name, task_type, qid)
+
+
+def _couplings(qids: list[str]) -> list[str]:
+    """Nearest-neighbour couplings of a square lattice over ``qids``."""
+    width = max(1, math.isqrt(len(qids)))
+    couplings = []
+    for i in range(len(qids)):
+        if (i + 1) % width and i + 1 < len(qids):
+            couplings.append(f"{qids[i]}-{qids[i + 1]}")
+        if i + width < len(qids):
+            couplings.append(f"{qids[i]}-{qids[i + width]}")
+    return couplings
+
+
+def _workload(qubits: int, stages: int) -> list[tuple[str, str, str]]:
+    """Return (task_name, task_type, qid) in execution order."""
+    qids = [str(i) for i in range(qubits)]
+    couplings = _couplings(qids)
+    work = []
+    for stage in range(stages):
+        suffix = f"_stage{stage}" if stage else ""
+        for task_name in FULL_1Q_TASKS:
+            work.extend((task_name + suffix, "qubit", qid) for qid in qids)
+        for task_name in FULL_2Q_TASKS:
+            work.extend((task_name + suffix, "coupling", cid) for cid in couplings)
+    return work
+
+
+def _replay(manager: TaskStateManager, work: list[tuple[str, str, str]]) -> int:
+    output: dict[str, Any] = {"value": ParameterModel(value=1.0, unit="GHz")}
+    completed = 0
+    for task_name, task_type, qid in work:
+        manager.start_task(task_name, task_type, qid)
+        manager.put_input_parameters(task_name, {"shots": 1024}, task_type, qid)
+        manager.put_run_parameters(task_name, {"interval": 150}, task_type, qid)
+        manager.put_output_parameters(task_name, output, task_type, qid)
+        manager.update_task_status_to_completed(task_name, "done", task_type, qid)
+        manager.end_task(task_name, task_type, qid)
+        completed += manager.this_task_is_completed(task_name, task_type, qid)
+    return completed
+
+
+def _run(
+    cls: type[TaskStateManager], qids: list[str], work: list[tuple[str, str, str]]
+) -> tuple[float, float, int]:
+    """Return the replay time, lookup time and completed task count of one run."""
+    gc.collect()
+    manager = cls(qids=qids)
+    start = time.perf_counter()
+    completed = _replay(manager, work)
+    replay = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task_name, task_type, qid in work:
+        manager.get_task(task_name, task_type, qid)
+    return replay, time.perf_counter() - start, completed
+
+
+def _bench(
+    qids: list[str], work: list[tuple[str, str, str]], repeat: int
+) -> dict[type[TaskStateManager], tuple[float, float]]:
+    """Return the best replay and lookup times of each variant.
+
+    Runs alternate between the variants, so neither always runs on a heap
+    the other has grown.
+    """
+    variants: list[type[TaskStateManager]] = [LinearTaskStateManager, TaskStateManager]
+    best = dict.fromkeys(variants, (math.inf, math.inf))
+    for run in range(repeat):
+        for cls in variants if run % 2 == 0 else variants[::-1]:
+            replay, lookup_time, completed = _run(cls, qids, work)
+            assert completed == len(work)
+            best[cls] = (min(best[cls][0], replay), min(best[cls][1], lookup_time))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--qubits", type=int, default=144, help="Number of qubits")
+    parser.add_argument("--stages", type=int, default=4, help="Workflow repetitions")
+    parser.add_argument("--repeat", type=int, default=4, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    qids = [str(i) for i in range(args.qubits)]
+    header = f"{'stages':>6} {'tasks':>7} {'tasks/qubit':>11}"
+    for label in ("replay", "lookup"):
+        header += f" {label + ' linear':>14} {label + ' indexed':>15} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for stages in sorted({1, args.stages}):
+        work = _workload(args.qubits, stages)
+        best = _bench(qids, work, args.repeat)
+        row = f"{stages:>6} {len(work):>7} {stages * len(FULL_1Q_TASKS):>11}"
+        for slow, fast in zip(best[LinearTaskStateManager], best[TaskStateManager], strict=True):
+            row += f" {slow * 1000:>12.1f}ms {fast * 1000:>13.1f}ms {slow / fast:>7.1f}x"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
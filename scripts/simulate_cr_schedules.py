@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Compare CR schedules by predicted and simulated makespan.
+
+Builds the CR pair list from a topology definition, then schedules it with:
+
+1. Greedy graph colouring (``MuxConflictScheduler``) for several strategies
+2. The default intra-then-inter MUX split around greedy colouring
+3. ``MakespanScheduler`` (LPT + local search on predicted durations)
+4. The intra-then-inter MUX split around ``MakespanScheduler``
+
+Each schedule is scored by its predicted makespan (sum of the slowest
+predicted pair per group) and by a Monte Carlo simulation in which every
+pair's actual duration is its prediction times log-normal noise.
+
+Durations come from ``task_result_history`` when ``--project`` and ``--chip``
+are given (read-only), otherwise from a synthetic distribution in which a
+fraction of pairs is several times slower than the rest.
+
+Usage:
+    # Synthetic durations on the 64-qubit square lattice:
+    python scripts/simulate_cr_schedules.py
+
+    # Recorded durations for a chip (docker compose running):
+    docker compose exec api python scripts/simulate_cr_schedules.py \\
+        --project proj-1 --chip 64Qv3 --topology square-lattice-mux-64
+
+    python scripts/simulate_cr_schedules.py --topology square-lattice-mux-144 --max-ops 12
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+def build_wiring(num_muxes: int, muxes_per_module: int) -> list[dict[str, Any]]:
+    """Synthesize a wiring list where neighbouring MUXes share modules."""
+    return [
+        {
+            "mux": mux,
+            "read_out": f"R{mux // muxes_per_module}-0",
+            "ctrl": [f"C{mux // muxes_per_module}-{i}" for i in range(4)],
+        }
+        for mux in range(num_muxes)
+    ]
+
+
+def synthetic_durations(
+    pairs: list[str], rng: random.Random, slow_fraction: float, slow_factor: float
+) -> dict[str, float]:
+    """Draw per-pair durations with a slow tail (e.g. many CR amplitude iterations)."""
+    durations = {}
+    for pair in pairs:
+        seconds = rng.lognormvariate(4.0, 0.25)
+        if rng.random() < slow_fraction:
+            seconds *= slow_factor
+        durations[pair] = seconds
+    return durations
+
+
+def simulate(
+    groups: list[list[str]],
+    durations: dict[str, float],
+    trials: int,
+    noise: float,
+    seed: int,
+) -> float:
+    """Return the mean makespan when actual durations are noisy predictions."""
+    rng = random.Random(seed)
+    makespans = []
+    for _ in range(trials):
+        actual = {pair: d * rng.lognormvariate(0.0, noise) for pair, d in durations.items()}
+        makespans.append(sum(max(actual[p] for p in group) for group in groups))
+    return statistics.mean(makespans)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Compare CR schedules by makespan")
+    parser.add_argument("--topology", default="square-lattice-mux-64", help="Topology ID")
+    parser.add_argument("--project", help="Project ID to read recorded durations from")
+    parser.add_argument("--chip", help="Chip ID to read recorded durations from")
+    parser.add_argument("--tasks", nargs="+", help="CR task names (default: CR/ZX90 sequence)")
+    parser.add_argument("--max-ops", type=int, default=10, help="Max parallel pairs per group")
+    parser.add_argument("--muxes-per-module", type=int, default=4, help="Synthetic wiring")
+    parser.add_argument("--slow-fraction", type=float, default=0.2, help="Synthetic slow pairs")
+    parser.add_argument("--slow-factor", type=float, default=4.0, help="Synthetic slowdown")
+    parser.add_argument("--noise", type=float, default=0.15, help="Log-normal sigma of noise")
+    parser.add_argument("--trials", type=int, default=200, help="Monte Carlo trials")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    from qdash.common.config.topology import load_topology
+    from qdash.workflow.engine.scheduler.cr_utils import (
+        build_mux_conflict_map,
+        build_qubit_to_mux_map,
+        predict_makespan,
+    )
+    from qdash.workflow.engine.scheduler.plugins import (
+        IntraThenInterMuxScheduler,
+        MakespanScheduler,
+        MuxConflictScheduler,
+        ScheduleContext,
+        load_cr_pair_durations,
+    )
+
+    topology = load_topology(args.topology)
+    pairs = [f"{control}-{target}" for control, target in topology.couplings]
+    wiring = build_wiring(-(-topology.num_qubits // 4), args.muxes_per_module)
+    context = ScheduleContext(
+        qid_to_mux=build_qubit_to_mux_map(wiring),
+        mux_conflict_map=build_mux_conflict_map(wiring),
+    )
+
+    if args.project and args.chip:
+        from qdash.api.db.session import init_db
+
+        init_db()
+        durations = load_cr_pair_durations(args.project, args.chip, args.tasks)
+        source = f"recorded ({len(durations)} couplings with history)"
+    else:
+        durations = synthetic_durations(
+            pairs, random.Random(args.seed), args.slow_fraction, args.slow_factor
+        )
+        source = f"synthetic (slow fraction {args.slow_fraction}, x{args.slow_factor})"
+
+    makespan = MakespanScheduler(durations, max_parallel_ops=args.max_ops)
+    pair_durations = {pair: makespan.predicted_duration(pair) for pair in pairs}
+    strategies: list[tuple[str, Any]] = [
+        (f"greedy {name}", MuxConflictScheduler(args.max_ops, name))
+        for name in ("largest_first", "smallest_last", "saturation_largest_first")
+    ]
+    strategies += [
+        (
+            "intra/inter + greedy (default)",
+            IntraThenInterMuxScheduler(MuxConflictScheduler(args.max_ops, "largest_first")),
+        ),
+        ("makespan", makespan),
+        (
+            "intra/inter + makespan",
+            IntraThenInterMuxScheduler(MakespanScheduler(durations, max_parallel_ops=args.max_ops)),
+        ),
+    ]
+
+    print(f"Topology {args.topology}: {len(pairs)} pairs, durations {source}")
+    print(f"Noise sigma {args.noise}, {args.trials} trials, max {args.max_ops} pairs/group\n")
+    print(
+        f"{'Strategy':<32} {'Groups':>6} {'Predicted (s)':>14} {'Simulated (s)':>14} "
+        f"{'vs default':>10} {'Plan (ms)':>10}"
+    )
+    print("-" * 92)
+
+    rows = []
+    for name, scheduler in strategies:
+        start = time.perf_counter()
+        groups = scheduler.schedule(pairs, context)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        scheduled = sorted(p for group in groups for p in group)
+        assert scheduled == sorted(pairs), f"{name} dropped or duplicated pairs"
+        predicted = predict_makespan(groups, pair_durations)
+        simulated = simulate(groups, pair_durations, args.trials, args.noise, args.seed)
+        rows.append((name, len(groups), predicted, simulated, elapsed_ms))
+
+    baseline = next(row[3] for row in rows if row[0].endswith("(default)"))
+    for name, num_groups, predicted, simulated, elapsed_ms in rows:
+        change = (simulated - baseline) / baseline * 100
+        print(
+            f"{name:<32} {num_groups:>6} {predicted:>14.1f} {simulated:>14.1f} "
+            f"{change:>+9.1f}% {elapsed_ms:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,82 @@
-"""Entrypoint placeholder for a hosted QDash agent worker container."""
+"""Entrypoint for the hosted QDash agent worker container.
+
+The worker serves the durable job queue: queued AI reviews of calibration
+task results and agent actions enqueued through the agent session API.
+Several worker threads (and several containers) can share one queue; leases
+and per-project concurrency limits are enforced by MongoDB.
+"""
 
 from __future__ import annotations
 
 import logging
-import time
+import os
+import signal
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qdash.common.job_worker import JobHandler
 
 logger = logging.getLogger(__name__)
 
+AGENT_WORKER_THREADS = int(os.getenv("QDASH_AGENT_WORKER_THREADS", "2"))
+
+
+def job_handlers() -> dict[str, JobHandler]:
+    """Return the handlers served by the agent worker, keyed by job kind."""
+    from qdash.api.services.agent_session_service import (
+        AGENT_ACTION_JOB_KIND,
+        run_agent_action_job,
+    )
+    from qdash.workflow.engine.task.ai_review import AI_REVIEW_JOB_KIND, run_ai_review_job
+
+    return {
+        AI_REVIEW_JOB_KIND: run_ai_review_job,
+        AGENT_ACTION_JOB_KIND: run_agent_action_job,
+    }
+
+
+def job_dead_handlers() -> dict[str, JobHandler]:
+    """Return the handlers run when a job gives up, keyed by job kind."""
+    from qdash.workflow.engine.task.ai_review import AI_REVIEW_JOB_KIND, on_ai_review_job_dead
+
+    return {AI_REVIEW_JOB_KIND: on_ai_review_job_dead}
+
 
 def main() -> None:
-    """Keep the worker container alive until a queue adapter is added."""
+    """Run queue worker threads until SIGTERM/SIGINT."""
+    from qdash.common.job_worker import JobWorker, default_worker_id
+    from qdash.dbmodel.initialize import initialize
+    from qdash.repository.job_queue import MongoJobQueueRepository
+
     logging.basicConfig(level=logging.INFO)
-    logger.info("QDash agent worker container is ready.")
-    logger.info("No job queue adapter is configured yet; API local execution remains active.")
-    while True:
-        time.sleep(3600)
+    initialize()
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    handlers = job_handlers()
+    dead_handlers = job_dead_handlers()
+    base_id = default_worker_id()
+    threads = [
+        threading.Thread(
+            target=JobWorker(
+                MongoJobQueueRepository(),
+                handlers,
+                worker_id=f"{base_id}:{index}",
+                dead_handlers=dead_handlers,
+            ).run_forever,
+            args=(stop,),
+            name=f"agent-worker-{index}",
+        )
+        for index in range(max(AGENT_WORKER_THREADS, 1))
+    ]
+    for thread in threads:
+        thread.start()
+    logger.info("QDash agent worker is ready with %d thread(s).", len(threads))
+    for thread in threads:
+        thread.join()
 
 
 if __name__ == "__main__":
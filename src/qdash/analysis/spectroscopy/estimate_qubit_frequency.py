@@ -87,6 +87,14 @@ class F12Result(NamedTuple):
     frequency: float
 
 
+class Region(NamedTuple):
+    """Statistics of one labelled region, computed from its bounding box."""
+
+    slices: tuple[slice, slice]
+    mask: npt.NDArray[np.bool_]
+    moment: float
+
+
 class Peak(NamedTuple):
     """Represents a detected peak region."""
 
@@ -154,32 +162,71 @@ class QubitResponse:
         )
 
         self._validate_input()
+        self._representative_y_cache: dict[int, int] = {}
 
     def compute_representative_y(self, target_label: int) -> int:
-        """Find the y-row that represents the labelled peak (used for repr_db)."""
-        repr_y_min = int(self.zs.shape[0])
+        """Find the y-row that represents the labelled peak (used for repr_db).
 
-        for peak in sorted(self.peaks, key=operator.attrgetter("height"), reverse=True):
-            idx_x = peak.x_start
-            idx_y = self.zs.shape[0] - peak.height
+        The strategy only sees the region's bounding-box mask, so the cost is
+        proportional to the region rather than the whole response. Results are
+        cached per label.
+        """
+        cached = self._representative_y_cache.get(target_label)
+        if cached is not None:
+            return cached
+
+        n_rows = int(self.zs.shape[0])
+        repr_y_min = n_rows
+        region = self.regions.get(target_label)
+
+        if region is not None:
+            y_slice, x_slice = region.slices
+            y0, x0 = int(y_slice.start), int(x_slice.start)
+            for peak in sorted(self.peaks, key=operator.attrgetter("height"), reverse=True):
+                idx_x = peak.x_start
+                idx_y = n_rows - peak.height
+
+                if idx_y > repr_y_min:
+                    break
+
+                label = cast("int", self.zs_labeled[idx_y, idx_x])
+                if label != target_label:
+                    continue
+
+                local_y = self.peak_repr_y_strategy.compute_representative_y(
+                    mask=region.mask,
+                    tip_x=int(idx_x) - x0,
+                    tip_y=int(idx_y) - y0,
+                )
+                repr_y = y0 + local_y if local_y < region.mask.shape[0] else n_rows
+                if repr_y < repr_y_min:
+                    repr_y_min = repr_y
 
-            if idx_y > repr_y_min:
-                break
+        self._representative_y_cache[target_label] = repr_y_min
+        return repr_y_min
 
-            label = cast("int", self.zs_labeled[idx_y, idx_x])
-            if label != target_label:
-                continue
+    @functools.cached_property
+    def regions(self) -> dict[int, Region]:
+        """Per-region masks and moments from a single ``find_objects`` pass.
 
-            mask = self.zs_labeled == label
-            repr_y = self.peak_repr_y_strategy.compute_representative_y(
-                mask=mask,
-                tip_x=int(idx_x),
-                tip_y=int(idx_y),
-            )
-            if repr_y < repr_y_min:
-                repr_y_min = repr_y
+        Each region is reduced over its bounding-box slice only. The pixels
+        are visited in the same row-major order as a full-size mask, so the
+        moments are bit-identical to :meth:`compute_moment`.
+        """
+        objects = scipy.ndimage.find_objects(self.zs_labeled)
 
-        return repr_y_min
+        regions: dict[int, Region] = {}
+        for label, slices in enumerate(objects, start=1):
+            if slices is None:
+                continue
+            mask = self.zs_labeled[slices] == label
+            y_slice, _ = slices
+            indices_y, indices_x = np.nonzero(mask)
+            weights = np.abs(self.zs[slices][indices_y, indices_x])
+            rows = indices_y + y_slice.start
+            moment = float(np.sum(weights * self.levers[rows] * self.y_diffs[rows]))
+            regions[label] = Region(slices=slices, mask=mask, moment=moment)
+        return regions
 
     @functools.cached_property
     def zs_labeled(self) -> npt.NDArray[np.int32]:
@@ -216,7 +263,7 @@ class QubitResponse:
             float(self.ys[repr_y]) if repr_y < self.zs.shape[0] else float(self.config.top_power)
         )
 
-        moment = self.compute_moment(self.zs, self.zs_labeled, self.levers, self.y_diffs, label)
+        moment = self.regions[label].moment
         quality_level_idx = np.searchsorted(self.config.f01_moment_thresholds, moment, side="left")
         return F01Result(
             idx_x=int(idx_x),
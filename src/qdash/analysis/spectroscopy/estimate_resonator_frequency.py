@@ -11,7 +11,7 @@ import functools
 import itertools
 from collections import Counter
 from dataclasses import dataclass, field
-from operator import attrgetter, itemgetter
+from operator import attrgetter
 from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
@@ -234,36 +234,85 @@ class EstimateResonatorFrequencyConfig:
         )
 
 
-def _detect_peaks(
-    trace: Sequence[float],
+def _smooth_rows(rows: np.ndarray, smooth_sigma: float) -> np.ndarray:
+    """Gaussian-smooth every row of a 2D array along the frequency axis."""
+    if not smooth_sigma or smooth_sigma <= 0:
+        return rows
+    radius = int(3 * smooth_sigma)
+    x = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (x / smooth_sigma) ** 2)
+    kernel /= kernel.sum()
+    return np.asarray(convolve1d(rows, kernel, axis=-1, mode="nearest"), dtype=float)
+
+
+def _detect_peaks_rows(
+    rows: Sequence[Sequence[float]],
     *,
     num_resonators: int,
     smooth_sigma: float,
     distance: int,
     prominence: float,
-) -> tuple[list[int], list[float]]:
-    """Find peaks in a 1D trace with smoothing and filtering."""
-    _trace = np.asarray(trace)
-
-    if smooth_sigma and smooth_sigma > 0:
-        radius = int(3 * smooth_sigma)
-        x = np.arange(-radius, radius + 1)
-        kernel = np.exp(-0.5 * (x / smooth_sigma) ** 2)
-        kernel /= kernel.sum()
-        trace_smooth = convolve1d(_trace, kernel, mode="nearest")
-    else:
-        trace_smooth = _trace
+) -> list[tuple[list[int], list[float]]]:
+    """Find the top peaks of every row of a 2D block in a single pass.
+
+    All rows are smoothed with one ``convolve1d`` call and then laid out
+    end-to-end, separated by NaN gaps at least ``distance`` samples wide.
+    NaN never compares greater or less than anything, so each gap behaves
+    exactly like an array border for local-maximum detection, the distance
+    filter and prominence evaluation. One ``find_peaks`` call therefore yields
+    the same peaks and prominences as calling it once per row, and the
+    per-row top-``num_resonators`` selection is done with a lexsort.
+    """
+    _rows = np.asarray(rows)
+    if _rows.ndim != 2 or _rows.shape[0] == 0:
+        return [([], []) for _ in range(len(rows))]
 
-    peaks, props = scipy_find_peaks(trace_smooth, distance=distance, prominence=prominence)
+    n_rows, n_cols = _rows.shape
+    smoothed = _smooth_rows(_rows, smooth_sigma)
 
+    gap = max(int(np.ceil(distance)), 1) if distance else 1
+    stride = n_cols + gap
+    flat = np.full((n_rows, stride), np.nan)
+    flat[:, :n_cols] = smoothed
+    flat = flat.ravel()[: n_rows * stride - gap]
+
+    peaks, props = scipy_find_peaks(flat, distance=distance, prominence=prominence)
+    result: list[tuple[list[int], list[float]]] = [([], []) for _ in range(n_rows)]
     if peaks.size == 0:
-        return [], []
+        return result
 
-    sorted_peaks = sorted(zip(props["prominences"], peaks, strict=False), reverse=True)
-    top_peaks = sorted(sorted_peaks[:num_resonators], key=itemgetter(1))
-    prominences, peaks_indices = zip(*top_peaks, strict=False)
+    row_idx, col_idx = np.divmod(peaks, stride)
+    prominences = props["prominences"]
 
-    return list(peaks_indices), list(prominences)
+    # Per row: highest prominence first, ties broken by the larger index.
+    order = np.lexsort((-col_idx, -prominences, row_idx))
+    sorted_rows = row_idx[order]
+    rank = np.arange(order.size) - np.searchsorted(sorted_rows, sorted_rows, side="left")
+    top = order[rank < num_resonators]
+    top = top[np.lexsort((col_idx[top], row_idx[top]))]
+
+    for r, c, p in zip(row_idx[top], col_idx[top], prominences[top], strict=True):
+        result[int(r)][0].append(int(c))
+        result[int(r)][1].append(float(p))
+    return result
+
+
+def _detect_peaks(
+    trace: Sequence[float],
+    *,
+    num_resonators: int,
+    smooth_sigma: float,
+    distance: int,
+    prominence: float,
+) -> tuple[list[int], list[float]]:
+    """Find peaks in a 1D trace with smoothing and filtering."""
+    return _detect_peaks_rows(
+        [trace],
+        num_resonators=num_resonators,
+        smooth_sigma=smooth_sigma,
+        distance=distance,
+        prominence=prominence,
+    )[0]
 
 
 def _group_peaks(
@@ -376,8 +425,27 @@ def _group_resonances(
 
 
 def _arg_closest(arr: Sequence[float], v: float) -> int:
-    """Find the index of the value closest to v in arr."""
-    return int(np.argmin([abs(x - v) for x in arr]))
+    """Find the index of the value closest to v in arr.
+
+    Power axes are normally strictly monotonic, in which case the lookup is a
+    binary search. Ties resolve to the lower index, matching ``np.argmin``.
+    """
+    _arr = np.asarray(arr, dtype=float)
+    if _arr.size < 2:
+        return 0
+    diff = np.diff(_arr)
+    if np.all(diff > 0):
+        idx = int(np.searchsorted(_arr, v, side="left"))
+    elif np.all(diff < 0):
+        # Descending axis: search the reversed view and map back.
+        idx = _arr.size - int(np.searchsorted(_arr[::-1], v, side="right"))
+    else:
+        return int(np.argmin(np.abs(_arr - v)))
+    if idx <= 0:
+        return 0
+    if idx >= _arr.size:
+        return _arr.size - 1
+    return idx - 1 if abs(_arr[idx - 1] - v) <= abs(_arr[idx] - v) else idx
 
 
 def _detect_high_power_peak_groups(
@@ -395,19 +463,18 @@ def _detect_high_power_peak_groups(
     if y_idx_high_min > y_idx_high_max:
         y_idx_high_min, y_idx_high_max = y_idx_high_max, y_idx_high_min
 
-    high_power_peaks: list[Peak] = []
-    for y_idx in range(y_idx_high_min, y_idx_high_max + 1):
-        peak_xs, prominences = _detect_peaks(
-            trace=zs[y_idx],
-            num_resonators=config.num_resonators * 2,
-            smooth_sigma=config.find_peaks_conf_high.smooth_sigma,
-            distance=config.find_peaks_conf_high.distance,
-            prominence=config.find_peaks_conf_high.prominence,
-        )
-        high_power_peaks.extend(
-            Peak(peak_idx, y_idx, prominence)
-            for peak_idx, prominence in zip(peak_xs, prominences, strict=False)
-        )
+    rows = _detect_peaks_rows(
+        zs[y_idx_high_min : y_idx_high_max + 1],
+        num_resonators=config.num_resonators * 2,
+        smooth_sigma=config.find_peaks_conf_high.smooth_sigma,
+        distance=config.find_peaks_conf_high.distance,
+        prominence=config.find_peaks_conf_high.prominence,
+    )
+    high_power_peaks = [
+        Peak(peak_idx, y_idx, prominence)
+        for y_idx, (peak_xs, prominences) in enumerate(rows, start=y_idx_high_min)
+        for peak_idx, prominence in zip(peak_xs, prominences, strict=False)
+    ]
 
     return _group_peaks(
         high_power_peaks,
@@ -457,15 +524,15 @@ def _detect_complementary_peaks(
     def is_known_peak(x_idx: int, y_idx: int) -> bool:
         return any(x_idx == known_peak.x and y_idx == known_peak.y for known_peak in known_peaks)
 
+    rows = _detect_peaks_rows(
+        zs[y_idx_high_min : y_idx_high_max + 1],
+        num_resonators=config.num_resonators * 2,
+        smooth_sigma=config.find_peaks_conf_low.smooth_sigma,
+        distance=config.find_peaks_conf_low.distance,
+        prominence=config.find_peaks_conf_low.prominence,
+    )
     peaks: dict[int, list[Peak]] = {}
-    for y_idx in range(y_idx_high_min, y_idx_high_max + 1):
-        peak_xs, prominences = _detect_peaks(
-            trace=zs[y_idx],
-            num_resonators=config.num_resonators * 2,
-            smooth_sigma=config.find_peaks_conf_low.smooth_sigma,
-            distance=config.find_peaks_conf_low.distance,
-            prominence=config.find_peaks_conf_low.prominence,
-        )
+    for y_idx, (peak_xs, prominences) in enumerate(rows, start=y_idx_high_min):
         peaks[y_idx] = [
             Peak(peak_idx, y_idx, prominence)
             for peak_idx, prominence in zip(peak_xs, prominences, strict=False)
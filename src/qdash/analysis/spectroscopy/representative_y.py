@@ -71,14 +71,23 @@ class WidthEstimator(ABC):
 
 @dataclass
 class HorizontalRunLengthEstimator(WidthEstimator):
-    """Width estimator based on the horizontal run length through (x, y)."""
+    """Width estimator based on the horizontal run length through (x, y).
+
+    Run lengths are cached per row for the mask currently being walked; the
+    cache is reset whenever a different mask object is passed in.
+    """
 
     _width_cache_by_row: dict[int, npt.NDArray[np.int_]] = field(default_factory=dict, init=False)
+    _cached_mask: npt.NDArray[np.bool_] | None = field(default=None, init=False, repr=False)
 
     def estimate(self, mask: npt.NDArray[np.bool_], x: int, y: int) -> int:
         if not mask[y, x]:
             return 0
 
+        if mask is not self._cached_mask:
+            self._width_cache_by_row.clear()
+            self._cached_mask = mask
+
         row_cache = self._width_cache_by_row.get(y)
         if row_cache is None:
             row_cache = np.full(mask.shape[1], -1, dtype=np.int_)
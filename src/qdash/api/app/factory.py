@@ -7,7 +7,9 @@ from fastapi.routing import APIRoute
 from qdash.api.app.metadata import API_METADATA, OPENAPI_EXTRA
 from qdash.api.app.router_registry import register_routers
 from qdash.api.db.session import lifespan
+from qdash.api.middleware.compression import CompressionMiddleware
 from qdash.api.middleware.request_id import RequestIdMiddleware
+from qdash.api.middleware.server_timing import ServerTimingMiddleware
 from qdash.config import Settings, get_settings, resolve_api_cors_origins
 
 
@@ -36,6 +38,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Innermost first: timings exclude compression; request IDs cover everything.
+    app.add_middleware(ServerTimingMiddleware)
+    app.add_middleware(CompressionMiddleware)
     app.add_middleware(RequestIdMiddleware)
     register_routers(app)
 
@@ -10,6 +10,7 @@ from fastapi import FastAPI
 from pymongo import MongoClient
 from pymongo.database import Database
 
+from qdash.api.lib.request_timing import MongoCommandTimer
 from qdash.dbmodel.document_models import document_models
 
 # Global client and database references
@@ -37,6 +38,7 @@ def get_mongo_client() -> MongoClient[Any]:
             port=mongo_port,
             username=os.getenv("MONGO_INITDB_ROOT_USERNAME"),
             password=os.getenv("MONGO_INITDB_ROOT_PASSWORD"),
+            event_listeners=[MongoCommandTimer()],
         )
     return _client
 
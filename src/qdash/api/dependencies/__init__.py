@@ -27,6 +27,7 @@ from qdash.api.services.cooldown_wiring_event_service import CooldownWiringEvent
 from qdash.api.services.copilot_chat_session_service import CopilotChatSessionService
 from qdash.api.services.cryostat_service import CryostatService
 from qdash.api.services.device_topology_service import DeviceTopologyService
+from qdash.api.services.execution_eta_service import ExecutionEtaService
 from qdash.api.services.execution_service import ExecutionService
 from qdash.api.services.file_service import FileService
 from qdash.api.services.forum_service import ForumService
@@ -61,6 +62,7 @@ from qdash.repository.coupling import MongoCouplingCalibrationRepository
 from qdash.repository.cryostat import MongoCryostatRepository
 from qdash.repository.execution_history import MongoExecutionHistoryRepository
 from qdash.repository.execution_lock import MongoExecutionLockRepository
+from qdash.repository.job_queue import MongoJobQueueRepository
 from qdash.repository.provenance import (
     MongoActivityRepository,
     MongoParameterVersionRepository,
@@ -74,7 +76,7 @@ from qdash.repository.task_definition import MongoTaskDefinitionRepository
 @cached_dependency_provider
 def get_agent_session_service() -> AgentSessionService:
     """Get the agent session service instance."""
-    return AgentSessionService()
+    return AgentSessionService(job_queue=get_job_queue_repository())
 
 
 @cached_dependency_provider
@@ -159,6 +161,19 @@ def get_execution_lock_repository() -> MongoExecutionLockRepository:
     return MongoExecutionLockRepository()
 
 
+@cached_dependency_provider
+def get_job_queue_repository() -> MongoJobQueueRepository:
+    """Get the durable job queue repository instance.
+
+    Returns
+    -------
+    MongoJobQueueRepository
+        The job queue repository
+
+    """
+    return MongoJobQueueRepository()
+
+
 @cached_dependency_provider
 def get_execution_service() -> ExecutionService:
     """Get the execution service instance.
@@ -172,6 +187,23 @@ def get_execution_service() -> ExecutionService:
     return ExecutionService(
         execution_history_repository=get_execution_history_repository(),
         execution_lock_repository=get_execution_lock_repository(),
+        eta_service=get_execution_eta_service(),
+    )
+
+
+@cached_dependency_provider
+def get_execution_eta_service() -> ExecutionEtaService:
+    """Get the execution ETA service instance.
+
+    Returns
+    -------
+    ExecutionEtaService
+        The execution ETA service
+
+    """
+    return ExecutionEtaService(
+        task_result_repository=get_task_result_repository(),
+        execution_history_repository=get_execution_history_repository(),
     )
 
 
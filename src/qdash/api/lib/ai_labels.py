@@ -10,6 +10,7 @@ TOOL_LABELS: dict[str, str] = {
     "get_coupling_params": "Fetching coupling parameters",
     "get_execution_history": "Fetching execution history",
     "compare_qubits": "Comparing qubits",
+    "compare_chips": "Comparing chips",
     "get_chip_topology": "Fetching chip topology",
     "search_task_results": "Searching task results",
     "get_calibration_notes": "Fetching calibration notes",
@@ -0,0 +1,225 @@
+"""Parallel, cached rendering of Plotly figures to static images.
+
+Kaleido is slow to start and renders one figure at a time per process, so
+report generation pre-renders every chart through a pool of warm worker
+processes before any page is drawn. Rendered images are kept in a bounded
+in-process LRU keyed by (chip, chart, figure hash, style), so regenerating a
+report for unchanged data skips Kaleido entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping
+
+    import plotly.graph_objects as go
+
+logger = logging.getLogger(__name__)
+
+CHART_RENDER_WORKERS = int(
+    os.getenv("QDASH_CHART_RENDER_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+CHART_CACHE_MAX_ENTRIES = int(os.getenv("QDASH_CHART_CACHE_MAX_ENTRIES", "512"))
+
+
+@dataclass(frozen=True)
+class ChartStyle:
+    """Output options that change the rendered bytes without changing the figure."""
+
+    format: str = "png"
+    scale: int = 2
+
+
+@dataclass(frozen=True)
+class ChartKey:
+    """Cache key of one rendered chart."""
+
+    chip_id: str
+    chart_id: str
+    data_hash: str
+    style: ChartStyle
+
+
+@dataclass(frozen=True)
+class ChartRequest:
+    """A figure to render, serialized so it can cross a process boundary."""
+
+    key: ChartKey
+    figure_json: str
+
+
+def build_chart_request(
+    chip_id: str,
+    chart_id: str,
+    fig: go.Figure,
+    style: ChartStyle | None = None,
+) -> ChartRequest:
+    """Serialize a figure and derive its cache key from the serialized content."""
+    figure_json = fig.to_json()
+    data_hash = hashlib.sha256(figure_json.encode()).hexdigest()
+    key = ChartKey(
+        chip_id=chip_id, chart_id=chart_id, data_hash=data_hash, style=style or ChartStyle()
+    )
+    return ChartRequest(key=key, figure_json=figure_json)
+
+
+class ChartImageCache:
+    """Thread-safe bounded LRU of rendered chart bytes.
+
+    Keys are usually ``ChartKey``; any hashable key works.
+    """
+
+    def __init__(self, max_entries: int = CHART_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> bytes | None:
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            return image
+
+    def put(self, key: Hashable, image: bytes) -> None:
+        with self._lock:
+            self._entries[key] = image
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def render_figure_json(figure_json: str, style: ChartStyle) -> bytes:
+    """Render a serialized figure with Kaleido."""
+    import plotly.io as pio
+
+    fig = pio.from_json(figure_json)
+    image: bytes = fig.to_image(format=style.format, scale=style.scale)
+    return image
+
+
+def _warm_worker() -> None:
+    """Start Kaleido once per worker so the first real render pays no startup cost."""
+    import plotly.graph_objects as go
+
+    try:
+        go.Figure().to_image(format="png", width=10, height=10)
+    except Exception as e:
+        logger.warning(f"Chart render worker warm-up failed: {e}")
+
+
+class ChartRenderer:
+    """Render batches of charts through a warm process pool with an LRU cache.
+
+    ``max_workers=0`` renders inline in the calling thread, which is what
+    tests and single-process deployments use. A broken pool (e.g. a worker
+    killed by the OOM killer) is discarded and the batch falls back to inline
+    rendering so a report request never fails because of the pool itself.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = CHART_RENDER_WORKERS,
+        cache: ChartImageCache | None = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self.cache = cache if cache is not None else ChartImageCache()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor | None:
+        if self._max_workers <= 0:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn: the API process is multi-threaded, forking it is unsafe.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+            return self._pool
+
+    def _discard_pool(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._discard_pool()
+
+    def render_many(self, requests: Iterable[ChartRequest]) -> dict[ChartKey, bytes]:
+        """Render every request, reusing cached images and deduplicating keys."""
+        results: dict[ChartKey, bytes] = {}
+        pending: dict[ChartKey, ChartRequest] = {}
+        for request in requests:
+            if request.key in results or request.key in pending:
+                continue
+            cached = self.cache.get(request.key)
+            if cached is not None:
+                results[request.key] = cached
+            else:
+                pending[request.key] = request
+
+        if pending:
+            rendered = self._render_pending(pending)
+            for key, image in rendered.items():
+                self.cache.put(key, image)
+            results.update(rendered)
+        return results
+
+    def _render_pending(self, pending: Mapping[ChartKey, ChartRequest]) -> dict[ChartKey, bytes]:
+        pool = self._get_pool()
+        if pool is None:
+            return {
+                key: render_figure_json(request.figure_json, key.style)
+                for key, request in pending.items()
+            }
+
+        try:
+            futures: dict[ChartKey, Future[bytes]] = {
+                key: pool.submit(render_figure_json, request.figure_json, key.style)
+                for key, request in pending.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+        except BrokenProcessPool:
+            logger.warning("Chart render pool broke; rendering this batch inline")
+            self._discard_pool()
+            return {
+                key: render_figure_json(request.figure_json, key.style)
+                for key, request in pending.items()
+            }
+
+
+_renderer: ChartRenderer | None = None
+_renderer_lock = threading.Lock()
+
+
+def get_chart_renderer() -> ChartRenderer:
+    """Return the process-wide chart renderer, creating it on first use."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = ChartRenderer()
+        return _renderer
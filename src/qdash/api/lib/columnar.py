@@ -0,0 +1,135 @@
+"""Columnar response formats for timeseries endpoints.
+
+Row responses validate one pydantic model per point and repeat every field
+name per point; for multi-qubit, multi-month charts that dominates the
+request. Columnar responses are built directly from raw Mongo rows into one
+list per field and series::
+
+    {"data": {"0": {"t": [...], "value": [...], "error": [...], "task_id": [...]}}}
+
+JSON is serialized with orjson (see ``qdash.api.lib.json_response``).
+``format=arrow`` returns the same columns as an Arrow IPC stream (one row per
+point with a ``series`` column) when ``pyarrow`` is installed.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException
+from starlette.responses import Response
+
+from qdash.api.lib.json_response import ORJSONResponse
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Documents the non-row representations on routes that accept ``format``.
+COLUMNAR_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": (
+            "Rows by default; format=columnar returns per-series column arrays "
+            "(t, value, error, task_id), format=arrow an Arrow IPC stream."
+        ),
+        "content": {ARROW_STREAM_MEDIA_TYPE: {}},
+    }
+}
+
+_COLUMNS = ("t", "value", "error", "task_id")
+
+
+class SeriesFormat(str, Enum):
+    """Representation of a timeseries response."""
+
+    ROWS = "rows"
+    COLUMNAR = "columnar"
+    ARROW = "arrow"
+
+
+class ColumnarSeries:
+    """Accumulates timeseries points into per-series column lists."""
+
+    def __init__(self) -> None:
+        self.series: dict[str, dict[str, Any]] = {}
+
+    def add(
+        self,
+        key: str,
+        t: datetime | None,
+        value: float | int | None,
+        error: float | None = None,
+        task_id: str | None = None,
+        **extra: Any,
+    ) -> None:
+        """Append one point; ``extra`` values go to additional columns of the same name."""
+        columns = self.series.get(key)
+        if columns is None:
+            columns = self.series[key] = {name: [] for name in (*_COLUMNS, *extra)}
+        columns["t"].append(t)
+        columns["value"].append(value)
+        columns["error"].append(error)
+        columns["task_id"].append(task_id)
+        for name, item in extra.items():
+            columns[name].append(item)
+
+    def set_meta(self, key: str, **meta: Any) -> None:
+        """Attach per-series scalars (e.g. ``unit``) next to the columns."""
+        columns = self.series.get(key)
+        if columns is None:
+            columns = self.series[key] = {name: [] for name in _COLUMNS}
+        for name, value in meta.items():
+            columns.setdefault(name, value)
+
+
+def orjson_response(content: Any, status_code: int = 200) -> Response:
+    """Serialize ``content`` with orjson (naive datetimes are treated as UTC)."""
+    return ORJSONResponse(content, status_code=status_code)
+
+
+def arrow_response(series: dict[str, dict[str, Any]]) -> Response:
+    """Encode columnar series as an Arrow IPC stream in long form.
+
+    Raises
+    ------
+    HTTPException
+        503 if ``pyarrow`` is not installed
+
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise HTTPException(
+            status_code=503,
+            detail="Arrow output requires pyarrow. Install with: pip install pyarrow",
+        ) from None
+
+    keys: list[str] = []
+    for key, columns in series.items():
+        keys.extend([key] * len(columns["t"]))
+    table = pa.table(
+        {
+            "series": pa.array(keys, type=pa.string()),
+            "t": pa.array(
+                [t for c in series.values() for t in c["t"]], type=pa.timestamp("us", tz="UTC")
+            ),
+            "value": pa.array([v for c in series.values() for v in c["value"]], type=pa.float64()),
+            "error": pa.array([e for c in series.values() for e in c["error"]], type=pa.float64()),
+            "task_id": pa.array(
+                [i for c in series.values() for i in c["task_id"]], type=pa.string()
+            ),
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE)
+
+
+def series_response(series: ColumnarSeries, fmt: SeriesFormat, **extra: Any) -> Response:
+    """Return ``series`` as columnar JSON (with ``extra`` top-level fields) or Arrow."""
+    if fmt == SeriesFormat.ARROW:
+        return arrow_response(series.series)
+    return orjson_response({**extra, "data": series.series})
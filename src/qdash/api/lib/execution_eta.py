@@ -0,0 +1,208 @@
+"""Remaining-time estimation for running executions.
+
+Workflows record the work an execution was started with in
+``note["plan"]`` (``ExecutionPlanModel``): sequential steps of parallel
+lanes of qids, and the tasks run per qid. Task durations are learned from
+``task_result_history`` per (task name, batch size) on the chip.
+
+A lane's remaining time is the sum of its remaining (task, qid) units, a
+step waits for its slowest lane, and steps add up. Unit durations are
+treated as independent, so variances add along the same path and give the
+confidence interval.
+
+Lanes run their units in order, so once a later unit of a lane (or a later
+step) has started, every earlier unit counts as done even if it left no
+task result; this covers tasks the workflow skips, such as MUX-level tasks
+on non-representative qubits.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from qdash.common.utils.datetime import ensure_timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import datetime
+
+    from qdash.datamodel.execution import ExecutionPlanModel
+
+FINISHED_TASK_STATUSES = frozenset({"completed", "failed", "skipped"})
+RUNNING_TASK_STATUS = "running"
+
+# Two-sided 90% interval of a normal distribution.
+ETA_CONFIDENCE = 0.9
+ETA_INTERVAL_Z = 1.645
+
+UnitKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class DurationEstimate:
+    """Predicted duration of one task run."""
+
+    mean: float
+    variance: float
+    samples: int
+
+
+class DurationModel:
+    """Task durations learned per (task name, batch size).
+
+    Unknown batch sizes use the nearest recorded size of the same task;
+    unknown tasks use the median task duration with a variance equal to its
+    square, so they widen the interval rather than narrow it.
+    """
+
+    def __init__(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        self._by_task: dict[str, dict[int, DurationEstimate]] = {}
+        for row in rows:
+            self._by_task.setdefault(row["name"], {})[int(row["batch_size"])] = DurationEstimate(
+                mean=float(row["mean_seconds"]),
+                variance=float(row["stddev_seconds"]) ** 2,
+                samples=int(row["count"]),
+            )
+        means = [e.mean for sizes in self._by_task.values() for e in sizes.values()]
+        self._fallback: DurationEstimate | None = None
+        if means:
+            median = statistics.median(means)
+            self._fallback = DurationEstimate(mean=median, variance=median**2, samples=0)
+
+    def __bool__(self) -> bool:
+        """Return True if any duration was recorded."""
+        return self._fallback is not None
+
+    def estimate(self, task_name: str, batch_size: int = 1) -> DurationEstimate | None:
+        """Return the predicted duration of ``task_name`` over ``batch_size`` qids."""
+        sizes = self._by_task.get(task_name)
+        if not sizes:
+            return self._fallback
+        if batch_size in sizes:
+            return sizes[batch_size]
+        nearest = min(sizes, key=lambda size: (abs(size - batch_size), size))
+        return sizes[nearest]
+
+
+@dataclass
+class ExecutionTaskState:
+    """Task result states seen so far for one execution."""
+
+    finished: set[UnitKey] = field(default_factory=set)
+    running: dict[UnitKey, datetime | None] = field(default_factory=dict)
+    watermark: datetime | None = None
+
+    def apply(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Fold task result rows (name, qid, status, start_at, end_at) into the state."""
+        for row in rows:
+            key = (row.get("name") or "", row.get("qid") or "")
+            status = row.get("status")
+            if status in FINISHED_TASK_STATUSES:
+                self.finished.add(key)
+                self.running.pop(key, None)
+                end_at = ensure_timezone(row.get("end_at"))
+                if end_at is not None and (self.watermark is None or end_at > self.watermark):
+                    self.watermark = end_at
+            elif status == RUNNING_TASK_STATUS and key not in self.finished:
+                self.running[key] = ensure_timezone(row.get("start_at"))
+
+
+@dataclass(frozen=True)
+class ProgressEstimate:
+    """Progress of an execution against its plan."""
+
+    completed_units: int
+    total_units: int
+    remaining_seconds: float | None
+    remaining_stddev: float | None
+    # Recorded runs behind the durations used for the remaining units.
+    samples: int
+
+
+@dataclass
+class _Sum:
+    mean: float = 0.0
+    variance: float = 0.0
+
+
+def _lane_units(plan: ExecutionPlanModel, lane: list[str]) -> list[tuple[list[UnitKey], int]]:
+    """Return the units of a lane in run order as (task result keys, batch size)."""
+    if plan.batch:
+        return [([(task, qid) for qid in lane], len(lane)) for task in plan.tasks]
+    return [([(task, qid)], 1) for qid in lane for task in plan.tasks]
+
+
+def estimate_progress(
+    plan: ExecutionPlanModel,
+    state: ExecutionTaskState,
+    model: DurationModel,
+    current_time: datetime,
+) -> ProgressEstimate:
+    """Estimate how much of ``plan`` is done and how long the rest will take.
+
+    ``remaining_seconds`` is None when no duration has been recorded for the
+    chip yet.
+    """
+    steps = [
+        [units for lane in step if lane and (units := _lane_units(plan, lane))]
+        for step in plan.steps
+    ]
+    steps = [step for step in steps if step]
+
+    def touched(keys: list[UnitKey]) -> bool:
+        return any(key in state.finished or key in state.running for key in keys)
+
+    last_started_step = max(
+        (
+            i
+            for i, step in enumerate(steps)
+            if any(touched(keys) for lane in step for keys, _ in lane)
+        ),
+        default=-1,
+    )
+
+    total_units = completed_units = 0
+    total = _Sum()
+    known = bool(model)
+    used: dict[tuple[str, int], int] = {}
+    for i, step in enumerate(steps):
+        slowest = _Sum()
+        for lane in step:
+            total_units += len(lane)
+            if i < last_started_step:
+                completed_units += len(lane)
+                continue
+            last_touched = max((j for j, (keys, _) in enumerate(lane) if touched(keys)), default=-1)
+            remaining = _Sum()
+            for j, (keys, batch_size) in enumerate(lane):
+                running_since = [state.running[key] for key in keys if key in state.running]
+                if not running_since and (
+                    j < last_touched or all(key in state.finished for key in keys)
+                ):
+                    completed_units += 1
+                    continue
+                estimate = model.estimate(keys[0][0], batch_size)
+                if estimate is None:
+                    continue
+                used[(keys[0][0], batch_size)] = estimate.samples
+                mean = estimate.mean
+                started = min((t for t in running_since if t is not None), default=None)
+                if started is not None:
+                    mean = max(mean - (current_time - started).total_seconds(), 0.0)
+                remaining.mean += mean
+                remaining.variance += estimate.variance
+            if remaining.mean > slowest.mean:
+                slowest = remaining
+        total.mean += slowest.mean
+        total.variance += slowest.variance
+
+    return ProgressEstimate(
+        completed_units=completed_units,
+        total_units=total_units,
+        remaining_seconds=total.mean if known else None,
+        remaining_stddev=math.sqrt(total.variance) if known else None,
+        samples=sum(used.values()),
+    )
@@ -0,0 +1,57 @@
+"""Fast JSON serialization for responses built outside FastAPI's serializer.
+
+Routes with a return type or ``response_model`` are already serialized by
+FastAPI straight to bytes in pydantic-core. Setting a custom default
+response class would switch those routes back to ``jsonable_encoder`` plus
+a ``render`` call, which is the slow part for large chip payloads, so the
+app keeps FastAPI's default. Responses assembled by hand (the ETag response
+cache, columnar timeseries) go through :func:`dumps_json` instead:
+
+- pydantic models are dumped by pydantic-core (same bytes as FastAPI),
+- everything else by orjson, with numpy arrays/scalars, sets, ``Decimal``
+  and nested models handled, naive datetimes treated as UTC (MongoDB
+  returns naive UTC) and NaN/Infinity written as ``null``.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from qdash.api.lib.request_timing import timed
+
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Convert values orjson does not serialize natively."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize ``content`` to compact UTF-8 JSON bytes."""
+    with timed("serialize"):
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode()
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with :func:`dumps_json`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
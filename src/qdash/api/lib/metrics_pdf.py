@@ -9,6 +9,7 @@ from __future__ import annotations
 import io
 import logging
 import math
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -20,6 +21,12 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
+from qdash.api.lib.chart_render import (
+    ChartRenderer,
+    ChartRequest,
+    build_chart_request,
+    get_chart_renderer,
+)
 from qdash.common.config.metrics import load_metrics_config
 from qdash.common.config.topology import TopologyDefinition, load_topology
 from qdash.common.visualization.metrics_chart import (
@@ -43,6 +50,19 @@ NODE_SIZE = 48  # Doubled for larger figures
 TEXT_SIZE = 18  # Large text for readability in cells
 
 
+@dataclass
+class _ReportPage:
+    """A chart page planned before any chart is rendered."""
+
+    title: str
+    unit: str
+    metric_type: Literal["qubit", "coupling"]
+    chart: ChartRequest | None
+    scale: float = 1.0
+    metric_data: dict[str, Any] = field(default_factory=dict)
+    cdf_group: Any = None
+
+
 class MetricsPDFGenerator:
     """Generate PDF reports for chip metrics using Plotly."""
 
@@ -90,12 +110,22 @@ class MetricsPDFGenerator:
         self.grid_size = self._geometry.grid_size
         self.mux_size = self._geometry.mux_size
 
-    def generate_pdf(self) -> io.BytesIO:
+    def generate_pdf(self, renderer: ChartRenderer | None = None) -> io.BytesIO:
         """Generate the complete PDF report.
 
+        All charts are rendered up front through ``renderer`` (the shared warm
+        process pool by default), and the PDF is assembled only afterwards.
+
+        Args:
+            renderer: Chart renderer to use instead of the process-wide one
+
         Returns:
             BytesIO buffer containing the PDF data
         """
+        pages = self._plan_pages()
+        renderer = renderer or get_chart_renderer()
+        images = renderer.render_many(page.chart for page in pages if page.chart is not None)
+
         buffer = io.BytesIO()
         c = canvas.Canvas(buffer, pagesize=A4)
 
@@ -107,7 +137,36 @@ class MetricsPDFGenerator:
         self._draw_summary_page(c)
         c.showPage()
 
-        page_num = 1
+        for page_num, page in enumerate(pages, start=1):
+            image = images.get(page.chart.key) if page.chart is not None else None
+            if page.cdf_group is not None:
+                self._draw_cdf_page(
+                    c,
+                    cdf_group=page.cdf_group,
+                    image=image,
+                    page_num=page_num,
+                )
+            else:
+                self._draw_metric_page(
+                    c,
+                    metric_title=page.title,
+                    metric_unit=page.unit,
+                    metric_scale=page.scale,
+                    metric_data=page.metric_data,
+                    metric_type=page.metric_type,
+                    image=image,
+                    page_num=page_num,
+                )
+            c.showPage()
+
+        c.save()
+        buffer.seek(0)
+        return buffer
+
+    def _plan_pages(self) -> list[_ReportPage]:
+        """Build every chart page's figure, in report order, without drawing."""
+        chip_id = self.metrics_response.chip_id
+        pages: list[_ReportPage] = []
 
         # Qubit metrics pages
         qubit_metrics = self.metrics_response.qubit_metrics
@@ -115,18 +174,25 @@ class MetricsPDFGenerator:
             schema_key = self._map_config_to_schema_key(metric_key, "qubit")
             metric_data = qubit_metrics.get(schema_key)
             if metric_data:
-                self._draw_metric_page(
-                    c,
-                    metric_key=metric_key,
+                fig = create_qubit_heatmap(
+                    metric_data=metric_data,
+                    geometry=self._geometry,
+                    metric_scale=metric_meta.scale,
                     metric_title=metric_meta.title,
                     metric_unit=metric_meta.unit,
-                    metric_scale=metric_meta.scale,
-                    metric_data=metric_data,
-                    metric_type="qubit",
-                    page_num=page_num,
                 )
-                c.showPage()
-                page_num += 1
+                pages.append(
+                    _ReportPage(
+                        title=metric_meta.title,
+                        unit=metric_meta.unit,
+                        scale=metric_meta.scale,
+                        metric_data=metric_data,
+                        metric_type="qubit",
+                        chart=build_chart_request(chip_id, f"qubit:{metric_key}", fig)
+                        if fig
+                        else None,
+                    )
+                )
 
         # Coupling metrics pages – one page per direction (forward / reverse)
         coupling_metrics = self.metrics_response.coupling_metrics
@@ -139,46 +205,50 @@ class MetricsPDFGenerator:
                 if not directed_data:
                     continue
                 direction_label = "Forward" if direction == "forward" else "Reverse"
-                self._draw_metric_page(
-                    c,
-                    metric_key=metric_key,
-                    metric_title=f"{metric_meta.title} ({direction_label})",
-                    metric_unit=metric_meta.unit,
-                    metric_scale=metric_meta.scale,
+                title = f"{metric_meta.title} ({direction_label})"
+                fig = self._create_coupling_graph(
                     metric_data=directed_data,
-                    metric_type="coupling",
-                    page_num=page_num,
+                    metric_scale=metric_meta.scale,
+                    metric_title=title,
+                    metric_unit=metric_meta.unit,
                 )
-                c.showPage()
-                page_num += 1
-
-        # CDF pages for qubit metric groups (skip empty groups)
-        for cdf_group in self.config.cdf_groups.qubit:
-            if self._has_cdf_data(cdf_group, "qubit"):
-                self._draw_cdf_page(
-                    c,
-                    cdf_group=cdf_group,
-                    metric_type="qubit",
-                    page_num=page_num,
+                pages.append(
+                    _ReportPage(
+                        title=title,
+                        unit=metric_meta.unit,
+                        scale=metric_meta.scale,
+                        metric_data=directed_data,
+                        metric_type="coupling",
+                        chart=build_chart_request(
+                            chip_id, f"coupling:{metric_key}:{direction}", fig
+                        )
+                        if fig
+                        else None,
+                    )
                 )
-                c.showPage()
-                page_num += 1
 
-        # CDF pages for coupling metric groups (skip empty groups)
-        for cdf_group in self.config.cdf_groups.coupling:
-            if self._has_cdf_data(cdf_group, "coupling"):
-                self._draw_cdf_page(
-                    c,
+        # CDF pages for qubit and coupling metric groups (skip empty groups)
+        cdf_groups: list[tuple[Any, Literal["qubit", "coupling"]]] = [
+            *((group, "qubit") for group in self.config.cdf_groups.qubit),
+            *((group, "coupling") for group in self.config.cdf_groups.coupling),
+        ]
+        for cdf_group, metric_type in cdf_groups:
+            if not self._has_cdf_data(cdf_group, metric_type):
+                continue
+            fig = self._create_cdf_chart(cdf_group, metric_type)
+            pages.append(
+                _ReportPage(
+                    title=cdf_group.title,
+                    unit=cdf_group.unit,
+                    metric_type=metric_type,
                     cdf_group=cdf_group,
-                    metric_type="coupling",
-                    page_num=page_num,
+                    chart=build_chart_request(chip_id, f"cdf:{metric_type}:{cdf_group.title}", fig)
+                    if fig
+                    else None,
                 )
-                c.showPage()
-                page_num += 1
+            )
 
-        c.save()
-        buffer.seek(0)
-        return buffer
+        return pages
 
     def _map_config_to_schema_key(self, config_key: str, metric_type: str) -> str:
         """Map configuration key to schema attribute key."""
@@ -445,15 +515,15 @@ class MetricsPDFGenerator:
     def _draw_metric_page(
         self,
         c: canvas.Canvas,
-        metric_key: str,
         metric_title: str,
         metric_unit: str,
         metric_scale: float,
         metric_data: dict[str, Any],
         metric_type: Literal["qubit", "coupling"],
+        image: bytes | None,
         page_num: int,
     ) -> None:
-        """Draw a single metric page with Plotly figure."""
+        """Draw a single metric page with a pre-rendered chart image."""
         # Header bar
         header_height = 50
         c.setFillColor(colors.Color(0.2, 0.3, 0.5))
@@ -478,28 +548,8 @@ class MetricsPDFGenerator:
         # Calculate statistics
         stats = self._calculate_statistics(metric_data, metric_scale, metric_type)
 
-        # Generate Plotly figure
-        if metric_type == "qubit":
-            fig = create_qubit_heatmap(
-                metric_data=metric_data,
-                geometry=self._geometry,
-                metric_scale=metric_scale,
-                metric_title=metric_title,
-                metric_unit=metric_unit,
-            )
-        else:
-            fig = self._create_coupling_graph(
-                metric_data=metric_data,
-                metric_scale=metric_scale,
-                metric_title=metric_title,
-                metric_unit=metric_unit,
-            )
-
-        if fig:
-            # Convert Plotly figure to image
-            img_buffer = io.BytesIO()
-            fig.write_image(img_buffer, format="png", scale=2)
-            img_buffer.seek(0)
+        if image:
+            img_buffer = io.BytesIO(image)
 
             # Get image dimensions
             img = Image.open(img_buffer)
@@ -945,10 +995,10 @@ class MetricsPDFGenerator:
         self,
         c: canvas.Canvas,
         cdf_group: Any,
-        metric_type: Literal["qubit", "coupling"],
+        image: bytes | None,
         page_num: int,
     ) -> None:
-        """Draw a CDF chart page for a metric group."""
+        """Draw a CDF chart page for a metric group with a pre-rendered image."""
         # Header bar
         header_height = 50
         c.setFillColor(colors.Color(0.2, 0.3, 0.5))
@@ -970,14 +1020,8 @@ class MetricsPDFGenerator:
         c.setFont("Helvetica", 10)
         c.drawString(self.width - unit_width - 42, self.height - 33, unit_text)
 
-        # Generate CDF chart
-        fig = self._create_cdf_chart(cdf_group, metric_type)
-
-        if fig:
-            # Convert Plotly figure to image
-            img_buffer = io.BytesIO()
-            fig.write_image(img_buffer, format="png", scale=2)
-            img_buffer.seek(0)
+        if image:
+            img_buffer = io.BytesIO(image)
 
             # Get image dimensions
             img = Image.open(img_buffer)
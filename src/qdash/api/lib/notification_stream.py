@@ -0,0 +1,78 @@
+"""Push channel for the unread notification counter.
+
+Open browser tabs used to poll ``GET /notifications/unread-count``. The
+stream endpoint instead keeps one connection per tab and sends an
+``unread_count`` event only when the count changes.
+
+Counter writes in this process bump a per-user version, which streams check
+every ``poll_seconds`` without touching the database. Writes made by other
+API workers are picked up by re-reading the counter every
+``resync_seconds``; that read is a single lookup on the counter's unique
+index.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import TYPE_CHECKING
+
+from starlette.concurrency import run_in_threadpool
+
+from qdash.api.lib.sse import sse_event
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+UNREAD_STREAM_POLL_SECONDS = float(os.getenv("QDASH_NOTIFICATION_STREAM_POLL_SECONDS", "0.5"))
+UNREAD_STREAM_RESYNC_SECONDS = float(os.getenv("QDASH_NOTIFICATION_STREAM_RESYNC_SECONDS", "15"))
+UNREAD_STREAM_HEARTBEAT_SECONDS = 25.0
+
+_versions: dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+
+def bump_counter_version(user_id: str) -> None:
+    """Signal streams in this process that ``user_id``'s counters changed."""
+    with _versions_lock:
+        _versions[user_id] = _versions.get(user_id, 0) + 1
+
+
+def counter_version(user_id: str) -> int:
+    """Return the in-process change version of ``user_id``'s counters."""
+    with _versions_lock:
+        return _versions.get(user_id, 0)
+
+
+async def unread_count_events(
+    user_id: str,
+    read_count: Callable[[], int],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    *,
+    poll_seconds: float = UNREAD_STREAM_POLL_SECONDS,
+    resync_seconds: float = UNREAD_STREAM_RESYNC_SECONDS,
+    heartbeat_seconds: float = UNREAD_STREAM_HEARTBEAT_SECONDS,
+) -> AsyncGenerator[str, None]:
+    """Yield SSE frames for the unread counter until the client disconnects.
+
+    The current count is always sent first. ``read_count`` runs in the
+    threadpool because the database driver is synchronous.
+    """
+    loop = asyncio.get_running_loop()
+    last_count: int | None = None
+    last_version = -1
+    last_read = last_sent = loop.time()
+    while not await is_disconnected():
+        version = counter_version(user_id)
+        current = loop.time()
+        if version != last_version or current - last_read >= resync_seconds:
+            last_version, last_read = version, current
+            count = await run_in_threadpool(read_count)
+            if count != last_count:
+                last_count, last_sent = count, current
+                yield sse_event("unread_count", {"unread_count": count})
+        if current - last_sent >= heartbeat_seconds:
+            last_sent = current
+            yield ": keepalive\n\n"
+        await asyncio.sleep(poll_seconds)
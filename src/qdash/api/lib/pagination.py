@@ -0,0 +1,109 @@
+"""Keyset pagination for API listings served by a single aggregation.
+
+Wraps :mod:`qdash.repository.pagination` for services that page raw
+collections themselves: the cursor is decoded into a keyset filter (an
+invalid one is a 400), one row more than the page is fetched so
+``next_cursor`` is only issued when another page exists, and the optional
+total is carried by the cursor so deeper pages need not count again.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException, status
+
+from qdash.repository.pagination import (
+    InvalidCursorError,
+    Page,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    sort_values,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CURSOR_DESCRIPTION = (
+    "Keyset pagination cursor. Send an empty value for the first page and "
+    "next_cursor for the following ones; skip is then ignored."
+)
+
+
+def aggregate_page(
+    collection: Any,
+    query: dict[str, Any],
+    *,
+    scope: str,
+    sort: SortKey,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+    stages: list[dict[str, Any]] | None = None,
+    count: Callable[[], int] | None = None,
+) -> Page[dict[str, Any]]:
+    """Run one page of a listing as a single aggregation.
+
+    ``cursor=None`` pages by ``skip``; any other value (``""`` for the first
+    page) pages by keyset and ignores ``skip``. ``stages`` run after the page
+    is cut, so lookups only touch the rows that are returned.
+
+    Parameters
+    ----------
+    collection : Any
+        The raw (pymongo) collection to aggregate
+    query : dict[str, Any]
+        Filter of the listing
+    scope : str
+        Cursor scope of the listing
+    sort : SortKey
+        Sort order; must end with a unique key
+    skip : int
+        Rows to skip in offset mode
+    limit : int
+        Page size
+    cursor : str | None
+        Keyset cursor, or None for offset paging
+    stages : list[dict[str, Any]] | None
+        Pipeline stages applied to the page rows
+    count : Callable[[], int] | None
+        Counts the matching rows; its result is carried by the cursor
+
+    Returns
+    -------
+    Page[dict[str, Any]]
+        The rows, the cursor of the next page and the total (if ``count`` is given)
+
+    Raises
+    ------
+    HTTPException
+        400 if the cursor is invalid
+
+    """
+    match = query
+    total: int | None = None
+    if cursor:
+        try:
+            after, total = decode_cursor(cursor, scope)
+            match = {"$and": [query, keyset_filter(sort, after)]}
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    if total is None and count is not None:
+        total = count()
+
+    pipeline: list[dict[str, Any]] = [{"$match": match}, {"$sort": dict(sort)}]
+    if cursor is None:
+        if skip:
+            pipeline.append({"$skip": skip})
+        pipeline.append({"$limit": limit})
+    else:
+        pipeline.append({"$limit": limit + 1})
+    rows = list(collection.aggregate([*pipeline, *(stages or [])]))
+
+    next_cursor = None
+    if cursor is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, sort_values(rows[-1], sort), total)
+    return Page(items=rows, next_cursor=next_cursor, total=total)
@@ -0,0 +1,20 @@
+"""Prefect client access for API services.
+
+Importing ``prefect`` costs about half a second, and only the flow,
+schedule and execution-cancel endpoints talk to the Prefect server, so the
+SDK is imported on the first call instead of at API startup.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from prefect.client.orchestration import PrefectClient
+
+
+def get_client(*args: Any, **kwargs: Any) -> PrefectClient:
+    """Return ``prefect.client.orchestration.get_client(*args, **kwargs)``."""
+    from prefect.client.orchestration import get_client as prefect_get_client
+
+    return cast("PrefectClient", prefect_get_client(*args, **kwargs))
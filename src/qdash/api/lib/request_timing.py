@@ -0,0 +1,83 @@
+"""Per-request timing breakdown reported as ``Server-Timing``.
+
+``ServerTimingMiddleware`` installs a :class:`RequestTimings` in a context
+variable for each request. Code running for that request adds to it:
+
+- MongoDB time, via :class:`MongoCommandTimer`, a pymongo command listener
+  attached to the API's ``MongoClient``. Sync endpoints run in a thread pool
+  that copies the request context, so their commands are attributed too.
+- Named phases such as serialization, via :func:`timed`.
+
+Outside a request (scripts, workers) nothing is recorded.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from pymongo import monitoring
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class RequestTimings:
+    """Accumulated timings of one request, in seconds."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.db_seconds = 0.0
+        self.db_commands = 0
+        self.phases: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add_db(self, seconds: float) -> None:
+        with self._lock:
+            self.db_seconds += seconds
+            self.db_commands += 1
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+
+REQUEST_TIMINGS_CTX_VAR: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the time spent in the ``with`` block to the current request's ``phase``."""
+    timings = REQUEST_TIMINGS_CTX_VAR.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_phase(phase, time.perf_counter() - start)
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """Adds the duration of every MongoDB command to the current request."""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event.duration_micros)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event.duration_micros)
+
+    @staticmethod
+    def _record(duration_micros: int) -> None:
+        timings = REQUEST_TIMINGS_CTX_VAR.get()
+        if timings is not None:
+            timings.add_db(duration_micros / 1_000_000)
@@ -0,0 +1,177 @@
+"""ETag and conditional-GET caching for read-heavy chip endpoints.
+
+Dashboard pages poll chip summaries, qubit/coupling lists and metrics far
+more often than calibration writes them. Responses are serialized once and
+kept in a bounded in-process LRU keyed by (project, route, query), together
+with the chip's data version (``ChipDataVersionDocument``) they were built
+from. A request first reads that version with one indexed lookup; a cached
+body is reused only if the version is unchanged and the entry is younger
+than the TTL, which also bounds staleness for writes that do not bump the
+version (e.g. time-window filters such as ``within_hours``).
+
+Every response carries a strong ETag derived from the body bytes, so a
+client that already holds the body gets ``304 Not Modified`` without the
+payload being sent again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from starlette.responses import Response
+
+from qdash.api.lib.json_response import dumps_json
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from starlette.requests import Request
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("QDASH_RESPONSE_CACHE_MAX_ENTRIES", "256"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("QDASH_RESPONSE_CACHE_TTL_SECONDS", "60"))
+
+# Clients must revalidate on every use; the ETag makes that cheap.
+_CACHE_CONTROL = "private, no-cache"
+
+CacheKey = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized response body and the chip data version it was built from."""
+
+    etag: str
+    body: bytes
+    version: int
+    stored_at: float
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong ETag for ``body``."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against ``etag`` (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = (part.strip() for part in if_none_match.split(","))
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class ResponseCache:
+    """Thread-safe bounded LRU of serialized responses with a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, version: int) -> CachedResponse | None:
+        """Return the entry for ``key`` if it was built from ``version`` and is fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.version != version or self._clock() - entry.stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, version: int, body: bytes) -> CachedResponse:
+        """Store ``body`` for ``key`` and return the new entry."""
+        entry = CachedResponse(
+            etag=compute_etag(body), body=body, version=version, stored_at=self._clock()
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+def _serialize(content: Any) -> bytes:
+    """Serialize a response model like FastAPI's own pydantic-core fast path."""
+    return dumps_json(content)
+
+
+def cached_json_response(
+    request: Request,
+    *,
+    project_id: str,
+    chip_id: str,
+    build: Callable[[], Any],
+    scope: str = "",
+    cache: ResponseCache | None = None,
+) -> Response:
+    """Serve a chip-scoped JSON response from the cache, honouring ``If-None-Match``.
+
+    Args:
+    ----
+        request: The incoming request; its path and query form the cache key
+        project_id: Project the response belongs to
+        chip_id: Chip whose data version validates the cached body
+        build: Produces the response model on a cache miss
+        scope: Extra key component for responses that also depend on the caller
+        cache: Cache to use (defaults to the process-wide cache)
+
+    Returns:
+    -------
+        A 200 response with the JSON body, or 304 if the client's ETag matches
+
+    """
+    cache = cache if cache is not None else get_response_cache()
+    version = ChipDataVersionDocument.get_version(project_id, chip_id)
+    key: CacheKey = (
+        project_id,
+        scope,
+        request.url.path,
+        *sorted(f"{name}={value}" for name, value in request.query_params.multi_items()),
+    )
+    entry = cache.get(key, version)
+    if entry is None:
+        entry = cache.put(key, version, _serialize(build()))
+
+    headers = {"ETag": entry.etag, "Cache-Control": _CACHE_CONTROL}
+    if request.method in ("GET", "HEAD") and etag_matches(
+        request.headers.get("if-none-match"), entry.etag
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
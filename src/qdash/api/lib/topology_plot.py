@@ -0,0 +1,243 @@
+"""Cached rendering of device topology plots.
+
+The topology PNG is requested far more often than the calibration data
+behind it changes, and a 300 dpi matplotlib render takes seconds. Images
+are cached by a content hash of exactly the inputs that change the
+picture: device name, qubit ids/positions/fidelities, coupling
+endpoints/fidelities and the style. Lifetimes, gate durations and readout
+errors are not drawn and are not part of the key.
+
+The cache has two tiers, a bounded in-process LRU and a directory of PNG
+files shared by API workers and kept across restarts. Set
+``QDASH_TOPOLOGY_PLOT_CACHE_DIR`` to an empty string to disable the disk tier.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from qdash.api.lib.chart_render import ChartImageCache
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+# Bump when the drawing code changes so stale files on disk are not served.
+RENDER_VERSION = 1
+
+TOPOLOGY_PLOT_CACHE_DIR = os.getenv(
+    "QDASH_TOPOLOGY_PLOT_CACHE_DIR",
+    str(Path(tempfile.gettempdir()) / "qdash-topology-plots"),
+)
+TOPOLOGY_PLOT_MEMORY_ENTRIES = int(os.getenv("QDASH_TOPOLOGY_PLOT_MEMORY_ENTRIES", "32"))
+TOPOLOGY_PLOT_DISK_ENTRIES = int(os.getenv("QDASH_TOPOLOGY_PLOT_DISK_ENTRIES", "256"))
+
+
+@dataclass(frozen=True)
+class TopologyPlotStyle:
+    """Output options that change the rendered image."""
+
+    dpi: int = 300
+    cmap: str = "viridis"
+
+
+def topology_plot_key(data: Mapping[str, Any], style: TopologyPlotStyle) -> str:
+    """Hash the parts of a ``Device`` dump that the plot actually draws."""
+    drawn = {
+        "version": RENDER_VERSION,
+        "style": asdict(style),
+        "name": data["name"],
+        "qubits": [
+            [q["id"], q["physical_id"], q["fidelity"], q["position"]["x"], q["position"]["y"]]
+            for q in data["qubits"]
+        ],
+        "couplings": [[c["control"], c["target"], c["fidelity"]] for c in data["couplings"]],
+    }
+    encoded = json.dumps(drawn, separators=(",", ":"), sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def render_topology_plot(data: Mapping[str, Any], style: TopologyPlotStyle) -> bytes:
+    """Draw the device graph and return it as PNG bytes.
+
+    Uses matplotlib's object API instead of pyplot, whose global figure
+    state is not safe to share between request threads.
+    """
+    import matplotlib as mpl
+    import networkx as nx
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.colors import Normalize
+    from matplotlib.figure import Figure
+
+    g = nx.Graph()
+    pos = {}
+    for qubit in data["qubits"]:
+        g.add_node(qubit["id"], physical_id=qubit["physical_id"], fidelity=qubit["fidelity"])
+        pos[qubit["id"]] = (qubit["position"]["x"] * 100, qubit["position"]["y"] * 100)
+
+    for coupling in data["couplings"]:
+        g.add_edge(coupling["control"], coupling["target"], fidelity=coupling["fidelity"])
+
+    with mpl.rc_context({"font.size": 14, "font.family": "sans-serif"}):
+        fig = Figure(figsize=(15, 15))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        nx.draw_networkx_nodes(
+            g,
+            pos,
+            ax=ax,
+            node_color=[g.nodes[node]["fidelity"] for node in g.nodes],
+            node_size=3000,
+            cmap=style.cmap,
+        )
+        nx.draw_networkx_edges(g, pos, ax=ax, width=3)
+
+        labels = {
+            node: f"Q{g.nodes[node]['physical_id']}\n{g.nodes[node]['fidelity'] * 100:.2f}%"
+            for node in g.nodes
+        }
+        nx.draw_networkx_labels(
+            g, pos, labels, ax=ax, font_size=12, font_weight="bold", font_color="white"
+        )
+
+        edge_labels = nx.get_edge_attributes(g, "fidelity")
+        edge_labels = {k: f"F={v:.2f}" for k, v in edge_labels.items()}
+        nx.draw_networkx_edge_labels(g, pos, edge_labels, ax=ax, font_size=10, label_pos=0.3)
+
+        fidelity_values = list(nx.get_node_attributes(g, "fidelity").values())
+        vmin, vmax = (min(fidelity_values), max(fidelity_values)) if fidelity_values else (0, 1)
+        sm = ScalarMappable(cmap=style.cmap, norm=Normalize(vmin=vmin, vmax=vmax))
+        cbar = fig.colorbar(sm, ax=ax, label="Qubit Fidelity (%)", fraction=0.046, pad=0.04)
+        cbar.ax.tick_params(labelsize=12)
+
+        title = (
+            f"Quantum Device: {data['name'].upper()}, "
+            f"qubit: {len(g.nodes)}, coupling: {len(g.edges)}"
+        )
+        ax.set_title(title, pad=20, fontsize=16, fontweight="bold")
+
+        if pos:
+            x_coords = [coord[0] for coord in pos.values()]
+            y_coords = [coord[1] for coord in pos.values()]
+            margin = 50
+            ax.set_xlim(min(x_coords) - margin, max(x_coords) + margin)
+            ax.set_ylim(min(y_coords) - margin, max(y_coords) + margin)
+        ax.axis("off")
+        fig.tight_layout()
+
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight", dpi=style.dpi)
+    return buf.getvalue()
+
+
+class TopologyPlotCache:
+    """Memory + disk cache of topology PNGs with single-flight rendering.
+
+    Misses are rendered under one lock: concurrent requests for the same
+    image wait for the first render instead of repeating it, and matplotlib
+    never draws two figures at once (rcParams are process-global).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = TOPOLOGY_PLOT_CACHE_DIR,
+        max_memory_entries: int = TOPOLOGY_PLOT_MEMORY_ENTRIES,
+        max_disk_entries: int = TOPOLOGY_PLOT_DISK_ENTRIES,
+    ) -> None:
+        self._memory = ChartImageCache(max_entries=max_memory_entries)
+        self._dir = Path(cache_dir) if cache_dir else None
+        self._max_disk_entries = max_disk_entries
+        self._render_lock = threading.Lock()
+
+    def get_cached(self, key: str) -> bytes | None:
+        """Return the image from memory only; never touches disk or renders."""
+        return self._memory.get(key)
+
+    def get_or_render(
+        self,
+        data: Mapping[str, Any],
+        style: TopologyPlotStyle | None = None,
+        key: str | None = None,
+    ) -> bytes:
+        """Return the image for ``data`` from memory, disk, or a fresh render.
+
+        This blocks for the duration of a render; call it from a worker
+        thread when serving requests.
+        """
+        style = style or TopologyPlotStyle()
+        key = key or topology_plot_key(data, style)
+        image = self._memory.get(key)
+        if image is not None:
+            return image
+
+        with self._render_lock:
+            image = self._memory.get(key) or self._read_disk(key)
+            if image is None:
+                image = render_topology_plot(data, style)
+                self._write_disk(key, image)
+            self._memory.put(key, image)
+        return image
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (disk files stay valid)."""
+        self._memory.clear()
+
+    def _path(self, key: str) -> Path | None:
+        return self._dir / f"{key}.png" if self._dir is not None else None
+
+    def _read_disk(self, key: str) -> bytes | None:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            image = path.read_bytes()
+            path.touch()  # mtime orders eviction
+            return image
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read cached topology plot {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, image: bytes) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(image)
+            tmp.replace(path)
+            self._prune_disk()
+        except OSError as e:
+            logger.warning(f"Failed to write cached topology plot {path}: {e}")
+
+    def _prune_disk(self) -> None:
+        assert self._dir is not None
+        files = sorted(self._dir.glob("*.png"), key=lambda p: p.stat().st_mtime)
+        for stale in files[: max(0, len(files) - self._max_disk_entries)]:
+            stale.unlink(missing_ok=True)
+
+
+_cache: TopologyPlotCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_topology_plot_cache() -> TopologyPlotCache:
+    """Return the process-wide topology plot cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TopologyPlotCache()
+        return _cache
@@ -0,0 +1,207 @@
+"""Response compression middleware (gzip, and brotli when installed).
+
+Chip-wide qubit lists, execution details and timeseries are large, highly
+repetitive JSON documents; compressed they shrink by one to two orders of
+magnitude. This is a pure ASGI middleware so streaming and SSE responses
+pass through without being buffered:
+
+- The encoding follows ``Accept-Encoding``: ``br`` if the ``brotli``
+  package is installed and accepted, otherwise ``gzip``.
+- Single-message bodies smaller than ``QDASH_COMPRESSION_MIN_SIZE`` bytes
+  are sent as-is, since compressing them costs more than it saves.
+- Responses that already have a ``Content-Encoding``, are already
+  compressed (PNG/JPEG/ZIP/...), or are event streams are never touched.
+- Streamed bodies are compressed chunk by chunk, flushing after each chunk.
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from starlette.datastructures import Headers, MutableHeaders
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("QDASH_COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("QDASH_GZIP_LEVEL", "5"))
+BROTLI_QUALITY = int(os.getenv("QDASH_BROTLI_QUALITY", "4"))
+
+# Content types whose payload is already compressed, or must not be buffered.
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    "image/png",
+    "image/jpeg",
+    "image/gif",
+    "image/webp",
+    "application/zip",
+    "application/x-zip-compressed",
+    "application/gzip",
+    "application/x-gzip",
+    "application/pdf",
+    "font/woff2",
+    "video/",
+    "audio/",
+    "text/event-stream",
+)
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    """Pick ``br`` or ``gzip`` from an ``Accept-Encoding`` header, if acceptable."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a response of ``content_type`` is worth compressing."""
+    content_type = content_type.lower()
+    return not any(content_type.startswith(prefix) for prefix in INCOMPRESSIBLE_CONTENT_TYPES)
+
+
+class _Compressor:
+    """Incremental gzip or brotli compressor."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self._brotli = encoding == "br"
+        if self._brotli:
+            # brotli is untyped; results are wrapped in bytes() for the checker.
+            self._impl: Any = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._impl = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so the client can decode it immediately."""
+        if self._brotli:
+            return bytes(self._impl.process(data) + self._impl.flush())
+        return bytes(self._impl.compress(data) + self._impl.flush(zlib.Z_SYNC_FLUSH))
+
+    def finish(self, data: bytes = b"") -> bytes:
+        """Compress the final chunk and terminate the stream."""
+        if self._brotli:
+            return bytes(self._impl.process(data) + self._impl.finish())
+        return bytes(self._impl.compress(data) + self._impl.flush())
+
+
+class CompressionMiddleware:
+    """Compress HTTP responses according to the client's ``Accept-Encoding``."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Per-request ``send`` wrapper that decides on and applies compression."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Message | None = None
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.downstream(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if "content-encoding" in headers or not is_compressible(
+                headers.get("content-type", "")
+            ):
+                self.passthrough = True
+                await self.downstream(message)
+            else:
+                # Hold the start message until the first body chunk shows the size.
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.start_message is None:
+            # e.g. ``http.response.pathsend``: hand the response over untouched.
+            if self.start_message is not None and self.compressor is None:
+                self.passthrough = True
+                await self.downstream(self.start_message)
+            await self.downstream(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.compressor is None:
+            start = self.start_message
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.downstream(start)
+                await self.downstream(message)
+                return
+
+            self.compressor = _Compressor(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+                await self.downstream(start)
+            else:
+                body = self.compressor.finish(body)
+                headers["Content-Length"] = str(len(body))
+                await self.downstream(start)
+                await self.downstream({"type": "http.response.body", "body": body})
+                return
+
+        if more_body:
+            chunk = self.compressor.compress(body)
+            if chunk:
+                await self.downstream(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+        else:
+            await self.downstream(
+                {"type": "http.response.body", "body": self.compressor.finish(body)}
+            )
@@ -1,12 +1,16 @@
 """Request ID middleware for correlating log entries across a single request."""
 
+from __future__ import annotations
+
 import logging
 import uuid
 from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from starlette.datastructures import Headers, MutableHeaders
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 REQUEST_ID_CTX_VAR: ContextVar[str] = ContextVar("request_id", default="")
 
@@ -21,18 +25,34 @@ class RequestIdFilter(logging.Filter):
         return True
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+class RequestIdMiddleware:
     """ASGI middleware that assigns a request ID to each incoming request.
 
     - Uses the ``X-Request-ID`` header if present, otherwise generates a short UUID.
     - Stores the ID in a ``ContextVar`` so that ``RequestIdFilter`` can read it.
     - Echoes the ID back in the ``X-Request-ID`` response header.
+
+    Implemented as plain ASGI (not ``BaseHTTPMiddleware``) so that streaming
+    and SSE responses are passed through without an extra task per request.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        request_id = request.headers.get(HEADER_NAME, uuid.uuid4().hex[:8])
-        REQUEST_ID_CTX_VAR.set(request_id)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(HEADER_NAME) or uuid.uuid4().hex[:8]
+        token = REQUEST_ID_CTX_VAR.set(request_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[HEADER_NAME] = request_id
+            await send(message)
 
-        response = await call_next(request)
-        response.headers[HEADER_NAME] = request_id
-        return response
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            REQUEST_ID_CTX_VAR.reset(token)
@@ -0,0 +1,98 @@
+"""Server-Timing middleware: per-request DB, handler and serialization time.
+
+Each response gets a ``Server-Timing`` header (shown in the browser's
+network panel) such as::
+
+    Server-Timing: db;dur=12.4;desc="7 commands", serialize;dur=2.1, handler;dur=30.5, app;dur=45.0
+
+- ``db``: MongoDB command time (see ``qdash.api.lib.request_timing``)
+- named phases recorded with ``timed()``, e.g. ``serialize``
+- ``handler``: time until the response started, minus ``db`` and the named
+  phases (endpoint code, validation and FastAPI's own response
+  serialization); never below zero
+- ``app``: time until the response started
+
+When the response is complete, one structured log record with the same
+numbers, the full duration (including the streamed body) and the status is
+written to the ``qdash.api.timing`` logger.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from starlette.datastructures import MutableHeaders
+
+from qdash.api.lib.request_timing import REQUEST_TIMINGS_CTX_VAR, RequestTimings
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("qdash.api.timing")
+
+
+def format_server_timing(timings: RequestTimings, app_seconds: float) -> str:
+    """Render ``timings`` as a ``Server-Timing`` header value (durations in ms)."""
+    entries = [f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.db_commands} commands"']
+    phase_seconds = timings.db_seconds
+    for name, seconds in timings.phases.items():
+        entries.append(f"{name};dur={seconds * 1000:.1f}")
+        phase_seconds += seconds
+    handler_seconds = max(app_seconds - phase_seconds, 0.0)
+    entries.append(f"handler;dur={handler_seconds * 1000:.1f}")
+    entries.append(f"app;dur={app_seconds * 1000:.1f}")
+    return ", ".join(entries)
+
+
+class ServerTimingMiddleware:
+    """Collect per-request timings and report them as headers and logs."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = REQUEST_TIMINGS_CTX_VAR.set(timings)
+        status_code = 500
+        app_seconds: float | None = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code, app_seconds
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                app_seconds = time.perf_counter() - timings.started
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", format_server_timing(timings, app_seconds))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            REQUEST_TIMINGS_CTX_VAR.reset(token)
+            total_seconds = time.perf_counter() - timings.started
+            logger.info(
+                "%s %s %s %.1fms",
+                scope["method"],
+                scope["path"],
+                status_code,
+                total_seconds * 1000,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(total_seconds * 1000, 2),
+                    "app_ms": round((app_seconds or total_seconds) * 1000, 2),
+                    "db_ms": round(timings.db_seconds * 1000, 2),
+                    "db_commands": timings.db_commands,
+                    **{
+                        f"{name}_ms": round(seconds * 1000, 2)
+                        for name, seconds in timings.phases.items()
+                    },
+                },
+            )
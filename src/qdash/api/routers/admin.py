@@ -3,10 +3,11 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, UploadFile, status
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 
 from qdash.api.dependencies import get_admin_service
 from qdash.api.lib.auth import get_admin_user
+from qdash.api.lib.pagination import CURSOR_DESCRIPTION
 from qdash.api.schemas.admin import (
     AddMemberRequest,
     BulkUserImportResponse,
@@ -70,10 +71,11 @@ def list_all_users(
     service: Annotated[AdminService, Depends(get_admin_service)],
     skip: int = 0,
     limit: int = 100,
+    cursor: Annotated[str | None, Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> UserListResponse:
     """List all users in the system (admin only)."""
     logger.debug(f"Admin {admin.username} listing all users")
-    return service.list_users(skip=skip, limit=limit)
+    return service.list_users(skip=skip, limit=limit, cursor=cursor)
 
 
 @router.get(
@@ -163,10 +165,11 @@ def list_all_projects(
     service: Annotated[AdminService, Depends(get_admin_service)],
     skip: int = 0,
     limit: int = 100,
+    cursor: Annotated[str | None, Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> ProjectListResponse:
     """List all projects in the system (admin only)."""
     logger.debug(f"Admin {admin.username} listing all projects")
-    return service.list_projects(skip=skip, limit=limit)
+    return service.list_projects(skip=skip, limit=limit, cursor=cursor)
 
 
 @router.delete(
@@ -299,3 +299,26 @@ async def execute_agent_action(
         body=body,
         flow_service=flow_service,
     )
+
+
+@router.post(
+    "/{session_id}/actions/{action_id}/enqueue",
+    response_model=AgentActionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue an authorized agent action for the agent worker",
+    operation_id="enqueueAgentAction",
+)
+def enqueue_agent_action(
+    session_id: str,
+    action_id: str,
+    body: ExecuteAgentActionRequest,
+    ctx: Annotated[ProjectContext, Depends(get_project_context_editor)],
+    service: Annotated[AgentSessionService, Depends(get_agent_session_service)],
+) -> AgentActionResponse:
+    """Queue one authorized run-task action; the agent worker dispatches it."""
+    return service.enqueue_action(
+        project_id=ctx.project_id,
+        session_id=session_id,
+        action_id=action_id,
+        body=body,
+    )
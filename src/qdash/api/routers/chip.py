@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import datetime as dt  # noqa: TC003 - FastAPI resolves route annotations at runtime.
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from qdash.api.dependencies import (
     get_chip_service,
@@ -21,7 +21,10 @@ from qdash.api.lib.project import (
     get_project_context,
     get_project_context_editor,
 )
+from qdash.api.lib.response_cache import cached_json_response
 from qdash.api.schemas.chip import (
+    BulkMetricsRequest,
+    BulkMetricsResponse,
     ChipDatesResponse,
     ChipDeletionImpactResponse,
     ChipResponse,
@@ -52,6 +55,18 @@ router = APIRouter()
 
 logger = logging.getLogger(__name__)
 
+_CURSOR_DESCRIPTION = (
+    "Keyset pagination cursor. Send an empty value for the first page and "
+    "next_cursor for the following ones; offset is then ignored."
+)
+_FIELDS_DESCRIPTION = (
+    "Fields to return besides qid and chip_id: status, data, note, metric_notes "
+    "or data.<metric>. All fields by default."
+)
+_ESTIMATED_TOTAL_DESCRIPTION = (
+    "In keyset mode, reuse the total counted for the first page instead of counting again."
+)
+
 
 # =============================================================================
 # Chip CRUD
@@ -328,18 +343,22 @@ def list_chip_muxes(
 )
 def get_chip(
     chip_id: str,
+    request: Request,
     ctx: Annotated[ProjectContext, Depends(get_project_context)],
     chip_service: Annotated[ChipService, Depends(get_chip_service)],
-) -> ChipResponse:
+) -> Response:
     """Get chip details including metadata and counts.
 
     Returns chip metadata (size, topology, qubit/coupling counts).
     For detailed qubit/coupling data, use the dedicated endpoints.
+    The response carries an ETag; ``If-None-Match`` yields 304 when unchanged.
 
     Parameters
     ----------
     chip_id : str
         ID of the chip
+    request : Request
+        The incoming request (cache key and conditional headers)
     ctx : ProjectContext
         Project context with user and project information
     chip_service : ChipService
@@ -347,15 +366,19 @@ def get_chip(
 
     Returns
     -------
-    ChipResponse
-        Chip details
+    Response
+        Chip details as ChipResponse JSON
 
     """
     logger.debug(f"Fetching chip {chip_id}, project: {ctx.project_id}")
-    summary = chip_service.get_chip_summary(ctx.project_id, chip_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail=f"Chip {chip_id} not found")
-    return summary
+
+    def build() -> ChipResponse:
+        summary = chip_service.get_chip_summary(ctx.project_id, chip_id)
+        if summary is None:
+            raise HTTPException(status_code=404, detail=f"Chip {chip_id} not found")
+        return summary
+
+    return cached_json_response(request, project_id=ctx.project_id, chip_id=chip_id, build=build)
 
 
 @router.get(
@@ -438,21 +461,28 @@ def delete_chip_note(
 )
 def list_chip_qubits(
     chip_id: str,
+    request: Request,
     ctx: Annotated[ProjectContext, Depends(get_project_context)],
     chip_service: Annotated[ChipService, Depends(get_chip_service)],
     limit: Annotated[int, Query(le=256, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
     qids: Annotated[list[str] | None, Query()] = None,
-) -> ListQubitsResponse:
+    cursor: Annotated[str | None, Query(description=_CURSOR_DESCRIPTION)] = None,
+    fields: Annotated[list[str] | None, Query(description=_FIELDS_DESCRIPTION)] = None,
+    estimated_total: Annotated[bool, Query(description=_ESTIMATED_TOTAL_DESCRIPTION)] = False,
+) -> Response:
     """List qubits for a chip with pagination.
 
     Retrieves qubit data from the separate QubitDocument collection.
-    Supports filtering by specific qubit IDs.
+    Supports filtering by specific qubit IDs. The response carries an ETag;
+    ``If-None-Match`` yields 304 when unchanged.
 
     Parameters
     ----------
     chip_id : str
         ID of the chip
+    request : Request
+        The incoming request (cache key and conditional headers)
     ctx : ProjectContext
         Project context with user and project information
     chip_service : ChipService
@@ -463,22 +493,38 @@ def list_chip_qubits(
         Number of qubits to skip for pagination
     qids : list[str] | None
         Optional list of specific qubit IDs to fetch
+    cursor : str | None
+        Keyset cursor; ``""`` starts keyset paging, ``next_cursor`` continues it
+    fields : list[str] | None
+        Fields to return besides qid/chip_id (default: all)
+    estimated_total : bool
+        Reuse the total counted on the first keyset page
 
     Returns
     -------
-    ListQubitsResponse
-        List of qubits with pagination info
+    Response
+        List of qubits with pagination info as ListQubitsResponse JSON
 
     """
     logger.debug(f"Listing qubits for chip {chip_id}, project: {ctx.project_id}")
-    qubits, total = chip_service.list_qubits(
-        project_id=ctx.project_id,
-        chip_id=chip_id,
-        limit=limit,
-        offset=offset,
-        qids=qids,
-    )
-    return ListQubitsResponse(qubits=qubits, total=total, limit=limit, offset=offset)
+
+    def build() -> ListQubitsResponse | dict[str, Any]:
+        response = chip_service.list_qubits(
+            project_id=ctx.project_id,
+            chip_id=chip_id,
+            limit=limit,
+            offset=offset,
+            qids=qids,
+            cursor=cursor,
+            fields=fields,
+            estimated_total=estimated_total,
+        )
+        # Fields that were not requested are omitted, not filled with defaults.
+        if fields is not None:
+            return response.model_dump(mode="json", exclude_unset=True)
+        return response
+
+    return cached_json_response(request, project_id=ctx.project_id, chip_id=chip_id, build=build)
 
 
 @router.get(
@@ -584,19 +630,26 @@ def reanalyze_qubit_spectroscopy(
 )
 def list_chip_couplings(
     chip_id: str,
+    request: Request,
     ctx: Annotated[ProjectContext, Depends(get_project_context)],
     chip_service: Annotated[ChipService, Depends(get_chip_service)],
     limit: Annotated[int, Query(le=512, ge=1)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> ListCouplingsResponse:
+    cursor: Annotated[str | None, Query(description=_CURSOR_DESCRIPTION)] = None,
+    fields: Annotated[list[str] | None, Query(description=_FIELDS_DESCRIPTION)] = None,
+    estimated_total: Annotated[bool, Query(description=_ESTIMATED_TOTAL_DESCRIPTION)] = False,
+) -> Response:
     """List couplings for a chip with pagination.
 
     Retrieves coupling data from the separate CouplingDocument collection.
+    The response carries an ETag; ``If-None-Match`` yields 304 when unchanged.
 
     Parameters
     ----------
     chip_id : str
         ID of the chip
+    request : Request
+        The incoming request (cache key and conditional headers)
     ctx : ProjectContext
         Project context with user and project information
     chip_service : ChipService
@@ -605,21 +658,37 @@ def list_chip_couplings(
         Maximum number of couplings to return (default 100, max 512)
     offset : int
         Number of couplings to skip for pagination
+    cursor : str | None
+        Keyset cursor; ``""`` starts keyset paging, ``next_cursor`` continues it
+    fields : list[str] | None
+        Fields to return besides qid/chip_id (default: all)
+    estimated_total : bool
+        Reuse the total counted on the first keyset page
 
     Returns
     -------
-    ListCouplingsResponse
-        List of couplings with pagination info
+    Response
+        List of couplings with pagination info as ListCouplingsResponse JSON
 
     """
     logger.debug(f"Listing couplings for chip {chip_id}, project: {ctx.project_id}")
-    couplings, total = chip_service.list_couplings(
-        project_id=ctx.project_id,
-        chip_id=chip_id,
-        limit=limit,
-        offset=offset,
-    )
-    return ListCouplingsResponse(couplings=couplings, total=total, limit=limit, offset=offset)
+
+    def build() -> ListCouplingsResponse | dict[str, Any]:
+        response = chip_service.list_couplings(
+            project_id=ctx.project_id,
+            chip_id=chip_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            fields=fields,
+            estimated_total=estimated_total,
+        )
+        # Fields that were not requested are omitted, not filled with defaults.
+        if fields is not None:
+            return response.model_dump(mode="json", exclude_unset=True)
+        return response
+
+    return cached_json_response(request, project_id=ctx.project_id, chip_id=chip_id, build=build)
 
 
 @router.get(
@@ -744,3 +813,43 @@ def get_chip_metric_heatmap(
     if heatmap is None:
         raise HTTPException(status_code=404, detail=f"Chip {chip_id} not found")
     return heatmap
+
+
+@router.post(
+    "/chips/metrics/bulk",
+    response_model=BulkMetricsResponse,
+    summary="Get selected metrics for several chips",
+    operation_id="getBulkChipMetrics",
+)
+def get_bulk_chip_metrics(
+    request: BulkMetricsRequest,
+    ctx: Annotated[ProjectContext, Depends(get_project_context)],
+    chip_service: Annotated[ChipService, Depends(get_chip_service)],
+) -> BulkMetricsResponse:
+    """Get selected metrics for many chips and qubits in one request.
+
+    Replaces one qubit-list request per chip: only the requested metric
+    values are read, in a single aggregation, and returned as a matrix with
+    one row per chip/qid and one column per field. Values are scaled to the
+    display units configured in metrics.yaml.
+
+    Parameters
+    ----------
+    request : BulkMetricsRequest
+        Chips, optional qids, metric fields and target (qubit or coupling)
+    ctx : ProjectContext
+        Project context with user and project information
+    chip_service : ChipService
+        Service for chip operations
+
+    Returns
+    -------
+    BulkMetricsResponse
+        Metric matrix with per-column units
+
+    """
+    logger.debug(
+        f"Fetching {len(request.fields)} metrics for chips {request.chip_ids}, "
+        f"project: {ctx.project_id}"
+    )
+    return chip_service.get_bulk_metrics(ctx.project_id, request)
@@ -5,9 +5,15 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
 
 from qdash.api.dependencies import get_device_topology_service
 from qdash.api.lib.project import ProjectContext, get_project_context
+from qdash.api.lib.topology_plot import (
+    TopologyPlotStyle,
+    get_topology_plot_cache,
+    topology_plot_key,
+)
 from qdash.api.schemas.device_topology import (
     Device,
     DeviceTopologyRequest,
@@ -72,12 +78,16 @@ def get_device_topology(
     description="Get the device topology as a PNG image.",
     operation_id="getDeviceTopologyPlot",
 )
-def get_device_topology_plot(
+async def get_device_topology_plot(
     ctx: Annotated[ProjectContext, Depends(get_project_context)],
     device: Device,
 ) -> Response:
     """Get the device topology as a PNG image.
 
+    Images are cached by the drawn content. Cache hits are served from the
+    event loop; a miss is rendered in the threadpool so it does not block
+    other requests.
+
     Args:
     ----
         ctx: Project context with user and project information
@@ -89,5 +99,11 @@ def get_device_topology_plot(
 
     """
     logger.info(f"project: {ctx.project_id}, user: {ctx.user.username}")
-    plot_bytes = DeviceTopologyService.generate_plot(device.model_dump())
+    data = device.model_dump()
+    style = TopologyPlotStyle()
+    key = topology_plot_key(data, style)
+    cache = get_topology_plot_cache()
+    plot_bytes = cache.get_cached(key)
+    if plot_bytes is None:
+        plot_bytes = await run_in_threadpool(cache.get_or_render, data, style, key)
     return Response(content=plot_bytes, media_type="image/png")
@@ -14,6 +14,7 @@ from fastapi.responses import FileResponse
 from starlette.exceptions import HTTPException
 
 from qdash.api.dependencies import get_execution_service, get_flow_service
+from qdash.api.lib.pagination import CURSOR_DESCRIPTION
 from qdash.api.lib.project import (
     ProjectContext,
     get_project_context,
@@ -88,8 +89,10 @@ def get_execution_lock_status(
 ) -> ExecutionLockStatusResponse:
     """Fetch the current status of the execution lock.
 
-    The execution lock prevents concurrent calibration workflows from running
-    simultaneously. This endpoint checks whether a lock is currently held.
+    Calibrations lease a chip, or a set of its qubits, while they run. This
+    endpoint returns the active leases, so a client can block a new
+    calibration only when the lease it would request overlaps one of them,
+    and the legacy project-wide lock flag.
 
     Parameters
     ----------
@@ -101,7 +104,7 @@ def get_execution_lock_status(
     Returns
     -------
     ExecutionLockStatusResponse
-        Response containing lock status (True if locked, False if available)
+        Response containing the legacy lock flag and the active leases
 
     """
     return execution_service.get_lock_status(ctx.project_id)
@@ -119,6 +122,7 @@ def list_executions(
     chip_id: Annotated[str, Query(description="Chip ID to filter executions")],
     skip: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
     limit: Annotated[int, Query(ge=1, le=100, description="Number of items to return")] = 20,
+    cursor: Annotated[str | None, Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> ListExecutionsResponse:
     """List executions for a given chip with pagination.
 
@@ -134,11 +138,13 @@ def list_executions(
         Number of items to skip (default: 0)
     limit : int
         Number of items to return (default: 20, max: 100)
+    cursor : str | None
+        Keyset cursor; deep pages cost the same as the first one
 
     Returns
     -------
     ListExecutionsResponse
-        Wrapped list of executions for the chip
+        Wrapped list of executions for the chip, with ``next_cursor`` in keyset mode
 
     """
     logger.debug(
@@ -148,16 +154,12 @@ def list_executions(
         skip,
         limit,
     )
-    executions = execution_service.list_executions(
+    return execution_service.list_executions(
         project_id=ctx.project_id,
         chip_id=chip_id,
         skip=skip,
         limit=limit,
-    )
-    return ListExecutionsResponse(
-        executions=executions,
-        skip=skip,
-        limit=limit,
+        cursor=cursor,
     )
 
 
@@ -5,16 +5,20 @@ from __future__ import annotations
 import logging
 from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi.responses import StreamingResponse
 
 from qdash.api.dependencies import get_metrics_service
+from qdash.api.lib.columnar import COLUMNAR_RESPONSES, SeriesFormat, series_response
 from qdash.api.lib.project import (
     ProjectContext,
     get_project_context,
 )
+from qdash.api.lib.response_cache import cached_json_response
 from qdash.api.schemas.metrics import (
     ChipMetricsResponse,
+    ChipPhaseTimingsResponse,
+    MetricsPdfJobResponse,
     QubitMetricHistoryResponse,
 )
 from qdash.api.services.metrics_service import MetricsService
@@ -49,6 +53,7 @@ async def get_metrics_config() -> dict[str, Any]:
 )
 async def get_chip_metrics(
     chip_id: str,
+    request: Request,
     ctx: Annotated[ProjectContext, Depends(get_project_context)],
     metrics_service: Annotated[MetricsService, Depends(get_metrics_service)],
     within_hours: Annotated[
@@ -76,7 +81,7 @@ async def get_chip_metrics(
         str | None,
         Query(description="Inclusive absolute upper bound on task start time (ISO8601 or date)."),
     ] = None,
-) -> ChipMetricsResponse:
+) -> Response:
     """Get chip calibration metrics for visualization.
 
     This endpoint returns calibration metrics for a specific chip from the database, including:
@@ -84,9 +89,12 @@ async def get_chip_metrics(
     - Gate fidelities (single-qubit and two-qubit)
     - Readout fidelities
 
+    The response carries an ETag; ``If-None-Match`` yields 304 when unchanged.
+
     Args:
     ----
         chip_id: The chip identifier
+        request: The incoming request (cache key and conditional headers)
         ctx: Project context with user and project information
         metrics_service: Injected metrics service
         within_hours: Optional filter to only include data from last N hours (e.g., 24)
@@ -96,15 +104,71 @@ async def get_chip_metrics(
 
     Returns:
     -------
-        ChipMetricsResponse with all metrics data
+        ChipMetricsResponse JSON with all metrics data
+
+    """
+    return cached_json_response(
+        request,
+        project_id=ctx.project_id,
+        chip_id=chip_id,
+        scope=ctx.user.username,
+        build=lambda: metrics_service.get_chip_metrics(
+            chip_id=chip_id,
+            project_id=ctx.project_id,
+            username=ctx.user.username,
+            within_hours=within_hours,
+            selection_mode=selection_mode,
+            start_at=start_at,
+            end_at=end_at,
+        ),
+    )
+
+
+@router.get(
+    "/chips/{chip_id}/phase-timings",
+    response_model=ChipPhaseTimingsResponse,
+    operation_id="getChipPhaseTimings",
+)
+async def get_chip_phase_timings(
+    chip_id: str,
+    ctx: Annotated[ProjectContext, Depends(get_project_context)],
+    metrics_service: Annotated[MetricsService, Depends(get_metrics_service)],
+    within_hours: Annotated[
+        int | None, Query(description="Filter to tasks started within N hours", ge=1)
+    ] = 168,
+    start_at: Annotated[
+        str | None,
+        Query(description="Inclusive absolute lower bound on task start time (ISO8601 or date)."),
+    ] = None,
+    end_at: Annotated[
+        str | None,
+        Query(description="Inclusive absolute upper bound on task start time (ISO8601 or date)."),
+    ] = None,
+) -> ChipPhaseTimingsResponse:
+    """Get where calibration time went, per task phase.
+
+    Aggregates the phase timings (preprocess, run, postprocess, artifacts,
+    provenance, history, ai_review) recorded on task results of the chip,
+    per task name and over all tasks.
+
+    Args:
+    ----
+        chip_id: The chip identifier
+        ctx: Project context with user and project information
+        metrics_service: Injected metrics service
+        within_hours: Only include tasks started within the last N hours (default 1 week)
+        start_at: Optional absolute lower bound (ISO8601 or date)
+        end_at: Optional absolute upper bound (ISO8601 or date)
+
+    Returns:
+    -------
+        ChipPhaseTimingsResponse with per-task and overall phase statistics
 
     """
-    return metrics_service.get_chip_metrics(
+    return metrics_service.get_phase_timings(
         chip_id=chip_id,
         project_id=ctx.project_id,
-        username=ctx.user.username,
         within_hours=within_hours,
-        selection_mode=selection_mode,
         start_at=start_at,
         end_at=end_at,
     )
@@ -114,6 +178,7 @@ async def get_chip_metrics(
     "/chips/{chip_id}/qubits/{qid}/history",
     response_model=QubitMetricHistoryResponse,
     operation_id="getQubitMetricHistory",
+    responses=COLUMNAR_RESPONSES,
 )
 async def get_qubit_metric_history(
     chip_id: str,
@@ -125,7 +190,11 @@ async def get_qubit_metric_history(
         int | None, Query(description="Max number of history items (None for unlimited)", ge=1)
     ] = None,
     within_days: Annotated[int | None, Query(description="Filter to last N days", ge=1)] = 30,
-) -> QubitMetricHistoryResponse:
+    series_format: Annotated[
+        SeriesFormat,
+        Query(alias="format", description="Response representation: rows, columnar or arrow"),
+    ] = SeriesFormat.ROWS,
+) -> QubitMetricHistoryResponse | Response:
     """Get historical metric data for a specific qubit with task_id for figure display.
 
     This endpoint queries TaskResultHistoryDocument to retrieve calibration
@@ -141,12 +210,32 @@ async def get_qubit_metric_history(
         metric: Metric name to retrieve history for
         limit: Maximum number of history items (None for unlimited within time range)
         within_days: Optional filter to only include data from last N days
+        series_format: Query parameter ``format``; ``columnar`` returns
+            ``{chip_id, metric_name, username, data: {id: {t, value, error,
+            task_id, execution_id, excluded}}}``, ``arrow`` an Arrow IPC stream
 
     Returns:
     -------
         QubitMetricHistoryResponse with historical metric data and task_ids
 
     """
+    if series_format != SeriesFormat.ROWS:
+        series = metrics_service.get_metric_history_columnar(
+            chip_id=chip_id,
+            qid=qid,
+            project_id=ctx.project_id,
+            metric=metric,
+            entity_type="qubit",
+            limit=limit,
+            within_days=within_days,
+        )
+        return series_response(
+            series,
+            series_format,
+            chip_id=chip_id,
+            metric_name=metric,
+            username=ctx.user.username,
+        )
     return metrics_service.get_metric_history(
         chip_id=chip_id,
         qid=qid,
@@ -163,6 +252,7 @@ async def get_qubit_metric_history(
     "/chips/{chip_id}/couplings/{coupling_id}/history",
     response_model=QubitMetricHistoryResponse,
     operation_id="getCouplingMetricHistory",
+    responses=COLUMNAR_RESPONSES,
 )
 async def get_coupling_metric_history(
     chip_id: str,
@@ -176,7 +266,11 @@ async def get_coupling_metric_history(
         int | None, Query(description="Max number of history items (None for unlimited)", ge=1)
     ] = None,
     within_days: Annotated[int | None, Query(description="Filter to last N days", ge=1)] = 30,
-) -> QubitMetricHistoryResponse:
+    series_format: Annotated[
+        SeriesFormat,
+        Query(alias="format", description="Response representation: rows, columnar or arrow"),
+    ] = SeriesFormat.ROWS,
+) -> QubitMetricHistoryResponse | Response:
     """Get historical metric data for a specific coupling with task_id for figure display.
 
     This endpoint queries TaskResultHistoryDocument to retrieve calibration
@@ -192,6 +286,9 @@ async def get_coupling_metric_history(
         metric: Metric name to retrieve history for
         limit: Maximum number of history items (None for unlimited within time range)
         within_days: Optional filter to only include data from last N days
+        series_format: Query parameter ``format``; ``columnar`` returns
+            ``{chip_id, metric_name, username, data: {id: {t, value, error,
+            task_id, execution_id, excluded}}}``, ``arrow`` an Arrow IPC stream
 
     Returns:
     -------
@@ -199,6 +296,23 @@ async def get_coupling_metric_history(
         (Note: qid field contains coupling_id for coupling metrics)
 
     """
+    if series_format != SeriesFormat.ROWS:
+        series = metrics_service.get_metric_history_columnar(
+            chip_id=chip_id,
+            qid=coupling_id,
+            project_id=ctx.project_id,
+            metric=metric,
+            entity_type="coupling",
+            limit=limit,
+            within_days=within_days,
+        )
+        return series_response(
+            series,
+            series_format,
+            chip_id=chip_id,
+            metric_name=metric,
+            username=ctx.user.username,
+        )
     return metrics_service.get_metric_history(
         chip_id=chip_id,
         qid=coupling_id,
@@ -272,3 +386,83 @@ async def download_metrics_pdf(
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
+
+
+@router.post(
+    "/chips/{chip_id}/metrics/pdf/jobs",
+    response_model=MetricsPdfJobResponse,
+    summary="Start a background metrics PDF report",
+    operation_id="createMetricsPdfJob",
+)
+async def create_metrics_pdf_job(
+    chip_id: str,
+    ctx: Annotated[ProjectContext, Depends(get_project_context)],
+    metrics_service: Annotated[MetricsService, Depends(get_metrics_service)],
+    within_hours: Annotated[int | None, Query(description="Filter to data within N hours")] = None,
+    selection_mode: Annotated[
+        Literal["latest", "best", "average"],
+        Query(description="Selection mode: 'latest', 'best', or 'average'"),
+    ] = "latest",
+    start_at: Annotated[
+        str | None,
+        Query(description="Inclusive absolute lower bound on task start time (ISO8601 or date)."),
+    ] = None,
+    end_at: Annotated[
+        str | None,
+        Query(description="Inclusive absolute upper bound on task start time (ISO8601 or date)."),
+    ] = None,
+) -> MetricsPdfJobResponse:
+    """Generate a metrics PDF report in the background.
+
+    Returns immediately with a job id. Poll the job until its status is
+    ``completed`` and then download the report from ``download_url``.
+    """
+    return metrics_service.submit_metrics_pdf_job(
+        chip_id=chip_id,
+        project_id=ctx.project_id,
+        username=ctx.user.username,
+        within_hours=within_hours,
+        selection_mode=selection_mode,
+        start_at=start_at,
+        end_at=end_at,
+    )
+
+
+@router.get(
+    "/pdf/jobs/{job_id}",
+    response_model=MetricsPdfJobResponse,
+    summary="Get a background metrics PDF report job",
+    operation_id="getMetricsPdfJob",
+)
+async def get_metrics_pdf_job(
+    job_id: str,
+    ctx: Annotated[ProjectContext, Depends(get_project_context)],
+    metrics_service: Annotated[MetricsService, Depends(get_metrics_service)],
+) -> MetricsPdfJobResponse:
+    """Get the status of a background metrics PDF report job."""
+    return metrics_service.get_metrics_pdf_job(ctx.project_id, job_id)
+
+
+@router.get(
+    "/pdf/jobs/{job_id}/download",
+    summary="Download a background metrics PDF report",
+    operation_id="downloadMetricsPdfJob",
+    responses={
+        200: {
+            "content": {"application/pdf": {}},
+            "description": "PDF report file",
+        }
+    },
+)
+async def download_metrics_pdf_job(
+    job_id: str,
+    ctx: Annotated[ProjectContext, Depends(get_project_context)],
+    metrics_service: Annotated[MetricsService, Depends(get_metrics_service)],
+) -> StreamingResponse:
+    """Download the PDF produced by a completed background report job."""
+    pdf_buffer, filename = metrics_service.get_metrics_pdf_job_file(ctx.project_id, job_id)
+    return StreamingResponse(
+        pdf_buffer,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
@@ -2,10 +2,14 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from qdash.api.dependencies import get_notification_service
 from qdash.api.lib.auth import get_current_active_user
+from qdash.api.lib.notification_stream import unread_count_events
+from qdash.api.lib.pagination import CURSOR_DESCRIPTION
 from qdash.api.lib.project import get_project_id_from_header
 from qdash.api.schemas.auth import User
 from qdash.api.schemas.notification import (
@@ -31,6 +35,7 @@ def list_notifications(
     unread_only: Annotated[bool, Query(description="Only return unread notifications")] = False,
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: Annotated[str | None, Query(description=CURSOR_DESCRIPTION)] = None,
 ) -> ListNotificationsResponse:
     """List notifications addressed to the current user."""
     return service.list_notifications(
@@ -39,6 +44,7 @@ def list_notifications(
         unread_only=unread_only,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
 
 
@@ -57,6 +63,29 @@ def get_unread_count(
     return service.unread_count(username=current_user.username, project_id=project_id)
 
 
+@router.get("/unread-count/stream", include_in_schema=False)
+async def stream_unread_count(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    service: Annotated[NotificationService, Depends(get_notification_service)],
+    project_id: Annotated[str | None, Depends(get_project_id_from_header)] = None,
+) -> StreamingResponse:
+    """SSE stream of the unread count; replaces polling ``/unread-count``.
+
+    Sends an ``unread_count`` event on connect and whenever the count changes.
+    """
+    user_id = await run_in_threadpool(service.resolve_recipient_id, current_user.username)
+    return StreamingResponse(
+        unread_count_events(
+            user_id,
+            lambda: service.unread_count_for_recipient(user_id=user_id, project_id=project_id),
+            request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.patch(
     "/{notification_id}/read",
     summary="Mark a notification as read",
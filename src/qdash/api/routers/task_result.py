@@ -7,9 +7,10 @@ from datetime import datetime  # noqa: TC003
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from qdash.api.dependencies import get_flow_service, get_task_result_service
+from qdash.api.lib.columnar import COLUMNAR_RESPONSES, SeriesFormat, series_response
 from qdash.api.lib.project import (
     ProjectContext,
     get_project_context,
@@ -424,6 +425,7 @@ def get_coupling_task_history(
     summary="Get timeseries task results by tag and parameter",
     response_model=TimeSeriesData,
     operation_id="getTimeseriesTaskResults",
+    responses=COLUMNAR_RESPONSES,
 )
 def get_timeseries_task_results(
     chip_id: Annotated[str, Query(description="Chip ID")],
@@ -434,7 +436,11 @@ def get_timeseries_task_results(
     service: Annotated[TaskResultService, Depends(get_task_result_service)],
     tag: Annotated[str | None, Query(description="Tag to filter by")] = None,
     qid: Annotated[str | None, Query(description="Optional qubit ID to filter by")] = None,
-) -> TimeSeriesData:
+    series_format: Annotated[
+        SeriesFormat,
+        Query(alias="format", description="Response representation: rows, columnar or arrow"),
+    ] = SeriesFormat.ROWS,
+) -> TimeSeriesData | Response:
     """Get timeseries task results filtered by tag and parameter.
 
     Retrieves time series data for calibration parameters, optionally filtered
@@ -458,10 +464,15 @@ def get_timeseries_task_results(
         Injected task result service
     qid : str | None
         Optional qubit ID to filter results to a specific qubit
+    series_format : SeriesFormat
+        Query parameter ``format``. ``rows`` (default) returns ``TimeSeriesData``; ``columnar`` returns
+        ``{"data": {qid: {"t", "value", "error", "task_id", "unit",
+        "description"}}}`` with one array per field; ``arrow`` returns the
+        columns as an Arrow IPC stream
 
     Returns
     -------
-    TimeSeriesData
+    TimeSeriesData | Response
         Time series data keyed by qubit ID, each containing a list of
         parameter values with timestamps
 
@@ -473,6 +484,11 @@ def get_timeseries_task_results(
         parameter,
         qid,
     )
+    if series_format != SeriesFormat.ROWS:
+        series = service.get_timeseries_columnar(
+            chip_id, tag, parameter, ctx.project_id, qid, start_at, end_at
+        )
+        return series_response(series, series_format)
     return service.get_timeseries(chip_id, tag, parameter, ctx.project_id, qid, start_at, end_at)
 
 
@@ -701,6 +717,7 @@ def set_task_result_excluded(
     from starlette.exceptions import HTTPException
 
     from qdash.common.utils.datetime import now
+    from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
     from qdash.dbmodel.task_result_history import TaskResultHistoryDocument
 
     doc = TaskResultHistoryDocument.find_one(
@@ -719,6 +736,7 @@ def set_task_result_excluded(
     doc.excluded_by = ctx.user.username
     doc.excluded_at = now()
     doc.save()
+    ChipDataVersionDocument.bump(doc.project_id, doc.chip_id)
 
     return TaskResultExcludeResponse(
         task_id=doc.task_id,
@@ -39,6 +39,7 @@ class ProjectListResponse(BaseModel):
 
     projects: list[ProjectListItem]
     total: int
+    next_cursor: str | None = None
 
 
 class UserListResponse(BaseModel):
@@ -46,6 +47,7 @@ class UserListResponse(BaseModel):
 
     users: list[UserListItem]
     total: int
+    next_cursor: str | None = None
 
 
 class UpdateUserRequest(BaseModel):
@@ -164,12 +164,19 @@ class QubitResponse(BaseModel):
 
 
 class ListQubitsResponse(BaseModel):
-    """Response model for listing qubits with pagination."""
+    """Response model for listing qubits with pagination.
+
+    ``next_cursor`` is set only in keyset mode (when a ``cursor`` was sent)
+    and is None on the last page. ``total_estimated`` is True when ``total``
+    was carried over from the first page instead of being counted again.
+    """
 
     qubits: list[QubitResponse]
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
 
 class CouplingResponse(BaseModel):
@@ -184,12 +191,19 @@ class CouplingResponse(BaseModel):
 
 
 class ListCouplingsResponse(BaseModel):
-    """Response model for listing couplings with pagination."""
+    """Response model for listing couplings with pagination.
+
+    ``next_cursor`` is set only in keyset mode (when a ``cursor`` was sent)
+    and is None on the last page. ``total_estimated`` is True when ``total``
+    was carried over from the first page instead of being counted again.
+    """
 
     couplings: list[CouplingResponse]
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
 
 class MetricHeatmapResponse(BaseModel):
@@ -205,6 +219,41 @@ class MetricHeatmapResponse(BaseModel):
     unit: str | None = None
 
 
+class BulkMetricsRequest(BaseModel):
+    """Body for reading selected metrics of many chips and qubits at once."""
+
+    chip_ids: list[str] = Field(min_length=1, max_length=32)
+    fields: list[str] = Field(
+        min_length=1,
+        max_length=64,
+        description="Metric names such as t1 or x90_gate_fidelity (data.<metric> is accepted)",
+    )
+    qids: list[str] | None = Field(
+        default=None, description="Qubit or coupling IDs to include; all when omitted"
+    )
+    target: Literal["qubit", "coupling"] = "qubit"
+
+
+class BulkMetricsRow(BaseModel):
+    """Metric values of one qubit or coupling, aligned to ``BulkMetricsResponse.fields``."""
+
+    chip_id: str
+    qid: str
+    values: list[float | None]
+
+
+class BulkMetricsResponse(BaseModel):
+    """Compact metric matrix: one row per chip/qid and one column per field.
+
+    Values are scaled to the display units of metrics.yaml; ``units[i]`` is
+    the unit of column ``fields[i]``. Missing metrics are None.
+    """
+
+    fields: list[str]
+    units: list[str | None]
+    rows: list[BulkMetricsRow]
+
+
 class MetricsSummaryResponse(BaseModel):
     """Response model for aggregated metrics summary.
 
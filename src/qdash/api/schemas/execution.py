@@ -8,10 +8,82 @@ from pydantic import BaseModel, field_serializer, field_validator
 from qdash.common.utils.datetime import format_elapsed_time, parse_elapsed_time
 
 
+class ExecutionLeaseStatus(BaseModel):
+    """An active hardware lease held by a running calibration.
+
+    Attributes
+    ----------
+        chip_id (str): Leased chip.
+        qids (list[str] | None): Leased qubits, or None for the whole chip.
+        owner (str): Holder of the lease, usually the execution ID.
+        expires_at (datetime): When the lease lapses unless renewed.
+
+    """
+
+    chip_id: str
+    qids: list[str] | None = None
+    owner: str
+    expires_at: datetime
+
+
 class ExecutionLockStatusResponse(BaseModel):
-    """Response model for the fetch_execution_lock_status endpoint."""
+    """Response model for the fetch_execution_lock_status endpoint.
+
+    ``lock`` is the legacy project-wide lock. Calibrations that lease their
+    hardware are listed in ``leases`` instead; a new calibration is only
+    blocked by a lease on the same chip that covers the whole chip or shares
+    a qubit with it.
+    """
 
     lock: bool
+    leases: list[ExecutionLeaseStatus] = []
+
+
+class PhaseTimingStat(BaseModel):
+    """Wall-clock time spent in one task phase, summed over tasks."""
+
+    phase: str
+    count: int
+    total_seconds: float
+    mean_seconds: float
+    max_seconds: float
+
+
+class ExecutionProgress(BaseModel):
+    """Predicted progress of a running execution.
+
+    Remaining time is predicted from the execution plan and the task
+    durations recorded on the chip; the low/high bounds and the earliest /
+    latest completion times span the ``confidence`` interval. They are None
+    until the chip has any recorded task duration.
+
+    Attributes
+    ----------
+        completed_tasks (int): Planned task runs finished or passed over.
+        total_tasks (int): Planned task runs.
+        fraction (float | None): ``completed_tasks / total_tasks``.
+        remaining_seconds (float | None): Predicted remaining seconds.
+        remaining_seconds_low (float | None): Lower bound of the remaining seconds.
+        remaining_seconds_high (float | None): Upper bound of the remaining seconds.
+        eta (datetime | None): Predicted completion time.
+        eta_earliest (datetime | None): Earliest completion time within the interval.
+        eta_latest (datetime | None): Latest completion time within the interval.
+        confidence (float): Coverage of the interval, e.g. 0.9.
+        history_samples (int): Recorded runs the remaining-time prediction is based on.
+
+    """
+
+    completed_tasks: int
+    total_tasks: int
+    fraction: float | None = None
+    remaining_seconds: float | None = None
+    remaining_seconds_low: float | None = None
+    remaining_seconds_high: float | None = None
+    eta: datetime | None = None
+    eta_earliest: datetime | None = None
+    eta_latest: datetime | None = None
+    confidence: float
+    history_samples: int = 0
 
 
 class Task(BaseModel):
@@ -38,6 +110,7 @@ class Task(BaseModel):
     elapsed_time: timedelta | None = None
     task_type: str | None = None
     default_view: bool = True
+    phase_timings: dict[str, float] = {}
 
     @field_validator("elapsed_time", mode="before")
     @classmethod
@@ -55,6 +128,10 @@ class Task(BaseModel):
 class ExecutionResponseSummary(BaseModel):
     """ExecutionResponseSummary is a Pydantic model that represents the summary of an execution response.
 
+    It is the row model of execution listings and carries only the columns
+    an execution table shows; notes, messages and task results are served by
+    the execution detail endpoint.
+
     Attributes
     ----------
         name (str): The name of the execution.
@@ -66,7 +143,7 @@ class ExecutionResponseSummary(BaseModel):
         user_id (str | None): Internal ID of the user who started the execution.
         username (str): Username snapshot of the user who started the execution.
         tags (list[str]): Tags associated with the execution.
-        note (dict): Notes for the execution.
+        progress (ExecutionProgress | None): Predicted progress while running.
 
     """
 
@@ -79,7 +156,7 @@ class ExecutionResponseSummary(BaseModel):
     end_at: datetime | None = None
     elapsed_time: timedelta | None = None
     tags: list[str]
-    note: dict[str, Any]
+    progress: ExecutionProgress | None = None
 
     @field_validator("elapsed_time", mode="before")
     @classmethod
@@ -110,6 +187,8 @@ class ExecutionResponseDetail(BaseModel):
         note (dict): Notes for the execution.
         tags (list[str]): Tags associated with the execution.
         chip_id (str): The chip ID for the execution.
+        phase_timings (list[PhaseTimingStat]): Task phase timings summed over all tasks.
+        progress (ExecutionProgress | None): Predicted progress while running.
 
     """
 
@@ -125,6 +204,8 @@ class ExecutionResponseDetail(BaseModel):
     note: dict[str, Any]
     tags: list[str] = []
     chip_id: str = ""
+    phase_timings: list[PhaseTimingStat] = []
+    progress: ExecutionProgress | None = None
 
     @field_validator("elapsed_time", mode="before")
     @classmethod
@@ -164,3 +245,4 @@ class ListExecutionsResponse(BaseModel):
     total: int | None = None
     skip: int | None = None
     limit: int | None = None
+    next_cursor: str | None = None
@@ -2,10 +2,12 @@
 
 import math
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, field_validator
 
+from qdash.api.schemas.execution import PhaseTimingStat
+
 
 class MetricValue(BaseModel):
     """Single metric value with metadata."""
@@ -63,3 +65,34 @@ class QubitMetricHistoryResponse(BaseModel):
     metric_name: str
     username: str
     history: list[MetricHistoryItem]
+
+
+class MetricsPdfJobResponse(BaseModel):
+    """Status of a background metrics PDF report job."""
+
+    job_id: str
+    chip_id: str
+    status: Literal["pending", "running", "completed", "failed"]
+    created_at: datetime
+    completed_at: datetime | None = None
+    filename: str | None = None
+    download_url: str | None = None
+    error: str | None = None
+
+
+class TaskPhaseTimings(BaseModel):
+    """Phase timings of one task name, aggregated over its runs."""
+
+    name: str
+    phases: list[PhaseTimingStat]
+
+
+class ChipPhaseTimingsResponse(BaseModel):
+    """Task phase timings of a chip, aggregated per task name and overall."""
+
+    chip_id: str
+    within_hours: int | None = None
+    start_at: datetime | None = None
+    end_at: datetime | None = None
+    phases: list[PhaseTimingStat]
+    tasks: list[TaskPhaseTimings]
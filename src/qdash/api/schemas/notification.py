@@ -32,6 +32,7 @@ class ListNotificationsResponse(BaseModel):
     unread_count: int
     skip: int
     limit: int
+    next_cursor: str | None = None
 
 
 class UnreadNotificationCountResponse(BaseModel):
@@ -9,8 +9,10 @@ from io import StringIO
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException, status
+from pymongo import ASCENDING
 
 from qdash.api.lib.auth import get_password_hash
+from qdash.api.lib.pagination import aggregate_page
 from qdash.api.schemas.admin import (
     BulkUserImportResponse,
     BulkUserImportResult,
@@ -41,6 +43,7 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from qdash.datamodel.project import ProjectRole
+    from qdash.repository.pagination import SortKey
 
 
 MAX_BULK_IMPORT_ROWS = 500
@@ -52,6 +55,11 @@ SUPPORTED_BULK_IMPORT_COLUMNS = {
     "system_role",
 }
 
+# Both listings page on a unique indexed key, so keyset cursors never skip
+# or repeat a row.
+_USER_SORT: SortKey = [("username", ASCENDING)]
+_PROJECT_SORT: SortKey = [("project_id", ASCENDING)]
+
 
 class AdminService:
     """Service for admin user and project management operations."""
@@ -241,33 +249,63 @@ class AdminService:
             total=len(results),
         )
 
-    def list_users(self, skip: int = 0, limit: int = 100) -> UserListResponse:
-        """List all users with project mapping."""
-        total = UserDocument.find_all().count()
-        users = list(UserDocument.find_all().skip(skip).limit(limit).run())
-
-        usernames = [u.username for u in users]
-        projects = list(ProjectDocument.find({"owner_username": {"$in": usernames}}).run())
-        owner_project_map = {p.owner_username: p.project_id for p in projects}
-
-        user_list = []
-        for u in users:
-            project_id = u.default_project_id or owner_project_map.get(u.username)
-            user_list.append(
-                UserListItem(
-                    user_id=u.user_id,
-                    username=u.username,
-                    display_name=u.display_name,
-                    organization=u.organization,
-                    avatar_key=u.avatar_key,
-                    disabled=u.disabled,
-                    system_role=u.system_role,
-                    default_project_id=project_id,
-                    must_change_password=u.must_change_password,
-                )
-            )
+    def list_users(
+        self, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> UserListResponse:
+        """List users ordered by username, with their default project.
+
+        One aggregation serves the page: owned projects are joined with
+        ``$lookup`` on the ``owner_username`` index. Pass ``cursor=""`` to
+        start keyset paging; ``skip`` is then ignored.
+        """
+        collection = UserDocument.get_motor_collection()
+        page = aggregate_page(
+            collection,
+            {},
+            scope="admin-users",
+            sort=_USER_SORT,
+            stages=[
+                {
+                    "$lookup": {
+                        "from": ProjectDocument.Settings.name,
+                        "localField": "username",
+                        "foreignField": "owner_username",
+                        "as": "owned_projects",
+                    }
+                },
+                {
+                    "$addFields": {
+                        "owned_project_id": {"$arrayElemAt": ["$owned_projects.project_id", 0]}
+                    }
+                },
+                {
+                    "$project": {
+                        "_id": 0,
+                        "owned_projects": 0,
+                        "hashed_password": 0,
+                        "access_token": 0,
+                    }
+                },
+            ],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=lambda: collection.count_documents({}),
+        )
 
-        return UserListResponse(users=user_list, total=total)
+        user_list = [
+            UserListItem.model_validate(
+                {
+                    **row,
+                    "default_project_id": row.get("default_project_id")
+                    or row.get("owned_project_id"),
+                }
+            )
+            for row in page.items
+        ]
+        return UserListResponse(
+            users=user_list, total=page.total or 0, next_cursor=page.next_cursor
+        )
 
     def get_user_details(self, username: str) -> UserDetailResponse:
         """Get detailed information about a user."""
@@ -385,27 +423,54 @@ class AdminService:
 
     # --- Project Management ---
 
-    def list_projects(self, skip: int = 0, limit: int = 100) -> ProjectListResponse:
-        """List all projects with member counts."""
-        total = ProjectDocument.find_all().count()
-        projects = list(ProjectDocument.find_all().skip(skip).limit(limit).run())
-
-        project_list = []
-        for p in projects:
-            member_count = ProjectMembershipDocument.find({"project_id": p.project_id}).count()
-            project_list.append(
-                ProjectListItem(
-                    project_id=p.project_id,
-                    name=p.name,
-                    owner_user_id=p.owner_user_id,
-                    owner_username=p.owner_username,
-                    description=p.description,
-                    member_count=member_count,
-                    created_at=p.system_info.created_at if p.system_info else None,
-                )
-            )
+    def list_projects(
+        self, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> ProjectListResponse:
+        """List projects ordered by ID, with member counts.
+
+        One aggregation serves the page: memberships are joined with
+        ``$lookup`` on the ``(project_id, user_id)`` index and counted, instead
+        of one count query per project. Pass ``cursor=""`` to start keyset
+        paging; ``skip`` is then ignored.
+        """
+        collection = ProjectDocument.get_motor_collection()
+        page = aggregate_page(
+            collection,
+            {},
+            scope="admin-projects",
+            sort=_PROJECT_SORT,
+            stages=[
+                {
+                    "$lookup": {
+                        "from": ProjectMembershipDocument.Settings.name,
+                        "localField": "project_id",
+                        "foreignField": "project_id",
+                        "as": "members",
+                    }
+                },
+                {
+                    "$project": {
+                        "_id": 0,
+                        "project_id": 1,
+                        "name": 1,
+                        "owner_user_id": 1,
+                        "owner_username": 1,
+                        "description": 1,
+                        "member_count": {"$size": "$members"},
+                        "created_at": "$system_info.created_at",
+                    }
+                },
+            ],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            count=lambda: collection.count_documents({}),
+        )
 
-        return ProjectListResponse(projects=project_list, total=total)
+        project_list = [ProjectListItem.model_validate(row) for row in page.items]
+        return ProjectListResponse(
+            projects=project_list, total=page.total or 0, next_cursor=page.next_cursor
+        )
 
     def delete_project(self, project_id: str, admin_username: str) -> dict[str, str]:
         """Delete a project with cascade cleanup."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import math
@@ -32,6 +33,7 @@ from qdash.api.schemas.agent_session import (
     SubmitAgentActionRequest,
 )
 from qdash.common.agent_gate import evaluate_numeric_candidate
+from qdash.common.job_worker import JobPermanentError
 from qdash.common.utils.datetime import ensure_timezone, now
 from qdash.datamodel.agent_session import (
     AgentActionDecision,
@@ -51,11 +53,29 @@ from qdash.dbmodel.task_result_history import TaskResultHistoryDocument
 
 if TYPE_CHECKING:
     from qdash.api.services.flow_service import FlowService
+    from qdash.datamodel.job import JobModel
+    from qdash.repository.protocols import JobQueueRepository
+
+AGENT_ACTION_JOB_KIND = "agent_action"
+# Agent runs are interactive, so they are leased ahead of background reviews.
+AGENT_ACTION_JOB_PRIORITY = 10
 
 
 class AgentSessionService:
     """Authorize and audit actions proposed by user-operated local agents."""
 
+    def __init__(self, job_queue: JobQueueRepository | None = None) -> None:
+        """Initialize the service with the queue used for worker-dispatched actions."""
+        self._job_queue = job_queue
+
+    @property
+    def job_queue(self) -> JobQueueRepository:
+        if self._job_queue is None:
+            from qdash.repository.job_queue import MongoJobQueueRepository
+
+            self._job_queue = MongoJobQueueRepository()
+        return self._job_queue
+
     @staticmethod
     def _session_response(doc: AgentSessionDocument) -> AgentSessionResponse:
         return AgentSessionResponse.model_validate(doc.model_dump())
@@ -1082,6 +1102,60 @@ class AgentSessionService:
         action = self._get_action_document(project_id, session_id, action_id)
         return self._action_response(self._refresh_action_execution(action))
 
+    @staticmethod
+    def _require_dispatchable(action: AgentActionDocument) -> None:
+        if action.decision != AgentActionDecision.AUTHORIZED:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Only authorized agent actions can be executed",
+            )
+        if action.action_type != AgentActionType.RUN_TASK:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only run_task actions can be dispatched",
+            )
+        if action.execution_status == "not_started":
+            AgentSessionService._dispatch_task_name(action)
+
+    @staticmethod
+    def _dispatch_task_name(action: AgentActionDocument) -> str:
+        if action.task_name is None or len(action.qids) != 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The initial agent dispatcher supports exactly one target qid",
+            )
+        return action.task_name
+
+    def enqueue_action(
+        self,
+        *,
+        project_id: str,
+        session_id: str,
+        action_id: str,
+        body: ExecuteAgentActionRequest,
+    ) -> AgentActionResponse:
+        """Queue one authorized run-task action for the agent worker.
+
+        The worker performs the same checks again through ``execute_action``,
+        so a session paused or closed while the job waits is never dispatched.
+        """
+        action = self._get_action_document(project_id, session_id, action_id)
+        self._require_dispatchable(action)
+        if action.execution_status != "not_started":
+            return self._action_response(action)
+        self.job_queue.enqueue(
+            AGENT_ACTION_JOB_KIND,
+            project_id,
+            {
+                "session_id": session_id,
+                "action_id": action_id,
+                "body": body.model_dump(mode="json"),
+            },
+            priority=AGENT_ACTION_JOB_PRIORITY,
+            dedupe_key=f"{AGENT_ACTION_JOB_KIND}:{project_id}:{action_id}",
+        )
+        return self._action_response(action)
+
     async def execute_action(
         self,
         *,
@@ -1099,23 +1173,10 @@ class AgentSessionService:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail=f"Agent action {action_id} not found"
             )
-        if action.decision != AgentActionDecision.AUTHORIZED:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Only authorized agent actions can be executed",
-            )
-        if action.action_type != AgentActionType.RUN_TASK:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only run_task actions can be dispatched",
-            )
+        self._require_dispatchable(action)
         if action.execution_status != "not_started":
             return self._action_response(action)
-        if action.task_name is None or len(action.qids) != 1:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="The initial agent dispatcher supports exactly one target qid",
-            )
+        task_name = self._dispatch_task_name(action)
 
         session = self._get_session_document(project_id, session_id)
         if session.status != AgentSessionStatus.ACTIVE:
@@ -1151,14 +1212,14 @@ class AgentSessionService:
 
         try:
             operation = await flow_service.execute_single_task_from_snapshot(
-                task_name=action.task_name,
+                task_name=task_name,
                 qid=action.qids[0],
                 chip_id=session.chip_id,
                 source_execution_id=body.source_execution_id,
                 username=session.created_by,
                 project_id=project_id,
                 tags=[f"agent-session:{session_id}"],
-                execution_name=f"agent:{action.task_name}",
+                execution_name=f"agent:{task_name}",
                 parameter_overrides={"input": action.parameter_overrides}
                 if action.parameter_overrides
                 else None,
@@ -1176,3 +1237,27 @@ class AgentSessionService:
         action.operation_id = operation.execution_id
         action.save()
         return self._action_response(action)
+
+
+def run_agent_action_job(job: JobModel) -> None:
+    """Job handler: dispatch one queued agent action.
+
+    Client errors (unknown action, inactive session, policy violations) cannot
+    succeed on retry and are raised as :class:`JobPermanentError`.
+    """
+    from qdash.api.dependencies import get_flow_service
+
+    try:
+        asyncio.run(
+            AgentSessionService().execute_action(
+                project_id=job.project_id,
+                session_id=job.payload["session_id"],
+                action_id=job.payload["action_id"],
+                body=ExecuteAgentActionRequest.model_validate(job.payload["body"]),
+                flow_service=get_flow_service(),
+            )
+        )
+    except HTTPException as exc:
+        if exc.status_code < status.HTTP_500_INTERNAL_SERVER_ERROR:
+            raise JobPermanentError(str(exc.detail)) from exc
+        raise
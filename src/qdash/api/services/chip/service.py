@@ -12,9 +12,14 @@ from typing import Any
 from starlette.exceptions import HTTPException
 
 from qdash.api.schemas.chip import (
+    BulkMetricsRequest,
+    BulkMetricsResponse,
+    BulkMetricsRow,
     ChipDeletionImpactResponse,
     ChipResponse,
     CouplingResponse,
+    ListCouplingsResponse,
+    ListQubitsResponse,
     MetricHeatmapResponse,
     MetricsSummaryResponse,
     MuxDetailResponse,
@@ -24,10 +29,11 @@ from qdash.api.schemas.chip import (
 )
 from qdash.api.schemas.success import SuccessResponse
 from qdash.api.services.chip.initializer import ChipInitializer
-from qdash.common.config.metrics import load_metrics_config
+from qdash.common.config.metrics import load_metrics_config, normalize_metric_matrix
 from qdash.common.utils.datetime import now
 from qdash.datamodel.note import NoteModel
 from qdash.dbmodel.chip import ChipDocument
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
 from qdash.dbmodel.chip_note import ChipNoteDocument
 from qdash.dbmodel.cooldown import CooldownDocument
 from qdash.dbmodel.coupling import CouplingDocument
@@ -44,6 +50,36 @@ from qdash.repository.protocols import (
 logger = logging.getLogger(__name__)
 
 
+def _unit_payload(unit: dict[str, Any], *, projected: bool = False) -> dict[str, Any]:
+    """Normalize a qubit/coupling dict from the repository for response validation.
+
+    With ``projected`` only the fields the repository returned are kept, so
+    that serializing with ``exclude_unset`` omits the ones not requested
+    instead of filling in defaults.
+    """
+    if not projected:
+        return {
+            "qid": unit["qid"],
+            "chip_id": unit["chip_id"],
+            "status": unit.get("status", "pending"),
+            "data": unit.get("data", {}),
+            "note": unit.get("note") or {},
+            "metric_notes": unit.get("metric_notes") or {},
+        }
+    payload: dict[str, Any] = {
+        key: unit[key] for key in ("qid", "chip_id", "status", "data") if key in unit
+    }
+    # Notes are dumped in full so that exclude_unset keeps their default keys.
+    if "note" in unit:
+        payload["note"] = NoteModel.model_validate(unit["note"] or {}).model_dump()
+    if "metric_notes" in unit:
+        payload["metric_notes"] = {
+            name: NoteModel.model_validate(note or {}).model_dump()
+            for name, note in (unit["metric_notes"] or {}).items()
+        }
+    return payload
+
+
 @lru_cache(maxsize=1)
 def _get_task_names_cached() -> tuple[str, ...]:
     """Get task names from task files (cached).
@@ -408,6 +444,7 @@ class ChipService:
             doc.note = NoteModel(content=body.note, updated_by=username, updated_at=now())
         doc.system_info.update_time()
         doc.save()
+        ChipDataVersionDocument.bump(project_id, chip_id)
         result = self.get_chip_summary(project_id, chip_id)
         if result is None:  # pragma: no cover - we just saved it
             raise HTTPException(status_code=500, detail="Failed to reload chip")
@@ -482,6 +519,7 @@ class ChipService:
             doc.note = note
             doc.system_info.update_time()
             doc.save()
+            ChipDataVersionDocument.bump(project_id, chip_id)
             return note
 
         scoped_doc = ChipNoteDocument.find_one(
@@ -511,6 +549,7 @@ class ChipService:
             scoped_doc.scope_source = scope.source
             scoped_doc.system_info.update_time()
             scoped_doc.save()
+        ChipDataVersionDocument.bump(project_id, chip_id)
         return note
 
     def delete_chip_note(
@@ -536,6 +575,7 @@ class ChipService:
             doc.note = NoteModel()
             doc.system_info.update_time()
             doc.save()
+            ChipDataVersionDocument.bump(project_id, chip_id)
             return SuccessResponse(message="Chip note cleared")
 
         scoped_doc = ChipNoteDocument.find_one(
@@ -545,6 +585,7 @@ class ChipService:
         ).run()
         if scoped_doc is not None:
             scoped_doc.delete()
+            ChipDataVersionDocument.bump(project_id, chip_id)
         return SuccessResponse(message="Chip note cleared")
 
     # ---------- chip deletion ----------
@@ -610,6 +651,7 @@ class ChipService:
         )
 
         doc.delete()
+        ChipDataVersionDocument.bump(project_id, chip_id)
         return SuccessResponse(message=f"Chip {chip_id} deleted")
 
     def list_qubits(
@@ -619,8 +661,12 @@ class ChipService:
         limit: int = 50,
         offset: int = 0,
         qids: list[str] | None = None,
-    ) -> tuple[list[QubitResponse], int]:
-        """List qubits with pagination.
+        *,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
+    ) -> ListQubitsResponse:
+        """List qubits with offset or keyset pagination.
 
         Parameters
         ----------
@@ -631,38 +677,45 @@ class ChipService:
         limit : int
             Maximum number of qubits to return
         offset : int
-            Number of qubits to skip
+            Number of qubits to skip (ignored when ``cursor`` is given)
         qids : list[str] | None
             Optional list of specific qubit IDs to fetch
+        cursor : str | None
+            Keyset cursor from a previous page (``""`` for the first page)
+        fields : list[str] | None
+            Fields to return besides ``qid``/``chip_id``
+        estimated_total : bool
+            Reuse the total carried by the cursor instead of counting again
 
         Returns
         -------
-        tuple[list[QubitResponse], int]
-            List of qubits and total count
+        ListQubitsResponse
+            Qubits with total count and next cursor
 
         """
-        qubits, total = self._chip_repo.list_qubits(
-            project_id=project_id,
-            chip_id=chip_id,
+        try:
+            page = self._chip_repo.list_qubits(
+                project_id=project_id,
+                chip_id=chip_id,
+                limit=limit,
+                offset=offset,
+                qids=qids,
+                cursor=cursor,
+                fields=fields,
+                estimated_total=estimated_total,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return ListQubitsResponse(
+            qubits=[
+                QubitResponse.model_validate(_unit_payload(q, projected=fields is not None))
+                for q in page.items
+            ],
+            total=page.total or 0,
             limit=limit,
             offset=offset,
-            qids=qids,
-        )
-        return (
-            [
-                QubitResponse.model_validate(
-                    {
-                        "qid": q["qid"],
-                        "chip_id": q["chip_id"],
-                        "status": q.get("status", "pending"),
-                        "data": q.get("data", {}),
-                        "note": q.get("note") or {},
-                        "metric_notes": q.get("metric_notes") or {},
-                    }
-                )
-                for q in qubits
-            ],
-            total,
+            next_cursor=page.next_cursor,
+            total_estimated=page.total_estimated,
         )
 
     def get_qubit(self, project_id: str, chip_id: str, qid: str) -> QubitResponse | None:
@@ -703,8 +756,12 @@ class ChipService:
         chip_id: str,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[CouplingResponse], int]:
-        """List couplings with pagination.
+        *,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
+    ) -> ListCouplingsResponse:
+        """List couplings with offset or keyset pagination.
 
         Parameters
         ----------
@@ -715,35 +772,42 @@ class ChipService:
         limit : int
             Maximum number of couplings to return
         offset : int
-            Number of couplings to skip
+            Number of couplings to skip (ignored when ``cursor`` is given)
+        cursor : str | None
+            Keyset cursor from a previous page (``""`` for the first page)
+        fields : list[str] | None
+            Fields to return besides ``qid``/``chip_id``
+        estimated_total : bool
+            Reuse the total carried by the cursor instead of counting again
 
         Returns
         -------
-        tuple[list[CouplingResponse], int]
-            List of couplings and total count
+        ListCouplingsResponse
+            Couplings with total count and next cursor
 
         """
-        couplings, total = self._chip_repo.list_couplings(
-            project_id=project_id,
-            chip_id=chip_id,
+        try:
+            page = self._chip_repo.list_couplings(
+                project_id=project_id,
+                chip_id=chip_id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                fields=fields,
+                estimated_total=estimated_total,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return ListCouplingsResponse(
+            couplings=[
+                CouplingResponse.model_validate(_unit_payload(c, projected=fields is not None))
+                for c in page.items
+            ],
+            total=page.total or 0,
             limit=limit,
             offset=offset,
-        )
-        return (
-            [
-                CouplingResponse.model_validate(
-                    {
-                        "qid": c["qid"],
-                        "chip_id": c["chip_id"],
-                        "status": c.get("status", "pending"),
-                        "data": c.get("data", {}),
-                        "note": c.get("note") or {},
-                        "metric_notes": c.get("metric_notes") or {},
-                    }
-                )
-                for c in couplings
-            ],
-            total,
+            next_cursor=page.next_cursor,
+            total_estimated=page.total_estimated,
         )
 
     def get_coupling(
@@ -853,3 +917,40 @@ class ChipService:
             values=result.get("values", {}),
             unit=result.get("unit"),
         )
+
+    def get_bulk_metrics(self, project_id: str, request: BulkMetricsRequest) -> BulkMetricsResponse:
+        """Get selected metrics for several chips as one compact matrix.
+
+        Uses a single projected aggregation over the qubit or coupling
+        collection instead of one request per chip or qubit.
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        request : BulkMetricsRequest
+            Chips, optional qids, metric fields and target collection
+
+        Returns
+        -------
+        BulkMetricsResponse
+            Metric values in display units, one row per chip/qid
+
+        """
+        is_coupling = request.target == "coupling"
+        try:
+            rows = self._chip_repo.aggregate_bulk_metrics(
+                project_id=project_id,
+                chip_ids=request.chip_ids,
+                fields=request.fields,
+                qids=request.qids,
+                is_coupling=is_coupling,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        units = normalize_metric_matrix(request.fields, rows, is_coupling=is_coupling)
+        return BulkMetricsResponse(
+            fields=request.fields,
+            units=units,
+            rows=[BulkMetricsRow.model_validate(row) for row in rows],
+        )
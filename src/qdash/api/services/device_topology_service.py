@@ -6,15 +6,11 @@ device topologies, abstracting away the data assembly from the router.
 
 from __future__ import annotations
 
-import io
 import logging
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
-import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
-import networkx as nx
-
+from qdash.api.lib.topology_plot import get_topology_plot_cache
 from qdash.api.schemas.device_topology import (
     Coupling,
     CouplingGateDuration,
@@ -29,9 +25,15 @@ from qdash.api.schemas.device_topology import (
 from qdash.common.config.topology import load_topology
 from qdash.common.domain.qubit import qid_to_label
 from qdash.common.utils.datetime import ensure_timezone, now, to_datetime
+from qdash.common.utils.lazy_import import lazy_import
 
 if TYPE_CHECKING:
+    import networkx as nx
+
     from qdash.repository.protocols import CalibrationNoteRepository, ChipRepository
+else:
+    # Only needed to split topologies; kept out of API startup.
+    nx = lazy_import("networkx")
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,9 @@ logger = logging.getLogger(__name__)
 POSITION_SCALE = 50
 POSITION_DIVISOR = 30
 
+# Qubit data entries the topology reads besides the configurable fidelity metric.
+QUBIT_TOPOLOGY_METRICS = ("t1", "t2_echo", "readout_fidelity_0", "readout_fidelity_1")
+
 assert POSITION_DIVISOR != 0, "POSITION_DIVISOR must not be zero"
 
 
@@ -79,6 +84,20 @@ def _search_coupling_data_by_control_qid(
     return filtered
 
 
+def _requested_coupling_ids(cr_params: dict[str, Any], qids: list[str]) -> list[str]:
+    """Coupling IDs in ``cr_params`` whose control and target are both requested."""
+    requested = set(qids)
+    ids = []
+    for cr_key in cr_params:
+        try:
+            control, target = _split_q_string(cr_key)
+        except ValueError:
+            continue
+        if control in requested and target in requested:
+            ids.append(f"{control}-{target}")
+    return ids
+
+
 def _normalize_coupling_key(control: str, target: str) -> str:
     """Normalize coupling key by sorting the qubits."""
     qubits = sorted([control, target])
@@ -160,11 +179,22 @@ class DeviceTopologyService:
         if chip_model is None:
             raise ValueError(f"No chip found for user {latest.username}")
 
-        qubit_models = self._chip_repo.get_all_qubit_models(
-            project_id, chip_model.chip_id, username=chip_model.username
+        qubit_metric = request.condition.qubit_fidelity.metric or "x90_gate_fidelity"
+        coupling_metric = request.condition.coupling_fidelity.metric or "zx90_gate_fidelity"
+        qubit_data = self._chip_repo.find_metric_data(
+            project_id,
+            chip_model.chip_id,
+            request.qubits,
+            [qubit_metric, *QUBIT_TOPOLOGY_METRICS],
+            username=chip_model.username,
         )
-        coupling_models = self._chip_repo.get_all_coupling_models(
-            project_id, chip_model.chip_id, username=chip_model.username
+        coupling_data = self._chip_repo.find_metric_data(
+            project_id,
+            chip_model.chip_id,
+            _requested_coupling_ids(cr_params, request.qubits),
+            [coupling_metric],
+            username=chip_model.username,
+            is_coupling=True,
         )
 
         topology = load_topology(chip_model.topology_id)
@@ -172,9 +202,9 @@ class DeviceTopologyService:
         id_mapping = {pid: idx for idx, pid in enumerate(sorted_physical_ids)}
 
         qubits = self._build_qubits(
-            request, qubit_models, topology, id_mapping, drag_hpi_params, drag_pi_params
+            request, qubit_data, topology, id_mapping, drag_hpi_params, drag_pi_params
         )
-        couplings = self._build_couplings(request, cr_params, coupling_models, topology, id_mapping)
+        couplings = self._build_couplings(request, cr_params, coupling_data, topology, id_mapping)
 
         filtered_qubits, filtered_couplings = self._apply_filters(qubits, couplings, request)
 
@@ -189,7 +219,7 @@ class DeviceTopologyService:
     def _build_qubits(
         self,
         request: DeviceTopologyRequest,
-        qubit_models: dict[str, Any],
+        qubit_data: dict[str, dict[str, Any]],
         topology: Any,
         id_mapping: dict[str, int],
         drag_hpi_params: dict[str, Any],
@@ -198,17 +228,17 @@ class DeviceTopologyService:
         """Build qubit list from calibration data."""
         qubits = []
         for qid in request.qubits:
-            qubit_doc = qubit_models.get(qid)
-            if qubit_doc is None:
+            data = qubit_data.get(qid)
+            if data is None:
                 continue
 
             use_24h = request.condition.qubit_fidelity.is_within_24h
             qubit_fidelity_metric = request.condition.qubit_fidelity.metric or "x90_gate_fidelity"
             x90_gate_fidelity = _get_value_within_24h_fallback(
-                qubit_doc.data.get(qubit_fidelity_metric, {}), use_24h, 0.25
+                data.get(qubit_fidelity_metric, {}), use_24h, 0.25
             )
-            t1 = _get_value_within_24h_fallback(qubit_doc.data.get("t1", {}), use_24h, 100.0)
-            t2 = _get_value_within_24h_fallback(qubit_doc.data.get("t2_echo", {}), use_24h, 100.0)
+            t1 = _get_value_within_24h_fallback(data.get("t1", {}), use_24h, 100.0)
+            t2 = _get_value_within_24h_fallback(data.get("t2_echo", {}), use_24h, 100.0)
             drag_hpi_duration = drag_hpi_params.get(
                 qid_to_label(qid, topology.num_qubits), {"duration": 20}
             )["duration"]
@@ -216,10 +246,10 @@ class DeviceTopologyService:
                 qid_to_label(qid, topology.num_qubits), {"duration": 20}
             )["duration"]
             readout_fidelity_0 = _get_value_within_24h_fallback(
-                qubit_doc.data.get("readout_fidelity_0", {}), use_24h, 0.25
+                data.get("readout_fidelity_0", {}), use_24h, 0.25
             )
             readout_fidelity_1 = _get_value_within_24h_fallback(
-                qubit_doc.data.get("readout_fidelity_1", {}), use_24h, 0.25
+                data.get("readout_fidelity_1", {}), use_24h, 0.25
             )
 
             prob_meas1_prep0 = 1 - readout_fidelity_0
@@ -261,7 +291,7 @@ class DeviceTopologyService:
         self,
         request: DeviceTopologyRequest,
         cr_params: dict[str, Any],
-        coupling_models: dict[str, Any],
+        coupling_data: dict[str, dict[str, Any]],
         topology: Any,
         id_mapping: dict[str, int],
     ) -> list[Coupling]:
@@ -290,15 +320,14 @@ class DeviceTopologyService:
                 cr_duration = cr_value.get("duration", 20)
 
                 coupling_key = f"{control}-{target}"
-                coupling_doc = coupling_models.get(coupling_key)
                 coupling_fidelity_metric = (
                     request.condition.coupling_fidelity.metric or "zx90_gate_fidelity"
                 )
-                coupling_data = (
-                    coupling_doc.data.get(coupling_fidelity_metric, {}) if coupling_doc else {}
+                fidelity_entry = coupling_data.get(coupling_key, {}).get(
+                    coupling_fidelity_metric, {}
                 )
                 zx90_gate_fidelity = _get_value_within_24h_fallback(
-                    coupling_data,
+                    fidelity_entry,
                     request.condition.coupling_fidelity.is_within_24h,
                     fallback=0.25,
                 )
@@ -390,77 +419,5 @@ class DeviceTopologyService:
 
     @staticmethod
     def generate_plot(data: dict[str, Any]) -> bytes:
-        """Generate a plot of the quantum device and return it as bytes."""
-        g = nx.Graph()
-        pos = {}
-        for qubit in data["qubits"]:
-            g.add_node(qubit["id"], physical_id=qubit["physical_id"], fidelity=qubit["fidelity"])
-            pos[qubit["id"]] = (qubit["position"]["x"] * 100, qubit["position"]["y"] * 100)
-
-        for coupling in data["couplings"]:
-            g.add_edge(
-                coupling["control"],
-                coupling["target"],
-                fidelity=coupling["fidelity"],
-                gate_duration=coupling["gate_duration"]["rzx90"],
-            )
-
-        plt.rcParams["font.size"] = 14
-        plt.rcParams["font.family"] = "sans-serif"
-
-        fig, ax = plt.subplots(figsize=(15, 15))
-        nx.draw_networkx_nodes(
-            g,
-            pos,
-            node_color=[g.nodes[node]["fidelity"] for node in g.nodes],
-            node_size=3000,
-            cmap="viridis",
-        )
-        nx.draw_networkx_edges(g, pos, width=3)
-
-        labels = {
-            node: f"Q{g.nodes[node]['physical_id']}\n{g.nodes[node]['fidelity'] * 100:.2f}%"
-            for node in g.nodes
-        }
-        nx.draw_networkx_labels(
-            g, pos, labels, font_size=12, font_weight="bold", font_color="white"
-        )
-
-        edge_labels = nx.get_edge_attributes(g, "fidelity")
-        edge_labels = {k: f"F={v:.2f}" for k, v in edge_labels.items()}
-        nx.draw_networkx_edge_labels(g, pos, edge_labels, font_size=10, label_pos=0.3)
-
-        qubit_number = len(g.nodes)
-        coupling_number = len(g.edges)
-
-        fidelity_values = list(nx.get_node_attributes(g, "fidelity").values())
-        vmin, vmax = (min(fidelity_values), max(fidelity_values)) if fidelity_values else (0, 1)
-        sm = plt.cm.ScalarMappable(cmap="viridis", norm=mcolors.Normalize(vmin=vmin, vmax=vmax))
-        cbar = plt.colorbar(sm, ax=ax, label="Qubit Fidelity (%)", fraction=0.046, pad=0.04)
-        cbar.ax.tick_params(labelsize=12)
-
-        title = (
-            f"Quantum Device: {data['name'].upper()}, "
-            f"qubit: {qubit_number}, coupling: {coupling_number}"
-        )
-        ax.set_title(
-            title,
-            pad=20,
-            fontsize=16,
-            fontweight="bold",
-        )
-
-        if pos:
-            x_coords = [coord[0] for coord in pos.values()]
-            y_coords = [coord[1] for coord in pos.values()]
-            margin = 50
-            ax.set_xlim(min(x_coords) - margin, max(x_coords) + margin)
-            ax.set_ylim(min(y_coords) - margin, max(y_coords) + margin)
-        ax.axis("off")
-        plt.tight_layout()
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format="png", bbox_inches="tight", dpi=300)
-        plt.close(fig)
-        buf.seek(0)
-        return buf.getvalue()
+        """Return the PNG plot of the quantum device, rendering it only on a cache miss."""
+        return get_topology_plot_cache().get_or_render(data)
@@ -0,0 +1,307 @@
+"""Remaining-time prediction for running executions.
+
+Execution lists and detail pages are polled while a calibration runs, so
+the service keeps two in-process caches:
+
+- Duration statistics per (project, chip), rebuilt by one aggregation at
+  most every ``stats_ttl_seconds``.
+- A tracker per running execution holding its plan and the task states
+  seen so far. Trackers refresh at most every ``refresh_seconds`` and only
+  read task results that finished since the last refresh or are still
+  running. The detail endpoint already loads every task of the execution,
+  so it feeds those in instead of querying again.
+
+A tracker is dropped once its execution is seen with any other status,
+and the least recently used trackers are evicted beyond
+``EXECUTION_ETA_MAX_EXECUTIONS``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from qdash.api.lib.execution_eta import (
+    ETA_CONFIDENCE,
+    ETA_INTERVAL_Z,
+    RUNNING_TASK_STATUS,
+    DurationModel,
+    ExecutionTaskState,
+    estimate_progress,
+)
+from qdash.api.schemas.execution import ExecutionProgress
+from qdash.common.utils.datetime import now
+from qdash.datamodel.execution import ExecutionPlanModel, ExecutionStatusModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from qdash.api.lib.execution_eta import ProgressEstimate
+    from qdash.api.schemas.execution import Task
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_ETA_STATS_TTL_SECONDS = float(os.getenv("QDASH_EXECUTION_ETA_STATS_TTL_SECONDS", "900"))
+EXECUTION_ETA_REFRESH_SECONDS = float(os.getenv("QDASH_EXECUTION_ETA_REFRESH_SECONDS", "10"))
+EXECUTION_ETA_HISTORY_DAYS = int(os.getenv("QDASH_EXECUTION_ETA_HISTORY_DAYS", "90"))
+EXECUTION_ETA_MAX_EXECUTIONS = 256
+
+# Task results may be written slightly out of end_at order by parallel workers.
+_REFRESH_OVERLAP = timedelta(seconds=60)
+_TASK_STATE_PROJECTION = {"_id": 0, "name": 1, "qid": 1, "status": 1, "start_at": 1, "end_at": 1}
+
+
+@dataclass
+class _Tracker:
+    """Plan and task states of one running execution."""
+
+    plan: ExecutionPlanModel | None
+    created_at: float
+    state: ExecutionTaskState = field(default_factory=ExecutionTaskState)
+    refreshed_at: float | None = None
+
+
+@dataclass
+class _DurationStats:
+    model: DurationModel
+    loaded_at: float
+
+
+class ExecutionEtaService:
+    """Service predicting progress and completion time of running executions.
+
+    Parameters
+    ----------
+    task_result_repository : Any
+        Repository for task result history access
+    execution_history_repository : Any
+        Repository for execution history access
+    stats_ttl_seconds : float
+        How long duration statistics of a chip are reused
+    refresh_seconds : float
+        Minimum interval between task state reads of one execution
+    history_days : int
+        How far back task durations are learned from
+    max_executions : int
+        Maximum number of tracked executions
+    clock : Callable[[], float]
+        Monotonic clock used for cache ages
+
+    """
+
+    def __init__(
+        self,
+        task_result_repository: Any,
+        execution_history_repository: Any,
+        *,
+        stats_ttl_seconds: float = EXECUTION_ETA_STATS_TTL_SECONDS,
+        refresh_seconds: float = EXECUTION_ETA_REFRESH_SECONDS,
+        history_days: int = EXECUTION_ETA_HISTORY_DAYS,
+        max_executions: int = EXECUTION_ETA_MAX_EXECUTIONS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the service with repositories."""
+        self._task_result_repo = task_result_repository
+        self._history_repo = execution_history_repository
+        self._stats_ttl_seconds = stats_ttl_seconds
+        self._refresh_seconds = refresh_seconds
+        self._history_days = history_days
+        self._max_executions = max_executions
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._trackers: OrderedDict[tuple[str, str], _Tracker] = OrderedDict()
+        self._stats: dict[tuple[str, str], _DurationStats] = {}
+
+    def estimate(
+        self,
+        project_id: str,
+        chip_id: str,
+        execution_id: str,
+        status: str,
+        *,
+        note: dict[str, Any] | None = None,
+        tasks: list[Task] | None = None,
+        current_time: datetime | None = None,
+    ) -> ExecutionProgress | None:
+        """Predict the progress of an execution.
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        execution_id : str
+            The execution identifier
+        status : str
+            The execution status; only running executions are estimated
+        note : dict[str, Any] | None
+            The execution note if already loaded (avoids reading the plan)
+        tasks : list[Task] | None
+            All tasks of the execution if already loaded (avoids reading task states)
+        current_time : datetime | None
+            Time the prediction is made at (defaults to now)
+
+        Returns
+        -------
+        ExecutionProgress | None
+            The prediction, or None if the execution is not running or has no plan
+
+        """
+        key = (project_id, execution_id)
+        if status != ExecutionStatusModel.RUNNING:
+            with self._lock:
+                self._trackers.pop(key, None)
+            return None
+
+        tracker = self._get_tracker(project_id, execution_id, note)
+        if tracker.plan is None:
+            return None
+
+        if tasks is not None:
+            state = ExecutionTaskState()
+            state.apply(
+                {
+                    "name": task.name,
+                    "qid": task.qid,
+                    "status": task.status,
+                    "start_at": task.start_at,
+                    "end_at": task.end_at,
+                }
+                for task in tasks
+            )
+            with self._lock:
+                tracker.state = state
+                tracker.refreshed_at = self._clock()
+        else:
+            self._refresh(project_id, execution_id, tracker)
+
+        current_time = current_time or now()
+        model = self._duration_model(project_id, chip_id, current_time)
+        with self._lock:
+            progress = estimate_progress(tracker.plan, tracker.state, model, current_time)
+        return _to_schema(progress, current_time)
+
+    def _get_tracker(
+        self, project_id: str, execution_id: str, note: dict[str, Any] | None
+    ) -> _Tracker:
+        """Return the tracker of an execution, reading its plan on first use.
+
+        A missing plan is remembered for ``refresh_seconds`` only, since
+        workflows record it after the execution starts.
+        """
+        key = (project_id, execution_id)
+        current = self._clock()
+        with self._lock:
+            tracker = self._trackers.get(key)
+            if tracker is not None and (
+                tracker.plan is not None
+                or (note is None and current - tracker.created_at < self._refresh_seconds)
+            ):
+                self._trackers.move_to_end(key)
+                return tracker
+
+        if note is None:
+            execution = self._history_repo.find_by_id(project_id, execution_id)
+            note = execution.note if execution is not None else {}
+        tracker = _Tracker(plan=_parse_plan(note, execution_id), created_at=current)
+
+        with self._lock:
+            existing = self._trackers.get(key)
+            if existing is None or existing.plan is None:
+                self._trackers[key] = tracker
+            else:
+                tracker = existing
+            self._trackers.move_to_end(key)
+            while len(self._trackers) > self._max_executions:
+                self._trackers.popitem(last=False)
+        return tracker
+
+    def _refresh(self, project_id: str, execution_id: str, tracker: _Tracker) -> None:
+        """Read task states changed since the last refresh of ``tracker``."""
+        current = self._clock()
+        with self._lock:
+            if (
+                tracker.refreshed_at is not None
+                and current - tracker.refreshed_at < self._refresh_seconds
+            ):
+                return
+            first = tracker.refreshed_at is None
+            watermark = tracker.state.watermark
+            tracker.refreshed_at = current
+
+        query: dict[str, Any] = {"project_id": project_id, "execution_id": execution_id}
+        if not first and watermark is not None:
+            query["$or"] = [
+                {"end_at": {"$gte": watermark - _REFRESH_OVERLAP}},
+                {"status": RUNNING_TASK_STATUS},
+            ]
+        rows = list(self._task_result_repo.iter_raw(query, _TASK_STATE_PROJECTION))
+        with self._lock:
+            tracker.state.apply(rows)
+
+    def _duration_model(
+        self, project_id: str, chip_id: str, current_time: datetime
+    ) -> DurationModel:
+        """Return the duration model of a chip, aggregating it when stale."""
+        key = (project_id, chip_id)
+        current = self._clock()
+        with self._lock:
+            cached = self._stats.get(key)
+        if cached is not None and current - cached.loaded_at < self._stats_ttl_seconds:
+            return cached.model
+        model = DurationModel(
+            self._task_result_repo.aggregate_duration_stats(
+                project_id=project_id,
+                chip_id=chip_id,
+                cutoff_time=current_time - timedelta(days=self._history_days),
+            )
+        )
+        with self._lock:
+            self._stats[key] = _DurationStats(model=model, loaded_at=current)
+        return model
+
+
+def _parse_plan(note: dict[str, Any] | None, execution_id: str) -> ExecutionPlanModel | None:
+    """Return the plan recorded in an execution note, if any."""
+    raw = (note or {}).get("plan")
+    if not raw:
+        return None
+    try:
+        return ExecutionPlanModel.model_validate(raw)
+    except ValidationError as e:
+        logger.warning(f"Ignoring invalid plan of execution {execution_id}: {e}")
+        return None
+
+
+def _to_schema(progress: ProgressEstimate, current_time: datetime) -> ExecutionProgress:
+    """Convert a ``ProgressEstimate`` into the response schema."""
+    fraction = progress.completed_units / progress.total_units if progress.total_units else None
+    result = ExecutionProgress(
+        completed_tasks=progress.completed_units,
+        total_tasks=progress.total_units,
+        fraction=round(fraction, 4) if fraction is not None else None,
+        confidence=ETA_CONFIDENCE,
+        history_samples=progress.samples,
+    )
+    if progress.remaining_seconds is None:
+        return result
+    margin = ETA_INTERVAL_Z * (progress.remaining_stddev or 0.0)
+    remaining = progress.remaining_seconds
+    low = max(remaining - margin, 0.0)
+    high = remaining + margin
+    result.remaining_seconds = round(remaining, 1)
+    result.remaining_seconds_low = round(low, 1)
+    result.remaining_seconds_high = round(high, 1)
+    result.eta = current_time + timedelta(seconds=remaining)
+    result.eta_earliest = current_time + timedelta(seconds=low)
+    result.eta_latest = current_time + timedelta(seconds=high)
+    return result
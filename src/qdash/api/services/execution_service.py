@@ -11,21 +11,44 @@ from uuid import UUID
 
 from bunnet import SortDirection
 from fastapi import HTTPException
-from prefect.client.orchestration import get_client
-from prefect.states import Cancelling
 
+from qdash.api.lib.prefect_client import get_client
 from qdash.api.schemas.execution import (
     CancelExecutionResponse,
+    ExecutionLeaseStatus,
     ExecutionLockStatusResponse,
+    ExecutionProgress,
     ExecutionResponseDetail,
     ExecutionResponseSummary,
+    ListExecutionsResponse,
+    PhaseTimingStat,
     Task,
 )
+from qdash.api.services.execution_eta_service import ExecutionEtaService
+from qdash.datamodel.task import task_phase_sort_key
 from qdash.dbmodel.task_result_history import TaskResultHistoryDocument
 
 logger = logging.getLogger(__name__)
 
 
+def summarize_phase_timings(tasks: list[Task]) -> list[PhaseTimingStat]:
+    """Sum per-task phase timings into one row per phase, in execution order."""
+    totals: dict[str, list[float]] = {}
+    for task in tasks:
+        for phase, seconds in task.phase_timings.items():
+            totals.setdefault(phase, []).append(seconds)
+    return [
+        PhaseTimingStat(
+            phase=phase,
+            count=len(values),
+            total_seconds=round(sum(values), 6),
+            mean_seconds=round(sum(values) / len(values), 6),
+            max_seconds=max(values),
+        )
+        for phase, values in sorted(totals.items(), key=lambda item: task_phase_sort_key(item[0]))
+    ]
+
+
 class ExecutionService:
     """Service for execution-related operations.
 
@@ -38,6 +61,8 @@ class ExecutionService:
         Repository for execution history access
     execution_lock_repository : Any
         Repository for execution lock operations
+    eta_service : ExecutionEtaService | None
+        Progress predictor for running executions (disabled if None)
 
     """
 
@@ -45,10 +70,12 @@ class ExecutionService:
         self,
         execution_history_repository: Any,
         execution_lock_repository: Any,
+        eta_service: ExecutionEtaService | None = None,
     ) -> None:
         """Initialize the service with repositories."""
         self._history_repo = execution_history_repository
         self._lock_repo = execution_lock_repository
+        self._eta_service = eta_service
 
     def list_executions(
         self,
@@ -56,8 +83,9 @@ class ExecutionService:
         chip_id: str,
         skip: int = 0,
         limit: int = 20,
-    ) -> list[ExecutionResponseSummary]:
-        """List executions for a chip with pagination.
+        cursor: str | None = None,
+    ) -> ListExecutionsResponse:
+        """List executions for a chip with offset or keyset pagination.
 
         Parameters
         ----------
@@ -66,37 +94,50 @@ class ExecutionService:
         chip_id : str
             The chip identifier
         skip : int
-            Number of items to skip
+            Number of items to skip (ignored when ``cursor`` is given)
         limit : int
             Number of items to return
+        cursor : str | None
+            Keyset cursor from a previous page (``""`` for the first page)
 
         Returns
         -------
-        list[ExecutionResponseSummary]
-            List of execution summaries
+        ListExecutionsResponse
+            Execution summaries and the cursor of the next page
 
         """
-        executions = self._history_repo.list_by_chip(
-            project_id=project_id,
-            chip_id=chip_id,
-            skip=skip,
+        try:
+            page = self._history_repo.list_by_chip(
+                project_id=project_id,
+                chip_id=chip_id,
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return ListExecutionsResponse(
+            executions=[
+                ExecutionResponseSummary(
+                    name=f"{execution.name}-{execution.execution_id}",
+                    execution_id=execution.execution_id,
+                    status=execution.status,
+                    user_id=execution.user_id,
+                    username=execution.username,
+                    start_at=execution.start_at,
+                    end_at=execution.end_at,
+                    elapsed_time=execution.elapsed_time,
+                    tags=execution.tags,
+                    progress=self._estimate_progress(
+                        project_id, chip_id, execution.execution_id, execution.status
+                    ),
+                )
+                for execution in page.items
+            ],
+            skip=skip if cursor is None else None,
             limit=limit,
+            next_cursor=page.next_cursor,
         )
-        return [
-            ExecutionResponseSummary(
-                name=f"{execution.name}-{execution.execution_id}",
-                execution_id=execution.execution_id,
-                status=execution.status,
-                user_id=execution.user_id,
-                username=execution.username,
-                start_at=execution.start_at,
-                end_at=execution.end_at,
-                elapsed_time=execution.elapsed_time,
-                tags=execution.tags,
-                note=execution.note,
-            )
-            for execution in executions
-        ]
 
     def get_execution(
         self,
@@ -138,6 +179,15 @@ class ExecutionService:
             note=execution.note,
             tags=execution.tags,
             chip_id=execution.chip_id,
+            phase_timings=summarize_phase_timings(tasks),
+            progress=self._estimate_progress(
+                project_id,
+                execution.chip_id,
+                execution.execution_id,
+                execution.status,
+                note=execution.note,
+                tasks=tasks,
+            ),
         )
 
     def get_execution_metadata(
@@ -181,13 +231,20 @@ class ExecutionService:
         Returns
         -------
         ExecutionLockStatusResponse
-            The lock status response
+            The legacy project-wide lock and the active hardware leases
 
         """
         status = self._lock_repo.get_lock_status(project_id)
-        if status is None:
-            return ExecutionLockStatusResponse(lock=False)
-        return ExecutionLockStatusResponse(lock=status)
+        leases = [
+            ExecutionLeaseStatus(
+                chip_id=lease.chip_id,
+                qids=lease.qids,
+                owner=lease.owner,
+                expires_at=lease.expires_at,
+            )
+            for lease in self._lock_repo.list_active_leases(project_id)
+        ]
+        return ExecutionLockStatusResponse(lock=status is True, leases=leases)
 
     async def cancel_execution(
         self,
@@ -217,6 +274,8 @@ class ExecutionService:
                 detail=f"Invalid flow run ID format: {flow_run_id}. Must be a valid UUID.",
             )
 
+        from prefect.states import Cancelling
+
         try:
             async with get_client() as client:
                 flow_run = await client.read_flow_run(parsed_flow_run_id)
@@ -267,6 +326,27 @@ class ExecutionService:
                 detail=f"Failed to cancel execution: {e}",
             )
 
+    def _estimate_progress(
+        self,
+        project_id: str,
+        chip_id: str,
+        execution_id: str,
+        status: str,
+        **kwargs: Any,
+    ) -> ExecutionProgress | None:
+        """Predict the progress of a running execution; never fails the request.
+
+        Other statuses are passed on too, so the ETA service drops the
+        tracker of an execution that has finished.
+        """
+        if self._eta_service is None:
+            return None
+        try:
+            return self._eta_service.estimate(project_id, chip_id, execution_id, status, **kwargs)
+        except Exception as e:
+            logger.warning(f"Failed to estimate progress of execution {execution_id}: {e}")
+            return None
+
     def _fetch_tasks_for_execution(
         self,
         project_id: str,
@@ -332,6 +412,7 @@ class ExecutionService:
                     end_at=doc.end_at,
                     elapsed_time=elapsed,
                     task_type=doc.task_type,
+                    phase_timings=doc.phase_timings,
                 )
             )
 
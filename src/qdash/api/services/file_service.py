@@ -7,19 +7,23 @@ import os
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 from fastapi import BackgroundTasks, HTTPException
 from fastapi.responses import FileResponse
-from git import Repo
-from git.exc import GitCommandError
 
 from qdash.api.lib.file_utils import validate_relative_path
 from qdash.api.schemas.file import FileTreeNode
 from qdash.common.config.path_resolver import resolve_config_base_path
 from qdash.common.utils.commit_message import format_machine_commit_message
 from qdash.common.utils.datetime import now_iso
+from qdash.common.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    import git
+else:
+    git = lazy_import("git")
 
 logger = logging.getLogger(__name__)
 
@@ -288,7 +292,7 @@ class FileService:
                     "message": "Config directory is not a Git repository",
                 }
 
-            repo = Repo(self._base_path)
+            repo = git.Repo(self._base_path)
 
             current_branch = repo.active_branch.name
             current_commit = repo.head.commit.hexsha[:8]
@@ -356,7 +360,7 @@ class FileService:
 
             if (self._base_path / ".git").exists():
                 logger.info("Fetching latest changes from remote")
-                repo = Repo(self._base_path)
+                repo = git.Repo(self._base_path)
                 repo.remotes.origin.set_url(auth_url)
                 repo.remotes.origin.fetch()
                 repo.git.reset("--hard", "origin/main")
@@ -366,7 +370,7 @@ class FileService:
                 if self._base_path.exists():
                     shutil.rmtree(self._base_path)
                 self._base_path.parent.mkdir(parents=True, exist_ok=True)
-                repo = Repo.clone_from(auth_url, str(self._base_path), depth=1)
+                repo = git.Repo.clone_from(auth_url, str(self._base_path), depth=1)
 
             current = repo.head.commit
             commit_sha = current.hexsha[:8]
@@ -386,7 +390,7 @@ class FileService:
                 "message": "Config files updated successfully",
             }
 
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             error_msg = str(e.stderr)
             parsed_err = urlparse(repo_url or "")
             masked_url: str = urlunparse(
@@ -458,7 +462,7 @@ class FileService:
 
             try:
                 logger.info("Cloning repository to temporary directory")
-                repo = Repo.clone_from(auth_url, temp_dir, branch="main", depth=1)
+                repo = git.Repo.clone_from(auth_url, temp_dir, branch="main", depth=1)
 
                 branch_name = (
                     f"config-update/{datetime.now(tz=timezone.utc).strftime('%Y%m%d-%H%M%S')}"
@@ -545,7 +549,7 @@ class FileService:
                 if temp_dir_path.exists():
                     shutil.rmtree(temp_dir)
 
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             error_msg = str(e.stderr)
             parsed_err = urlparse(repo_url or "")
             masked_url: str = urlunparse(
@@ -13,16 +13,8 @@ from zoneinfo import ZoneInfo
 import httpx
 from croniter import croniter
 from fastapi import HTTPException
-from prefect.client.orchestration import get_client
-from prefect.client.schemas import StateType
-from prefect.client.schemas.filters import (
-    DeploymentFilter,
-    DeploymentFilterId,
-    FlowRunFilter,
-    FlowRunFilterState,
-    FlowRunFilterStateType,
-)
 
+from qdash.api.lib.prefect_client import get_client
 from qdash.api.schemas.flow import (
     DeleteScheduleResponse,
     FlowScheduleSummary,
@@ -58,6 +50,26 @@ def _get_cron_from_schedules(schedules: list[Any]) -> tuple[str | None, bool]:
     return None, False
 
 
+def _scheduled_runs_filters(deployment_id: str) -> dict[str, Any]:
+    """Build ``read_flow_runs`` filters selecting a deployment's SCHEDULED runs."""
+    from prefect.client.schemas import StateType
+    from prefect.client.schemas.filters import (
+        DeploymentFilter,
+        DeploymentFilterId,
+        FlowRunFilter,
+        FlowRunFilterState,
+        FlowRunFilterStateType,
+    )
+
+    state_filter = FlowRunFilterStateType(any_=[StateType.SCHEDULED])
+    return {
+        "deployment_filter": DeploymentFilter(
+            id=DeploymentFilterId(any_=[uuid.UUID(deployment_id)])
+        ),
+        "flow_run_filter": FlowRunFilter(state=FlowRunFilterState(type=state_filter)),
+    }
+
+
 class FlowScheduleService:
     """Service for flow schedule management (cron and one-time)."""
 
@@ -210,12 +222,8 @@ class FlowScheduleService:
 
                 # Get one-time scheduled runs
                 try:
-                    state_filter = FlowRunFilterStateType(any_=[StateType.SCHEDULED])
                     flow_runs = await client.read_flow_runs(
-                        deployment_filter=DeploymentFilter(
-                            id=DeploymentFilterId(any_=[uuid.UUID(flow.deployment_id)])
-                        ),
-                        flow_run_filter=FlowRunFilter(state=FlowRunFilterState(type=state_filter)),
+                        **_scheduled_runs_filters(flow.deployment_id),
                         limit=limit,
                     )
 
@@ -311,12 +319,8 @@ class FlowScheduleService:
                 logger.warning(f"Failed to read deployment schedule: {e}")
 
             try:
-                state_filter = FlowRunFilterStateType(any_=[StateType.SCHEDULED])
                 flow_runs = await client.read_flow_runs(
-                    deployment_filter=DeploymentFilter(
-                        id=DeploymentFilterId(any_=[uuid.UUID(flow.deployment_id)])
-                    ),
-                    flow_run_filter=FlowRunFilter(state=FlowRunFilterState(type=state_filter)),
+                    **_scheduled_runs_filters(flow.deployment_id),
                     limit=limit,
                     offset=offset,
                 )
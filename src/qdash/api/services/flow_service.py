@@ -12,7 +12,6 @@ from typing import TYPE_CHECKING, Any, cast
 
 import httpx
 from fastapi import HTTPException
-from prefect.client.orchestration import get_client
 
 from qdash.agent import (
     AgentEvent,
@@ -21,6 +20,7 @@ from qdash.agent import (
     build_unified_diff,
     prepare_workspace,
 )
+from qdash.api.lib.prefect_client import get_client
 from qdash.api.schemas.flow import (
     ExecuteFlowRequest,
     ExecuteFlowResponse,
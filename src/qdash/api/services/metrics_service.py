@@ -7,28 +7,110 @@ abstracting away the repository layer and aggregation logic from the routers.
 from __future__ import annotations
 
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from io import BytesIO
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Literal
 
 from bunnet import SortDirection
 from fastapi import HTTPException
 
+from qdash.api.lib.columnar import ColumnarSeries
+from qdash.api.schemas.execution import PhaseTimingStat
 from qdash.api.schemas.metrics import (
     ChipMetricsResponse,
+    ChipPhaseTimingsResponse,
     MetricHistoryItem,
+    MetricsPdfJobResponse,
     MetricValue,
     QubitMetricHistoryResponse,
+    TaskPhaseTimings,
 )
 from qdash.common.config.metrics import load_metrics_config
+from qdash.common.config.paths import CALIB_DATA_BASE
 from qdash.common.utils.datetime import local_now, now, to_datetime
+from qdash.datamodel.task import task_phase_sort_key
+from qdash.dbmodel.metrics_pdf_job import MetricsPdfJobDocument
 
 if TYPE_CHECKING:
-    from io import BytesIO
-
     from qdash.repository.protocols import ChipRepository, TaskResultHistoryRepository
 
 logger = logging.getLogger(__name__)
 
+PDF_JOB_WORKERS = 2
+PDF_JOB_MAX_RETAINED = 32
+PDF_JOB_TIMEOUT_SECONDS = 3600
+
+_PDF_JOB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=PDF_JOB_WORKERS,
+    thread_name_prefix="metrics-pdf",
+)
+
+
+# Job state is stored in Mongo and finished reports on the shared calibration
+# data volume, so every API worker can serve any job. Only finished jobs are
+# evicted (oldest first) once more than PDF_JOB_MAX_RETAINED of them exist.
+# Jobs still pending or running PDF_JOB_TIMEOUT_SECONDS after submission were
+# abandoned by a crashed or restarted worker and are marked failed.
+METRICS_PDF_DIR = CALIB_DATA_BASE / "metrics_pdf"
+_PDF_JOB_FINISHED = ["completed", "failed"]
+_PDF_JOB_ACTIVE = ["pending", "running"]
+
+
+def _pdf_job_response(job: MetricsPdfJobDocument) -> MetricsPdfJobResponse:
+    return MetricsPdfJobResponse(
+        job_id=job.job_id,
+        chip_id=job.chip_id,
+        status=job.status,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+        filename=job.filename,
+        download_url=(
+            f"/metrics/pdf/jobs/{job.job_id}/download" if job.status == "completed" else None
+        ),
+        error=job.error,
+    )
+
+
+def _update_pdf_job(job_id: str, **fields: Any) -> None:
+    MetricsPdfJobDocument.get_motor_collection().update_one({"job_id": job_id}, {"$set": fields})
+
+
+def _expire_stalled_pdf_jobs() -> None:
+    """Mark jobs pending or running for longer than PDF_JOB_TIMEOUT_SECONDS as failed."""
+    timestamp = now()
+    MetricsPdfJobDocument.get_motor_collection().update_many(
+        {
+            "status": {"$in": _PDF_JOB_ACTIVE},
+            "created_at": {"$lt": timestamp - timedelta(seconds=PDF_JOB_TIMEOUT_SECONDS)},
+        },
+        {
+            "$set": {
+                "status": "failed",
+                "error": f"PDF job did not finish within {PDF_JOB_TIMEOUT_SECONDS} seconds",
+                "completed_at": timestamp,
+            }
+        },
+    )
+
+
+def _evict_finished_pdf_jobs() -> None:
+    """Delete finished jobs and their files beyond the newest PDF_JOB_MAX_RETAINED."""
+    stale = (
+        MetricsPdfJobDocument.get_motor_collection()
+        .find({"status": {"$in": _PDF_JOB_FINISHED}}, {"job_id": 1, "_id": 0})
+        .sort("created_at", SortDirection.DESCENDING)
+        .skip(PDF_JOB_MAX_RETAINED)
+    )
+    job_ids = [doc["job_id"] for doc in stale]
+    if not job_ids:
+        return
+    for job_id in job_ids:
+        (METRICS_PDF_DIR / f"{job_id}.pdf").unlink(missing_ok=True)
+    MetricsPdfJobDocument.get_motor_collection().delete_many({"job_id": {"$in": job_ids}})
+
 
 def normalize_qid(qid: str) -> str:
     """Normalize qubit ID to canonical format.
@@ -139,6 +221,36 @@ def _parse_date_range(
     return start_dt, end_dt
 
 
+def _metric_history_query(
+    chip_id: str,
+    qid: str,
+    project_id: str,
+    metric: str,
+    entity_type: Literal["qubit", "coupling"],
+    within_days: int | None,
+) -> dict[str, Any]:
+    """Build the task result filter for a qubit or coupling metric history."""
+    query: dict[str, Any] = {
+        "project_id": project_id,
+        "chip_id": chip_id,
+        "task_type": entity_type,
+        f"output_parameters.{metric}": {"$exists": True},
+    }
+
+    if entity_type == "qubit":
+        normalized_qid = normalize_qid(qid)
+        qid_variants = list(
+            {normalized_qid, qid, f"Q{normalized_qid.zfill(2)}", f"Q{normalized_qid.zfill(3)}"}
+        )
+        query["qid"] = {"$in": qid_variants}
+    else:
+        query["qid"] = qid
+
+    if within_days:
+        query["start_at"] = {"$gte": now() - timedelta(days=within_days)}
+    return query
+
+
 def _get_task_timestamp(task_doc: Any) -> datetime:
     """Get the best available timestamp for a task history document."""
 
@@ -173,6 +285,18 @@ def _get_task_timestamp(task_doc: Any) -> datetime:
     return now()
 
 
+def _phase_timing_stat(
+    phase: str, count: int, total_seconds: float, max_seconds: float
+) -> PhaseTimingStat:
+    return PhaseTimingStat(
+        phase=phase,
+        count=count,
+        total_seconds=round(total_seconds, 6),
+        mean_seconds=round(total_seconds / count, 6) if count else 0.0,
+        max_seconds=max_seconds,
+    )
+
+
 class MetricsService:
     """Service for chip calibration metrics operations."""
 
@@ -290,6 +414,76 @@ class MetricsService:
             coupling_metrics=coupling_metrics,
         )
 
+    def get_phase_timings(
+        self,
+        chip_id: str,
+        project_id: str,
+        within_hours: int | None = None,
+        start_at: str | datetime | None = None,
+        end_at: str | datetime | None = None,
+    ) -> ChipPhaseTimingsResponse:
+        """Get task phase timings of a chip, per task name and overall.
+
+        Args:
+        ----
+            chip_id: The chip identifier
+            project_id: The project identifier
+            within_hours: Optional time filter
+            start_at: Optional absolute lower bound (ISO8601 string or datetime)
+            end_at: Optional absolute upper bound (ISO8601 string or datetime)
+
+        Returns:
+        -------
+            ChipPhaseTimingsResponse with per-task and overall phase statistics
+
+        """
+        start_at_dt, end_at_dt = _parse_date_range(start_at, end_at)
+        cutoff_time = start_at_dt
+        if cutoff_time is None and within_hours:
+            cutoff_time = now() - timedelta(hours=within_hours)
+
+        rows = self._task_result_repo.aggregate_phase_timings(
+            project_id=project_id,
+            chip_id=chip_id,
+            cutoff_time=cutoff_time,
+            end_time=end_at_dt,
+        )
+
+        by_task: dict[str, list[PhaseTimingStat]] = {}
+        overall: dict[str, dict[str, float]] = {}
+        for row in rows:
+            by_task.setdefault(row["name"], []).append(
+                _phase_timing_stat(
+                    row["phase"], row["count"], row["total_seconds"], row["max_seconds"]
+                )
+            )
+            total = overall.setdefault(
+                row["phase"], {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            total["count"] += row["count"]
+            total["total_seconds"] += row["total_seconds"]
+            total["max_seconds"] = max(total["max_seconds"], row["max_seconds"])
+
+        return ChipPhaseTimingsResponse(
+            chip_id=chip_id,
+            within_hours=within_hours,
+            start_at=start_at_dt,
+            end_at=end_at_dt,
+            phases=[
+                _phase_timing_stat(phase, int(t["count"]), t["total_seconds"], t["max_seconds"])
+                for phase, t in sorted(
+                    overall.items(), key=lambda item: task_phase_sort_key(item[0])
+                )
+            ],
+            tasks=[
+                TaskPhaseTimings(
+                    name=name,
+                    phases=sorted(phases, key=lambda stat: task_phase_sort_key(stat.phase)),
+                )
+                for name, phases in sorted(by_task.items())
+            ],
+        )
+
     def get_metric_history(
         self,
         chip_id: str,
@@ -319,29 +513,7 @@ class MetricsService:
             QubitMetricHistoryResponse with historical metric data
 
         """
-        cutoff_time = None
-        if within_days:
-            cutoff_time = now() - timedelta(days=within_days)
-
-        query: dict[str, Any] = {
-            "project_id": project_id,
-            "chip_id": chip_id,
-            "task_type": entity_type,
-            f"output_parameters.{metric}": {"$exists": True},
-        }
-
-        if entity_type == "qubit":
-            normalized_qid = normalize_qid(qid)
-            qid_variants = list(
-                {normalized_qid, qid, f"Q{normalized_qid.zfill(2)}", f"Q{normalized_qid.zfill(3)}"}
-            )
-            query["qid"] = {"$in": qid_variants}
-        else:
-            query["qid"] = qid
-
-        if cutoff_time:
-            query["start_at"] = {"$gte": cutoff_time}
-
+        query = _metric_history_query(chip_id, qid, project_id, metric, entity_type, within_days)
         task_results = self._task_result_repo.find(
             query, sort=[("start_at", SortDirection.DESCENDING)], limit=limit
         )
@@ -390,6 +562,70 @@ class MetricsService:
             history=history_items,
         )
 
+    def get_metric_history_columnar(
+        self,
+        chip_id: str,
+        qid: str,
+        project_id: str,
+        metric: str,
+        entity_type: Literal["qubit", "coupling"],
+        limit: int | None = None,
+        within_days: int | None = 30,
+    ) -> ColumnarSeries:
+        """Get the same history as :meth:`get_metric_history` as column arrays.
+
+        Only the metric and the fields needed for the columns are projected,
+        and rows are read from the cursor without building documents.
+
+        Args:
+        ----
+            chip_id: The chip identifier
+            qid: The qubit or coupling identifier (used as the series key)
+            project_id: The project identifier
+            metric: Metric name to retrieve history for
+            entity_type: "qubit" or "coupling"
+            limit: Maximum number of history items
+            within_days: Optional filter to last N days
+
+        Returns:
+        -------
+            ColumnarSeries with ``t``, ``value``, ``error``, ``task_id``,
+            ``execution_id`` and ``excluded`` columns, newest first
+
+        """
+        query = _metric_history_query(chip_id, qid, project_id, metric, entity_type, within_days)
+        rows = self._task_result_repo.iter_raw(
+            query,
+            {
+                "_id": 0,
+                "task_id": 1,
+                "execution_id": 1,
+                "start_at": 1,
+                "end_at": 1,
+                "system_info.created_at": 1,
+                "excluded": 1,
+                f"output_parameters.{metric}": 1,
+            },
+            sort=[("start_at", SortDirection.DESCENDING)],
+            limit=limit,
+        )
+        series = ColumnarSeries()
+        for row in rows:
+            metric_data = (row.get("output_parameters") or {}).get(metric)
+            value, _, metric_task_id = _extract_metric_output_info(metric_data)
+            if value is None:
+                continue
+            series.add(
+                qid,
+                _get_task_timestamp(SimpleNamespace(**row)),
+                value,
+                metric_data.get("error") if isinstance(metric_data, dict) else None,
+                metric_task_id or row.get("task_id"),
+                execution_id=row.get("execution_id"),
+                excluded=bool(row.get("excluded", False)),
+            )
+        return series
+
     def generate_metrics_pdf(
         self,
         chip_id: str,
@@ -466,6 +702,99 @@ class MetricsService:
 
         return pdf_buffer, filename, chip.topology_id
 
+    def submit_metrics_pdf_job(
+        self,
+        chip_id: str,
+        project_id: str,
+        username: str,
+        within_hours: int | None = None,
+        selection_mode: Literal["latest", "best", "average"] = "latest",
+        start_at: str | datetime | None = None,
+        end_at: str | datetime | None = None,
+    ) -> MetricsPdfJobResponse:
+        """Queue a metrics PDF report to be generated in the background.
+
+        Large reports hold a request worker for a long time; this returns
+        immediately and the finished PDF is fetched from ``download_url``.
+
+        Raises
+        ------
+            HTTPException: 404 if chip not found
+
+        """
+        if not self._chip_repo.find_one_document({"project_id": project_id, "chip_id": chip_id}):
+            raise HTTPException(status_code=404, detail=f"Chip {chip_id} not found")
+
+        job = MetricsPdfJobDocument(
+            job_id=uuid.uuid4().hex,
+            project_id=project_id,
+            chip_id=chip_id,
+            created_at=now(),
+        )
+        job.insert()
+        _expire_stalled_pdf_jobs()
+        _evict_finished_pdf_jobs()
+        job_id = job.job_id
+
+        def run() -> None:
+            _update_pdf_job(job_id, status="running")
+            try:
+                buffer, filename, _ = self.generate_metrics_pdf(
+                    chip_id=chip_id,
+                    project_id=project_id,
+                    username=username,
+                    within_hours=within_hours,
+                    selection_mode=selection_mode,
+                    start_at=start_at,
+                    end_at=end_at,
+                )
+                METRICS_PDF_DIR.mkdir(parents=True, exist_ok=True)
+                (METRICS_PDF_DIR / f"{job_id}.pdf").write_bytes(buffer.getvalue())
+                _update_pdf_job(job_id, status="completed", filename=filename, completed_at=now())
+            except HTTPException as e:
+                _update_pdf_job(job_id, status="failed", error=str(e.detail), completed_at=now())
+            except Exception as e:
+                logger.exception("Metrics PDF job %s failed", job_id)
+                _update_pdf_job(job_id, status="failed", error=str(e), completed_at=now())
+
+        _PDF_JOB_EXECUTOR.submit(run)
+        return _pdf_job_response(job)
+
+    def _get_pdf_job(self, project_id: str, job_id: str) -> MetricsPdfJobDocument:
+        _expire_stalled_pdf_jobs()
+        job = MetricsPdfJobDocument.find_one({"job_id": job_id, "project_id": project_id}).run()
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"PDF job {job_id} not found")
+        return job
+
+    def get_metrics_pdf_job(self, project_id: str, job_id: str) -> MetricsPdfJobResponse:
+        """Get the status of a background metrics PDF job.
+
+        Raises
+        ------
+            HTTPException: 404 if the job is unknown or belongs to another project
+
+        """
+        return _pdf_job_response(self._get_pdf_job(project_id, job_id))
+
+    def get_metrics_pdf_job_file(self, project_id: str, job_id: str) -> tuple[BytesIO, str]:
+        """Get the generated PDF of a completed background job.
+
+        Raises
+        ------
+            HTTPException: 404 if the job or its file is unknown, 409 if it has not completed
+
+        """
+        job = self._get_pdf_job(project_id, job_id)
+        if job.status != "completed" or job.filename is None:
+            raise HTTPException(
+                status_code=409, detail=f"PDF job {job_id} is {job.status}, not completed"
+            )
+        path = METRICS_PDF_DIR / f"{job_id}.pdf"
+        if not path.is_file():
+            raise HTTPException(status_code=404, detail=f"PDF of job {job_id} not found")
+        return BytesIO(path.read_bytes()), job.filename
+
     def _extract_metrics(
         self,
         chip_id: str,
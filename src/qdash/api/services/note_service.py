@@ -22,6 +22,7 @@ from qdash.common.utils.datetime import ensure_timezone, format_iso, now
 from qdash.datamodel.note import NoteCommentModel, NoteModel
 from qdash.datamodel.user import SystemRole
 from qdash.dbmodel.chip import ChipDocument
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
 from qdash.dbmodel.cooldown import CooldownDocument
 from qdash.dbmodel.coupling import CouplingDocument
 from qdash.dbmodel.metric_note import MetricNoteDocument
@@ -138,6 +139,8 @@ class NoteService:
             content=content,
             extra=extra or {},
         )
+        # Notes are part of the cached chip/qubit/coupling responses.
+        ChipDataVersionDocument.bump(project_id, chip_id)
         if action == "upsert":
             self._notify_note_mentions(
                 event_id=str(event.id),
@@ -3,29 +3,50 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, NamedTuple
 
 from bson import ObjectId
 from fastapi import HTTPException, status
-from pymongo.errors import DuplicateKeyError
+from pymongo import DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
 
+from qdash.api.lib.notification_stream import bump_counter_version
+from qdash.api.lib.pagination import aggregate_page
 from qdash.api.schemas.notification import (
     ListNotificationsResponse,
     NotificationResponse,
     UnreadNotificationCountResponse,
 )
 from qdash.common.utils.datetime import now
-from qdash.dbmodel.notification import NotificationDocument
+from qdash.dbmodel.notification import NotificationCounterDocument, NotificationDocument
 from qdash.dbmodel.project_membership import ProjectMembershipDocument
 from qdash.dbmodel.user import UserDocument
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from qdash.repository.pagination import SortKey
+
 MENTION_RE = re.compile(r"(?<![\w.-])@([A-Za-z0-9_.-]+)\b")
 PROJECT_MENTION = "project"
 RESERVED_MENTIONS = {"qdash", PROJECT_MENTION}
 EXCERPT_LIMIT = 180
+DUPLICATE_KEY_ERROR = 11000
+
+# Project of the empty counter that marks a recipient without notifications
+# as backfilled.
+_NO_PROJECT = ""
+
+# Served by the notification inbox indexes; _id breaks created_at ties.
+_INBOX_SORT: SortKey = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+
+class Recipient(NamedTuple):
+    """A notification recipient or actor resolved to its user ID."""
+
+    username: str
+    user_id: str | None
 
 
 class NotificationService:
@@ -84,55 +105,233 @@ class NotificationService:
         user = UserDocument.find_one({"username": username}).run()
         return user.user_id if user else None
 
+    def _recipient(self, username: str) -> Recipient:
+        return Recipient(username=username, user_id=self._user_id_for_username(username))
+
     def _active_project_recipients(
-        self, project_id: str, usernames: Iterable[str], actor_username: str
-    ) -> list[UserDocument]:
-        requested = {u for u in usernames if u != actor_username}
-        if not requested:
-            return []
+        self, project_id: str, usernames: Iterable[str] | None, actor_username: str
+    ) -> list[Recipient]:
+        """Resolve active, enabled project members in one aggregation.
+
+        ``usernames=None`` selects every active member (``@project``).
+        """
+        username_filter: dict[str, object]
+        if usernames is None:
+            username_filter = {"$ne": actor_username}
+        else:
+            requested = sorted({u for u in usernames if u != actor_username})
+            if not requested:
+                return []
+            username_filter = {"$in": requested}
+
+        rows = ProjectMembershipDocument.get_motor_collection().aggregate(
+            [
+                {
+                    "$match": {
+                        "project_id": project_id,
+                        "status": "active",
+                        "username": username_filter,
+                    }
+                },
+                {
+                    "$lookup": {
+                        "from": UserDocument.Settings.name,
+                        "localField": "username",
+                        "foreignField": "username",
+                        "as": "user",
+                    }
+                },
+                {"$unwind": "$user"},
+                {"$match": {"user.disabled": {"$ne": True}}},
+                {"$project": {"_id": 0, "username": "$user.username", "user_id": "$user.user_id"}},
+            ]
+        )
+        recipients = [Recipient(row["username"], row.get("user_id")) for row in rows]
+        return sorted(recipients, key=lambda r: r.username)
 
-        memberships = ProjectMembershipDocument.find(
-            {"project_id": project_id, "status": "active", "username": {"$in": list(requested)}}
-        ).to_list()
-        active_usernames = {m.username for m in memberships}
-        if not active_usernames:
-            return []
+    def _mentioned_project_recipients(
+        self, project_id: str, content: str, actor_username: str
+    ) -> list[Recipient]:
+        if self.has_project_mention(content):
+            # Every directly mentioned member is also an active member.
+            return self._active_project_recipients(project_id, None, actor_username)
+        return self._active_project_recipients(
+            project_id, self.extract_mentions(content), actor_username
+        )
+
+    def _build_notification(
+        self,
+        *,
+        project_id: str,
+        recipient: Recipient,
+        actor: Recipient,
+        kind: str,
+        source_type: str,
+        source_id: str,
+        target_url: str,
+        title: str,
+        excerpt: str,
+        dedupe_key: str,
+    ) -> NotificationDocument:
+        return NotificationDocument(
+            project_id=project_id,
+            recipient_user_id=recipient.user_id,
+            recipient_username=recipient.username,
+            actor_user_id=actor.user_id,
+            actor_username=actor.username,
+            kind=kind,
+            source_type=source_type,
+            source_id=source_id,
+            target_url=target_url,
+            title=title,
+            excerpt=self._excerpt(excerpt),
+            dedupe_key=dedupe_key,
+        )
+
+    def _insert_notifications(self, docs: list[NotificationDocument]) -> list[NotificationDocument]:
+        """Insert ``docs`` in one unordered batch, skipping duplicates.
 
-        users = UserDocument.find(
-            {"username": {"$in": list(active_usernames)}, "disabled": {"$ne": True}}
-        ).to_list()
-        return sorted(users, key=lambda u: u.username)
-
-    def _active_project_members(self, project_id: str, actor_username: str) -> list[UserDocument]:
-        memberships = ProjectMembershipDocument.find(
-            {"project_id": project_id, "status": "active", "username": {"$ne": actor_username}}
-        ).to_list()
-        active_usernames = {m.username for m in memberships}
-        if not active_usernames:
+        Returns the inserted documents; their unread counters are incremented.
+        """
+        if not docs:
             return []
+        rows = [doc.model_dump(exclude={"id", "revision_id"}) for doc in docs]
+        duplicates: set[int] = set()
+        try:
+            NotificationDocument.get_motor_collection().insert_many(rows, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                raise
+            duplicates = {error["index"] for error in errors}
+
+        inserted = []
+        for index, (doc, row) in enumerate(zip(docs, rows, strict=True)):
+            if index not in duplicates:
+                doc.id = row["_id"]
+                inserted.append(doc)
+        self._count_created(inserted)
+        return inserted
 
-        users = UserDocument.find(
-            {"username": {"$in": list(active_usernames)}, "disabled": {"$ne": True}}
-        ).to_list()
-        return sorted(users, key=lambda u: u.username)
+    @staticmethod
+    def _count_created(docs: Iterable[NotificationDocument]) -> None:
+        """Add new notifications to their recipients' counters.
+
+        Recipients that received the same number of notifications in the same
+        project share one ``update_many``, so a fan-out costs a constant
+        number of writes.
+        """
+        increments = Counter(
+            (doc.project_id, doc.recipient_user_id) for doc in docs if doc.recipient_user_id
+        )
+        groups: dict[tuple[str, int], list[str]] = defaultdict(list)
+        for (project_id, user_id), amount in increments.items():
+            groups[(project_id, amount)].append(user_id)
+
+        collection = NotificationCounterDocument.get_motor_collection()
+        timestamp = now()
+        for (project_id, amount), user_ids in groups.items():
+            query = {"project_id": project_id, "recipient_user_id": {"$in": user_ids}}
+            existing = {
+                row["recipient_user_id"] for row in collection.find(query, {"recipient_user_id": 1})
+            }
+            missing = [
+                {
+                    "recipient_user_id": user_id,
+                    "project_id": project_id,
+                    "unread": 0,
+                    "total": 0,
+                    "updated_at": timestamp,
+                }
+                for user_id in user_ids
+                if user_id not in existing
+            ]
+            if missing:
+                try:
+                    collection.insert_many(missing, ordered=False)
+                except BulkWriteError as e:
+                    # Created concurrently by another fan-out; the $inc below still applies.
+                    errors = e.details.get("writeErrors", [])
+                    if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                        raise
+            collection.update_many(
+                query,
+                {"$inc": {"unread": amount, "total": amount}, "$set": {"updated_at": timestamp}},
+            )
+        for user_id in {user_id for _, user_id in increments}:
+            bump_counter_version(user_id)
 
-    def _mentioned_project_recipients(
-        self, project_id: str, content: str, actor_username: str
-    ) -> list[UserDocument]:
-        recipients = {
-            user.username: user
-            for user in self._active_project_recipients(
-                project_id, self.extract_mentions(content), actor_username
+    @staticmethod
+    def _count_read(user_id: str, project_id: str, amount: int) -> None:
+        """Remove ``amount`` newly read notifications from the unread counter."""
+        if not amount:
+            return
+        NotificationCounterDocument.get_motor_collection().update_one(
+            {"recipient_user_id": user_id, "project_id": project_id},
+            {"$inc": {"unread": -amount}, "$set": {"updated_at": now()}},
+        )
+        bump_counter_version(user_id)
+
+    @staticmethod
+    def _counts(user_id: str, project_id: str | None) -> tuple[int, int]:
+        """Return ``(unread, total)`` from the maintained counters."""
+        query: dict[str, object] = {"recipient_user_id": user_id}
+        if project_id:
+            query["project_id"] = project_id
+        rows = list(
+            NotificationCounterDocument.get_motor_collection().find(
+                query, {"_id": 0, "unread": 1, "total": 1, "backfilled": 1}
+            )
+        )
+        if user_id and not (rows and all(row.get("backfilled") for row in rows)):
+            rows = NotificationService._backfill_counters(user_id, project_id)
+        unread = sum(row.get("unread", 0) for row in rows)
+        total = sum(row.get("total", 0) for row in rows)
+        # Counters briefly lag when a notification is read before its
+        # creation was counted; never show a negative badge.
+        return max(unread, 0), max(total, 0)
+
+    @staticmethod
+    def _backfill_counters(user_id: str, project_id: str | None) -> list[dict[str, int]]:
+        """Recompute a recipient's counters from their notifications.
+
+        Counters only see notifications created after they were introduced,
+        so a recipient's first read counts the older ones. Afterwards the
+        counters are marked ``backfilled`` and reads skip this step. Every
+        project of the recipient is backfilled, even on a read scoped to one
+        project, so later reads of the others never miss older notifications.
+        A requested project without notifications gets an empty counter, and
+        so does a recipient without any (project ``""``), so their reads skip
+        this step too.
+        """
+        counts = {
+            row["_id"]: {"unread": row["unread"], "total": row["total"]}
+            for row in NotificationDocument.get_motor_collection().aggregate(
+                [
+                    {"$match": {"recipient_user_id": user_id}},
+                    {
+                        "$group": {
+                            "_id": "$project_id",
+                            "unread": {"$sum": {"$cond": [{"$eq": ["$read_at", None]}, 1, 0]}},
+                            "total": {"$sum": 1},
+                        }
+                    },
+                ]
             )
         }
-        if self.has_project_mention(content):
-            recipients.update(
-                {
-                    user.username: user
-                    for user in self._active_project_members(project_id, actor_username)
-                }
+        requested = project_id or _NO_PROJECT
+        if project_id or not counts:
+            counts.setdefault(requested, {"unread": 0, "total": 0})
+
+        counters = NotificationCounterDocument.get_motor_collection()
+        timestamp = now()
+        for project, row in counts.items():
+            counters.update_one(
+                {"recipient_user_id": user_id, "project_id": project},
+                {"$set": {**row, "backfilled": True, "updated_at": timestamp}},
+                upsert=True,
             )
-        return sorted(recipients.values(), key=lambda u: u.username)
+        return [counts[requested]] if project_id else list(counts.values())
 
     def create_notification(
         self,
@@ -149,25 +348,20 @@ class NotificationService:
         dedupe_key: str,
     ) -> NotificationDocument | None:
         """Create a notification unless an equivalent one already exists."""
-        doc = NotificationDocument(
+        doc = self._build_notification(
             project_id=project_id,
-            recipient_user_id=self._user_id_for_username(recipient_username),
-            recipient_username=recipient_username,
-            actor_user_id=self._user_id_for_username(actor_username),
-            actor_username=actor_username,
+            recipient=self._recipient(recipient_username),
+            actor=self._recipient(actor_username),
             kind=kind,
             source_type=source_type,
             source_id=source_id,
             target_url=target_url,
             title=title,
-            excerpt=self._excerpt(excerpt),
+            excerpt=excerpt,
             dedupe_key=dedupe_key,
         )
-        try:
-            doc.insert()
-        except DuplicateKeyError:
-            return None
-        return doc
+        inserted = self._insert_notifications([doc])
+        return inserted[0] if inserted else None
 
     def notify_issue_event(
         self,
@@ -184,13 +378,14 @@ class NotificationService:
         """Create mention and reply notifications for an issue or reply."""
         target_url = f"/issues/{root_issue_id}"
         issue_title = title or f"Issue on {task_id}"
+        actor = self._recipient(actor_username)
         mentioned = self._mentioned_project_recipients(project_id, content, actor_username)
 
-        for recipient in mentioned:
-            self.create_notification(
+        docs = [
+            self._build_notification(
                 project_id=project_id,
-                recipient_username=recipient.username,
-                actor_username=actor_username,
+                recipient=recipient,
+                actor=actor,
                 kind="mention",
                 source_type="issue",
                 source_id=issue_id,
@@ -199,6 +394,8 @@ class NotificationService:
                 excerpt=content,
                 dedupe_key=f"mention:issue:{issue_id}:{recipient.user_id or recipient.username}",
             )
+            for recipient in mentioned
+        ]
 
         mentioned_usernames = {recipient.username for recipient in mentioned}
         if (
@@ -206,18 +403,21 @@ class NotificationService:
             and parent_author != actor_username
             and parent_author not in mentioned_usernames
         ):
-            self.create_notification(
-                project_id=project_id,
-                recipient_username=parent_author,
-                actor_username=actor_username,
-                kind="issue_reply",
-                source_type="issue",
-                source_id=issue_id,
-                target_url=target_url,
-                title=f"{actor_username} replied to {issue_title}",
-                excerpt=content,
-                dedupe_key=f"issue_reply:{issue_id}:{parent_author}",
+            docs.append(
+                self._build_notification(
+                    project_id=project_id,
+                    recipient=self._recipient(parent_author),
+                    actor=actor,
+                    kind="issue_reply",
+                    source_type="issue",
+                    source_id=issue_id,
+                    target_url=target_url,
+                    title=f"{actor_username} replied to {issue_title}",
+                    excerpt=content,
+                    dedupe_key=f"issue_reply:{issue_id}:{parent_author}",
+                )
             )
+        self._insert_notifications(docs)
 
     def notify_note_mentions(
         self,
@@ -231,19 +431,26 @@ class NotificationService:
     ) -> None:
         """Create mention notifications for a note event."""
         recipients = self._mentioned_project_recipients(project_id, content, actor_username)
-        for recipient in recipients:
-            self.create_notification(
-                project_id=project_id,
-                recipient_username=recipient.username,
-                actor_username=actor_username,
-                kind="note_mention",
-                source_type="note_event",
-                source_id=note_event_id,
-                target_url=target_url,
-                title=title,
-                excerpt=content,
-                dedupe_key=f"mention:note_event:{note_event_id}:{recipient.user_id or recipient.username}",
-            )
+        if not recipients:
+            return
+        actor = self._recipient(actor_username)
+        self._insert_notifications(
+            [
+                self._build_notification(
+                    project_id=project_id,
+                    recipient=recipient,
+                    actor=actor,
+                    kind="note_mention",
+                    source_type="note_event",
+                    source_id=note_event_id,
+                    target_url=target_url,
+                    title=title,
+                    excerpt=content,
+                    dedupe_key=f"mention:note_event:{note_event_id}:{recipient.user_id or recipient.username}",
+                )
+                for recipient in recipients
+            ]
+        )
 
     def notify_forum_event(
         self,
@@ -258,13 +465,14 @@ class NotificationService:
     ) -> None:
         """Create mention and reply notifications for a forum thread."""
         target_url = f"/forum/{root_post_id}"
+        actor = self._recipient(actor_username)
         mentioned = self._mentioned_project_recipients(project_id, content, actor_username)
 
-        for recipient in mentioned:
-            self.create_notification(
+        docs = [
+            self._build_notification(
                 project_id=project_id,
-                recipient_username=recipient.username,
-                actor_username=actor_username,
+                recipient=recipient,
+                actor=actor,
                 kind="forum_mention",
                 source_type="forum_post",
                 source_id=post_id,
@@ -273,6 +481,8 @@ class NotificationService:
                 excerpt=content,
                 dedupe_key=f"mention:forum_post:{post_id}:{recipient.user_id or recipient.username}",
             )
+            for recipient in mentioned
+        ]
 
         mentioned_usernames = {recipient.username for recipient in mentioned}
         if (
@@ -280,18 +490,21 @@ class NotificationService:
             and parent_author != actor_username
             and parent_author not in mentioned_usernames
         ):
-            self.create_notification(
-                project_id=project_id,
-                recipient_username=parent_author,
-                actor_username=actor_username,
-                kind="forum_reply",
-                source_type="forum_post",
-                source_id=post_id,
-                target_url=target_url,
-                title=f"{actor_username} replied to {title}",
-                excerpt=content,
-                dedupe_key=f"forum_reply:{post_id}:{parent_author}",
+            docs.append(
+                self._build_notification(
+                    project_id=project_id,
+                    recipient=self._recipient(parent_author),
+                    actor=actor,
+                    kind="forum_reply",
+                    source_type="forum_post",
+                    source_id=post_id,
+                    target_url=target_url,
+                    title=f"{actor_username} replied to {title}",
+                    excerpt=content,
+                    dedupe_key=f"forum_reply:{post_id}:{parent_author}",
+                )
             )
+        self._insert_notifications(docs)
 
     def list_notifications(
         self,
@@ -301,47 +514,60 @@ class NotificationService:
         unread_only: bool,
         skip: int,
         limit: int,
+        cursor: str | None = None,
     ) -> ListNotificationsResponse:
-        """List notifications for a user."""
-        identity_query: dict[str, object] = {
-            "recipient_user_id": self._user_id_for_username(username) or ""
-        }
-        query: dict[str, object] = dict(identity_query)
+        """List notifications for a user, newest first.
+
+        Counts come from the maintained counters, so a page costs one
+        indexed range read. Pass ``cursor=""`` to start keyset paging;
+        ``skip`` is then ignored.
+        """
+        user_id = self._user_id_for_username(username) or ""
+        unread_count, total = self._counts(user_id, project_id)
+
+        query: dict[str, object] = {"recipient_user_id": user_id}
         if project_id:
             query["project_id"] = project_id
         if unread_only:
             query["read_at"] = None
+            total = unread_count
 
-        unread_query: dict[str, object] = dict(identity_query)
-        unread_query["read_at"] = None
-        if project_id:
-            unread_query["project_id"] = project_id
-
-        total = NotificationDocument.find(query).count()
-        unread_count = NotificationDocument.find(unread_query).count()
-        docs = (
-            NotificationDocument.find(query).sort("-created_at").skip(skip).limit(limit).to_list()
+        page = aggregate_page(
+            NotificationDocument.get_motor_collection(),
+            query,
+            scope=f"notifications:{project_id or ''}:{int(unread_only)}",
+            sort=_INBOX_SORT,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
         )
+        docs = [NotificationDocument.model_validate(row) for row in page.items]
         return ListNotificationsResponse(
             notifications=[self._to_response(doc) for doc in docs],
             total=total,
             unread_count=unread_count,
-            skip=skip,
+            skip=skip if cursor is None else 0,
             limit=limit,
+            next_cursor=page.next_cursor,
         )
 
+    def resolve_recipient_id(self, username: str) -> str:
+        """Return the user ID notifications for ``username`` are addressed to."""
+        return self._user_id_for_username(username) or ""
+
+    def unread_count_for_recipient(self, *, user_id: str, project_id: str | None) -> int:
+        """Return the unread count of an already resolved recipient."""
+        unread, _ = self._counts(user_id, project_id)
+        return unread
+
     def unread_count(
         self, *, username: str, project_id: str | None
     ) -> UnreadNotificationCountResponse:
         """Return unread notification count for a user."""
-        query: dict[str, object] = {
-            "recipient_user_id": self._user_id_for_username(username) or "",
-            "read_at": None,
-        }
-        if project_id:
-            query["project_id"] = project_id
         return UnreadNotificationCountResponse(
-            unread_count=NotificationDocument.find(query).count()
+            unread_count=self.unread_count_for_recipient(
+                user_id=self.resolve_recipient_id(username), project_id=project_id
+            )
         )
 
     def mark_read(self, *, notification_id: str, username: str) -> NotificationResponse:
@@ -350,25 +576,39 @@ class NotificationService:
             "_id": ObjectId(notification_id),
             "recipient_user_id": self._user_id_for_username(username) or "",
         }
+        raw = NotificationDocument.get_motor_collection().find_one_and_update(
+            {**identity_query, "read_at": None},
+            {"$set": {"read_at": now()}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if raw is not None:
+            doc = NotificationDocument.model_validate(raw)
+            self._count_read(str(identity_query["recipient_user_id"]), doc.project_id, 1)
+            return self._to_response(doc)
+
         doc = NotificationDocument.find_one(identity_query).run()
         if doc is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found"
             )
-        if doc.read_at is None:
-            doc.read_at = now()
-            doc.save()
         return self._to_response(doc)
 
     def mark_all_read(self, *, username: str, project_id: str | None) -> dict[str, int]:
         """Mark all matching notifications as read."""
-        query: dict[str, object] = {
-            "recipient_user_id": self._user_id_for_username(username) or "",
-            "read_at": None,
-        }
-        if project_id:
-            query["project_id"] = project_id
+        user_id = self._user_id_for_username(username) or ""
+        query: dict[str, object] = {"recipient_user_id": user_id, "read_at": None}
+        collection = NotificationDocument.get_motor_collection()
+        project_ids = [project_id] if project_id else collection.distinct("project_id", query)
+
         read_at = now()
-        result = NotificationDocument.find(query).update_many({"$set": {"read_at": read_at}}).run()
-        modified_count = getattr(result, "modified_count", 0)
-        return {"updated": int(modified_count)}
+        updated = 0
+        # One update per project keeps each counter decrement equal to the
+        # number of notifications that update actually flipped.
+        for pid in project_ids:
+            result = collection.update_many(
+                {**query, "project_id": pid}, {"$set": {"read_at": read_at}}
+            )
+            modified_count = int(getattr(result, "modified_count", 0))
+            self._count_read(user_id, pid, modified_count)
+            updated += modified_count
+        return {"updated": updated}
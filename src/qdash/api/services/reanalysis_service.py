@@ -15,18 +15,6 @@ from typing import TYPE_CHECKING, Any
 from bunnet import SortDirection
 from fastapi import HTTPException
 
-from qdash.analysis.spectroscopy import (
-    NUM_RESONATORS,
-    EstimateQubitFrequencyConfig,
-    EstimateResonatorFrequencyConfig,
-    create_bare_shift_boundary_estimator,
-    create_marked_figure,
-    estimate_and_mark_qubit_figure,
-    estimate_resonator_frequency_from_figure,
-    guess_sorted_slots_for_partial_mux,
-    peak_positions_from_assignment_order,
-    resolve_resonator_assignment_order,
-)
 from qdash.api.schemas.reanalysis import (
     ReanalyzeOutputParameter,
     ReanalyzeQubitSpectroscopyParams,
@@ -34,11 +22,17 @@ from qdash.api.schemas.reanalysis import (
     ReanalyzeResponse,
 )
 from qdash.common.config.path_resolver import resolve_calib_data_path
+from qdash.common.utils.lazy_import import lazy_import
 from qdash.dbmodel.task_result_history import TaskResultHistoryDocument
 
 if TYPE_CHECKING:
     import plotly.graph_objs as go
 
+    from qdash.analysis import spectroscopy
+else:
+    # numpy/scipy estimators; loaded on the first re-analysis request.
+    spectroscopy = lazy_import("qdash.analysis.spectroscopy")
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,7 +76,7 @@ class ReanalysisService:
                     doc.run_parameters, "bare_shift_strength_limit", default=4.0
                 )
                 strength_limit = float(stored_limit) if stored_limit is not None else 4.0
-            estimator = create_bare_shift_boundary_estimator(
+            estimator = spectroscopy.create_bare_shift_boundary_estimator(
                 type=estimator_type,
                 args={"strength_limit": strength_limit},
             )
@@ -92,10 +86,12 @@ class ReanalysisService:
             )
             config = config.with_boundary(boundary)
 
-        resonances, rejected, frequencies = estimate_resonator_frequency_from_figure(
+        resonances, rejected, frequencies = spectroscopy.estimate_resonator_frequency_from_figure(
             raw_fig, config
         )
-        marked_fig = create_marked_figure(raw_fig, resonances, rejected_resonances=rejected)
+        marked_fig = spectroscopy.create_marked_figure(
+            raw_fig, resonances, rejected_resonances=rejected
+        )
 
         trace = raw_fig.data[0]
         assignment_order = self._pick_resonator_assignment_order(params, doc.run_parameters)
@@ -142,7 +138,7 @@ class ReanalysisService:
         config = self._build_qubit_config(params, doc.run_parameters)
         retry_with_trim = bool(params.retry_with_trim)
 
-        marked_fig, freq_result = estimate_and_mark_qubit_figure(
+        marked_fig, freq_result = spectroscopy.estimate_and_mark_qubit_figure(
             raw_fig, config, retry_with_trim=retry_with_trim
         )
 
@@ -282,9 +278,9 @@ class ReanalysisService:
     def _build_resonator_config(
         params: ReanalyzeResonatorSpectroscopyParams,
         stored_run_parameters: dict[str, Any],
-    ) -> EstimateResonatorFrequencyConfig:
+    ) -> spectroscopy.EstimateResonatorFrequencyConfig:
         """Build a config; missing fields fall back to the stored task's run_parameters."""
-        defaults = EstimateResonatorFrequencyConfig()
+        defaults = spectroscopy.EstimateResonatorFrequencyConfig()
 
         def pick(name: str, fallback: Any) -> Any:
             value = getattr(params, name, None)
@@ -295,7 +291,7 @@ class ReanalysisService:
                 return stored["value"]
             return fallback
 
-        return EstimateResonatorFrequencyConfig(
+        return spectroscopy.EstimateResonatorFrequencyConfig(
             num_resonators=int(pick("num_resonators", defaults.num_resonators)),
             high_power_min=pick("high_power_min", defaults.high_power_min),
             high_power_max=pick("high_power_max", defaults.high_power_max),
@@ -311,8 +307,8 @@ class ReanalysisService:
     def _build_qubit_config(
         params: ReanalyzeQubitSpectroscopyParams,
         stored_run_parameters: dict[str, Any],
-    ) -> EstimateQubitFrequencyConfig:
-        defaults = EstimateQubitFrequencyConfig()
+    ) -> spectroscopy.EstimateQubitFrequencyConfig:
+        defaults = spectroscopy.EstimateQubitFrequencyConfig()
 
         def pick(name: str, fallback: Any) -> Any:
             value = getattr(params, name, None)
@@ -323,7 +319,7 @@ class ReanalysisService:
                 return stored["value"]
             return fallback
 
-        return EstimateQubitFrequencyConfig(
+        return spectroscopy.EstimateQubitFrequencyConfig(
             binarize_threshold_sigma_plus=float(
                 pick("binarize_threshold_sigma_plus", defaults.binarize_threshold_sigma_plus)
             ),
@@ -349,7 +345,7 @@ class ReanalysisService:
             if isinstance(stored_pattern, dict) and "value" in stored_pattern:
                 pattern = str(stored_pattern["value"])
 
-        return list(resolve_resonator_assignment_order(pattern))
+        return list(spectroscopy.resolve_resonator_assignment_order(pattern))
 
     @staticmethod
     def _pick_resonator_for_qid(
@@ -369,10 +365,12 @@ class ReanalysisService:
                 status_code=400, detail=f"qid {qid!r} is not a valid integer qubit id."
             ) from exc
 
-        id_in_mux = qid_int % NUM_RESONATORS
-        peak_positions = peak_positions_from_assignment_order(assignment_order)
+        id_in_mux = qid_int % spectroscopy.NUM_RESONATORS
+        peak_positions = spectroscopy.peak_positions_from_assignment_order(assignment_order)
         assigned_slot = peak_positions[id_in_mux]
-        sorted_slots, assignment_mode = guess_sorted_slots_for_partial_mux(xs, frequencies)
+        sorted_slots, assignment_mode = spectroscopy.guess_sorted_slots_for_partial_mux(
+            xs, frequencies
+        )
         resonance_index = (
             sorted_slots.index(assigned_slot) if assigned_slot in sorted_slots else None
         )
@@ -384,7 +382,7 @@ class ReanalysisService:
             "assigned slot %d unavailable in mode %s.",
             qid,
             len(frequencies),
-            NUM_RESONATORS,
+            spectroscopy.NUM_RESONATORS,
             assigned_slot,
             assignment_mode,
         )
@@ -24,6 +24,7 @@ from qdash.api.schemas.calibration import (
 from qdash.common.config.paths import QUBEX_CONFIG_BASE
 from qdash.common.utils.datetime import now
 from qdash.datamodel.system_info import SystemInfoModel
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
 from qdash.dbmodel.provenance import ProvenanceRelationType
 from qdash.dbmodel.qubit import QubitDocument
 from qdash.repository.provenance import (
@@ -501,6 +502,7 @@ class SeedImportService:
             qubit_doc.system_info.update_time()
             qubit_doc.save()
             logger.info(f"Updated QubitDocument for {chip_id}/{normalized_qid}")
+        ChipDataVersionDocument.bump(project_id, chip_id)
 
     def _record_provenance(
         self,
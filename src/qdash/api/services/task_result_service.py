@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING, Any, cast
 from bunnet import SortDirection
 from pymongo import ReturnDocument
 
+from qdash.api.lib.columnar import ColumnarSeries
 from qdash.api.schemas.task_result import (
     AiReviewListItem,
     AiReviewListResponse,
@@ -691,22 +692,9 @@ class TaskResultService:
         TimeSeriesData
 
         """
-        if start_at is None or end_at is None:
-            end_at_dt = now()
-            start_at_dt = now() - timedelta(days=7)
-        else:
-            start_at_dt = datetime.fromisoformat(start_at)
-            end_at_dt = datetime.fromisoformat(end_at)
-
-        query_filter: dict[str, Any] = {
-            "project_id": project_id,
-            "chip_id": chip_id,
-            "output_parameter_names": parameter,
-            "start_at": {"$gte": start_at_dt, "$lte": end_at_dt},
-        }
-        if tag is not None:
-            query_filter["tags"] = tag
-
+        query_filter = self._timeseries_filter(
+            chip_id, tag, parameter, project_id, start_at, end_at
+        )
         task_results = self._task_result_repo.find_with_projection(
             query_filter,
             projection_model=TimeSeriesProjection,
@@ -735,6 +723,85 @@ class TaskResultService:
 
         return TimeSeriesData(data=timeseries_by_qid)
 
+    def get_timeseries_columnar(
+        self,
+        chip_id: str,
+        tag: str | None,
+        parameter: str,
+        project_id: str,
+        target_qid: str | None = None,
+        start_at: str | None = None,
+        end_at: str | None = None,
+    ) -> ColumnarSeries:
+        """Fetch the same timeseries as :meth:`get_timeseries` as column arrays.
+
+        Rows are read straight from the cursor, projected to the one parameter,
+        without building a model per point. ``t`` is the parameter's
+        ``calibrated_at`` (falling back to the task start time).
+
+        Returns
+        -------
+        ColumnarSeries
+            Per-qid ``t``/``value``/``error``/``task_id`` columns plus ``unit``
+            and ``description``
+
+        """
+        query_filter = self._timeseries_filter(
+            chip_id, tag, parameter, project_id, start_at, end_at
+        )
+        if target_qid is not None:
+            query_filter["qid"] = target_qid
+
+        rows = self._task_result_repo.iter_raw(
+            query_filter,
+            {"_id": 0, "qid": 1, "start_at": 1, "task_id": 1, f"output_parameters.{parameter}": 1},
+            sort=[("start_at", SortDirection.ASCENDING)],
+        )
+        series = ColumnarSeries()
+        for row in rows:
+            param = (row.get("output_parameters") or {}).get(parameter)
+            if not isinstance(param, dict):
+                continue
+            qid = row.get("qid", "")
+            series.add(
+                qid,
+                param.get("calibrated_at") or row.get("start_at"),
+                param.get("value"),
+                param.get("error"),
+                param.get("task_id") or row.get("task_id"),
+            )
+            series.set_meta(
+                qid, unit=param.get("unit", ""), description=param.get("description", "")
+            )
+        return series
+
+    @staticmethod
+    def _timeseries_filter(
+        chip_id: str,
+        tag: str | None,
+        parameter: str,
+        project_id: str,
+        start_at: str | None,
+        end_at: str | None,
+    ) -> dict[str, Any]:
+        """Build the task result filter shared by the timeseries queries."""
+        if start_at is None or end_at is None:
+            end_at_dt = now()
+            start_at_dt = now() - timedelta(days=7)
+        else:
+            start_at_dt = datetime.fromisoformat(start_at)
+            end_at_dt = datetime.fromisoformat(end_at)
+
+        query_filter: dict[str, Any] = {
+            "project_id": project_id,
+            "chip_id": chip_id,
+            "output_parameter_names": parameter,
+            "start_at": {"$gte": start_at_dt, "$lte": end_at_dt},
+        }
+        if tag is not None:
+            query_filter["tags"] = tag
+        return query_filter
+
     def request_bulk_ai_review(
         self,
         *,
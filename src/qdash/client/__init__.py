@@ -38,6 +38,7 @@ from qdash.client.services.models import (
     AiReviewListResponse,
     AiReviewRunDetailResponse,
     AiReviewRunListResponse,
+    BulkMetricsResponse,
     CancelExecutionResponse,
     CandidateGateResponse,
     ChipMetricsResponse,
@@ -104,6 +105,7 @@ __all__ = [
     "AiReviewListResponse",
     "AiReviewRunDetailResponse",
     "AiReviewRunListResponse",
+    "BulkMetricsResponse",
     "CancelExecutionResponse",
     "CandidateGateResponse",
     "ChipMetricsResponse",
@@ -5,7 +5,7 @@ import random
 import time
 from datetime import UTC, datetime
 from importlib.metadata import PackageNotFoundError, version
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import httpx
 from pydantic import BaseModel, ValidationError
@@ -40,6 +40,8 @@ from qdash.client.services.models import (
     AiReviewRunDetailResponse,
     AiReviewRunListResponse,
     BodyReExecuteTaskResult,
+    BulkMetricsRequest,
+    BulkMetricsResponse,
     CancelExecutionResponse,
     CandidateGateResponse,
     ChipMetricsResponse,
@@ -76,6 +78,7 @@ from qdash.client.services.models import (
     SaveFlowResponse,
     ScheduleFlowResponse,
     SuccessResponse,
+    Target,
     TaskHistoryResponse,
     TaskKnowledgeResponse,
     TaskResultExcludeResponse,
@@ -292,8 +295,18 @@ class QDashClient:
         qids: list[str] | None = None,
         offset: int = 0,
         limit: int = 50,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
     ) -> ListQubitsResponse:
-        params = self._query_params(qids=qids, offset=offset, limit=limit)
+        params = self._query_params(
+            qids=qids,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            estimated_total=estimated_total or None,
+        )
         response = self._request("GET", f"/chips/{chip_id}/qubits", params=params)
         return self._validate_model_payload(ListQubitsResponse, response.data)
 
@@ -307,18 +320,38 @@ class QDashClient:
         *,
         offset: int = 0,
         limit: int = 100,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
     ) -> ListCouplingsResponse:
-        response = self._request(
-            "GET",
-            f"/chips/{chip_id}/couplings",
-            params={"offset": offset, "limit": limit},
+        params = self._query_params(
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            estimated_total=estimated_total or None,
         )
+        response = self._request("GET", f"/chips/{chip_id}/couplings", params=params)
         return self._validate_model_payload(ListCouplingsResponse, response.data)
 
     def get_chip_coupling(self, chip_id: str, coupling_id: str) -> CouplingResponse:
         response = self._request("GET", f"/chips/{chip_id}/couplings/{coupling_id}")
         return self._validate_model_payload(CouplingResponse, response.data)
 
+    def get_bulk_metrics(
+        self,
+        chip_ids: list[str],
+        fields: list[str],
+        *,
+        qids: list[str] | None = None,
+        target: Literal["qubit", "coupling"] = "qubit",
+    ) -> BulkMetricsResponse:
+        body = BulkMetricsRequest(
+            chip_ids=chip_ids, fields=fields, qids=qids, target=Target(target)
+        )
+        response = self._request("POST", "/chips/metrics/bulk", json=body.model_dump(mode="json"))
+        return self._validate_model_payload(BulkMetricsResponse, response.data)
+
     def get_task_results_timeseries(
         self,
         *,
@@ -697,11 +730,12 @@ class QDashClient:
         chip_id: str,
         skip: int = 0,
         limit: int = 20,
+        cursor: str | None = None,
     ) -> ListExecutionsResponse:
         response = self._request(
             "GET",
             "/executions",
-            params={"chip_id": chip_id, "skip": skip, "limit": limit},
+            params=self._query_params(chip_id=chip_id, skip=skip, limit=limit, cursor=cursor),
         )
         return self._validate_model_payload(ListExecutionsResponse, response.data)
 
@@ -261,6 +261,38 @@ class BulkAiReviewResponse(BaseModel):
     skipped_reason: Annotated[str | None, Field(title="Skipped Reason")] = None
 
 
+class Target(StrEnum):
+    qubit = "qubit"
+    coupling = "coupling"
+
+
+class BulkMetricsRequest(BaseModel):
+    """
+    Body for reading selected metrics of many chips and qubits at once.
+    """
+
+    chip_ids: Annotated[list[str], Field(max_length=32, min_length=1, title="Chip Ids")]
+    fields: Annotated[list[str], Field(max_length=64, min_length=1, title="Fields")]
+    """
+    Metric names such as t1 or x90_gate_fidelity (data.<metric> is accepted)
+    """
+    qids: Annotated[list[str] | None, Field(title="Qids")] = None
+    """
+    Qubit or coupling IDs to include; all when omitted
+    """
+    target: Annotated[Target, Field(title="Target")] = Target.qubit
+
+
+class BulkMetricsRow(BaseModel):
+    """
+    Metric values of one qubit or coupling, aligned to ``BulkMetricsResponse.fields``.
+    """
+
+    chip_id: Annotated[str, Field(title="Chip Id")]
+    qid: Annotated[str, Field(title="Qid")]
+    values: Annotated[list[float | None], Field(title="Values")]
+
+
 class CalibrationNoteResponse(BaseModel):
     """
     CalibrationNote is a subclass of BaseModel.
@@ -727,18 +759,83 @@ class ExecutionIdResponse(BaseModel):
     """
 
 
+class ExecutionLeaseStatus(BaseModel):
+    """
+    An active hardware lease held by a running calibration.
+
+    Attributes
+    ----------
+        chip_id (str): Leased chip.
+        qids (list[str] | None): Leased qubits, or None for the whole chip.
+        owner (str): Holder of the lease, usually the execution ID.
+        expires_at (datetime): When the lease lapses unless renewed.
+    """
+
+    chip_id: Annotated[str, Field(title="Chip Id")]
+    qids: Annotated[list[str] | None, Field(title="Qids")] = None
+    owner: Annotated[str, Field(title="Owner")]
+    expires_at: Annotated[AwareDatetime, Field(title="Expires At")]
+
+
 class ExecutionLockStatusResponse(BaseModel):
     """
     Response model for the fetch_execution_lock_status endpoint.
+
+    ``lock`` is the legacy project-wide lock. Calibrations that lease their
+    hardware are listed in ``leases`` instead; a new calibration is only
+    blocked by a lease on the same chip that covers the whole chip or shares
+    a qubit with it.
     """
 
     lock: Annotated[bool, Field(title="Lock")]
+    leases: Annotated[list[ExecutionLeaseStatus], Field(title="Leases")] = []
+
+
+class ExecutionProgress(BaseModel):
+    """
+    Predicted progress of a running execution.
+
+    Remaining time is predicted from the execution plan and the task
+    durations recorded on the chip; the low/high bounds and the earliest /
+    latest completion times span the ``confidence`` interval. They are None
+    until the chip has any recorded task duration.
+
+    Attributes
+    ----------
+        completed_tasks (int): Planned task runs finished or passed over.
+        total_tasks (int): Planned task runs.
+        fraction (float | None): ``completed_tasks / total_tasks``.
+        remaining_seconds (float | None): Predicted remaining seconds.
+        remaining_seconds_low (float | None): Lower bound of the remaining seconds.
+        remaining_seconds_high (float | None): Upper bound of the remaining seconds.
+        eta (datetime | None): Predicted completion time.
+        eta_earliest (datetime | None): Earliest completion time within the interval.
+        eta_latest (datetime | None): Latest completion time within the interval.
+        confidence (float): Coverage of the interval, e.g. 0.9.
+        history_samples (int): Recorded runs the remaining-time prediction is based on.
+    """
+
+    completed_tasks: Annotated[int, Field(title="Completed Tasks")]
+    total_tasks: Annotated[int, Field(title="Total Tasks")]
+    fraction: Annotated[float | None, Field(title="Fraction")] = None
+    remaining_seconds: Annotated[float | None, Field(title="Remaining Seconds")] = None
+    remaining_seconds_low: Annotated[float | None, Field(title="Remaining Seconds Low")] = None
+    remaining_seconds_high: Annotated[float | None, Field(title="Remaining Seconds High")] = None
+    eta: Annotated[AwareDatetime | None, Field(title="Eta")] = None
+    eta_earliest: Annotated[AwareDatetime | None, Field(title="Eta Earliest")] = None
+    eta_latest: Annotated[AwareDatetime | None, Field(title="Eta Latest")] = None
+    confidence: Annotated[float, Field(title="Confidence")]
+    history_samples: Annotated[int, Field(title="History Samples")] = 0
 
 
 class ExecutionResponseSummary(BaseModel):
     """
     ExecutionResponseSummary is a Pydantic model that represents the summary of an execution response.
 
+    It is the row model of execution listings and carries only the columns
+    an execution table shows; notes, messages and task results are served by
+    the execution detail endpoint.
+
     Attributes
     ----------
         name (str): The name of the execution.
@@ -750,7 +847,7 @@ class ExecutionResponseSummary(BaseModel):
         user_id (str | None): Internal ID of the user who started the execution.
         username (str): Username snapshot of the user who started the execution.
         tags (list[str]): Tags associated with the execution.
-        note (dict): Notes for the execution.
+        progress (ExecutionProgress | None): Predicted progress while running.
     """
 
     name: Annotated[str, Field(title="Name")]
@@ -762,7 +859,7 @@ class ExecutionResponseSummary(BaseModel):
     end_at: Annotated[AwareDatetime | None, Field(title="End At")] = None
     elapsed_time: Annotated[timedelta | None, Field(title="Elapsed Time")] = None
     tags: Annotated[list[str], Field(title="Tags")]
-    note: Annotated[dict[str, Any], Field(title="Note")]
+    progress: ExecutionProgress | None = None
 
 
 class ExpectedResultResponse(BaseModel):
@@ -1816,6 +1913,7 @@ class ListExecutionsResponse(BaseModel):
     total: Annotated[int | None, Field(title="Total")] = None
     skip: Annotated[int | None, Field(title="Skip")] = None
     limit: Annotated[int | None, Field(title="Limit")] = None
+    next_cursor: Annotated[str | None, Field(title="Next Cursor")] = None
 
 
 class ListFlowSchedulesResponse(BaseModel):
@@ -3465,6 +3563,7 @@ class UserListResponse(BaseModel):
 
     users: Annotated[list[UserListItem], Field(title="Users")]
     total: Annotated[int, Field(title="Total")]
+    next_cursor: Annotated[str | None, Field(title="Next Cursor")] = None
 
 
 class DisplayName(RootModel[str]):
@@ -3526,6 +3625,7 @@ class QdashApiSchemasAdminProjectListResponse(BaseModel):
 
     projects: Annotated[list[ProjectListItem], Field(title="Projects")]
     total: Annotated[int, Field(title="Total")]
+    next_cursor: Annotated[str | None, Field(title="Next Cursor")] = None
 
 
 class AddMemberRequest(BaseModel):
@@ -3616,6 +3716,19 @@ class BulkAiReviewRequest(BaseModel):
     model_override: ModelConfig | None = None
 
 
+class BulkMetricsResponse(BaseModel):
+    """
+    Compact metric matrix: one row per chip/qid and one column per field.
+
+    Values are scaled to the display units of metrics.yaml; ``units[i]`` is
+    the unit of column ``fields[i]``. Missing metrics are None.
+    """
+
+    fields: Annotated[list[str], Field(title="Fields")]
+    units: Annotated[list[str | None], Field(title="Units")]
+    rows: Annotated[list[BulkMetricsRow], Field(title="Rows")]
+
+
 class BulkUserImportResult(BaseModel):
     """
     Result for a single row in a bulk user import.
@@ -3832,6 +3945,7 @@ class ExecutionResponseDetail(BaseModel):
         note (dict): Notes for the execution.
         tags (list[str]): Tags associated with the execution.
         chip_id (str): The chip ID for the execution.
+        progress (ExecutionProgress | None): Predicted progress while running.
     """
 
     name: Annotated[str, Field(title="Name")]
@@ -3846,6 +3960,7 @@ class ExecutionResponseDetail(BaseModel):
     note: Annotated[dict[str, Any], Field(title="Note")]
     tags: Annotated[list[str], Field(title="Tags")] = []
     chip_id: Annotated[str, Field(title="Chip Id")] = ""
+    progress: ExecutionProgress | None = None
 
 
 class HTTPValidationError(BaseModel):
@@ -3958,12 +4073,18 @@ class ListCooldownsResponse(BaseModel):
 class ListCouplingsResponse(BaseModel):
     """
     Response model for listing couplings with pagination.
+
+    ``next_cursor`` is set only in keyset mode (when a ``cursor`` was sent)
+    and is None on the last page. ``total_estimated`` is True when ``total``
+    was carried over from the first page instead of being counted again.
     """
 
     couplings: Annotated[list[CouplingResponse], Field(title="Couplings")]
     total: Annotated[int, Field(title="Total")]
     limit: Annotated[int, Field(title="Limit")]
     offset: Annotated[int, Field(title="Offset")]
+    next_cursor: Annotated[str | None, Field(title="Next Cursor")] = None
+    total_estimated: Annotated[bool, Field(title="Total Estimated")] = False
 
 
 class ListCryostatsResponse(BaseModel):
@@ -3992,17 +4113,24 @@ class ListNotificationsResponse(BaseModel):
     unread_count: Annotated[int, Field(title="Unread Count")]
     skip: Annotated[int, Field(title="Skip")]
     limit: Annotated[int, Field(title="Limit")]
+    next_cursor: Annotated[str | None, Field(title="Next Cursor")] = None
 
 
 class ListQubitsResponse(BaseModel):
     """
     Response model for listing qubits with pagination.
+
+    ``next_cursor`` is set only in keyset mode (when a ``cursor`` was sent)
+    and is None on the last page. ``total_estimated`` is True when ``total``
+    was carried over from the first page instead of being counted again.
     """
 
     qubits: Annotated[list[QubitResponse], Field(title="Qubits")]
     total: Annotated[int, Field(title="Total")]
     limit: Annotated[int, Field(title="Limit")]
     offset: Annotated[int, Field(title="Offset")]
+    next_cursor: Annotated[str | None, Field(title="Next Cursor")] = None
+    total_estimated: Annotated[bool, Field(title="Total Estimated")] = False
 
 
 class ListTagResponse(BaseModel):
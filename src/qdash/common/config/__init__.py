@@ -53,8 +53,10 @@ from qdash.common.config.topology import (
     QubitPosition,
     TopologyDefinition,
     VisualizationConfig,
+    get_topology_path,
     list_topologies,
     load_topology,
+    parse_topology,
 )
 
 __all__ = [
@@ -89,11 +91,13 @@ __all__ = [
     "get_qubit_metric_metadata",
     "get_task_category",
     "get_tasks",
+    "get_topology_path",
     "is_task_available",
     "list_topologies",
     "load_backend_config",
     "load_metrics_config",
     "load_topology",
+    "parse_topology",
     "resolve_calib_data_path",
     "resolve_calibtasks_base_path",
     "resolve_config_base_path",
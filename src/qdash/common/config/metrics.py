@@ -90,3 +90,41 @@ def get_qubit_metric_metadata(metric_key: str) -> MetricMetadata | None:
 def get_coupling_metric_metadata(metric_key: str) -> MetricMetadata | None:
     """Get metadata for a coupling metric."""
     return load_metrics_config().coupling_metrics.get(metric_key)
+
+
+def normalize_metric_matrix(
+    fields: list[str],
+    rows: list[dict[str, Any]],
+    *,
+    is_coupling: bool = False,
+) -> list[str | None]:
+    """Scale metric rows in place to the display units from metrics.yaml.
+
+    ``rows`` are ``aggregate_bulk_metrics`` rows whose ``values`` align with
+    ``fields``. Configured metrics are multiplied by their ``scale``; other
+    metrics keep their stored values. Non-numeric values become None and the
+    per-row ``units`` are dropped.
+
+    Returns
+    -------
+    list[str | None]
+        The unit of each column: the configured unit, else the first stored one
+
+    """
+    config = load_metrics_config()
+    metadata = config.coupling_metrics if is_coupling else config.qubit_metrics
+    units: list[str | None] = []
+    for i, field in enumerate(fields):
+        meta = metadata.get(field.removeprefix("data."))
+        scale = meta.scale if meta else 1.0
+        for row in rows:
+            value = row["values"][i]
+            numeric = isinstance(value, int | float) and not isinstance(value, bool)
+            row["values"][i] = value * scale if numeric else None
+        if meta is not None:
+            units.append(meta.unit)
+        else:
+            units.append(next((row["units"][i] for row in rows if row["units"][i]), None))
+    for row in rows:
+        row.pop("units", None)
+    return units
@@ -67,18 +67,25 @@ def _topologies_dir() -> Path:
     return _get_config_dir() / TOPOLOGIES_DIR
 
 
+def get_topology_path(topology_id: str) -> Path:
+    """Get the file path of a topology definition."""
+    return _topologies_dir() / f"{topology_id}.yaml"
+
+
+def parse_topology(data: bytes | str) -> TopologyDefinition:
+    """Parse the content of a topology YAML file."""
+    return TopologyDefinition(**yaml.safe_load(data))
+
+
 @lru_cache(maxsize=32)
 def load_topology(topology_id: str) -> TopologyDefinition:
     """Load a specific topology definition."""
-    topology_path = _topologies_dir() / f"{topology_id}.yaml"
+    topology_path = get_topology_path(topology_id)
 
     if not topology_path.exists():
         raise FileNotFoundError(f"Topology file not found: {topology_path}")
 
-    with topology_path.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-
-    return TopologyDefinition(**data)
+    return parse_topology(topology_path.read_bytes())
 
 
 def list_topologies(size: int | None = None) -> list[dict[str, str]]:
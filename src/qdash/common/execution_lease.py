@@ -0,0 +1,194 @@
+"""Hardware leases for calibration sessions.
+
+An :class:`ExecutionLeaseManager` acquires a lease on a chip (or a set of
+its qubits) for one calibration session and renews it from a heartbeat
+thread, like :class:`qdash.common.job_worker.JobWorker` does for job leases.
+If the session process dies, the heartbeat stops and the lease lapses after
+``lease_seconds``, so the hardware is not left locked. Before each write the
+session calls :meth:`ExecutionLeaseManager.check`, which verifies the lease's
+fencing token is still live, so a session that stalled past its lease
+cannot overwrite results of the session that took over. Worker sessions
+that run part of a parent session's calibration :meth:`adopt` the parent's
+lease, so their writes are fenced on it too.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from qdash.datamodel.execution_lock import ExecutionLeaseModel
+    from qdash.repository.protocols import ExecutionLockRepository
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_LEASE_SECONDS = float(os.getenv("QDASH_EXECUTION_LEASE_SECONDS", "120"))
+
+
+class ExecutionLockConflictError(RuntimeError):
+    """Raised when the requested hardware is leased by another session."""
+
+
+class ExecutionLeaseLostError(RuntimeError):
+    """Raised when a session writes after its lease expired or was released."""
+
+
+def lease_qids(qids: Iterable[str] | None) -> list[str] | None:
+    """Return the qubits a session must lease, or None for the whole chip.
+
+    Coupling IDs such as ``"0-1"`` lease both of their qubits.
+    """
+    if not qids:
+        return None
+    return sorted({qubit for qid in qids for qubit in qid.split("-")})
+
+
+def _describe(lease: ExecutionLeaseModel) -> str:
+    scope = "the whole chip" if lease.qids is None else f"qubits {', '.join(lease.qids)}"
+    return f"{lease.owner} ({scope})"
+
+
+class ExecutionLeaseManager:
+    """Hold one session's lease: acquire, renew in the background, check, release."""
+
+    def __init__(
+        self,
+        repository: ExecutionLockRepository,
+        *,
+        lease_seconds: float = EXECUTION_LEASE_SECONDS,
+    ) -> None:
+        self._repo = repository
+        self._lease_seconds = lease_seconds
+        self._lease: ExecutionLeaseModel | None = None
+        self._owned = False
+        self._lost = threading.Event()
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat: threading.Thread | None = None
+
+    @property
+    def lease(self) -> ExecutionLeaseModel | None:
+        """The held lease, or None before acquire/after release."""
+        return self._lease
+
+    def acquire(
+        self,
+        project_id: str,
+        chip_id: str,
+        owner: str,
+        qids: list[str] | None = None,
+    ) -> ExecutionLeaseModel:
+        """Lease ``qids`` on the chip (None = whole chip) and start the heartbeat.
+
+        Raises
+        ------
+        ExecutionLockConflictError
+            If an active lease on the chip overlaps the request
+
+        """
+        if self._lease is not None:
+            raise RuntimeError("ExecutionLeaseManager already holds a lease")
+        lease = self._repo.acquire_lease(
+            project_id, chip_id, owner, qids=qids, lease_seconds=self._lease_seconds
+        )
+        if lease is None:
+            holders = [
+                _describe(active)
+                for active in self._repo.list_active_leases(project_id, chip_id)
+                if active.conflicts_with(qids)
+            ]
+            msg = (
+                f"Calibration is already running on chip {chip_id}"
+                + (f": {'; '.join(holders)}" if holders else "")
+                + ". Cannot start a new session."
+            )
+            raise ExecutionLockConflictError(msg)
+
+        self._lease = lease
+        self._owned = True
+        self._lost.clear()
+        self._stop_heartbeat.clear()
+        self._heartbeat = threading.Thread(
+            target=self._run_heartbeat,
+            args=(lease,),
+            name=f"execution-lease-{lease.lease_id[:8]}",
+            daemon=True,
+        )
+        self._heartbeat.start()
+        logger.info(
+            "Acquired execution lease %s on %s for %s",
+            lease.fencing_token,
+            chip_id,
+            _describe(lease),
+        )
+        return lease
+
+    def adopt(self, lease: ExecutionLeaseModel) -> None:
+        """Fence writes on a lease held by another session.
+
+        Used by worker sessions of a parent that holds ``lease``: :meth:`check`
+        verifies it as usual, but it is neither renewed nor released here.
+        """
+        if self._lease is not None:
+            raise RuntimeError("ExecutionLeaseManager already holds a lease")
+        self._lease = lease
+        self._owned = False
+        self._lost.clear()
+
+    def _run_heartbeat(self, lease: ExecutionLeaseModel) -> None:
+        interval = max(self._lease_seconds / 3, 0.01)
+        while not self._stop_heartbeat.wait(interval):
+            try:
+                held = self._repo.renew_lease(lease, lease_seconds=self._lease_seconds)
+            except Exception as exc:
+                # Transient database errors: keep trying until the lease runs out.
+                logger.warning("Renewing execution lease %s failed: %s", lease.lease_id, exc)
+                continue
+            if not held:
+                logger.warning("Lost execution lease on chip %s", lease.chip_id)
+                self._lost.set()
+                return
+
+    def check(self) -> None:
+        """Verify the lease's fencing token before writing results.
+
+        Does nothing when no lease is held (sessions run without a lock).
+
+        Raises
+        ------
+        ExecutionLeaseLostError
+            If the lease expired, was released, or was taken over
+
+        """
+        lease = self._lease
+        if lease is None:
+            return
+        if self._lost.is_set() or not self._repo.is_lease_held(lease):
+            self._lost.set()
+            msg = (
+                f"Execution lease on chip {lease.chip_id} "
+                f"(token {lease.fencing_token}) is no longer held"
+            )
+            raise ExecutionLeaseLostError(msg)
+
+    def release(self) -> None:
+        """Stop the heartbeat and release the lease (idempotent).
+
+        An adopted lease is only forgotten; its owner releases it.
+        """
+        lease = self._lease
+        if lease is None:
+            return
+        if not self._owned:
+            self._lease = None
+            return
+        self._stop_heartbeat.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        self._lease = None
+        self._repo.release_lease(lease)
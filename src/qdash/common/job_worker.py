@@ -0,0 +1,163 @@
+"""Worker loop for the durable job queue.
+
+A :class:`JobWorker` leases jobs of the kinds it has handlers for, keeps the
+lease alive with a heartbeat while the handler runs, and then completes the
+job or records the failure so the queue can retry it with backoff. Handlers
+signal transient failures by raising; a per-kind dead handler runs once a job
+has used up its attempts. The same loop drives the hosted
+``qdash.agent.worker`` process and the in-process drainers that replace
+per-process thread pools.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qdash.datamodel.job import JobModel
+    from qdash.repository.protocols import JobQueueRepository
+
+logger = logging.getLogger(__name__)
+
+JOB_LEASE_SECONDS = float(os.getenv("QDASH_JOB_LEASE_SECONDS", "300"))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("QDASH_JOB_POLL_INTERVAL_SECONDS", "2"))
+JOB_PROJECT_CONCURRENCY = int(os.getenv("QDASH_JOB_PROJECT_CONCURRENCY", "2"))
+
+JobHandler = Callable[["JobModel"], None]
+
+
+class JobPermanentError(Exception):
+    """Raised by a handler when retrying the job cannot succeed."""
+
+
+def default_worker_id() -> str:
+    """Return an identifier unique to this process."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobWorker:
+    """Lease and run queued jobs with registered handlers.
+
+    ``project_concurrency`` caps simultaneously leased jobs per (project,
+    kind) across every worker sharing the queue; ``0`` or a negative value
+    disables the cap. ``dead_handlers`` run, keyed by job kind, after a
+    failed attempt moves a job to dead; they receive the dead job including
+    its ``last_error``.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueueRepository,
+        handlers: Mapping[str, JobHandler],
+        *,
+        worker_id: str | None = None,
+        lease_seconds: float = JOB_LEASE_SECONDS,
+        poll_interval: float = JOB_POLL_INTERVAL_SECONDS,
+        project_concurrency: int = JOB_PROJECT_CONCURRENCY,
+        dead_handlers: Mapping[str, JobHandler] | None = None,
+    ) -> None:
+        if not handlers:
+            raise ValueError("at least one job handler is required")
+        self._queue = queue
+        self._handlers = dict(handlers)
+        self._dead_handlers = dict(dead_handlers or {})
+        self.worker_id = worker_id or default_worker_id()
+        self._lease_seconds = lease_seconds
+        self._poll_interval = poll_interval
+        self._project_concurrency = project_concurrency if project_concurrency > 0 else None
+
+    def run_once(self) -> bool:
+        """Lease and run at most one job. Returns whether a job was leased."""
+        job = self._queue.lease(
+            self.worker_id,
+            list(self._handlers),
+            lease_seconds=self._lease_seconds,
+            project_concurrency=self._project_concurrency,
+        )
+        if job is None:
+            return False
+        self._run(job)
+        return True
+
+    def _run(self, job: JobModel) -> None:
+        lease_token = job.lease_token or ""
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(job.job_id, lease_token, stop_heartbeat),
+            name=f"job-heartbeat-{job.job_id[:8]}",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            self._handlers[job.kind](job)
+        except JobPermanentError as exc:
+            logger.warning("Job %s (%s) failed permanently: %s", job.job_id, job.kind, exc)
+            self._fail(job, lease_token, str(exc), retry=False)
+        except Exception as exc:
+            logger.exception("Job %s (%s) attempt %d failed", job.job_id, job.kind, job.attempts)
+            self._fail(job, lease_token, f"{type(exc).__name__}: {exc}", retry=True)
+        else:
+            if not self._queue.complete(job.job_id, lease_token):
+                logger.warning("Job %s finished after its lease was reclaimed", job.job_id)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+
+    def _fail(self, job: JobModel, lease_token: str, error: str, *, retry: bool) -> None:
+        """Record a failed attempt and run the dead handler if the job gave up."""
+        from qdash.datamodel.job import JobStatus
+
+        released = self._queue.fail(job.job_id, lease_token, error, retry=retry)
+        if released is None or released.status != JobStatus.DEAD:
+            return
+        on_dead = self._dead_handlers.get(job.kind)
+        if on_dead is None:
+            return
+        try:
+            on_dead(released)
+        except Exception:
+            logger.exception("Dead handler for job %s (%s) failed", job.job_id, job.kind)
+
+    def _heartbeat(self, job_id: str, lease_token: str, stop: threading.Event) -> None:
+        interval = max(self._lease_seconds / 3, 0.01)
+        while not stop.wait(interval):
+            if not self._extend_lease(job_id, lease_token):
+                return
+
+    def _extend_lease(self, job_id: str, lease_token: str) -> bool:
+        """Extend the lease once. Returns False when the lease was lost."""
+        try:
+            held = self._queue.heartbeat(job_id, lease_token, lease_seconds=self._lease_seconds)
+        except Exception as exc:
+            # Transient database errors: keep trying until the lease runs out.
+            logger.warning("Heartbeat for job %s failed: %s", job_id, exc)
+            return True
+        if not held:
+            logger.warning("Lost lease on job %s", job_id)
+        return held
+
+    def drain(self) -> int:
+        """Run jobs until none can be leased. Returns the number of jobs run."""
+        processed = 0
+        while self.run_once():
+            processed += 1
+        return processed
+
+    def run_forever(self, stop: threading.Event | None = None) -> None:
+        """Poll the queue until ``stop`` is set."""
+        stop = stop or threading.Event()
+        logger.info("Job worker %s serving kinds: %s", self.worker_id, sorted(self._handlers))
+        while not stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception:
+                logger.exception("Job worker %s failed to poll the queue", self.worker_id)
+            stop.wait(self._poll_interval)
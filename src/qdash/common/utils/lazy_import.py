@@ -0,0 +1,87 @@
+"""Deferred imports for heavy optional-at-startup dependencies.
+
+Importing ``qdash.api.main`` used to load plotly, matplotlib, networkx,
+scipy, prefect, GitPython and the OpenAI SDK, although most requests never
+touch them. ``lazy_import`` returns a stand-in that imports the real module
+on first attribute access, so a module can keep its familiar top-level
+alias while paying the import cost only when the code path runs::
+
+    if TYPE_CHECKING:
+        import networkx as nx
+    else:
+        nx = lazy_import("networkx")
+
+The ``TYPE_CHECKING`` branch keeps type checkers and IDEs on the real
+module. ``tests/qdash/api/test_import_time.py`` guards that these modules
+stay out of API startup.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class _LazyModule(ModuleType):
+    """Module stand-in that imports ``__name__`` on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._lock = threading.Lock()
+        self._module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return module ``name``, deferring the import until it is first used.
+
+    If the module was already imported, it is returned directly.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return _LazyModule(name)
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` (PEP 562) for deferred package re-exports.
+
+    ``exports`` maps each public name to the submodule defining it, so
+    ``from package import name`` keeps working while importing the package
+    itself stays cheap::
+
+        __getattr__ = lazy_exports(__name__, {"run_chat": "qdash.copilot.agent"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -1,13 +1,37 @@
-"""Visualization helpers shared across runtime surfaces."""
+"""Visualization helpers shared across runtime surfaces.
 
+The Plotly-based chart builders are re-exported lazily so that importing
+``figure_metadata`` (used by the repository layer) does not load Plotly.
+"""
+
+from typing import TYPE_CHECKING
+
+from qdash.common.utils.lazy_import import lazy_exports
 from qdash.common.visualization.figure_metadata import figure_role_suffix, set_figure_role
-from qdash.common.visualization.metrics_chart import (
-    ChipGeometry,
-    build_chip_geometry,
-    chip_geometry_from_topology,
-    create_data_matrix,
-    create_qubit_heatmap,
-    get_qubit_position,
+
+if TYPE_CHECKING:
+    from qdash.common.visualization.metrics_chart import (
+        ChipGeometry,
+        build_chip_geometry,
+        chip_geometry_from_topology,
+        create_data_matrix,
+        create_qubit_heatmap,
+        get_qubit_position,
+    )
+
+__getattr__ = lazy_exports(
+    __name__,
+    dict.fromkeys(
+        (
+            "ChipGeometry",
+            "build_chip_geometry",
+            "chip_geometry_from_topology",
+            "create_data_matrix",
+            "create_qubit_heatmap",
+            "get_qubit_position",
+        ),
+        "qdash.common.visualization.metrics_chart",
+    ),
 )
 
 __all__ = [
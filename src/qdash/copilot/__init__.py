@@ -7,12 +7,36 @@ Package layout:
 - ``config``: configuration models and loaders
 - ``contracts``: request/response models shared across layers
 - ``prompts`` / ``tooling`` / ``services``: implementation details grouped by role
+
+Re-exports resolve on first access so that importing a submodule such as
+``qdash.copilot.config`` does not load the agent and the OpenAI SDK.
 """
 
-from qdash.copilot.agent import blocks_to_markdown, run_analysis, run_chat
-from qdash.copilot.config import CopilotConfig, ModelConfig, load_copilot_config
-from qdash.copilot.contracts import AnalysisResponse, ChatRequest, TaskAnalysisContext
-from qdash.copilot.runtime import CopilotRuntime
+from typing import TYPE_CHECKING
+
+from qdash.common.utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from qdash.copilot.agent import blocks_to_markdown, run_analysis, run_chat
+    from qdash.copilot.config import CopilotConfig, ModelConfig, load_copilot_config
+    from qdash.copilot.contracts import AnalysisResponse, ChatRequest, TaskAnalysisContext
+    from qdash.copilot.runtime import CopilotRuntime
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "blocks_to_markdown": "qdash.copilot.agent",
+        "run_analysis": "qdash.copilot.agent",
+        "run_chat": "qdash.copilot.agent",
+        "CopilotConfig": "qdash.copilot.config",
+        "ModelConfig": "qdash.copilot.config",
+        "load_copilot_config": "qdash.copilot.config",
+        "AnalysisResponse": "qdash.copilot.contracts",
+        "ChatRequest": "qdash.copilot.contracts",
+        "TaskAnalysisContext": "qdash.copilot.contracts",
+        "CopilotRuntime": "qdash.copilot.runtime",
+    },
+)
 
 __all__ = [
     "AnalysisResponse",
@@ -34,6 +34,7 @@ _TIMESERIES_CALL_LIMIT = 3
 _STORED_TOOLS: dict[str, StoredToolKey] = {
     "get_chip_parameter_timeseries": lambda args: args["parameter_name"],
     "get_chip_summary": lambda _args: "chip_summary",
+    "compare_chips": lambda _args: "chip_comparison",
 }
 
 
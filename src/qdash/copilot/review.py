@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING, Any
 
-from qdash.copilot.agent import blocks_to_markdown, run_analysis
 from qdash.copilot.runtime import CopilotRuntime
 
 if TYPE_CHECKING:
@@ -148,6 +147,9 @@ def render_ai_review_markdown(
     if forced := forced_ai_review_markdown(task_name, context_bundle.context.output_parameters):
         return forced
 
+    # The agent pulls in the OpenAI SDK; keep it off the API import path.
+    from qdash.copilot.agent import blocks_to_markdown, run_analysis
+
     result = asyncio.run(
         run_analysis(
             context=context_bundle.context,
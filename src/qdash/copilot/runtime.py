@@ -346,6 +346,20 @@ class CopilotRuntime:
             param_names=param_names,
         )
 
+    def load_compare_chips(
+        self, chip_ids: list[str], param_names: list[str], qids: list[str] | None = None
+    ) -> dict[str, Any]:
+        """Compare selected parameters across chips in one bulk metrics read.
+
+        Returns per-chip statistics and a list-of-dicts ``qubits`` table in
+        metrics.yaml display units.
+        """
+        return self._chip_overview_loader.load_compare_chips(
+            chip_ids=chip_ids,
+            param_names=param_names,
+            qids=qids,
+        )
+
     def load_chip_topology(self, chip_id: str) -> dict[str, Any]:
         """Load chip topology information."""
         return self._topology_context_loader.load_chip_topology(chip_id=chip_id)
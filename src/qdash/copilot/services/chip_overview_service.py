@@ -21,6 +21,17 @@ class ChipOverviewDataAccessProtocol(Protocol):
 
     def load_qubits_for_chip(self, chip_id: str) -> list[Any]: ...
 
+    def load_chip(self, chip_id: str) -> Any: ...
+
+    def load_bulk_metrics(
+        self,
+        project_id: str,
+        chip_ids: list[str],
+        fields: list[str],
+        qids: list[str] | None = None,
+        is_coupling: bool = False,
+    ) -> dict[str, Any]: ...
+
 
 @dataclass(frozen=True)
 class ParameterTimeseriesEntry:
@@ -216,6 +227,64 @@ class ChipOverviewLoader:
             "qubits": qubits,
         }
 
+    def load_compare_chips(
+        self,
+        *,
+        chip_ids: list[str],
+        param_names: list[str],
+        qids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Compare selected parameters across chips, in metrics.yaml display units."""
+        chips_by_project: dict[str, list[str]] = {}
+        missing: list[str] = []
+        for chip_id in dict.fromkeys(chip_ids):
+            chip = self._data_access.load_chip(chip_id)
+            if chip is None:
+                missing.append(chip_id)
+            else:
+                chips_by_project.setdefault(str(chip.project_id), []).append(chip_id)
+        if not chips_by_project:
+            return {"error": f"No chips found for chip_ids={chip_ids}"}
+
+        rows: list[dict[str, Any]] = []
+        units: list[str | None] = [None] * len(param_names)
+        try:
+            for project_id, project_chip_ids in chips_by_project.items():
+                matrix = self._data_access.load_bulk_metrics(
+                    project_id, project_chip_ids, param_names, qids=qids
+                )
+                rows.extend(matrix["rows"])
+                units = [unit or new for unit, new in zip(units, matrix["units"], strict=True)]
+        except ValueError as exc:
+            return {"error": str(exc)}
+
+        found = [chip_id for ids in chips_by_project.values() for chip_id in ids]
+        order = {chip_id: i for i, chip_id in enumerate(found)}
+        rows.sort(key=lambda row: (order[row["chip_id"]], _qid_sort_key(row["qid"])))
+
+        numeric_values: dict[str, dict[str, list[float]]] = {chip_id: {} for chip_id in found}
+        qubits: list[dict[str, Any]] = []
+        for row in rows:
+            entry: dict[str, Any] = {"chip_id": row["chip_id"], "qid": row["qid"]}
+            for param, value in zip(param_names, row["values"], strict=True):
+                entry[param] = value
+                if value is not None and math.isfinite(value):
+                    numeric_values[row["chip_id"]].setdefault(param, []).append(float(value))
+            qubits.append(entry)
+
+        result: dict[str, Any] = {
+            "chip_ids": found,
+            "units": dict(zip(param_names, units, strict=True)),
+            "statistics": {
+                chip_id: self._build_chip_summary_statistics(values)
+                for chip_id, values in numeric_values.items()
+            },
+            "qubits": qubits,
+        }
+        if missing:
+            result["missing_chip_ids"] = missing
+        return result
+
     def _normalize_chip_summary_docs(
         self,
         docs: list[Any],
@@ -280,3 +349,8 @@ class ChipOverviewLoader:
                 row[param] = raw_qubits[qid].get(param)
             qubits.append(row)
         return qubits
+
+
+def _qid_sort_key(qid: str) -> tuple[int, int, str]:
+    """Sort numeric qids numerically, before any non-numeric ones."""
+    return (0, int(qid), "") if qid.isdigit() else (1, 0, qid)
@@ -145,6 +145,24 @@ class CopilotDataAccess:
             .run(),
         )
 
+    def load_bulk_metrics(
+        self,
+        project_id: str,
+        chip_ids: list[str],
+        fields: list[str],
+        qids: list[str] | None = None,
+        is_coupling: bool = False,
+    ) -> dict[str, Any]:
+        """Read selected metrics for several chips as a compact matrix in display units."""
+        from qdash.common.config.metrics import normalize_metric_matrix
+        from qdash.repository.chip import MongoChipRepository
+
+        rows = MongoChipRepository().aggregate_bulk_metrics(
+            project_id, chip_ids, fields, qids=qids, is_coupling=is_coupling
+        )
+        units = normalize_metric_matrix(fields, rows, is_coupling=is_coupling)
+        return {"fields": fields, "units": units, "rows": rows}
+
     def load_qubits_for_chip(self, chip_id: str) -> list[QubitDocument]:
         from qdash.dbmodel.qubit import QubitDocument
 
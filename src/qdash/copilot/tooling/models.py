@@ -36,6 +36,12 @@ class CompareQubitsArgs(BaseModel):
     param_names: list[str] | None = None
 
 
+class CompareChipsArgs(BaseModel):
+    chip_ids: list[str]
+    param_names: list[str]
+    qids: list[str] | None = None
+
+
 class GetCouplingParamsArgs(BaseModel):
     chip_id: str
     coupling_id: str | None = None
@@ -8,6 +8,7 @@ from typing import Any, Protocol, TypeVar
 from pydantic import BaseModel
 
 from qdash.copilot.tooling.models import (
+    CompareChipsArgs,
     CompareQubitsArgs,
     ExecutePythonAnalysisArgs,
     GenerateChipHeatmapArgs,
@@ -84,6 +85,13 @@ class ToolRegistryDataService(Protocol):
         param_names: list[str] | None = None,
     ) -> dict[str, Any]: ...
 
+    def load_compare_chips(
+        self,
+        chip_ids: list[str],
+        param_names: list[str],
+        qids: list[str] | None = None,
+    ) -> dict[str, Any]: ...
+
     def load_chip_topology(self, chip_id: str) -> dict[str, Any]: ...
 
     def load_search_task_results(
@@ -221,6 +229,12 @@ class ToolExecutorRegistryBuilder:
                 GetChipSummaryArgs,
                 lambda args: self._service.load_chip_summary(args.chip_id, args.param_names),
             ),
+            "compare_chips": self._build_executor(
+                CompareChipsArgs,
+                lambda args: self._service.load_compare_chips(
+                    args.chip_ids, args.param_names, args.qids
+                ),
+            ),
             "get_chip_topology": self._build_executor(
                 GetChipTopologyArgs,
                 lambda args: self._service.load_chip_topology(args.chip_id),
@@ -11,6 +11,7 @@ import ast
 import io
 import logging
 import signal
+import threading
 from contextlib import redirect_stdout
 from typing import Any, TypedDict
 
@@ -194,6 +195,11 @@ def _ensure_serializable(obj: Any) -> Any:
 def execute_python_analysis(code: str, context_data: dict[str, Any] | None = None) -> SandboxResult:
     """Execute Python analysis code in a sandboxed environment.
 
+    The code is AST-validated here and then run in a warm worker process
+    from :func:`~qdash.copilot.tooling.sandbox_pool.get_sandbox_pool`, so a
+    runaway allocation or CPU loop cannot affect the API worker. When the pool
+    is disabled (``QDASH_SANDBOX_POOL_SIZE=0``) it runs in-process instead.
+
     Parameters
     ----------
     code : str
@@ -216,6 +222,20 @@ def execute_python_analysis(code: str, context_data: dict[str, Any] | None = Non
     if error is not None:
         return {"output": None, "chart": None, "error": error}
 
+    from qdash.copilot.tooling.sandbox_pool import get_sandbox_pool
+
+    pool = get_sandbox_pool()
+    if pool is not None:
+        return pool.run(code, context_data)
+    return run_validated_code(code, context_data)
+
+
+def run_validated_code(code: str, context_data: dict[str, Any] | None = None) -> SandboxResult:
+    """Run already-validated code with restricted builtins in this process.
+
+    The ``SIGALRM`` timeout is only armed on the main thread, where signal
+    handlers can be installed; sandbox pool workers always run it there.
+    """
     # Build restricted globals
     restricted_globals: dict[str, Any] = {
         "__builtins__": {**SAFE_BUILTINS, "__import__": _safe_import},
@@ -225,9 +245,9 @@ def execute_python_analysis(code: str, context_data: dict[str, Any] | None = Non
     # Capture stdout
     stdout_capture = io.StringIO()
 
-    # Set up timeout (Unix only)
+    # Set up timeout (Unix main thread only)
     old_handler = None
-    has_alarm = hasattr(signal, "SIGALRM")
+    has_alarm = hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
     if has_alarm:
         old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
         signal.alarm(EXECUTION_TIMEOUT_SECONDS)
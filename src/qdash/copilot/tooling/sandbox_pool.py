@@ -0,0 +1,310 @@
+"""Pre-started worker processes for the Python analysis sandbox.
+
+Each worker imports every module in ``ALLOWED_MODULES`` once at start-up, so
+a sandbox run pays only for the user code rather than for numpy/pandas/scipy/
+plotly imports. Workers run under ``RLIMIT_AS``/``RLIMIT_CPU`` limits and
+are killed by the parent on a wall-clock timeout, so a runaway allocation or
+CPU loop takes down a disposable worker instead of the API process. Code and
+``data`` are sent to the worker pickled over a pipe, and the result comes back
+the same way.
+
+Workers are recycled after ``max_runs_per_worker`` runs to bound memory
+growth from leaked state, and :meth:`SandboxPool.metrics` exposes run counts
+and latency percentiles.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from qdash.copilot.tooling.sandbox import (
+    ALLOWED_MODULES,
+    EXECUTION_TIMEOUT_SECONDS,
+    SandboxResult,
+    run_validated_code,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+logger = logging.getLogger(__name__)
+
+SANDBOX_POOL_SIZE = int(os.getenv("QDASH_SANDBOX_POOL_SIZE", "2"))
+SANDBOX_MAX_RUNS_PER_WORKER = int(os.getenv("QDASH_SANDBOX_MAX_RUNS_PER_WORKER", "50"))
+SANDBOX_MEMORY_LIMIT_MB = int(os.getenv("QDASH_SANDBOX_MEMORY_LIMIT_MB", "1024"))
+
+# Extra wall-clock time the parent waits past the in-worker SIGALRM timeout
+# before it gives up on the worker and kills it.
+KILL_GRACE_SECONDS = 2.0
+# How long a freshly started worker may take to import ALLOWED_MODULES.
+WORKER_STARTUP_TIMEOUT_SECONDS = 60.0
+_READY = "ready"
+LATENCY_WINDOW = 256
+
+
+def _current_vm_bytes() -> int | None:
+    """Virtual memory size of this process, if the platform exposes it."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _set_limits(memory_limit_bytes: int, cpu_seconds: int) -> None:
+    """Cap address space growth and CPU time of the current worker process.
+
+    ``RLIMIT_AS`` is set relative to the size after imports, so the budget
+    covers what user code allocates rather than the libraries themselves.
+    ``RLIMIT_CPU`` is cumulative per process, so it is re-armed before each
+    run relative to the CPU time used so far.
+    """
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-Unix
+        return
+
+    if memory_limit_bytes > 0:
+        vm = _current_vm_bytes()
+        if vm is not None:
+            limit = vm + memory_limit_bytes
+            with contextlib.suppress(ValueError, OSError):
+                resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    used = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(used.ru_utime + used.ru_stime) + cpu_seconds + 1
+    with contextlib.suppress(ValueError, OSError):
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, soft + 1))
+
+
+def _worker_main(conn: Connection, memory_limit_bytes: int) -> None:
+    """Serve sandbox runs until the parent closes the pipe or sends ``None``."""
+    # One BLAS thread per worker: parallelism comes from the pool.
+    for var in ("OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, "1")
+    for module in sorted(ALLOWED_MODULES):
+        with contextlib.suppress(ImportError):
+            importlib.import_module(module)
+    conn.send(_READY)
+
+    memory_armed = False
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+
+        code, context_data = message
+        _set_limits(0 if memory_armed else memory_limit_bytes, EXECUTION_TIMEOUT_SECONDS)
+        memory_armed = True
+
+        result = run_validated_code(code, context_data)
+        try:
+            conn.send(result)
+        except Exception as e:
+            conn.send({"output": None, "chart": None, "error": f"Result is not transferable: {e}"})
+
+
+@dataclass
+class _Worker:
+    process: BaseProcess
+    conn: Connection
+    runs: int = 0
+    ready: bool = False
+
+
+@dataclass
+class SandboxPoolMetrics:
+    """Counters and recent latencies of a sandbox pool."""
+
+    runs: int = 0
+    timeouts: int = 0
+    crashes: int = 0
+    recycled: int = 0
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def snapshot(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies_ms)
+
+        def percentile(p: float) -> float | None:
+            if not ordered:
+                return None
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+        return {
+            "runs": self.runs,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "recycled": self.recycled,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_max": ordered[-1] if ordered else None,
+        }
+
+
+class SandboxPool:
+    """A fixed-size pool of warm sandbox worker processes.
+
+    ``run`` checks out an idle worker, blocking until one is free, so at most
+    ``size`` analyses execute concurrently. Workers are started with the
+    ``spawn`` method because the API process is multi-threaded.
+    """
+
+    def __init__(
+        self,
+        size: int = SANDBOX_POOL_SIZE,
+        max_runs_per_worker: int = SANDBOX_MAX_RUNS_PER_WORKER,
+        memory_limit_mb: int = SANDBOX_MEMORY_LIMIT_MB,
+        timeout_seconds: float = EXECUTION_TIMEOUT_SECONDS,
+    ) -> None:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self._size = size
+        self._max_runs = max_runs_per_worker
+        self._memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self._timeout = timeout_seconds
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._metrics = SandboxPoolMetrics()
+        self._metrics_lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._memory_limit_bytes),
+            name="qdash-sandbox",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process=process, conn=parent_conn)
+
+    @staticmethod
+    def _stop_worker(worker: _Worker, *, kill: bool) -> None:
+        if kill:
+            worker.process.kill()
+        else:
+            with contextlib.suppress(OSError, BrokenPipeError):
+                worker.conn.send(None)
+        worker.process.join(timeout=1)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join(timeout=1)
+        worker.conn.close()
+
+    def _record(self, latency_ms: float, **counters: int) -> None:
+        with self._metrics_lock:
+            self._metrics.runs += 1
+            self._metrics.latencies_ms.append(latency_ms)
+            for name, value in counters.items():
+                setattr(self._metrics, name, getattr(self._metrics, name) + value)
+
+    def run(self, code: str, context_data: dict[str, Any] | None = None) -> SandboxResult:
+        """Run validated code in a worker and return its result."""
+        if self._closed:
+            raise RuntimeError("SandboxPool is closed")
+
+        worker = self._idle.get()
+        started = time.perf_counter()
+        replace = False
+        kill = True
+        try:
+            if not worker.ready:
+                # Import time of a fresh worker does not count toward the timeout.
+                if not worker.conn.poll(WORKER_STARTUP_TIMEOUT_SECONDS):
+                    raise OSError("sandbox worker did not start")
+                worker.conn.recv()
+                worker.ready = True
+                started = time.perf_counter()
+            worker.conn.send((code, context_data or {}))
+            # The worker's own SIGALRM normally answers first; the grace
+            # period only expires if it is stuck where signals do not fire.
+            if worker.conn.poll(self._timeout + KILL_GRACE_SECONDS):
+                result: SandboxResult = worker.conn.recv()
+                worker.runs += 1
+                if worker.runs >= self._max_runs:
+                    replace, kill = True, False
+                    self._record(_elapsed_ms(started), recycled=1)
+                else:
+                    self._record(_elapsed_ms(started))
+                return result
+
+            replace = True
+            self._record(_elapsed_ms(started), timeouts=1)
+            return {
+                "output": None,
+                "chart": None,
+                "error": f"Execution timed out after {self._timeout:g} seconds",
+            }
+        except (EOFError, OSError, BrokenPipeError):
+            # The worker died: RLIMIT_CPU (SIGXCPU), the OOM killer, or a crash
+            # in native code.
+            replace = True
+            self._record(_elapsed_ms(started), crashes=1)
+            return {
+                "output": None,
+                "chart": None,
+                "error": "Sandbox worker terminated (resource limit exceeded)",
+            }
+        finally:
+            if self._closed:
+                self._stop_worker(worker, kill=replace and kill)
+            elif replace:
+                self._stop_worker(worker, kill=kill)
+                self._idle.put(self._start_worker())
+            else:
+                self._idle.put(worker)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return run counters and latency percentiles."""
+        with self._metrics_lock:
+            snapshot = self._metrics.snapshot()
+        snapshot["size"] = self._size
+        snapshot["idle"] = self._idle.qsize()
+        return snapshot
+
+    def close(self) -> None:
+        """Stop all idle workers. Busy workers are stopped when returned."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._stop_worker(worker, kill=False)
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+_pool: SandboxPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxPool | None:
+    """Return the shared sandbox pool, or None when disabled by configuration."""
+    global _pool
+    if SANDBOX_POOL_SIZE <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool()
+        return _pool
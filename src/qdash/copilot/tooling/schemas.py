@@ -151,6 +151,41 @@ AGENT_TOOLS: list[dict[str, Any]] = [
             "additionalProperties": False,
         },
     },
+    {
+        "type": "function",
+        "name": "compare_chips",
+        "description": (
+            "Compare selected qubit parameters across several chips in one call. Returns: "
+            "(1) statistics: per-chip, per-parameter mean/median/std/min/max, "
+            "(2) qubits: one {chip_id, qid, param: value} row per qubit, "
+            "(3) units: the display unit of each parameter. "
+            "Use this instead of calling get_chip_summary for each chip."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "chip_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Chip IDs to compare",
+                },
+                "param_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Parameter names to compare (e.g. ['t1', 't2_echo', 'x90_gate_fidelity'])"
+                    ),
+                },
+                "qids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional qubit IDs to include. If omitted, all qubits are used.",
+                },
+            },
+            "required": ["chip_ids", "param_names"],
+            "additionalProperties": False,
+        },
+    },
     {
         "type": "function",
         "name": "get_coupling_params",
@@ -14,6 +14,7 @@ from qdash.datamodel.system_info import SystemInfoModel
 
 __all__ = [
     "ExecutionModel",
+    "ExecutionPlanModel",
     "ExecutionStatusModel",
 ]
 
@@ -100,3 +101,27 @@ class ExecutionModel(BaseModel):
     def _serialize_elapsed_time(cls, v: timedelta | None) -> str | None:
         """Serialize elapsed_time to H:MM:SS format."""
         return format_elapsed_time(v) if v else None
+
+
+class ExecutionPlanModel(BaseModel):
+    """Work an execution was started with, stored under ``note["plan"]``.
+
+    Steps run one after another. The lanes of a step run in parallel and
+    each lane runs every task for each of its qids in order. With ``batch``
+    set, each task instead runs once over all qids of the step.
+
+    Attributes
+    ----------
+        backend (str | None): The backend name. e.g. "qubex".
+        tasks (list[str]): The task names run per qid. e.g. ["CheckRabi", "CheckT1"].
+        steps (list[list[list[str]]]): Lanes of qids per step. e.g. [[["0", "1"], ["4"]]].
+        batch (bool): Whether each task runs once per step over all its qids.
+
+    """
+
+    backend: str | None = Field(None, description="The backend name")
+    tasks: list[str] = Field(default_factory=list, description="Task names run per qid")
+    steps: list[list[list[str]]] = Field(
+        default_factory=list, description="Parallel lanes of qids for each sequential step"
+    )
+    batch: bool = Field(False, description="Whether each task runs once over a step's qids")
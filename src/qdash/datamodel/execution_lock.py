@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
+
+from qdash.common.utils.datetime import ensure_timezone
+
+__all__ = [
+    "ExecutionLeaseModel",
+]
+
+
+class ExecutionLeaseModel(BaseModel):
+    """A time-limited claim on a chip, or on some of its qubits, by one calibration.
+
+    Leases on the same chip conflict when either covers the whole chip
+    (``qids`` is None) or their qubit sets overlap. ``fencing_token``
+    increases with every lease granted on the chip, so a session whose
+    lease expired cannot be mistaken for the newer holder.
+    """
+
+    lease_id: str = Field(..., description="Unique lease identifier")
+    project_id: str = Field(..., description="Owning project identifier")
+    chip_id: str = Field(..., description="Leased chip")
+    owner: str = Field(..., description="Holder of the lease, usually the execution ID")
+    qids: list[str] | None = Field(
+        default=None, description="Leased qubits, or None for the whole chip"
+    )
+    fencing_token: int = Field(..., description="Monotonic per-chip lease counter")
+    acquired_at: datetime = Field(..., description="When the lease was granted")
+    expires_at: datetime = Field(..., description="When the lease lapses unless renewed")
+
+    @field_validator("acquired_at", "expires_at", mode="before")
+    @classmethod
+    def _ensure_timezone(cls, v: Any) -> datetime | Any:
+        """MongoDB returns naive UTC datetimes; make them timezone-aware."""
+        if isinstance(v, datetime):
+            return ensure_timezone(v)
+        return v
+
+    def conflicts_with(self, qids: list[str] | None) -> bool:
+        """Check whether a request for ``qids`` (None = whole chip) overlaps this lease."""
+        if self.qids is None or qids is None:
+            return True
+        return not set(self.qids).isdisjoint(qids)
@@ -0,0 +1,84 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
+
+from qdash.common.utils.datetime import ensure_timezone
+
+__all__ = [
+    "JobModel",
+    "JobStatus",
+    "job_retry_delay_seconds",
+]
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a queued background job.
+
+    Attributes
+    ----------
+        QUEUED (str): Waiting for a worker (possibly delayed by ``available_at``).
+        LEASED (str): Held by a worker until ``lease_expires_at``.
+        COMPLETED (str): Finished successfully.
+        DEAD (str): Gave up after ``max_attempts`` or a permanent failure.
+
+    """
+
+    QUEUED = "queued"
+    LEASED = "leased"
+    COMPLETED = "completed"
+    DEAD = "dead"
+
+
+class JobModel(BaseModel):
+    """A unit of background work stored in the job queue."""
+
+    job_id: str = Field(..., description="Unique job identifier")
+    kind: str = Field(..., description="Handler name, e.g. 'ai_review'")
+    project_id: str = Field(..., description="Owning project identifier")
+    payload: dict[str, Any] = Field(default_factory=dict, description="Handler arguments")
+    priority: int = Field(default=0, description="Higher priorities are leased first")
+    status: JobStatus = Field(default=JobStatus.QUEUED, description="Current job status")
+    attempts: int = Field(default=0, description="Number of times the job has been leased")
+    max_attempts: int = Field(default=3, description="Leases allowed before the job is dead")
+    dedupe_key: str | None = Field(
+        default=None, description="At most one queued or leased job exists per key"
+    )
+    available_at: datetime = Field(..., description="Earliest time the job may be leased")
+    lease_owner: str | None = Field(default=None, description="Worker holding the lease")
+    lease_token: str | None = Field(default=None, description="Token of the current lease")
+    leased_at: datetime | None = Field(default=None, description="When the lease was taken")
+    lease_expires_at: datetime | None = Field(
+        default=None, description="When the lease becomes reclaimable"
+    )
+    last_error: str = Field(default="", description="Error of the last failed attempt")
+    created_at: datetime = Field(..., description="When the job was enqueued")
+    updated_at: datetime = Field(..., description="When the job was last modified")
+    finished_at: datetime | None = Field(default=None, description="When the job completed/died")
+
+    @field_validator(
+        "available_at",
+        "leased_at",
+        "lease_expires_at",
+        "created_at",
+        "updated_at",
+        "finished_at",
+        mode="before",
+    )
+    @classmethod
+    def _ensure_timezone(cls, v: Any) -> datetime | Any:
+        """MongoDB returns naive UTC datetimes; make them timezone-aware."""
+        if isinstance(v, datetime):
+            return ensure_timezone(v)
+        return v
+
+
+JOB_RETRY_BACKOFF_BASE_SECONDS = 30.0
+JOB_RETRY_BACKOFF_MAX_SECONDS = 600.0
+
+
+def job_retry_delay_seconds(attempts: int) -> float:
+    """Exponential backoff before a failed job is leasable again."""
+    exponent = max(attempts - 1, 0)
+    return float(min(JOB_RETRY_BACKOFF_BASE_SECONDS * 2**exponent, JOB_RETRY_BACKOFF_MAX_SECONDS))
@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Any, Final, Literal
 
 import numpy as np
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer, field_validator
 
 from qdash.common.utils.datetime import format_elapsed_time, format_iso, now, parse_elapsed_time
 from qdash.datamodel.system_info import SystemInfoModel
@@ -172,6 +172,38 @@ class TaskStatusModel(str, Enum):
     CANCELLED = CANCELLED
 
 
+class TaskPhase(str, Enum):
+    """Phases of a task execution whose wall-clock time is recorded.
+
+    Attributes
+    ----------
+        PREPROCESS (str): ``task.preprocess`` on the backend.
+        RUN (str): ``task.run`` / ``task.batch_run`` (the experiment itself).
+        POSTPROCESS (str): ``task.postprocess`` (fitting, figure creation).
+        ARTIFACTS (str): Saving figures and raw data to the filesystem.
+        PROVENANCE (str): Recording provenance lineage.
+        HISTORY (str): Writing the task result history.
+        AI_REVIEW (str): Enqueueing and generating the AI review note.
+
+    """
+
+    PREPROCESS = "preprocess"
+    RUN = "run"
+    POSTPROCESS = "postprocess"
+    ARTIFACTS = "artifacts"
+    PROVENANCE = "provenance"
+    HISTORY = "history"
+    AI_REVIEW = "ai_review"
+
+
+_TASK_PHASE_ORDER = {phase.value: index for index, phase in enumerate(TaskPhase)}
+
+
+def task_phase_sort_key(phase: str) -> tuple[int, str]:
+    """Sort key listing phases in execution order, unknown phases last."""
+    return _TASK_PHASE_ORDER.get(phase, len(_TASK_PHASE_ORDER)), phase
+
+
 class CalibDataModel(BaseModel):
     """Calibration data model.
 
@@ -185,15 +217,44 @@ class CalibDataModel(BaseModel):
     qubit: dict[str, dict[str, ParameterModel]] = Field(default_factory=dict)
     coupling: dict[str, dict[str, ParameterModel]] = Field(default_factory=dict)
 
+    # (kind, qid, parameter_name) written since the last take_changes().
+    # None until the first call: everything present counts as changed.
+    _changed: set[tuple[str, str, str]] | None = PrivateAttr(default=None)
+
     def put_qubit_data(self, qid: str, parameter_name: str, data: ParameterModel) -> None:
         if qid not in self.qubit:
             self.qubit[qid] = {}
         self.qubit[qid][parameter_name] = data
+        if self._changed is not None:
+            self._changed.add(("qubit", qid, parameter_name))
 
     def put_coupling_data(self, qid: str, parameter_name: str, data: ParameterModel) -> None:
         if qid not in self.coupling:
             self.coupling[qid] = {}
         self.coupling[qid][parameter_name] = data
+        if self._changed is not None:
+            self._changed.add(("coupling", qid, parameter_name))
+
+    def take_changes(self) -> "CalibDataModel":
+        """Return the entries written since the previous call and reset tracking.
+
+        The first call returns every entry. Only writes made through
+        ``put_qubit_data``/``put_coupling_data`` are tracked afterwards;
+        parameters are shared with this model, not copied.
+        """
+        if self._changed is None:
+            delta = CalibDataModel(
+                qubit={qid: dict(params) for qid, params in self.qubit.items()},
+                coupling={qid: dict(params) for qid, params in self.coupling.items()},
+            )
+        else:
+            delta = CalibDataModel()
+            for kind, qid, parameter_name in self._changed:
+                parameter = self[kind].get(qid, {}).get(parameter_name)
+                if parameter is not None:
+                    delta[kind].setdefault(qid, {})[parameter_name] = parameter
+        self._changed = set()
+        return delta
 
     def __getitem__(self, key: str) -> dict[str, dict[str, ParameterModel]]:
         """Get the item by key."""
@@ -221,6 +282,7 @@ class BaseTaskResultModel(BaseModel):
         elapsed_time (timedelta): The elapsed time of the task.
         task_type (str): The type of the task.
         system_info (SystemInfoModel): The system information.
+        phase_timings (dict[str, float]): Seconds spent per TaskPhase.
 
     """
 
@@ -245,6 +307,7 @@ class BaseTaskResultModel(BaseModel):
     elapsed_time: timedelta | None = None
     task_type: str = "global"
     system_info: SystemInfoModel = SystemInfoModel()
+    phase_timings: dict[str, float] = {}
 
     @field_validator("elapsed_time", mode="before")
     @classmethod
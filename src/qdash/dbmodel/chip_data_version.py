@@ -0,0 +1,62 @@
+"""Per-chip write counter used to validate cached API responses."""
+
+import logging
+from typing import ClassVar
+
+from bunnet import Document
+from pydantic import ConfigDict, Field
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+
+class ChipDataVersionDocument(Document):
+    """Monotonic version of a chip's calibration data.
+
+    Every write of qubit/coupling calibration data, task results or chip data
+    increments ``version``. Readers compare it with the version a cached
+    response was built from; reading it is one indexed point lookup.
+    """
+
+    project_id: str = Field(..., description="Owning project identifier")
+    chip_id: str = Field(..., description="The chip ID")
+    version: int = Field(default=0, description="Incremented on every chip data write")
+
+    class Settings:
+        """Settings for the document."""
+
+        name = "chip_data_version"
+        indexes: ClassVar = [
+            IndexModel([("project_id", ASCENDING), ("chip_id", ASCENDING)], unique=True),
+        ]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
+
+    @classmethod
+    def bump(cls, project_id: str | None, chip_id: str | None) -> None:
+        """Increment the chip's version after a write.
+
+        Failures are logged, not raised: the data write already succeeded, and
+        cached responses still expire after their TTL.
+        """
+        if not project_id or not chip_id:
+            return
+        try:
+            cls.get_motor_collection().update_one(
+                {"project_id": project_id, "chip_id": chip_id},
+                {"$inc": {"version": 1}},
+                upsert=True,
+            )
+        except PyMongoError as exc:
+            logger.warning("Failed to bump data version of chip %s: %s", chip_id, exc)
+
+    @classmethod
+    def get_version(cls, project_id: str, chip_id: str) -> int:
+        """Return the chip's current version (0 if it was never written)."""
+        raw = cls.get_motor_collection().find_one(
+            {"project_id": project_id, "chip_id": chip_id}, {"version": 1, "_id": 0}
+        )
+        return int(raw["version"]) if raw else 0
@@ -7,6 +7,7 @@ from pymongo import ASCENDING, IndexModel
 from qdash.datamodel.coupling import CouplingModel
 from qdash.datamodel.note import NoteModel
 from qdash.datamodel.system_info import SystemInfoModel
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
 from qdash.dbmodel.coupling_history import CouplingHistoryDocument
 from qdash.dbmodel.user import UserDocument
 
@@ -101,6 +102,7 @@ class CouplingDocument(Document):
         coupling_doc.data = CouplingDocument.merge_calib_data(coupling_doc.data, output_parameters)
         coupling_doc.system_info.update_time()
         coupling_doc.save()
+        ChipDataVersionDocument.bump(coupling_doc.project_id, chip_id)
         # Create history entry for the updated coupling
         coupling_model = CouplingModel(
             project_id=project_id,
@@ -121,6 +123,7 @@ class CouplingDocument(Document):
             raise ValueError(f"Coupling {qid} not found in chip {chip_id}")
         coupling_doc.status = status
         coupling_doc.save()
+        ChipDataVersionDocument.bump(coupling_doc.project_id, chip_id)
         return coupling_doc
 
     @staticmethod
@@ -9,6 +9,7 @@ from qdash.dbmodel.agent_session import (
 from qdash.dbmodel.backend import BackendDocument
 from qdash.dbmodel.calibration_note import CalibrationNoteDocument
 from qdash.dbmodel.chip import ChipDocument
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
 from qdash.dbmodel.chip_history import ChipHistoryDocument
 from qdash.dbmodel.chip_note import ChipNoteDocument
 from qdash.dbmodel.cooldown import CooldownDocument
@@ -19,14 +20,16 @@ from qdash.dbmodel.coupling_history import CouplingHistoryDocument
 from qdash.dbmodel.cryostat import CryostatDocument
 from qdash.dbmodel.execution_counter import ExecutionCounterDocument
 from qdash.dbmodel.execution_history import ExecutionHistoryDocument
-from qdash.dbmodel.execution_lock import ExecutionLockDocument
+from qdash.dbmodel.execution_lock import ExecutionLeaseDocument, ExecutionLockDocument
 from qdash.dbmodel.flow import FlowDocument
 from qdash.dbmodel.forum import ForumCategoryDocument, ForumCounterDocument, ForumPostDocument
 from qdash.dbmodel.issue import IssueDocument
 from qdash.dbmodel.issue_knowledge import IssueKnowledgeDocument
+from qdash.dbmodel.job import JobDocument
 from qdash.dbmodel.metric_note import MetricNoteDocument
+from qdash.dbmodel.metrics_pdf_job import MetricsPdfJobDocument
 from qdash.dbmodel.note_event import NoteEventDocument
-from qdash.dbmodel.notification import NotificationDocument
+from qdash.dbmodel.notification import NotificationCounterDocument, NotificationDocument
 from qdash.dbmodel.project import ProjectDocument
 from qdash.dbmodel.project_membership import ProjectMembershipDocument
 from qdash.dbmodel.provenance import (
@@ -54,6 +57,7 @@ def document_models() -> list[Any]:
         TaskResultHistoryDocument,
         QubitDocument,
         ChipDocument,
+        ChipDataVersionDocument,
         ChipNoteDocument,
         TaskDocument,
         CouplingDocument,
@@ -62,6 +66,7 @@ def document_models() -> list[Any]:
         UserDocument,
         ExecutionCounterDocument,
         ExecutionLockDocument,
+        ExecutionLeaseDocument,
         TagDocument,
         CalibrationNoteDocument,
         QubitHistoryDocument,
@@ -78,10 +83,13 @@ def document_models() -> list[Any]:
         TargetNoteDocument,
         NoteEventDocument,
         NotificationDocument,
+        NotificationCounterDocument,
         CryostatDocument,
         CooldownDocument,
         CooldownWiringEventDocument,
         CopilotChatSessionDocument,
+        JobDocument,
+        MetricsPdfJobDocument,
         # Provenance tracking
         ParameterVersionDocument,
         ProvenanceRelationDocument,
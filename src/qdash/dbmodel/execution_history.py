@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 from typing import Any, ClassVar
 
 from bunnet import Document
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from qdash.common.utils.datetime import ensure_timezone, parse_elapsed_time
@@ -12,6 +12,26 @@ from qdash.datamodel.system_info import SystemInfoModel
 from qdash.dbmodel.user import UserDocument
 
 
+def _aware_datetime(v: Any) -> datetime | Any:
+    if v is None:
+        return None
+    if isinstance(v, datetime):
+        return ensure_timezone(v)
+    # For other inputs (e.g., strings), let pydantic handle the conversion
+    return v
+
+
+def _elapsed_seconds(v: Any) -> float | None:
+    if v is None:
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, timedelta):
+        return v.total_seconds()
+    td = parse_elapsed_time(v)
+    return td.total_seconds() if td else None
+
+
 class ExecutionHistoryDocument(Document):
     """Document for storing execution history metadata.
 
@@ -55,25 +75,13 @@ class ExecutionHistoryDocument(Document):
     @classmethod
     def _ensure_timezone(cls, v: Any) -> datetime | Any:
         """Ensure datetime fields are timezone-aware."""
-        if v is None:
-            return None
-        if isinstance(v, datetime):
-            return ensure_timezone(v)
-        # For other inputs (e.g., strings), let pydantic handle the conversion
-        return v
+        return _aware_datetime(v)
 
     @field_validator("elapsed_time", mode="before")
     @classmethod
     def _parse_elapsed_time(cls, v: Any) -> float | None:
         """Parse elapsed_time from various formats and return seconds."""
-        if v is None:
-            return None
-        if isinstance(v, (int, float)):
-            return float(v)
-        if isinstance(v, timedelta):
-            return v.total_seconds()
-        td = parse_elapsed_time(v)
-        return td.total_seconds() if td else None
+        return _elapsed_seconds(v)
 
     class Settings:
         """Settings for the document."""
@@ -82,7 +90,12 @@ class ExecutionHistoryDocument(Document):
         indexes: ClassVar = [
             IndexModel([("project_id", ASCENDING), ("execution_id", ASCENDING)], unique=True),
             IndexModel(
-                [("project_id", ASCENDING), ("chip_id", ASCENDING), ("start_at", DESCENDING)]
+                [
+                    ("project_id", ASCENDING),
+                    ("chip_id", ASCENDING),
+                    ("start_at", DESCENDING),
+                    ("execution_id", DESCENDING),
+                ]
             ),
             IndexModel([("project_id", ASCENDING), ("chip_id", ASCENDING)]),
             IndexModel(
@@ -150,3 +163,36 @@ class ExecutionHistoryDocument(Document):
     model_config = ConfigDict(
         from_attributes=True,
     )
+
+
+class ExecutionHistorySummary(BaseModel):
+    """Projection of ``ExecutionHistoryDocument`` for execution listings.
+
+    Used with ``find(...).project(ExecutionHistorySummary)`` so listings read
+    only the columns an execution table shows; ``note``, ``message``,
+    ``system_info`` and ``calib_data_path`` are loaded by ``find_by_id`` when
+    a single execution is opened.
+    """
+
+    execution_id: str
+    name: str
+    status: str
+    chip_id: str
+    user_id: str | None = None
+    username: str = ""
+    tags: list[str] = []
+    start_at: datetime | None = None
+    end_at: datetime | None = None
+    elapsed_time: float | None = None
+
+    @field_validator("start_at", "end_at", mode="before")
+    @classmethod
+    def _ensure_timezone(cls, v: Any) -> datetime | Any:
+        """Ensure datetime fields are timezone-aware."""
+        return _aware_datetime(v)
+
+    @field_validator("elapsed_time", mode="before")
+    @classmethod
+    def _parse_elapsed_time(cls, v: Any) -> float | None:
+        """Parse elapsed_time from various formats and return seconds."""
+        return _elapsed_seconds(v)
@@ -1,4 +1,4 @@
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from bunnet import Document
 from pydantic import ConfigDict, Field
@@ -54,3 +54,37 @@ class ExecutionLockDocument(Document):
     @classmethod
     def unlock(cls, project_id: str) -> None:
         cls.set_lock(lock=False, project_id=project_id)
+
+
+class ExecutionLeaseDocument(Document):
+    """Active calibration leases on one chip.
+
+    All leases of a chip live in one document so that checking for an
+    overlapping lease and adding a new one is a single atomic update.
+    Expired entries are pruned lazily on the next acquisition.
+    """
+
+    project_id: str = Field(..., description="Owning project identifier")
+    chip_id: str = Field(..., description="Leased chip")
+    fencing_token: int = Field(default=0, description="Last fencing token issued for the chip")
+    leases: list[dict[str, Any]] = Field(default_factory=list, description="Granted leases")
+
+    class Settings:
+        """Settings for the document."""
+
+        name = "execution_lease"
+        indexes: ClassVar = [
+            IndexModel(
+                [("project_id", ASCENDING), ("chip_id", ASCENDING)],
+                unique=True,
+                name="project_chip_unique",
+            ),
+            IndexModel(
+                [("project_id", ASCENDING), ("leases.owner", ASCENDING)],
+                name="project_lease_owner_idx",
+            ),
+        ]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
@@ -0,0 +1,77 @@
+"""Document model for the durable background job queue."""
+
+from datetime import datetime
+from typing import Any, ClassVar
+
+from bunnet import Document
+from pydantic import ConfigDict, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from qdash.common.utils.datetime import now
+
+
+class JobDocument(Document):
+    """A queued background job (AI review, agent action run, ...).
+
+    ``active_key`` mirrors ``dedupe_key`` while the job is queued or leased and
+    is unset once it finishes, so the unique sparse index on it allows at most
+    one active job per key.
+    """
+
+    job_id: str = Field(..., description="Unique job identifier")
+    kind: str = Field(..., description="Handler name")
+    project_id: str = Field(..., description="Owning project identifier")
+    payload: dict[str, Any] = Field(default_factory=dict, description="Handler arguments")
+    priority: int = Field(default=0, description="Higher priorities are leased first")
+    status: str = Field(default="queued", description="queued | leased | completed | dead")
+    attempts: int = Field(default=0, description="Number of times the job has been leased")
+    max_attempts: int = Field(default=3, description="Leases allowed before the job is dead")
+    dedupe_key: str | None = Field(default=None, description="Deduplication key")
+    active_key: str | None = Field(default=None, description="dedupe_key while active")
+    available_at: datetime = Field(default_factory=now, description="Earliest lease time")
+    lease_owner: str | None = Field(default=None, description="Worker holding the lease")
+    lease_token: str | None = Field(default=None, description="Token of the current lease")
+    leased_at: datetime | None = Field(default=None, description="When the lease was taken")
+    lease_expires_at: datetime | None = Field(default=None, description="Lease expiry")
+    last_error: str = Field(default="", description="Error of the last failed attempt")
+    created_at: datetime = Field(default_factory=now, description="When the job was enqueued")
+    updated_at: datetime = Field(default_factory=now, description="Last modification time")
+    finished_at: datetime | None = Field(default=None, description="When the job completed/died")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    class Settings:
+        """Mongo metadata."""
+
+        name = "job_queue"
+        indexes: ClassVar = [
+            IndexModel([("job_id", ASCENDING)], unique=True, name="job_id_unique"),
+            IndexModel(
+                [("active_key", ASCENDING)],
+                unique=True,
+                sparse=True,
+                name="active_key_unique",
+            ),
+            IndexModel(
+                [
+                    ("status", ASCENDING),
+                    ("kind", ASCENDING),
+                    ("priority", DESCENDING),
+                    ("available_at", ASCENDING),
+                ],
+                name="status_kind_priority_available_idx",
+            ),
+            IndexModel(
+                [("status", ASCENDING), ("lease_expires_at", ASCENDING)],
+                name="status_lease_expires_idx",
+            ),
+            IndexModel(
+                [
+                    ("project_id", ASCENDING),
+                    ("kind", ASCENDING),
+                    ("status", ASCENDING),
+                    ("leased_at", ASCENDING),
+                ],
+                name="project_kind_status_leased_idx",
+            ),
+        ]
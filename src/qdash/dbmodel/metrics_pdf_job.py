@@ -0,0 +1,52 @@
+"""Document model for background metrics PDF report jobs."""
+
+from datetime import datetime
+from typing import Any, ClassVar, Literal
+
+from bunnet import Document
+from pydantic import ConfigDict, Field, field_validator
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from qdash.common.utils.datetime import ensure_timezone, now
+
+
+class MetricsPdfJobDocument(Document):
+    """State of a background metrics PDF report job.
+
+    The job runs in the API worker that accepted it, but its state lives here
+    and the finished PDF is written to the shared calibration data volume, so
+    any worker can report its status and serve the download.
+    """
+
+    job_id: str = Field(..., description="Unique job identifier")
+    project_id: str = Field(..., description="Owning project identifier")
+    chip_id: str = Field(..., description="Chip the report is generated for")
+    status: Literal["pending", "running", "completed", "failed"] = Field(
+        default="pending", description="Job status"
+    )
+    created_at: datetime = Field(default_factory=now, description="When the job was submitted")
+    completed_at: datetime | None = Field(default=None, description="When the job finished")
+    filename: str | None = Field(default=None, description="Download filename of the report")
+    error: str | None = Field(default=None, description="Error of a failed job")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    class Settings:
+        """Mongo metadata."""
+
+        name = "metrics_pdf_job"
+        indexes: ClassVar = [
+            IndexModel([("job_id", ASCENDING)], unique=True, name="job_id_unique"),
+            IndexModel(
+                [("status", ASCENDING), ("created_at", DESCENDING)],
+                name="status_created_idx",
+            ),
+        ]
+
+    @field_validator("created_at", "completed_at", mode="before")
+    @classmethod
+    def _ensure_timezone(cls, v: Any) -> datetime | Any:
+        """Ensure datetime fields are timezone-aware."""
+        if isinstance(v, datetime):
+            return ensure_timezone(v)
+        return v
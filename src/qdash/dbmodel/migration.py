@@ -37,6 +37,9 @@ Run migrations with:
 
     python -m qdash.dbmodel.migration migrate-forum-status          # dry-run
     python -m qdash.dbmodel.migration migrate-forum-status --execute  # execute
+
+    python -m qdash.dbmodel.migration backfill-notification-counters          # dry-run
+    python -m qdash.dbmodel.migration backfill-notification-counters --execute  # execute
 """
 
 import logging
@@ -911,6 +914,75 @@ def migrate_forum_status(dry_run: bool = True) -> dict[str, Any]:
     return stats
 
 
+def migrate_backfill_notification_counters(dry_run: bool = True) -> dict[str, Any]:
+    """Recompute per-(user, project) notification counters from notifications.
+
+    Unread and total counts are maintained incrementally when notifications
+    are created or read. Run this once after upgrading so notifications that
+    predate the counters are included; it is also safe to re-run to repair
+    drift. Counters whose notifications were all removed are reset to zero.
+    """
+    from qdash.common.utils.datetime import now
+    from qdash.dbmodel.notification import NotificationCounterDocument, NotificationDocument
+
+    counters = NotificationCounterDocument.get_motor_collection()
+    actual = {
+        (row["_id"]["recipient_user_id"], row["_id"]["project_id"]): (row["unread"], row["total"])
+        for row in NotificationDocument.get_motor_collection().aggregate(
+            [
+                {"$match": {"recipient_user_id": {"$nin": [None, ""]}}},
+                {
+                    "$group": {
+                        "_id": {
+                            "recipient_user_id": "$recipient_user_id",
+                            "project_id": "$project_id",
+                        },
+                        "unread": {"$sum": {"$cond": [{"$eq": ["$read_at", None]}, 1, 0]}},
+                        "total": {"$sum": 1},
+                    }
+                },
+            ]
+        )
+    }
+    stored = {
+        (row["recipient_user_id"], row["project_id"]): (
+            row.get("unread", 0),
+            row.get("total", 0),
+            row.get("backfilled", False),
+        )
+        for row in counters.find({})
+    }
+    stats: dict[str, Any] = {
+        "counters_expected": len(actual),
+        "counters_found": len(stored),
+        "counters_to_update": 0,
+    }
+
+    timestamp = now()
+    for key in actual.keys() | stored.keys():
+        unread, total = actual.get(key, (0, 0))
+        if stored.get(key) == (unread, total, True):
+            continue
+        stats["counters_to_update"] += 1
+        if not dry_run:
+            user_id, project_id = key
+            counters.update_one(
+                {"recipient_user_id": user_id, "project_id": project_id},
+                {
+                    "$set": {
+                        "unread": unread,
+                        "total": total,
+                        "backfilled": True,
+                        "updated_at": timestamp,
+                    }
+                },
+                upsert=True,
+            )
+
+    logger.info("Notification counter backfill: %s", stats)
+    return stats
+
+
 def migrate_backfill_user_id(dry_run: bool = True) -> dict[str, Any]:
     """Backfill opaque user IDs and relationship user_id fields.
 
@@ -1751,6 +1823,16 @@ if __name__ == "__main__":
         help="Actually execute the migration (default is dry-run)",
     )
 
+    notification_counters_parser = subparsers.add_parser(
+        "backfill-notification-counters",
+        help="Recompute unread/total notification counters",
+    )
+    notification_counters_parser.add_argument(
+        "--execute",
+        action="store_true",
+        help="Actually execute the migration (default is dry-run)",
+    )
+
     args = parser.parse_args()
 
     if args.command == "fix-invalid-fidelity":
@@ -1829,5 +1911,11 @@ if __name__ == "__main__":
         initialize()
         stats = migrate_forum_status(dry_run=not args.execute)
         logger.info(f"Migration complete: {stats}")
+    elif args.command == "backfill-notification-counters":
+        from qdash.dbmodel.initialize import initialize
+
+        initialize()
+        stats = migrate_backfill_notification_counters(dry_run=not args.execute)
+        logger.info(f"Migration complete: {stats}")
     else:
         parser.print_help()
@@ -38,13 +38,26 @@ class NotificationDocument(Document):
 
         name = "notification"
         indexes: ClassVar = [
+            # Inbox pages: newest first with _id breaking created_at ties, so
+            # keyset cursors resume with one index seek.
             IndexModel(
                 [
                     ("recipient_user_id", ASCENDING),
                     ("project_id", ASCENDING),
                     ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
                 ],
-                name="recipient_user_id_project_created_idx",
+                name="notification_inbox_idx",
+            ),
+            IndexModel(
+                [
+                    ("recipient_user_id", ASCENDING),
+                    ("project_id", ASCENDING),
+                    ("read_at", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="notification_unread_inbox_idx",
             ),
             IndexModel(
                 [
@@ -54,6 +67,14 @@ class NotificationDocument(Document):
                 ],
                 name="recipient_user_id_read_created_idx",
             ),
+            IndexModel(
+                [
+                    ("recipient_user_id", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="notification_all_projects_inbox_idx",
+            ),
             IndexModel(
                 [
                     ("recipient_username", ASCENDING),
@@ -72,3 +93,38 @@ class NotificationDocument(Document):
             ),
             IndexModel([("dedupe_key", ASCENDING)], unique=True, name="dedupe_key_unique_idx"),
         ]
+
+
+class NotificationCounterDocument(Document):
+    """Unread and total notification counts of one user in one project.
+
+    Maintained with atomic ``$inc`` updates when notifications are created or
+    marked read, so the inbox badge is a single indexed read instead of a
+    count over the notification collection. Counters created by those
+    updates are ``backfilled`` in all of their recipient's projects on the
+    recipient's first read, which counts the notifications that predate them
+    (a recipient without any gets one empty counter with ``project_id=""``);
+    rebuild all of them with
+    ``python -m qdash.dbmodel.migration backfill-notification-counters``.
+    """
+
+    recipient_user_id: str = Field(..., description="Recipient user ID")
+    project_id: str = Field(..., description="Owning project identifier")
+    unread: int = Field(default=0, description="Unread notifications")
+    total: int = Field(default=0, description="All notifications")
+    backfilled: bool = Field(default=False, description="Recomputed from the notifications")
+    updated_at: datetime = Field(default_factory=now, description="Last counter change")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    class Settings:
+        """Mongo metadata."""
+
+        name = "notification_counter"
+        indexes: ClassVar = [
+            IndexModel(
+                [("recipient_user_id", ASCENDING), ("project_id", ASCENDING)],
+                unique=True,
+                name="notification_counter_recipient_project_idx",
+            ),
+        ]
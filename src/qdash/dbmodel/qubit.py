@@ -7,6 +7,7 @@ from pymongo import ASCENDING, IndexModel
 from qdash.datamodel.note import NoteModel
 from qdash.datamodel.qubit import QubitModel
 from qdash.datamodel.system_info import SystemInfoModel
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
 from qdash.dbmodel.qubit_history import QubitHistoryDocument
 from qdash.dbmodel.user import UserDocument
 
@@ -100,6 +101,7 @@ class QubitDocument(Document):
         qubit_doc.data = QubitDocument.merge_calib_data(qubit_doc.data, output_parameters)
         qubit_doc.system_info.update_time()
         qubit_doc.save()
+        ChipDataVersionDocument.bump(qubit_doc.project_id, chip_id)
         # Create history entry for the updated qubit
         qubit_model = QubitModel(
             project_id=project_id,
@@ -121,6 +123,7 @@ class QubitDocument(Document):
         doc.status = status
         doc.system_info.update_time()
         doc.save()
+        ChipDataVersionDocument.bump(doc.project_id, chip_id)
         return doc
 
     @staticmethod
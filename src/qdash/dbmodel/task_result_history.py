@@ -10,6 +10,7 @@ from qdash.datamodel.execution import ExecutionModel
 from qdash.datamodel.note import AiReviewModel, NoteModel
 from qdash.datamodel.system_info import SystemInfoModel
 from qdash.datamodel.task import BaseTaskResultModel
+from qdash.dbmodel.chip_data_version import ChipDataVersionDocument
 from qdash.dbmodel.user import UserDocument
 
 
@@ -31,6 +32,7 @@ class TaskResultHistoryDocument(Document):
         end_at (datetime): The time when the execution ended.
         elapsed_time (timedelta): The elapsed time.
         system_info (SystemInfoModel): The system information.
+        phase_timings (dict[str, float]): Seconds spent per task phase.
 
     """
 
@@ -71,6 +73,10 @@ class TaskResultHistoryDocument(Document):
     start_at: datetime | None = Field(..., description="The time when the execution started")
     end_at: datetime | None = Field(..., description="The time when the execution ended")
     elapsed_time: float | None = Field(..., description="The elapsed time in seconds")
+    phase_timings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds spent per task phase (preprocess, run, postprocess, ...)",
+    )
     task_type: str = Field(..., description="The task type")
     system_info: SystemInfoModel = Field(..., description="The system information")
     qid: str = Field("", description="The qubit ID")
@@ -280,6 +286,7 @@ class TaskResultHistoryDocument(Document):
             start_at=task.start_at,
             end_at=task.end_at,
             elapsed_time=task.elapsed_time,
+            phase_timings=dict(task.phase_timings),
             task_type=task.task_type,
             system_info=task.system_info.model_dump(),
             qid=getattr(task, "qid", ""),
@@ -302,6 +309,7 @@ class TaskResultHistoryDocument(Document):
         if doc is None:
             doc = cls.from_datamodel(task=task, execution_model=execution_model)
             doc.save()
+            ChipDataVersionDocument.bump(execution_model.project_id, execution_model.chip_id)
             return doc
         doc.project_id = execution_model.project_id
         doc.user_id = cls._user_id_for_username(execution_model.username)
@@ -323,6 +331,8 @@ class TaskResultHistoryDocument(Document):
         doc.start_at = task.start_at
         doc.end_at = task.end_at
         doc.elapsed_time = task.elapsed_time.total_seconds() if task.elapsed_time else None
+        # Keep phases recorded outside the task model (e.g. the async AI review).
+        doc.phase_timings = {**doc.phase_timings, **task.phase_timings}
         doc.task_type = task.task_type
         doc.system_info = task.system_info
         doc.qid = getattr(task, "qid", "")
@@ -335,4 +345,5 @@ class TaskResultHistoryDocument(Document):
             chip_id=execution_model.chip_id,
         )
         doc.save()
+        ChipDataVersionDocument.bump(execution_model.project_id, execution_model.chip_id)
         return doc
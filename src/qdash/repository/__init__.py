@@ -19,6 +19,7 @@ from qdash.repository.execution_lock import MongoExecutionLockRepository
 # Filesystem implementations
 from qdash.repository.filesystem import FilesystemCalibDataSaver
 from qdash.repository.flow import MongoFlowRepository
+from qdash.repository.job_queue import MongoJobQueueRepository
 from qdash.repository.note_event import MongoNoteEventRepository
 from qdash.repository.project import MongoProjectRepository
 from qdash.repository.project_membership import MongoProjectMembershipRepository
@@ -31,6 +32,7 @@ from qdash.repository.protocols import (
     ExecutionCounterRepository,
     ExecutionLockRepository,
     ExecutionRepository,
+    JobQueueRepository,
     QubitCalibrationRepository,
     TaskRepository,
     TaskResultHistoryRepository,
@@ -62,6 +64,7 @@ __all__ = [
     "ExecutionRepository",
     # Filesystem implementations
     "FilesystemCalibDataSaver",
+    "JobQueueRepository",
     # Provenance implementations
     "MongoActivityRepository",
     # MongoDB implementations
@@ -77,6 +80,7 @@ __all__ = [
     "MongoExecutionLockRepository",
     "MongoExecutionRepository",
     "MongoFlowRepository",
+    "MongoJobQueueRepository",
     "MongoNoteEventRepository",
     "MongoParameterVersionRepository",
     "MongoProjectMembershipRepository",
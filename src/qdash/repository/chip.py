@@ -5,9 +5,10 @@ data persistence operations.
 """
 
 import logging
+import re
 from typing import Any
 
-from pymongo import DESCENDING
+from pymongo import ASCENDING, DESCENDING
 
 from qdash.datamodel.chip import ChipModel
 from qdash.datamodel.task import CalibDataModel
@@ -17,9 +18,96 @@ from qdash.dbmodel.coupling_history import CouplingHistoryDocument
 from qdash.dbmodel.qubit import QubitDocument
 from qdash.dbmodel.qubit_history import QubitHistoryDocument
 from qdash.dbmodel.user import UserDocument
+from qdash.repository.pagination import (
+    Page,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    sort_values,
+)
 
 logger = logging.getLogger(__name__)
 
+# Qubit/coupling listings page on the unique index (project_id, chip_id, qid, username).
+_UNIT_SORT: SortKey = [("qid", ASCENDING), ("username", ASCENDING)]
+_UNIT_FIELDS = frozenset({"status", "data", "note", "metric_notes"})
+_METRIC_NAME = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _unit_projection(fields: list[str] | None) -> dict[str, Any]:
+    """Build the projection for a qubit/coupling listing (raises ValueError on unknown fields)."""
+    projection: dict[str, Any] = {"_id": 0, "qid": 1, "chip_id": 1, "username": 1}
+    if fields is None:
+        projection.update(dict.fromkeys(_UNIT_FIELDS, 1))
+        return projection
+    for field in fields:
+        top, _, sub = field.partition(".")
+        if top not in _UNIT_FIELDS or (sub and top != "data"):
+            msg = f"Unknown field '{field}'"
+            raise ValueError(msg)
+        projection[field] = 1
+    # A parent path and one of its children cannot both be projected.
+    if "data" in projection:
+        projection = {k: v for k, v in projection.items() if not k.startswith("data.")}
+    return projection
+
+
+def _metric_names(fields: list[str]) -> list[str]:
+    """Strip the optional ``data.`` prefix from metric field paths (raises ValueError)."""
+    metrics = []
+    for field in fields:
+        metric = field.removeprefix("data.")
+        if not _METRIC_NAME.fullmatch(metric):
+            msg = f"Unknown field '{field}'"
+            raise ValueError(msg)
+        metrics.append(metric)
+    return metrics
+
+
+def _to_unit(row: dict[str, Any]) -> dict[str, Any]:
+    """Shape a raw qubit/coupling row like ``find_qubit``, keeping only fetched fields."""
+    unit = {"qid": row["qid"], "chip_id": row["chip_id"]}
+    unit.update({k: row[k] for k in _UNIT_FIELDS if k in row})
+    return unit
+
+
+def _list_units(
+    collection: Any,
+    query: dict[str, Any],
+    *,
+    scope: str,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    fields: list[str] | None,
+    estimated_total: bool,
+) -> Page[dict[str, Any]]:
+    """Page through qubit or coupling rows with offset or keyset pagination."""
+    projection = _unit_projection(fields)
+    if cursor is None:
+        rows = list(collection.find(query, projection).skip(offset).limit(limit))
+        return Page(items=[_to_unit(row) for row in rows], total=collection.count_documents(query))
+
+    after, carried_total = decode_cursor(cursor, scope) if cursor else (None, None)
+    page_query = {"$and": [query, keyset_filter(_UNIT_SORT, after)]} if after else query
+    rows = list(collection.find(page_query, projection).sort(_UNIT_SORT).limit(limit + 1))
+    if estimated_total and carried_total is not None:
+        total, total_estimated = carried_total, True
+    else:
+        total, total_estimated = collection.count_documents(query), False
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, sort_values(rows[-1], _UNIT_SORT), total)
+    return Page(
+        items=[_to_unit(row) for row in rows],
+        next_cursor=next_cursor,
+        total=total,
+        total_estimated=total_estimated,
+    )
+
 
 class MongoChipRepository:
     """MongoDB implementation of ChipRepository.
@@ -350,7 +438,11 @@ class MongoChipRepository:
         limit: int = 50,
         offset: int = 0,
         qids: list[str] | None = None,
-    ) -> tuple[list[dict[str, Any]], int]:
+        *,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
+    ) -> Page[dict[str, Any]]:
         """List qubits from QubitDocument collection with pagination.
 
         Parameters
@@ -362,38 +454,41 @@ class MongoChipRepository:
         limit : int
             Maximum number of qubits
         offset : int
-            Number to skip
+            Number to skip (ignored when ``cursor`` is given)
         qids : list[str] | None
             Optional specific qubit IDs
+        cursor : str | None
+            Keyset cursor from a previous page; ``""`` starts keyset paging
+            (ordered by qid) from the first qubit
+        fields : list[str] | None
+            Fields to return besides ``qid``/``chip_id`` (``status``, ``data``,
+            ``note``, ``metric_notes`` or ``data.<metric>``); all by default
+        estimated_total : bool
+            Reuse the total carried by ``cursor`` instead of counting again
 
         Returns
         -------
-        tuple[list[dict[str, Any]], int]
-            List of qubit dicts and total count
+        Page[dict[str, Any]]
+            Qubit dicts with total count and next cursor
+
+        Raises
+        ------
+        ValueError
+            If ``fields`` names an unknown field or ``cursor`` is invalid
 
         """
         query: dict[str, Any] = {"project_id": project_id, "chip_id": chip_id}
         if qids:
             query["qid"] = {"$in": qids}
-
-        total = QubitDocument.find(query).count()
-        docs = list(QubitDocument.find(query).skip(offset).limit(limit).run())
-
-        return (
-            [
-                {
-                    "qid": doc.qid,
-                    "chip_id": doc.chip_id,
-                    "status": doc.status,
-                    "data": doc.data,
-                    "note": doc.note.model_dump(mode="json"),
-                    "metric_notes": {
-                        k: v.model_dump(mode="json") for k, v in doc.metric_notes.items()
-                    },
-                }
-                for doc in docs
-            ],
-            total,
+        return _list_units(
+            QubitDocument.get_motor_collection(),
+            query,
+            scope=f"qubits:{project_id}:{chip_id}",
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            fields=fields,
+            estimated_total=estimated_total,
         )
 
     def find_qubit(self, project_id: str, chip_id: str, qid: str) -> dict[str, Any] | None:
@@ -434,7 +529,11 @@ class MongoChipRepository:
         chip_id: str,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[dict[str, Any]], int]:
+        *,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
+    ) -> Page[dict[str, Any]]:
         """List couplings from CouplingDocument collection with pagination.
 
         Parameters
@@ -446,34 +545,35 @@ class MongoChipRepository:
         limit : int
             Maximum number of couplings
         offset : int
-            Number to skip
+            Number to skip (ignored when ``cursor`` is given)
+        cursor : str | None
+            Keyset cursor from a previous page; ``""`` starts keyset paging
+            (ordered by coupling ID) from the first coupling
+        fields : list[str] | None
+            Fields to return besides ``qid``/``chip_id``; all by default
+        estimated_total : bool
+            Reuse the total carried by ``cursor`` instead of counting again
 
         Returns
         -------
-        tuple[list[dict[str, Any]], int]
-            List of coupling dicts and total count
+        Page[dict[str, Any]]
+            Coupling dicts with total count and next cursor
 
-        """
-        query: dict[str, Any] = {"project_id": project_id, "chip_id": chip_id}
+        Raises
+        ------
+        ValueError
+            If ``fields`` names an unknown field or ``cursor`` is invalid
 
-        total = CouplingDocument.find(query).count()
-        docs = list(CouplingDocument.find(query).skip(offset).limit(limit).run())
-
-        return (
-            [
-                {
-                    "qid": doc.qid,
-                    "chip_id": doc.chip_id,
-                    "status": doc.status,
-                    "data": doc.data,
-                    "note": doc.note.model_dump(mode="json"),
-                    "metric_notes": {
-                        k: v.model_dump(mode="json") for k, v in doc.metric_notes.items()
-                    },
-                }
-                for doc in docs
-            ],
-            total,
+        """
+        return _list_units(
+            CouplingDocument.get_motor_collection(),
+            {"project_id": project_id, "chip_id": chip_id},
+            scope=f"couplings:{project_id}:{chip_id}",
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            fields=fields,
+            estimated_total=estimated_total,
         )
 
     def find_coupling(
@@ -632,6 +732,68 @@ class MongoChipRepository:
 
         return {"values": values, "unit": unit}
 
+    def aggregate_bulk_metrics(
+        self,
+        project_id: str,
+        chip_ids: list[str],
+        fields: list[str],
+        qids: list[str] | None = None,
+        is_coupling: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Read selected metrics for many chips in one projected aggregation.
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_ids : list[str]
+            Chips to read
+        fields : list[str]
+            Metric names, optionally prefixed with ``data.``
+        qids : list[str] | None
+            Qubit/coupling IDs to include (all when None)
+        is_coupling : bool
+            Whether to query coupling or qubit collection
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Rows sorted by chip_id and qid, each with ``values`` and ``units``
+            lists aligned to ``fields`` (None where a metric is missing)
+
+        Raises
+        ------
+        ValueError
+            If a field is not a plain metric name
+
+        """
+        metrics = _metric_names(fields)
+        match: dict[str, Any] = {"project_id": project_id, "chip_id": {"$in": chip_ids}}
+        if qids is not None:
+            match["qid"] = {"$in": qids}
+
+        # Index-based aliases keep the projection flat whatever the metric names are.
+        projection: dict[str, Any] = {"_id": 0, "chip_id": 1, "qid": 1}
+        for i, metric in enumerate(metrics):
+            projection[f"v{i}"] = f"$data.{metric}.value"
+            projection[f"u{i}"] = f"$data.{metric}.unit"
+
+        collection = CouplingDocument if is_coupling else QubitDocument
+        pipeline = [
+            {"$match": match},
+            {"$project": projection},
+            {"$sort": {"chip_id": ASCENDING, "qid": ASCENDING}},
+        ]
+        return [
+            {
+                "chip_id": row["chip_id"],
+                "qid": row["qid"],
+                "values": [row.get(f"v{i}") for i in range(len(metrics))],
+                "units": [row.get(f"u{i}") for i in range(len(metrics))],
+            }
+            for row in collection.aggregate(pipeline).run()
+        ]
+
     def get_qubit_ids(self, project_id: str, chip_id: str) -> list[str]:
         """Get all qubit IDs for a chip from QubitDocument collection.
 
@@ -748,6 +910,51 @@ class MongoChipRepository:
             for doc in docs
         }
 
+    def find_metric_data(
+        self,
+        project_id: str,
+        chip_id: str,
+        ids: list[str],
+        metrics: list[str],
+        *,
+        username: str | None = None,
+        is_coupling: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        """Get selected ``data`` entries for some qubits or couplings.
+
+        Only the requested metrics are projected, so callers that need a
+        handful of values do not load whole documents.
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        ids : list[str]
+            Qubit or coupling IDs to fetch
+        metrics : list[str]
+            Metric names to read from ``data``
+        username : str | None
+            Optional owner filter
+        is_coupling : bool
+            Whether to query coupling or qubit collection
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Map of ID to its (partial) data dict
+
+        """
+        query: dict[str, Any] = {"project_id": project_id, "chip_id": chip_id, "qid": {"$in": ids}}
+        if username is not None:
+            query["username"] = username
+        projection = {"_id": 0, "qid": 1}
+        projection.update({f"data.{metric}": 1 for metric in _metric_names(metrics)})
+        document = CouplingDocument if is_coupling else QubitDocument
+        rows = document.get_motor_collection().find(query, projection)
+        return {row["qid"]: row.get("data", {}) for row in rows}
+
     # Entity model methods for metrics extraction
 
     def get_all_qubit_models(
@@ -5,13 +5,22 @@ history persistence operations.
 """
 
 import logging
+from typing import Any
 
 from bunnet import SortDirection
 
-from qdash.dbmodel.execution_history import ExecutionHistoryDocument
+from qdash.dbmodel.execution_history import ExecutionHistoryDocument, ExecutionHistorySummary
+from qdash.repository.pagination import Page, decode_cursor, encode_cursor, keyset_filter
 
 logger = logging.getLogger(__name__)
 
+# Served by the (project_id, chip_id, start_at, execution_id) index; execution_id
+# breaks start_at ties so keyset pages never skip or repeat an execution.
+_EXECUTION_SORT: list[tuple[str, SortDirection]] = [
+    ("start_at", SortDirection.DESCENDING),
+    ("execution_id", SortDirection.DESCENDING),
+]
+
 
 class MongoExecutionHistoryRepository:
     """MongoDB implementation of ExecutionHistoryRepository.
@@ -38,8 +47,12 @@ class MongoExecutionHistoryRepository:
         chip_id: str,
         skip: int = 0,
         limit: int = 20,
-    ) -> list[ExecutionHistoryDocument]:
-        """List executions for a chip with pagination.
+        cursor: str | None = None,
+    ) -> Page[ExecutionHistorySummary]:
+        """List execution summaries for a chip, newest first, with pagination.
+
+        Only the listing columns are read (see ``ExecutionHistorySummary``);
+        use ``find_by_id`` for the full document.
 
         Parameters
         ----------
@@ -48,26 +61,51 @@ class MongoExecutionHistoryRepository:
         chip_id : str
             The chip identifier
         skip : int
-            Number of items to skip
+            Number of items to skip (ignored when ``cursor`` is given)
         limit : int
             Number of items to return
+        cursor : str | None
+            Keyset cursor from a previous page; ``""`` starts keyset paging
+            from the newest execution
 
         Returns
         -------
-        list[ExecutionHistoryDocument]
-            List of execution history documents
+        Page[ExecutionHistorySummary]
+            Execution summaries and the cursor of the next page
+
+        Raises
+        ------
+        ValueError
+            If ``cursor`` is invalid
 
         """
-        results: list[ExecutionHistoryDocument] = (
-            ExecutionHistoryDocument.find(
-                {"project_id": project_id, "chip_id": chip_id},
-                sort=[("start_at", SortDirection.DESCENDING)],
+        query: dict[str, Any] = {"project_id": project_id, "chip_id": chip_id}
+        if cursor is None:
+            results: list[ExecutionHistorySummary] = list(
+                ExecutionHistoryDocument.find(query, sort=_EXECUTION_SORT)
+                .skip(skip)
+                .limit(limit)
+                .project(ExecutionHistorySummary)
+                .run()
             )
-            .skip(skip)
-            .limit(limit)
+            return Page(items=results)
+
+        scope = f"executions:{project_id}:{chip_id}"
+        if cursor:
+            after, _ = decode_cursor(cursor, scope)
+            query = {"$and": [query, keyset_filter(_EXECUTION_SORT, after)]}
+        results = list(
+            ExecutionHistoryDocument.find(query, sort=_EXECUTION_SORT)
+            .limit(limit + 1)
+            .project(ExecutionHistorySummary)
             .run()
         )
-        return results
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            last = results[-1]
+            next_cursor = encode_cursor(scope, [last.start_at, last.execution_id])
+        return Page(items=results, next_cursor=next_cursor)
 
     def find_by_id(
         self,
@@ -1,36 +1,77 @@
 """MongoDB implementation of ExecutionLockRepository.
 
 This module provides the concrete MongoDB implementation for execution
-lock operations.
+lock operations: the legacy per-project flag and per-chip leases.
+Acquiring a lease is a single conditional ``find_one_and_update`` on the
+chip's lease document, so two sessions can never both win overlapping
+qubits.
 """
 
+from __future__ import annotations
+
 import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from qdash.dbmodel.execution_lock import ExecutionLockDocument
+from qdash.common.utils.datetime import now
+from qdash.datamodel.execution_lock import ExecutionLeaseModel
+from qdash.dbmodel.execution_lock import ExecutionLeaseDocument, ExecutionLockDocument
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
 
+def _to_model(project_id: str, chip_id: str, raw: dict[str, Any]) -> ExecutionLeaseModel:
+    return ExecutionLeaseModel(project_id=project_id, chip_id=chip_id, **raw)
+
+
 class MongoExecutionLockRepository:
     """MongoDB implementation of ExecutionLockRepository.
 
-    This class provides mutual exclusion for calibration sessions.
-    Only one calibration can run per project at a time.
+    Calibrations take a lease on (project, chip) and optionally a qubit
+    set. Leases on disjoint qubits of the same chip, or on different chips,
+    are granted concurrently. A lease lapses unless renewed, so a crashed
+    flow frees its hardware after ``lease_seconds``.
 
     Example
     -------
         >>> repo = MongoExecutionLockRepository()
-        >>> if not repo.is_locked(project_id="proj-1"):
-        ...     repo.lock(project_id="proj-1")
+        >>> lease = repo.acquire_lease("proj-1", "64Qv3", "exec-1", qids=["0", "1"],
+        ...                            lease_seconds=120)
+        >>> if lease is not None:
         ...     try:
-        ...         # run calibration
+        ...         # run calibration, calling renew_lease() periodically
         ...     finally:
-        ...         repo.unlock(project_id="proj-1")
+        ...         repo.release_lease(lease)
 
     """
 
+    def __init__(self, clock: Callable[[], datetime] = now) -> None:
+        """Initialize the repository.
+
+        Parameters
+        ----------
+        clock : Callable[[], datetime]
+            Source of the current time (injectable for tests)
+
+        """
+        self._clock = clock
+
+    @staticmethod
+    def _collection() -> Any:
+        return ExecutionLeaseDocument.get_motor_collection()
+
     def is_locked(self, project_id: str) -> bool:
-        """Check if the project is currently locked.
+        """Check if the legacy project-wide lock is set.
+
+        Leases are not reflected here: they only block overlapping hardware,
+        see :meth:`list_active_leases`.
 
         Parameters
         ----------
@@ -47,7 +88,7 @@ class MongoExecutionLockRepository:
         return status is True
 
     def get_lock_status(self, project_id: str) -> bool | None:
-        """Get the raw lock status.
+        """Get the raw status of the legacy project-wide lock.
 
         Parameters
         ----------
@@ -84,3 +125,114 @@ class MongoExecutionLockRepository:
 
         """
         ExecutionLockDocument.unlock(project_id=project_id)
+
+    def acquire_lease(
+        self,
+        project_id: str,
+        chip_id: str,
+        owner: str,
+        *,
+        qids: list[str] | None = None,
+        lease_seconds: float,
+    ) -> ExecutionLeaseModel | None:
+        """Atomically lease a chip or a qubit set on it, or return None on conflict."""
+        timestamp = self._clock()
+        chip_filter = {"project_id": project_id, "chip_id": chip_id}
+        self._collection().update_one(
+            chip_filter, {"$pull": {"leases": {"expires_at": {"$lte": timestamp}}}}
+        )
+
+        conflict: dict[str, Any] = {"expires_at": {"$gt": timestamp}}
+        if qids is not None:
+            conflict["$or"] = [{"qids": None}, {"qids": {"$in": qids}}]
+        lease: dict[str, Any] = {
+            "lease_id": uuid.uuid4().hex,
+            "owner": owner,
+            "qids": sorted(set(qids)) if qids is not None else None,
+            "fencing_token": None,
+            "acquired_at": timestamp,
+            "expires_at": timestamp + timedelta(seconds=lease_seconds),
+        }
+        free_filter = {**chip_filter, "leases": {"$not": {"$elemMatch": conflict}}}
+        update = {"$inc": {"fencing_token": 1}, "$push": {"leases": lease}}
+        try:
+            raw = self._collection().find_one_and_update(
+                free_filter, update, upsert=True, return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Either the chip document holds a conflicting lease, or a
+            # concurrent first lease on the chip created it between our match
+            # and insert. Retry against the existing document to tell them apart.
+            raw = self._collection().find_one_and_update(
+                free_filter, update, return_document=ReturnDocument.AFTER
+            )
+            if raw is None:
+                return None
+
+        # A lease with a null token is never held, so it is safe to publish
+        # the token in a second step.
+        lease["fencing_token"] = raw["fencing_token"]
+        self._collection().update_one(
+            {**chip_filter, "leases.lease_id": lease["lease_id"]},
+            {"$set": {"leases.$.fencing_token": lease["fencing_token"]}},
+        )
+        return _to_model(project_id, chip_id, lease)
+
+    def _held_filter(self, lease: ExecutionLeaseModel) -> dict[str, Any]:
+        return {
+            "project_id": lease.project_id,
+            "chip_id": lease.chip_id,
+            "leases": {
+                "$elemMatch": {
+                    "lease_id": lease.lease_id,
+                    "fencing_token": lease.fencing_token,
+                    "expires_at": {"$gt": self._clock()},
+                }
+            },
+        }
+
+    def renew_lease(self, lease: ExecutionLeaseModel, *, lease_seconds: float) -> bool:
+        """Extend a held lease. Returns False if it expired or was released."""
+        expires_at = self._clock() + timedelta(seconds=lease_seconds)
+        result = self._collection().update_one(
+            self._held_filter(lease), {"$set": {"leases.$.expires_at": expires_at}}
+        )
+        return bool(result.matched_count)
+
+    def is_lease_held(self, lease: ExecutionLeaseModel) -> bool:
+        """Check the fencing token: True only while this exact lease is live."""
+        return self._collection().find_one(self._held_filter(lease), {"_id": 1}) is not None
+
+    def release_lease(self, lease: ExecutionLeaseModel) -> bool:
+        """Release a lease. Returns False if it was no longer present."""
+        result = self._collection().update_one(
+            {"project_id": lease.project_id, "chip_id": lease.chip_id},
+            {"$pull": {"leases": {"lease_id": lease.lease_id}}},
+        )
+        return bool(result.modified_count)
+
+    def release_owner_leases(self, project_id: str, owner: str) -> int:
+        """Release every lease held by ``owner`` in the project. Returns how many chips."""
+        result = self._collection().update_many(
+            {"project_id": project_id, "leases.owner": owner},
+            {"$pull": {"leases": {"owner": owner}}},
+        )
+        return int(result.modified_count)
+
+    def list_active_leases(
+        self, project_id: str, chip_id: str | None = None
+    ) -> list[ExecutionLeaseModel]:
+        """List unexpired leases in the project, optionally for one chip."""
+        timestamp = self._clock()
+        query: dict[str, Any] = {"project_id": project_id}
+        if chip_id is not None:
+            query["chip_id"] = chip_id
+        leases = []
+        for doc in self._collection().find(query, {"_id": 0, "chip_id": 1, "leases": 1}):
+            for raw in doc.get("leases", []):
+                if raw.get("fencing_token") is None:
+                    continue
+                model = _to_model(project_id, doc["chip_id"], raw)
+                if model.expires_at > timestamp:
+                    leases.append(model)
+        return leases
@@ -4,17 +4,21 @@ This module provides concrete implementations of the CalibDataSaver protocol
 using the local filesystem as the backend.
 """
 
+from __future__ import annotations
+
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import numpy.typing as npt
-import plotly.graph_objs as go
 
 from qdash.common.visualization.figure_metadata import figure_role_suffix
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    import plotly.graph_objs as go
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,6 +11,7 @@ from qdash.repository.inmemory.coupling import InMemoryCouplingCalibrationReposi
 from qdash.repository.inmemory.execution import InMemoryExecutionRepository
 from qdash.repository.inmemory.execution_counter import InMemoryExecutionCounterRepository
 from qdash.repository.inmemory.execution_lock import InMemoryExecutionLockRepository
+from qdash.repository.inmemory.job_queue import InMemoryJobQueueRepository
 from qdash.repository.inmemory.qubit import InMemoryQubitCalibrationRepository
 from qdash.repository.inmemory.task import InMemoryTaskRepository
 from qdash.repository.inmemory.task_result_history import InMemoryTaskResultHistoryRepository
@@ -24,6 +25,7 @@ __all__ = [
     "InMemoryExecutionCounterRepository",
     "InMemoryExecutionLockRepository",
     "InMemoryExecutionRepository",
+    "InMemoryJobQueueRepository",
     "InMemoryQubitCalibrationRepository",
     "InMemoryTaskRepository",
     "InMemoryTaskResultHistoryRepository",
@@ -4,6 +4,14 @@ This module provides a mock implementation that stores lock states in memory,
 useful for unit testing without requiring a MongoDB instance.
 """
 
+import threading
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from qdash.common.utils.datetime import now
+from qdash.datamodel.execution_lock import ExecutionLeaseModel
+
 
 class InMemoryExecutionLockRepository:
     """In-memory implementation of ExecutionLockRepository for testing.
@@ -22,12 +30,16 @@ class InMemoryExecutionLockRepository:
 
     """
 
-    def __init__(self) -> None:
+    def __init__(self, clock: Callable[[], datetime] = now) -> None:
         """Initialize with empty storage."""
+        self._clock = clock
         self._locks: dict[str, bool] = {}
+        self._leases: dict[str, ExecutionLeaseModel] = {}
+        self._fencing_tokens: dict[tuple[str, str], int] = {}
+        self._mutex = threading.Lock()
 
     def is_locked(self, project_id: str) -> bool:
-        """Check if the project is currently locked.
+        """Check if the legacy project-wide lock is set.
 
         Parameters
         ----------
@@ -64,6 +76,91 @@ class InMemoryExecutionLockRepository:
         """
         self._locks[project_id] = False
 
+    def get_lock_status(self, project_id: str) -> bool | None:
+        """Get the raw legacy lock status (None if the project was never locked)."""
+        return self._locks.get(project_id)
+
+    def acquire_lease(
+        self,
+        project_id: str,
+        chip_id: str,
+        owner: str,
+        *,
+        qids: list[str] | None = None,
+        lease_seconds: float,
+    ) -> ExecutionLeaseModel | None:
+        """Atomically lease a chip or a qubit set on it, or return None on conflict."""
+        with self._mutex:
+            if any(
+                lease.conflicts_with(qids) for lease in self.list_active_leases(project_id, chip_id)
+            ):
+                return None
+            timestamp = self._clock()
+            token = self._fencing_tokens.get((project_id, chip_id), 0) + 1
+            self._fencing_tokens[(project_id, chip_id)] = token
+            lease = ExecutionLeaseModel(
+                lease_id=uuid.uuid4().hex,
+                project_id=project_id,
+                chip_id=chip_id,
+                owner=owner,
+                qids=sorted(set(qids)) if qids is not None else None,
+                fencing_token=token,
+                acquired_at=timestamp,
+                expires_at=timestamp + timedelta(seconds=lease_seconds),
+            )
+            self._leases[lease.lease_id] = lease
+            return lease.model_copy()
+
+    def renew_lease(self, lease: ExecutionLeaseModel, *, lease_seconds: float) -> bool:
+        """Extend a held lease. Returns False if it expired or was released."""
+        with self._mutex:
+            if not self.is_lease_held(lease):
+                return False
+            stored = self._leases[lease.lease_id]
+            stored.expires_at = self._clock() + timedelta(seconds=lease_seconds)
+            return True
+
+    def is_lease_held(self, lease: ExecutionLeaseModel) -> bool:
+        """Check the fencing token: True only while this exact lease is live."""
+        stored = self._leases.get(lease.lease_id)
+        return (
+            stored is not None
+            and stored.fencing_token == lease.fencing_token
+            and stored.expires_at > self._clock()
+        )
+
+    def release_lease(self, lease: ExecutionLeaseModel) -> bool:
+        """Release a lease. Returns False if it was no longer present."""
+        with self._mutex:
+            return self._leases.pop(lease.lease_id, None) is not None
+
+    def release_owner_leases(self, project_id: str, owner: str) -> int:
+        """Release every lease held by ``owner`` in the project. Returns how many chips."""
+        with self._mutex:
+            released = [
+                lease
+                for lease in self._leases.values()
+                if lease.project_id == project_id and lease.owner == owner
+            ]
+            for lease in released:
+                del self._leases[lease.lease_id]
+            return len({lease.chip_id for lease in released})
+
+    def list_active_leases(
+        self, project_id: str, chip_id: str | None = None
+    ) -> list[ExecutionLeaseModel]:
+        """List unexpired leases in the project, optionally for one chip."""
+        timestamp = self._clock()
+        return [
+            lease.model_copy()
+            for lease in list(self._leases.values())
+            if lease.project_id == project_id
+            and (chip_id is None or lease.chip_id == chip_id)
+            and lease.expires_at > timestamp
+        ]
+
     def clear(self) -> None:
-        """Clear all locks (useful for test setup/teardown)."""
+        """Clear all locks and leases (useful for test setup/teardown)."""
         self._locks.clear()
+        self._leases.clear()
+        self._fencing_tokens.clear()
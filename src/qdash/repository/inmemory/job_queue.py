@@ -0,0 +1,209 @@
+"""In-memory implementation of JobQueueRepository for testing.
+
+This module provides a thread-safe job queue with the same leasing,
+retry and concurrency semantics as the MongoDB implementation, useful for
+unit testing workers without requiring a MongoDB instance.
+"""
+
+import threading
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from qdash.common.utils.datetime import now
+from qdash.datamodel.job import JobModel, JobStatus, job_retry_delay_seconds
+
+
+class InMemoryJobQueueRepository:
+    """In-memory implementation of JobQueueRepository for testing.
+
+    Example
+    -------
+        >>> queue = InMemoryJobQueueRepository()
+        >>> queue.enqueue("ai_review", "proj-1", {"task_id": "t1"})
+        >>> job = queue.lease("worker-1", ["ai_review"], lease_seconds=60)
+        >>> queue.complete(job.job_id, job.lease_token)
+        True
+
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = now) -> None:
+        """Initialize with empty storage."""
+        self._clock = clock
+        self._jobs: dict[str, JobModel] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        kind: str,
+        project_id: str,
+        payload: dict[str, Any],
+        *,
+        priority: int = 0,
+        max_attempts: int = 3,
+        dedupe_key: str | None = None,
+        delay_seconds: float = 0,
+    ) -> JobModel | None:
+        """Add a job to the queue, or return None if an active duplicate exists."""
+        with self._lock:
+            if dedupe_key is not None and any(
+                job.dedupe_key == dedupe_key and self._is_active(job) for job in self._jobs.values()
+            ):
+                return None
+            timestamp = self._clock()
+            job = JobModel(
+                job_id=uuid.uuid4().hex,
+                kind=kind,
+                project_id=project_id,
+                payload=payload,
+                priority=priority,
+                max_attempts=max_attempts,
+                dedupe_key=dedupe_key,
+                available_at=timestamp + timedelta(seconds=delay_seconds),
+                created_at=timestamp,
+                updated_at=timestamp,
+            )
+            self._jobs[job.job_id] = job
+            return job.model_copy()
+
+    @staticmethod
+    def _is_active(job: JobModel) -> bool:
+        return job.status in (JobStatus.QUEUED, JobStatus.LEASED)
+
+    def _live_leases(self, project_id: str, kind: str, timestamp: datetime) -> int:
+        return sum(
+            1
+            for job in self._jobs.values()
+            if job.project_id == project_id
+            and job.kind == kind
+            and job.status == JobStatus.LEASED
+            and job.lease_expires_at is not None
+            and job.lease_expires_at > timestamp
+        )
+
+    def lease(
+        self,
+        worker_id: str,
+        kinds: list[str],
+        *,
+        lease_seconds: float,
+        project_concurrency: int | None = None,
+    ) -> JobModel | None:
+        """Lease the highest-priority available job."""
+        self.requeue_expired()
+        with self._lock:
+            timestamp = self._clock()
+            candidates = [
+                job
+                for job in self._jobs.values()
+                if job.status == JobStatus.QUEUED
+                and job.kind in kinds
+                and job.available_at <= timestamp
+                and (
+                    project_concurrency is None
+                    or self._live_leases(job.project_id, job.kind, timestamp) < project_concurrency
+                )
+            ]
+            if not candidates:
+                return None
+            job = min(candidates, key=lambda j: (-j.priority, j.available_at, j.created_at))
+            job.status = JobStatus.LEASED
+            job.attempts += 1
+            job.lease_owner = worker_id
+            job.lease_token = uuid.uuid4().hex
+            job.leased_at = timestamp
+            job.lease_expires_at = timestamp + timedelta(seconds=lease_seconds)
+            job.updated_at = timestamp
+            return job.model_copy()
+
+    def _held(self, job_id: str, lease_token: str) -> JobModel | None:
+        job = self._jobs.get(job_id)
+        if job is None or job.status != JobStatus.LEASED or job.lease_token != lease_token:
+            return None
+        return job
+
+    @staticmethod
+    def _clear_lease(job: JobModel) -> None:
+        job.lease_owner = None
+        job.lease_token = None
+        job.leased_at = None
+        job.lease_expires_at = None
+
+    def heartbeat(self, job_id: str, lease_token: str, *, lease_seconds: float) -> bool:
+        """Extend a held lease."""
+        with self._lock:
+            job = self._held(job_id, lease_token)
+            if job is None:
+                return False
+            timestamp = self._clock()
+            job.lease_expires_at = timestamp + timedelta(seconds=lease_seconds)
+            job.updated_at = timestamp
+            return True
+
+    def complete(self, job_id: str, lease_token: str) -> bool:
+        """Mark a leased job completed."""
+        with self._lock:
+            job = self._held(job_id, lease_token)
+            if job is None:
+                return False
+            timestamp = self._clock()
+            job.status = JobStatus.COMPLETED
+            self._clear_lease(job)
+            job.updated_at = timestamp
+            job.finished_at = timestamp
+            return True
+
+    def fail(
+        self,
+        job_id: str,
+        lease_token: str,
+        error: str,
+        *,
+        retry: bool = True,
+    ) -> JobModel | None:
+        """Requeue a failed job with backoff, or mark it dead when out of attempts."""
+        with self._lock:
+            job = self._held(job_id, lease_token)
+            if job is None:
+                return None
+            self._release(job, error=error, retry=retry)
+            return job.model_copy()
+
+    def _release(self, job: JobModel, *, error: str, retry: bool) -> None:
+        timestamp = self._clock()
+        self._clear_lease(job)
+        job.last_error = error[:2000]
+        job.updated_at = timestamp
+        if retry and job.attempts < job.max_attempts:
+            job.status = JobStatus.QUEUED
+            job.available_at = timestamp + timedelta(seconds=job_retry_delay_seconds(job.attempts))
+        else:
+            job.status = JobStatus.DEAD
+            job.finished_at = timestamp
+
+    def requeue_expired(self) -> int:
+        """Return jobs whose worker stopped heartbeating to the queue (or to dead)."""
+        with self._lock:
+            timestamp = self._clock()
+            expired = [
+                job
+                for job in self._jobs.values()
+                if job.status == JobStatus.LEASED
+                and job.lease_expires_at is not None
+                and job.lease_expires_at < timestamp
+            ]
+            for job in expired:
+                self._release(job, error=f"lease expired (worker {job.lease_owner})", retry=True)
+            return len(expired)
+
+    def get(self, job_id: str) -> JobModel | None:
+        """Get a job by ID."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job is not None else None
+
+    def clear(self) -> None:
+        """Clear all jobs (useful for test setup/teardown)."""
+        with self._lock:
+            self._jobs.clear()
@@ -0,0 +1,316 @@
+"""MongoDB implementation of JobQueueRepository.
+
+This module provides a durable job queue on top of the ``job_queue``
+collection. Leasing is a single ``find_one_and_update``, so concurrent
+workers (threads, processes or hosts) never lease the same job twice.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from qdash.common.utils.datetime import now
+from qdash.datamodel.job import JobModel, JobStatus, job_retry_delay_seconds
+from qdash.dbmodel.job import JobDocument
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on lease attempts per call when a leased job has to be handed
+# back because its project is already at the concurrency limit.
+_MAX_LEASE_ROUNDS = 8
+
+_LEASE_FIELDS_RESET: dict[str, Any] = {
+    "lease_owner": None,
+    "lease_token": None,
+    "leased_at": None,
+    "lease_expires_at": None,
+}
+
+
+def _to_model(raw: dict[str, Any]) -> JobModel:
+    return JobModel.model_validate(raw)
+
+
+class MongoJobQueueRepository:
+    """MongoDB implementation of JobQueueRepository.
+
+    Jobs are ordered by ``priority`` (descending), then ``available_at``.
+    ``project_concurrency`` caps leased jobs per (project, kind): a worker
+    that wins a job beyond the cap hands it back and tries the next project,
+    so one busy project cannot starve the others.
+
+    Example
+    -------
+        >>> queue = MongoJobQueueRepository()
+        >>> queue.enqueue("ai_review", "proj-1", {"task_id": "t1"})
+        >>> job = queue.lease("worker-1", ["ai_review"], lease_seconds=300)
+
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = now) -> None:
+        """Initialize the repository.
+
+        Parameters
+        ----------
+        clock : Callable[[], datetime]
+            Source of the current time (injectable for tests)
+
+        """
+        self._clock = clock
+
+    @staticmethod
+    def _collection() -> Any:
+        return JobDocument.get_motor_collection()
+
+    def enqueue(
+        self,
+        kind: str,
+        project_id: str,
+        payload: dict[str, Any],
+        *,
+        priority: int = 0,
+        max_attempts: int = 3,
+        dedupe_key: str | None = None,
+        delay_seconds: float = 0,
+    ) -> JobModel | None:
+        """Add a job to the queue, or return None if an active duplicate exists."""
+        timestamp = self._clock()
+        doc: dict[str, Any] = {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "project_id": project_id,
+            "payload": payload,
+            "priority": priority,
+            "status": JobStatus.QUEUED.value,
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "dedupe_key": dedupe_key,
+            "available_at": timestamp + timedelta(seconds=delay_seconds),
+            **_LEASE_FIELDS_RESET,
+            "last_error": "",
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "finished_at": None,
+        }
+        if dedupe_key is not None:
+            doc["active_key"] = dedupe_key
+        try:
+            self._collection().insert_one(doc)
+        except DuplicateKeyError:
+            logger.debug("Job %s deduplicated on key %s", kind, dedupe_key)
+            return None
+        return _to_model(doc)
+
+    def _saturated(self, kinds: list[str], limit: int, timestamp: datetime) -> list[dict[str, str]]:
+        """Return (project_id, kind) pairs that already hold ``limit`` live leases."""
+        pipeline = [
+            {
+                "$match": {
+                    "status": JobStatus.LEASED.value,
+                    "kind": {"$in": kinds},
+                    "lease_expires_at": {"$gt": timestamp},
+                }
+            },
+            {"$group": {"_id": {"project_id": "$project_id", "kind": "$kind"}, "n": {"$sum": 1}}},
+            {"$match": {"n": {"$gte": limit}}},
+        ]
+        return [row["_id"] for row in self._collection().aggregate(pipeline)]
+
+    def _within_limit(self, job: dict[str, Any], limit: int, timestamp: datetime) -> bool:
+        """Check whether ``job`` is among the first ``limit`` live leases of its group.
+
+        Ordering by (leased_at, job_id) makes every racing worker agree on
+        which leases win, so at least one of them keeps its job.
+        """
+        winners = (
+            self._collection()
+            .find(
+                {
+                    "project_id": job["project_id"],
+                    "kind": job["kind"],
+                    "status": JobStatus.LEASED.value,
+                    "lease_expires_at": {"$gt": timestamp},
+                },
+                {"job_id": 1},
+            )
+            .sort([("leased_at", ASCENDING), ("job_id", ASCENDING)])
+            .limit(limit)
+        )
+        return any(row["job_id"] == job["job_id"] for row in winners)
+
+    def lease(
+        self,
+        worker_id: str,
+        kinds: list[str],
+        *,
+        lease_seconds: float,
+        project_concurrency: int | None = None,
+    ) -> JobModel | None:
+        """Atomically lease the highest-priority available job."""
+        self.requeue_expired()
+        excluded: list[dict[str, str]] = []
+        for _ in range(_MAX_LEASE_ROUNDS):
+            timestamp = self._clock()
+            if project_concurrency is not None:
+                excluded = self._saturated(kinds, project_concurrency, timestamp)
+            query: dict[str, Any] = {
+                "status": JobStatus.QUEUED.value,
+                "kind": {"$in": kinds},
+                "available_at": {"$lte": timestamp},
+            }
+            if excluded:
+                query["$nor"] = excluded
+            token = uuid.uuid4().hex
+            raw = self._collection().find_one_and_update(
+                query,
+                {
+                    "$set": {
+                        "status": JobStatus.LEASED.value,
+                        "lease_owner": worker_id,
+                        "lease_token": token,
+                        "leased_at": timestamp,
+                        "lease_expires_at": timestamp + timedelta(seconds=lease_seconds),
+                        "updated_at": timestamp,
+                    },
+                    "$inc": {"attempts": 1},
+                },
+                sort=[("priority", DESCENDING), ("available_at", ASCENDING)],
+                return_document=ReturnDocument.AFTER,
+            )
+            if raw is None:
+                return None
+            if project_concurrency is None or self._within_limit(
+                raw, project_concurrency, timestamp
+            ):
+                return _to_model(raw)
+
+            # Lost a race for the project's last slot: hand the job back untouched.
+            self._collection().update_one(
+                {"job_id": raw["job_id"], "lease_token": token},
+                {
+                    "$set": {
+                        "status": JobStatus.QUEUED.value,
+                        **_LEASE_FIELDS_RESET,
+                        "updated_at": timestamp,
+                    },
+                    "$inc": {"attempts": -1},
+                },
+            )
+        return None
+
+    def heartbeat(self, job_id: str, lease_token: str, *, lease_seconds: float) -> bool:
+        """Extend a held lease."""
+        timestamp = self._clock()
+        result = self._collection().update_one(
+            {"job_id": job_id, "lease_token": lease_token, "status": JobStatus.LEASED.value},
+            {
+                "$set": {
+                    "lease_expires_at": timestamp + timedelta(seconds=lease_seconds),
+                    "updated_at": timestamp,
+                }
+            },
+        )
+        return bool(result.matched_count)
+
+    def complete(self, job_id: str, lease_token: str) -> bool:
+        """Mark a leased job completed."""
+        timestamp = self._clock()
+        result = self._collection().update_one(
+            {"job_id": job_id, "lease_token": lease_token, "status": JobStatus.LEASED.value},
+            {
+                "$set": {
+                    "status": JobStatus.COMPLETED.value,
+                    **_LEASE_FIELDS_RESET,
+                    "updated_at": timestamp,
+                    "finished_at": timestamp,
+                },
+                "$unset": {"active_key": ""},
+            },
+        )
+        return bool(result.matched_count)
+
+    def fail(
+        self,
+        job_id: str,
+        lease_token: str,
+        error: str,
+        *,
+        retry: bool = True,
+    ) -> JobModel | None:
+        """Requeue a failed job with backoff, or mark it dead when out of attempts."""
+        raw = self._collection().find_one(
+            {"job_id": job_id, "lease_token": lease_token, "status": JobStatus.LEASED.value}
+        )
+        if raw is None:
+            return None
+        return self._release(raw, error=error, retry=retry)
+
+    def _release(self, raw: dict[str, Any], *, error: str, retry: bool) -> JobModel | None:
+        """Move a leased job back to the queue or to dead, guarded by its lease token."""
+        timestamp = self._clock()
+        update: dict[str, Any]
+        if retry and raw["attempts"] < raw["max_attempts"]:
+            delay = job_retry_delay_seconds(raw["attempts"])
+            update = {
+                "$set": {
+                    "status": JobStatus.QUEUED.value,
+                    **_LEASE_FIELDS_RESET,
+                    "available_at": timestamp + timedelta(seconds=delay),
+                    "last_error": error[:2000],
+                    "updated_at": timestamp,
+                }
+            }
+        else:
+            update = {
+                "$set": {
+                    "status": JobStatus.DEAD.value,
+                    **_LEASE_FIELDS_RESET,
+                    "last_error": error[:2000],
+                    "updated_at": timestamp,
+                    "finished_at": timestamp,
+                },
+                "$unset": {"active_key": ""},
+            }
+        updated = self._collection().find_one_and_update(
+            {
+                "job_id": raw["job_id"],
+                "lease_token": raw["lease_token"],
+                "status": JobStatus.LEASED.value,
+            },
+            update,
+            return_document=ReturnDocument.AFTER,
+        )
+        return _to_model(updated) if updated is not None else None
+
+    def requeue_expired(self) -> int:
+        """Return jobs whose worker stopped heartbeating to the queue (or to dead)."""
+        expired = list(
+            self._collection().find(
+                {
+                    "status": JobStatus.LEASED.value,
+                    "lease_expires_at": {"$lt": self._clock()},
+                }
+            )
+        )
+        touched = 0
+        for raw in expired:
+            owner = raw.get("lease_owner")
+            if self._release(raw, error=f"lease expired (worker {owner})", retry=True) is not None:
+                touched += 1
+        if touched:
+            logger.warning("Reclaimed %d job(s) with expired leases", touched)
+        return touched
+
+    def get(self, job_id: str) -> JobModel | None:
+        """Get a job by ID."""
+        raw = self._collection().find_one({"job_id": job_id})
+        return _to_model(raw) if raw is not None else None
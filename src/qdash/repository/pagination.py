@@ -0,0 +1,140 @@
+"""Keyset (cursor) pagination helpers for MongoDB repositories.
+
+``skip``/``limit`` paging makes MongoDB walk and discard every skipped
+document, so page N costs O(N * limit). Keyset paging instead resumes from
+the sort key of the last returned document, which an index on the same
+keys answers with a single seek regardless of depth.
+
+Cursors are opaque to clients: URL-safe base64 of the last row's sort-key
+values (Extended JSON, so datetimes round-trip), a scope tag that stops a
+qubit cursor from being replayed against executions, and optionally the
+total counted on the first page so deeper pages need not count again.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from bson import json_util
+from bson.errors import InvalidBSON
+
+T = TypeVar("T")
+
+# Accepts bunnet's ``SortDirection`` (an int enum) as well as pymongo's ints.
+SortKey = Sequence[tuple[str, int]]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another listing."""
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of a listing.
+
+    Attributes
+    ----------
+    items : list[T]
+        The rows of this page
+    next_cursor : str | None
+        Cursor for the following page (None on the last page or in offset mode)
+    total : int | None
+        Number of matching rows, if it was requested
+    total_estimated : bool
+        True if ``total`` was carried over from an earlier page instead of
+        being counted for this request
+
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+    total: int | None = None
+    total_estimated: bool = False
+
+
+def encode_cursor(scope: str, values: list[Any], total: int | None = None) -> str:
+    """Encode the sort-key ``values`` of the last row of a page as a cursor."""
+    payload: dict[str, Any] = {"s": scope, "k": values}
+    if total is not None:
+        payload["n"] = total
+    raw = json_util.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str) -> tuple[list[Any], int | None]:
+    """Decode a cursor produced by :func:`encode_cursor` for ``scope``.
+
+    Returns
+    -------
+    tuple[list[Any], int | None]
+        The sort-key values to resume after, and the carried total (if any)
+
+    Raises
+    ------
+    InvalidCursorError
+        If the cursor cannot be decoded or was issued for another scope
+
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json_util.loads(raw)
+    except (binascii.Error, ValueError, TypeError, InvalidBSON) as exc:
+        msg = "Invalid pagination cursor"
+        raise InvalidCursorError(msg) from exc
+    if not isinstance(payload, dict) or payload.get("s") != scope:
+        msg = "Pagination cursor does not belong to this listing"
+        raise InvalidCursorError(msg)
+    values = payload.get("k")
+    total = payload.get("n")
+    if not isinstance(values, list) or (total is not None and not isinstance(total, int)):
+        msg = "Invalid pagination cursor"
+        raise InvalidCursorError(msg)
+    return values, total
+
+
+def _strictly_after(field: str, direction: int, value: Any) -> dict[str, Any] | None:
+    """Condition for ``field`` sorting strictly after ``value`` (null sorts lowest)."""
+    if direction > 0:
+        if value is None:
+            return {field: {"$ne": None}}
+        return {field: {"$gt": value}}
+    if value is None:
+        return None
+    return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+
+def keyset_filter(sort: SortKey, values: list[Any]) -> dict[str, Any]:
+    """Build the filter selecting rows that sort strictly after ``values``.
+
+    For sort keys ``(a, b)`` this is ``a after va OR (a == va AND b after vb)``,
+    which MongoDB answers as index range scans on an index over ``(a, b)``.
+
+    Raises
+    ------
+    InvalidCursorError
+        If ``values`` does not have one entry per sort key
+
+    """
+    if len(values) != len(sort):
+        msg = "Pagination cursor does not match the sort order"
+        raise InvalidCursorError(msg)
+    branches: list[dict[str, Any]] = []
+    for i, (field, direction) in enumerate(sort):
+        after = _strictly_after(field, direction, values[i])
+        if after is None:
+            continue
+        equal = [{prev: values[j]} for j, (prev, _) in enumerate(sort[:i])]
+        branches.append({"$and": [*equal, after]} if equal else after)
+    if not branches:
+        # The cursor points at the last possible key: nothing sorts after it.
+        return {"_id": {"$exists": False}}
+    return branches[0] if len(branches) == 1 else {"$or": branches}
+
+
+def sort_values(row: dict[str, Any], sort: SortKey) -> list[Any]:
+    """Extract the sort-key values of a raw document."""
+    return [row.get(field) for field, _ in sort]
@@ -9,7 +9,7 @@ The protocols follow the Repository pattern, providing:
 - Clear separation between domain logic and data access
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from typing import Any, Literal, Protocol, runtime_checkable
 
@@ -17,8 +17,11 @@ from qdash.datamodel.calibration_note import CalibrationNoteModel
 from qdash.datamodel.chip import ChipModel
 from qdash.datamodel.coupling import CouplingModel
 from qdash.datamodel.execution import ExecutionModel
+from qdash.datamodel.execution_lock import ExecutionLeaseModel
+from qdash.datamodel.job import JobModel
 from qdash.datamodel.qubit import QubitModel
 from qdash.datamodel.task import BaseTaskResultModel, CalibDataModel
+from qdash.repository.pagination import Page
 
 
 @runtime_checkable
@@ -117,6 +120,34 @@ class TaskResultHistoryRepository(Protocol):
         """
         ...
 
+    def iter_raw(
+        self,
+        query: dict[str, Any],
+        projection: dict[str, Any],
+        sort: list[tuple[str, Any]] | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream raw task result rows (no document validation).
+
+        Parameters
+        ----------
+        query : dict[str, Any]
+            MongoDB-style query filter
+        projection : dict[str, Any]
+            MongoDB projection
+        sort : list[tuple[str, Any]] | None
+            Sort specification
+        limit : int | None
+            Maximum number of rows
+
+        Returns
+        -------
+        Iterator[dict[str, Any]]
+            Raw rows
+
+        """
+        ...
+
     def aggregate_latest_metrics(
         self,
         *,
@@ -222,6 +253,93 @@ class TaskResultHistoryRepository(Protocol):
         """
         ...
 
+    def aggregate_phase_timings(
+        self,
+        *,
+        project_id: str,
+        chip_id: str,
+        cutoff_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> list[Any]:
+        """Aggregate task phase timings per (task name, phase).
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        cutoff_time : datetime | None
+            Optional inclusive lower bound on ``start_at``
+        end_time : datetime | None
+            Optional inclusive upper bound on ``start_at``
+
+        Returns
+        -------
+        list[Any]
+            Rows with name, phase, count, total_seconds and max_seconds
+
+        """
+        ...
+
+    def aggregate_elapsed_times(
+        self,
+        *,
+        project_id: str,
+        chip_id: str,
+        task_names: list[str],
+        qids: list[str] | None = None,
+        cutoff_time: datetime | None = None,
+    ) -> list[Any]:
+        """Aggregate completed task durations per (task name, qid).
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        task_names : list[str]
+            Task names to include
+        qids : list[str] | None
+            Optional qubit or coupling IDs to restrict the aggregation to
+        cutoff_time : datetime | None
+            Optional inclusive lower bound on ``start_at``
+
+        Returns
+        -------
+        list[Any]
+            Rows with name, qid, count, mean_seconds and max_seconds
+
+        """
+        ...
+
+    def aggregate_duration_stats(
+        self,
+        *,
+        project_id: str,
+        chip_id: str,
+        cutoff_time: datetime | None = None,
+    ) -> list[Any]:
+        """Aggregate task run durations per (task name, batch size).
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        cutoff_time : datetime | None
+            Optional inclusive lower bound on ``start_at``
+
+        Returns
+        -------
+        list[Any]
+            Rows with name, batch_size, count, mean_seconds and stddev_seconds
+
+        """
+        ...
+
 
 @runtime_checkable
 class ChipRepository(Protocol):
@@ -364,8 +482,12 @@ class ChipRepository(Protocol):
         limit: int = 50,
         offset: int = 0,
         qids: list[str] | None = None,
-    ) -> tuple[list[dict[str, Any]], int]:
-        """List qubits with pagination."""
+        *,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
+    ) -> Page[dict[str, Any]]:
+        """List qubits with offset or keyset pagination."""
         ...
 
     def find_qubit(self, project_id: str, chip_id: str, qid: str) -> dict[str, Any] | None:
@@ -378,8 +500,12 @@ class ChipRepository(Protocol):
         chip_id: str,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[dict[str, Any]], int]:
-        """List couplings with pagination."""
+        *,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        estimated_total: bool = False,
+    ) -> Page[dict[str, Any]]:
+        """List couplings with offset or keyset pagination."""
         ...
 
     def find_coupling(
@@ -407,6 +533,17 @@ class ChipRepository(Protocol):
         """Aggregate heatmap data for a single metric."""
         ...
 
+    def aggregate_bulk_metrics(
+        self,
+        project_id: str,
+        chip_ids: list[str],
+        fields: list[str],
+        qids: list[str] | None = None,
+        is_coupling: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Read selected metrics for many chips in one aggregation."""
+        ...
+
     def get_qubit_ids(self, project_id: str, chip_id: str) -> list[str]:
         """Get all qubit IDs for a chip."""
         ...
@@ -427,6 +564,19 @@ class ChipRepository(Protocol):
         """Get multiple couplings by their IDs."""
         ...
 
+    def find_metric_data(
+        self,
+        project_id: str,
+        chip_id: str,
+        ids: list[str],
+        metrics: list[str],
+        *,
+        username: str | None = None,
+        is_coupling: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        """Get selected data entries for some qubits or couplings."""
+        ...
+
     def get_all_qubit_models(
         self, project_id: str, chip_id: str, username: str | None = None
     ) -> dict[str, Any]:
@@ -1053,22 +1203,27 @@ class ExecutionLockRepository(Protocol):
     """Protocol for execution lock operations.
 
     This repository provides mutual exclusion for calibration sessions.
-    Only one calibration can run per project at a time.
+    Sessions lease a chip, or a qubit set on it, for a limited time;
+    leases on disjoint qubits or different chips are granted concurrently.
+    The per-project ``lock``/``unlock`` flag is kept for older callers.
 
     Example
     -------
         >>> repo = MongoExecutionLockRepository()
-        >>> if not repo.is_locked(project_id="proj-1"):
-        ...     repo.lock(project_id="proj-1")
+        >>> lease = repo.acquire_lease("proj-1", "64Qv3", "exec-1", qids=["0"],
+        ...                            lease_seconds=120)
+        >>> if lease is not None:
         ...     try:
-        ...         # run calibration
+        ...         # run calibration, calling renew_lease() periodically
         ...     finally:
-        ...         repo.unlock(project_id="proj-1")
+        ...         repo.release_lease(lease)
 
     """
 
     def is_locked(self, project_id: str) -> bool:
-        """Check if the project is currently locked.
+        """Check if the legacy project-wide lock is set.
+
+        Active leases are not reflected; use :meth:`list_active_leases`.
 
         Parameters
         ----------
@@ -1105,6 +1260,60 @@ class ExecutionLockRepository(Protocol):
         """
         ...
 
+    def acquire_lease(
+        self,
+        project_id: str,
+        chip_id: str,
+        owner: str,
+        *,
+        qids: list[str] | None = None,
+        lease_seconds: float,
+    ) -> ExecutionLeaseModel | None:
+        """Atomically lease a chip or a qubit set on it.
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip to lease
+        owner : str
+            Holder of the lease, usually the execution ID
+        qids : list[str] | None
+            Qubits to lease, or None for the whole chip
+        lease_seconds : float
+            Time until the lease lapses unless renewed
+
+        Returns
+        -------
+        ExecutionLeaseModel | None
+            The granted lease, or None if an active lease overlaps
+
+        """
+        ...
+
+    def renew_lease(self, lease: ExecutionLeaseModel, *, lease_seconds: float) -> bool:
+        """Extend a held lease. Returns False if it expired or was released."""
+        ...
+
+    def is_lease_held(self, lease: ExecutionLeaseModel) -> bool:
+        """Check the fencing token: True only while this exact lease is live."""
+        ...
+
+    def release_lease(self, lease: ExecutionLeaseModel) -> bool:
+        """Release a lease. Returns False if it was no longer present."""
+        ...
+
+    def release_owner_leases(self, project_id: str, owner: str) -> int:
+        """Release every lease held by ``owner`` in the project."""
+        ...
+
+    def list_active_leases(
+        self, project_id: str, chip_id: str | None = None
+    ) -> list[ExecutionLeaseModel]:
+        """List unexpired leases in the project, optionally for one chip."""
+        ...
+
 
 @runtime_checkable
 class UserRepository(Protocol):
@@ -1163,3 +1372,121 @@ class TaskRepository(Protocol):
 
         """
         ...
+
+
+@runtime_checkable
+class JobQueueRepository(Protocol):
+    """Protocol for the durable background job queue.
+
+    Jobs are leased, not popped: a worker holds a job until its lease expires,
+    and a job whose worker died becomes leasable again after the visibility
+    timeout. Every mutation of a leased job must present the ``lease_token``
+    returned by :meth:`lease`, so a worker whose lease was reclaimed cannot
+    complete or fail the job after another worker picked it up.
+
+    Example
+    -------
+        >>> queue = MongoJobQueueRepository()
+        >>> queue.enqueue("ai_review", "proj-1", {"task_id": "t1"}, dedupe_key="ai_review:t1")
+        >>> job = queue.lease("worker-1", ["ai_review"], lease_seconds=300)
+        >>> if job is not None:
+        ...     queue.complete(job.job_id, job.lease_token)
+
+    """
+
+    def enqueue(
+        self,
+        kind: str,
+        project_id: str,
+        payload: dict[str, Any],
+        *,
+        priority: int = 0,
+        max_attempts: int = 3,
+        dedupe_key: str | None = None,
+        delay_seconds: float = 0,
+    ) -> JobModel | None:
+        """Add a job to the queue.
+
+        Parameters
+        ----------
+        kind : str
+            Handler name
+        project_id : str
+            Owning project identifier
+        payload : dict[str, Any]
+            JSON-serializable handler arguments
+        priority : int
+            Higher priorities are leased first
+        max_attempts : int
+            Leases allowed before the job is marked dead
+        dedupe_key : str | None
+            If a queued or leased job with this key exists, nothing is added
+        delay_seconds : float
+            Delay before the job becomes leasable
+
+        Returns
+        -------
+        JobModel | None
+            The new job, or None if it was deduplicated
+
+        """
+        ...
+
+    def lease(
+        self,
+        worker_id: str,
+        kinds: list[str],
+        *,
+        lease_seconds: float,
+        project_concurrency: int | None = None,
+    ) -> JobModel | None:
+        """Atomically lease the next available job.
+
+        Parameters
+        ----------
+        worker_id : str
+            Identifier of the leasing worker
+        kinds : list[str]
+            Job kinds the worker can handle
+        lease_seconds : float
+            Visibility timeout of the lease
+        project_concurrency : int | None
+            Maximum leased jobs of one kind per project, None for unlimited
+
+        Returns
+        -------
+        JobModel | None
+            The leased job, or None if nothing is available
+
+        """
+        ...
+
+    def heartbeat(self, job_id: str, lease_token: str, *, lease_seconds: float) -> bool:
+        """Extend a lease. Returns False if the lease is no longer held."""
+        ...
+
+    def complete(self, job_id: str, lease_token: str) -> bool:
+        """Mark a leased job completed. Returns False if the lease is no longer held."""
+        ...
+
+    def fail(
+        self,
+        job_id: str,
+        lease_token: str,
+        error: str,
+        *,
+        retry: bool = True,
+    ) -> JobModel | None:
+        """Record a failed attempt and requeue with backoff or mark the job dead.
+
+        Returns the updated job, or None if the lease is no longer held.
+        """
+        ...
+
+    def requeue_expired(self) -> int:
+        """Return jobs with expired leases to the queue. Returns how many were touched."""
+        ...
+
+    def get(self, job_id: str) -> JobModel | None:
+        """Get a job by ID."""
+        ...
@@ -5,6 +5,8 @@ history persistence operations.
 """
 
 import logging
+import math
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Literal, TypedDict
 
@@ -26,6 +28,36 @@ class MetricAggregateResult(TypedDict, total=False):
     stddev: float | None
 
 
+class PhaseTimingAggregate(TypedDict):
+    """Result type for phase timing aggregation."""
+
+    name: str
+    phase: str
+    count: int
+    total_seconds: float
+    max_seconds: float
+
+
+class ElapsedTimeAggregate(TypedDict):
+    """Result type for elapsed time aggregation."""
+
+    name: str
+    qid: str
+    count: int
+    mean_seconds: float
+    max_seconds: float
+
+
+class TaskDurationStat(TypedDict):
+    """Result type for task duration statistics."""
+
+    name: str
+    batch_size: int
+    count: int
+    mean_seconds: float
+    stddev_seconds: float
+
+
 def _build_start_at_filter(
     cutoff_time: datetime | None, end_time: datetime | None
 ) -> dict[str, datetime] | None:
@@ -103,6 +135,238 @@ class MongoTaskResultHistoryRepository:
             doc.source_task_id = source_task_id
             doc.save()
 
+    def set_phase_timings(
+        self,
+        *,
+        project_id: str | None,
+        task_id: str,
+        phase_timings: dict[str, float],
+    ) -> None:
+        """Set phase timings on a task result document.
+
+        Only the given phases are written, so a phase recorded separately
+        (e.g. the asynchronous AI review) is not overwritten.
+
+        Parameters
+        ----------
+        project_id : str | None
+            The project identifier
+        task_id : str
+            The task identifier
+        phase_timings : dict[str, float]
+            Seconds per phase to set
+
+        """
+        if not phase_timings:
+            return
+        TaskResultHistoryDocument.get_motor_collection().update_one(
+            {"project_id": project_id, "task_id": task_id},
+            {"$set": {f"phase_timings.{phase}": value for phase, value in phase_timings.items()}},
+        )
+
+    def aggregate_phase_timings(
+        self,
+        *,
+        project_id: str,
+        chip_id: str,
+        cutoff_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> list[PhaseTimingAggregate]:
+        """Aggregate phase timings per task name with one aggregation pipeline.
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        cutoff_time : datetime | None
+            Optional inclusive lower bound on ``start_at``
+        end_time : datetime | None
+            Optional inclusive upper bound on ``start_at``
+
+        Returns
+        -------
+        list[PhaseTimingAggregate]
+            One row per (task name, phase), sorted by task name then phase
+
+        """
+        match_stage: dict[str, Any] = {
+            "project_id": project_id,
+            "chip_id": chip_id,
+            "phase_timings": {"$exists": True, "$ne": {}},
+        }
+        start_at_filter = _build_start_at_filter(cutoff_time, end_time)
+        if start_at_filter:
+            match_stage["start_at"] = start_at_filter
+
+        pipeline: list[dict[str, Any]] = [
+            {"$match": match_stage},
+            {"$project": {"name": 1, "phases": {"$objectToArray": "$phase_timings"}}},
+            {"$unwind": "$phases"},
+            {
+                "$group": {
+                    "_id": {"name": "$name", "phase": "$phases.k"},
+                    "count": {"$sum": 1},
+                    "total_seconds": {"$sum": "$phases.v"},
+                    "max_seconds": {"$max": "$phases.v"},
+                }
+            },
+        ]
+        results = list(TaskResultHistoryDocument.aggregate(pipeline).run())
+        rows = [
+            PhaseTimingAggregate(
+                name=doc["_id"]["name"],
+                phase=doc["_id"]["phase"],
+                count=int(doc["count"]),
+                total_seconds=float(doc["total_seconds"]),
+                max_seconds=float(doc["max_seconds"]),
+            )
+            for doc in results
+        ]
+        return sorted(rows, key=lambda row: (row["name"], row["phase"]))
+
+    def aggregate_elapsed_times(
+        self,
+        *,
+        project_id: str,
+        chip_id: str,
+        task_names: list[str],
+        qids: list[str] | None = None,
+        cutoff_time: datetime | None = None,
+    ) -> list[ElapsedTimeAggregate]:
+        """Aggregate completed task durations per (task name, qid).
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        task_names : list[str]
+            Task names to include
+        qids : list[str] | None
+            Optional qubit or coupling IDs to restrict the aggregation to
+        cutoff_time : datetime | None
+            Optional inclusive lower bound on ``start_at``
+
+        Returns
+        -------
+        list[ElapsedTimeAggregate]
+            One row per (task name, qid), sorted by task name then qid
+
+        """
+        match_stage: dict[str, Any] = {
+            "project_id": project_id,
+            "chip_id": chip_id,
+            "name": {"$in": task_names},
+            "status": "completed",
+            "elapsed_time": {"$gt": 0},
+        }
+        if qids is not None:
+            match_stage["qid"] = {"$in": qids}
+        start_at_filter = _build_start_at_filter(cutoff_time, None)
+        if start_at_filter:
+            match_stage["start_at"] = start_at_filter
+
+        pipeline: list[dict[str, Any]] = [
+            {"$match": match_stage},
+            {
+                "$group": {
+                    "_id": {"name": "$name", "qid": "$qid"},
+                    "count": {"$sum": 1},
+                    "mean_seconds": {"$avg": "$elapsed_time"},
+                    "max_seconds": {"$max": "$elapsed_time"},
+                }
+            },
+        ]
+        results = list(TaskResultHistoryDocument.aggregate(pipeline).run())
+        rows = [
+            ElapsedTimeAggregate(
+                name=doc["_id"]["name"],
+                qid=doc["_id"]["qid"],
+                count=int(doc["count"]),
+                mean_seconds=float(doc["mean_seconds"]),
+                max_seconds=float(doc["max_seconds"]),
+            )
+            for doc in results
+        ]
+        return sorted(rows, key=lambda row: (row["name"], row["qid"]))
+
+    def aggregate_duration_stats(
+        self,
+        *,
+        project_id: str,
+        chip_id: str,
+        cutoff_time: datetime | None = None,
+    ) -> list[TaskDurationStat]:
+        """Aggregate task run durations per (task name, batch size).
+
+        Rows of one execution that share a task name and ``start_at`` come
+        from one batch run over several qids and count as a single run of
+        that batch size. Completed and failed runs both count, since both
+        take time.
+
+        Parameters
+        ----------
+        project_id : str
+            The project identifier
+        chip_id : str
+            The chip identifier
+        cutoff_time : datetime | None
+            Optional inclusive lower bound on ``start_at``
+
+        Returns
+        -------
+        list[TaskDurationStat]
+            One row per (task name, batch size), sorted by task name then batch size
+
+        """
+        match_stage: dict[str, Any] = {
+            "project_id": project_id,
+            "chip_id": chip_id,
+            "status": {"$in": ["completed", "failed"]},
+            "elapsed_time": {"$gt": 0},
+        }
+        start_at_filter = _build_start_at_filter(cutoff_time, None)
+        if start_at_filter:
+            match_stage["start_at"] = start_at_filter
+
+        pipeline: list[dict[str, Any]] = [
+            {"$match": match_stage},
+            {
+                "$group": {
+                    "_id": {
+                        "execution_id": "$execution_id",
+                        "name": "$name",
+                        "start_at": "$start_at",
+                    },
+                    "batch_size": {"$sum": 1},
+                    "seconds": {"$max": "$elapsed_time"},
+                }
+            },
+            {
+                "$group": {
+                    "_id": {"name": "$_id.name", "batch_size": "$batch_size"},
+                    "count": {"$sum": 1},
+                    "mean_seconds": {"$avg": "$seconds"},
+                    "mean_square": {"$avg": {"$multiply": ["$seconds", "$seconds"]}},
+                }
+            },
+        ]
+        results = list(TaskResultHistoryDocument.aggregate(pipeline).run())
+        rows = [
+            TaskDurationStat(
+                name=doc["_id"]["name"],
+                batch_size=int(doc["_id"]["batch_size"]),
+                count=int(doc["count"]),
+                mean_seconds=float(doc["mean_seconds"]),
+                stddev_seconds=math.sqrt(max(doc["mean_square"] - doc["mean_seconds"] ** 2, 0.0)),
+            )
+            for doc in results
+        ]
+        return sorted(rows, key=lambda row: (row["name"], row["batch_size"]))
+
     def find_latest_by_chip_and_qids(
         self,
         *,
@@ -221,6 +485,39 @@ class MongoTaskResultHistoryRepository:
             finder = finder.sort(sort)
         return list(finder.project(projection_model).run())
 
+    def iter_raw(
+        self,
+        query: dict[str, Any],
+        projection: dict[str, Any],
+        sort: list[tuple[str, Any]] | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream raw task result rows without building documents.
+
+        Parameters
+        ----------
+        query : dict[str, Any]
+            MongoDB query dict
+        projection : dict[str, Any]
+            MongoDB projection (e.g. ``{"output_parameters.t1": 1}``)
+        sort : list[tuple[str, Any]] | None
+            Optional sort specification
+        limit : int | None
+            Maximum number of rows
+
+        Returns
+        -------
+        Iterator[dict[str, Any]]
+            Raw rows straight from the cursor
+
+        """
+        cursor = TaskResultHistoryDocument.get_motor_collection().find(query, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+        return iter(cursor)
+
     def finalize_running_tasks(
         self,
         *,
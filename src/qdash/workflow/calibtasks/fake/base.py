@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+import functools
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from qdash.workflow.calibtasks.base import BaseTask, RunResult
 from qdash.workflow.engine.util import qid_to_label
@@ -19,6 +21,13 @@ class FakeTask(BaseTask):
     # name is empty to prevent registration in BaseTask.registry
     # Only concrete subclasses with a name should be registered
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Check failures injected through the fake backend before each run
+        run = cls.__dict__.get("run")
+        if run is not None:
+            setattr(cls, "run", _check_injected_failure(run))  # noqa: B010
+
     def batch_run(self, backend: "FakeBackend", qids: list[str]) -> RunResult:
         """Default implementation for batch run.
 
@@ -53,3 +62,16 @@ class FakeTask(BaseTask):
 
         """
         return str(qid_to_label(qid, num_qubits))
+
+
+def _check_injected_failure(
+    run: Callable[[Any, "FakeBackend", str], RunResult],
+) -> Callable[[Any, "FakeBackend", str], RunResult]:
+    """Wrap a task's run to raise failures injected by the fake backend first."""
+
+    @functools.wraps(run)
+    def wrapper(self: FakeTask, backend: "FakeBackend", qid: str) -> RunResult:
+        backend.check_injected_failure(self.get_name(), qid, self.run_parameters)
+        return run(self, backend, qid)
+
+    return wrapper
@@ -15,7 +15,8 @@ BaseBackend
 
 FakeBackend
     Simulation backend for testing without real hardware.
-    Returns mock results for all measurements.
+    Returns mock results for all measurements, and can inject task
+    failures (``inject_failures`` config or ``QDASH_FAKE_FAILURES``).
 
 QubexBackend
     Real hardware backend using the qubex library.
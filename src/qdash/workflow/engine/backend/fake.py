@@ -1,12 +1,31 @@
+import json
+import math
+import os
 from typing import Any
 
 from qdash.datamodel.task import TaskTypes
 from qdash.workflow.engine.backend.base import BaseBackend
 from qdash.workflow.engine.backend.qubex_paths import get_qubex_paths
 
+# JSON failure rules read by fake backends in every process (e.g. Dask workers).
+FAKE_FAILURES_ENV = "QDASH_FAKE_FAILURES"
+
+
+class InjectedFailureError(RuntimeError):
+    """Task failure injected by the fake backend."""
+
 
 class FakeBackend(BaseBackend):
-    """Backend management for QUBEX-compatible fake experiments."""
+    """Backend management for QUBEX-compatible fake experiments.
+
+    Task failures can be injected for testing with the ``inject_failures``
+    config key or the ``QDASH_FAKE_FAILURES`` environment variable (JSON).
+    Rules map task name -> qid (or ``"*"``) -> frequency offsets in GHz at
+    which the task fails, matched against the ``qubit_frequency_offset`` run
+    parameter (0 when unset); ``null`` fails every attempt::
+
+        {"CheckRabi": {"3": [0.0], "*": [0.001]}, "CheckT1": {"5": null}}
+    """
 
     name: str = "fake"
 
@@ -14,6 +33,10 @@ class FakeBackend(BaseBackend):
         """Initialize the Fake backend with a configuration dictionary."""
         self._config = config
         self._exp: Any | None = None
+        failures = config.get("inject_failures")
+        if failures is None and os.getenv(FAKE_FAILURES_ENV):
+            failures = json.loads(os.environ[FAKE_FAILURES_ENV])
+        self._failures: dict[str, dict[str, list[float] | None]] = failures or {}
 
     @property
     def config(self) -> dict[str, Any]:
@@ -59,3 +82,20 @@ class FakeBackend(BaseBackend):
             msg = "Backend instance is not initialized. Please call connect() first."
             raise RuntimeError(msg)
         return self._exp
+
+    def check_injected_failure(
+        self, task_name: str, qid: str, run_parameters: dict[str, Any]
+    ) -> None:
+        """Raise InjectedFailureError if a failure rule matches this task run."""
+        rules = self._failures.get(task_name)
+        if not rules:
+            return
+        key = qid if qid in rules else "*"
+        if key not in rules:
+            return
+        param = run_parameters.get("qubit_frequency_offset")
+        offset = float(getattr(param, "value", 0.0) or 0.0)
+        failing = rules[key]
+        if failing is None or any(math.isclose(offset, o, abs_tol=1e-12) for o in failing):
+            msg = f"Injected failure: {task_name} on Q{qid} at {offset * 1000:+.0f} MHz offset"
+            raise InjectedFailureError(msg)
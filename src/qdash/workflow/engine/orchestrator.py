@@ -21,6 +21,8 @@ from qdash.workflow.engine.task.context import TaskContext
 from qdash.workflow.engine.task.history_recorder import TaskHistoryRecorder
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from qdash.workflow.engine.backend.base import BaseBackend
     from qdash.workflow.engine.config import CalibConfig
     from qdash.workflow.engine.task.snapshot_loader import SnapshotParameterLoader
@@ -60,6 +62,7 @@ class CalibOrchestrator:
         config: CalibConfig,
         github_integration: GitHubIntegration | None = None,
         snapshot_loader: SnapshotParameterLoader | None = None,
+        write_fence: Callable[[], None] | None = None,
     ) -> None:
         """Initialize the session manager.
 
@@ -67,10 +70,13 @@ class CalibOrchestrator:
             config: Session configuration
             github_integration: Optional GitHub integration for config pull
             snapshot_loader: Optional snapshot parameter loader for re-execution
+            write_fence: Called before task results are persisted; raises to
+                abort the write (e.g. when the session's execution lease was lost)
         """
         self.config = config
         self.github_integration = github_integration
         self._snapshot_loader = snapshot_loader
+        self._write_fence = write_fence
         self._source_task_id: str | None = None
 
         # Session components (initialized in initialize())
@@ -173,6 +179,7 @@ class CalibOrchestrator:
             history_recorder=self._create_history_recorder(),
             force_update_params=config.force_update_params,
             persist_output_parameters=config.persist_output_parameters,
+            write_fence=self._write_fence,
         )
 
         # Initialize Backend
@@ -498,6 +505,7 @@ class CalibOrchestrator:
             source_task_id=self._source_task_id,
             force_update_params=config.force_update_params,
             persist_output_parameters=config.persist_output_parameters,
+            write_fence=self._write_fence,
         )
 
         # Copy relevant calibration data
@@ -544,6 +552,7 @@ class CalibOrchestrator:
             source_task_id=self._source_task_id,
             force_update_params=config.force_update_params,
             persist_output_parameters=config.persist_output_parameters,
+            write_fence=self._write_fence,
         )
 
         relevant_qids: list[str] = []
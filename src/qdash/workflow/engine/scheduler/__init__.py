@@ -29,6 +29,24 @@ OneQubitScheduler (1-Qubit)
 OneQubitScheduleResult
     Result of 1-qubit scheduling with stage information.
 
+RetryScheduler (1-Qubit retries)
+    Regroups the failed qubits of a parallel stage into retry rounds.
+
+    Features:
+    - MUX-aware retry groups, capped at the stage's group count
+    - Retries resume at the failed task
+    - Per-task retry budgets and frequency offsets (RetryPolicy)
+
+WiringIndex / TopologyIndex (shared)
+    Wiring and topology files compiled once per process and shared by all
+    schedulers (``get_wiring_index`` / ``get_topology_index``).
+
+    Features:
+    - Cached per file, reused while mtime and size are unchanged
+    - Recompiled only when the content hash changes
+    - Frozen MUX membership, MUX conflicts, box types, qubit neighbours
+      and CR directions
+
 Conflict Types
 --------------
 1. **MUX Conflict**: Two qubits share the same MUX (multiplexer)
@@ -69,6 +87,17 @@ from qdash.workflow.engine.scheduler.one_qubit_types import (
     OneQubitScheduleResult,
     OneQubitStageInfo,
 )
+from qdash.workflow.engine.scheduler.retry_scheduler import (
+    RetryAttempt,
+    RetryPolicy,
+    RetryScheduler,
+)
+from qdash.workflow.engine.scheduler.topology_index import (
+    TopologyIndex,
+    WiringIndex,
+    get_topology_index,
+    get_wiring_index,
+)
 
 __all__ = [
     "BOX_A",
@@ -83,4 +112,13 @@ __all__ = [
     # 1-Qubit Scheduler
     "OneQubitScheduler",
     "OneQubitStageInfo",
+    # Retry scheduling (1-qubit)
+    "RetryAttempt",
+    "RetryPolicy",
+    "RetryScheduler",
+    # Compiled wiring/topology (shared)
+    "TopologyIndex",
+    "WiringIndex",
+    "get_topology_index",
+    "get_wiring_index",
 ]
@@ -41,23 +41,25 @@ Example:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import yaml
-
-from qdash.workflow.engine.backend.qubex_paths import get_qubex_paths
 from qdash.workflow.engine.scheduler.cr_utils import (
-    build_mux_conflict_map,
-    build_qubit_to_mux_map,
     convert_to_parallel_groups,
     extract_qubit_frequency,
     group_cr_pairs_by_conflict,
     infer_direction_from_design,
     split_fast_slow_pairs,
 )
+from qdash.workflow.engine.scheduler.topology_index import (
+    TopologyIndex,
+    WiringIndex,
+    get_topology_index,
+    get_wiring_index,
+)
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from qdash.common.config.topology import TopologyDefinition
     from qdash.datamodel.chip import ChipModel
     from qdash.repository.protocols import ChipRepository
@@ -175,7 +177,9 @@ class CRScheduler:
         self.wiring_config_path = wiring_config_path
         self._chip_repo = chip_repo
         self._chip: ChipModel | None = None
+        self._wiring_index: WiringIndex | None = None
         self._wiring_config: list[dict[str, Any]] | None = None
+        self._topology_index: TopologyIndex | None = None
         self._topology: TopologyDefinition | None = None
         # Cached individual document data (scalable approach for 256+ qubits)
         self._qubit_models: dict[str, Any] | None = None
@@ -229,16 +233,15 @@ class CRScheduler:
             chip = self._load_chip_data()
             if chip.topology_id:
                 try:
-                    from qdash.common.config.topology import load_topology
-
-                    self._topology = load_topology(chip.topology_id)
+                    self._topology_index = get_topology_index(chip.topology_id)
+                    self._topology = self._topology_index.topology
                 except FileNotFoundError:
                     logger.warning(
                         f"Topology {chip.topology_id} not found, falling back to design-based"
                     )
         return self._topology
 
-    def _get_topology_direction_set(self, inverse: bool = False) -> set[str] | None:
+    def _get_topology_direction_set(self, inverse: bool = False) -> frozenset[str] | None:
         """Get set of valid coupling directions from topology.
 
         Returns None if topology doesn't have checkerboard_cr convention.
@@ -246,34 +249,28 @@ class CRScheduler:
         topology = self._load_topology()
         if topology is None or topology.direction_convention != "checkerboard_cr":
             return None
-        if inverse:
-            return {f"{c[1]}-{c[0]}" for c in topology.couplings}
-        else:
-            return {f"{c[0]}-{c[1]}" for c in topology.couplings}
+        if self._topology_index is None or self._topology_index.topology is not topology:
+            self._topology_index = TopologyIndex.compile(topology)
+        return self._topology_index.directions(inverse)
+
+    def _load_wiring_index(self) -> WiringIndex:
+        """Load the compiled wiring shared with other schedulers."""
+        if self._wiring_index is None:
+            self._wiring_index = get_wiring_index(self.chip_id, self.wiring_config_path)
+        return self._wiring_index
 
     def _load_wiring_config(self) -> list[dict[str, Any]]:
         """Load wiring configuration from YAML file."""
         if self._wiring_config is None:
-            # Use provided path or default path
-            if self.wiring_config_path is not None:
-                wiring_path = Path(self.wiring_config_path)
-            else:
-                wiring_path = get_qubex_paths().wiring_yaml(self.chip_id)
-
-            if not wiring_path.exists():
-                msg = f"Wiring config not found: {wiring_path}"
-                raise FileNotFoundError(msg)
-
-            yaml_data = yaml.safe_load(wiring_path.read_text())
-            if self.chip_id in yaml_data:
-                self._wiring_config = yaml_data[self.chip_id]
-            else:
-                # New YAML format: top-level keys are group names (e.g., "A2"),
-                # each mapping to a list of MUX configs. Flatten all lists.
-                self._wiring_config = [entry for group in yaml_data.values() for entry in group]
-
+            self._wiring_config = self._load_wiring_index().wiring_config_list()
         return self._wiring_config
 
+    def _compile_wiring(self, wiring_config: list[dict[str, Any]]) -> WiringIndex:
+        """Return the compiled form of ``wiring_config``, reusing the shared index."""
+        if wiring_config is self._wiring_config and self._wiring_index is not None:
+            return self._wiring_index
+        return WiringIndex.compile(self.chip_id, wiring_config)
+
     def _get_two_qubit_pair_list(self) -> list[str]:
         """Extract all two-qubit coupling IDs from CouplingDocument collection."""
         coupling_ids = self._load_coupling_ids()
@@ -354,9 +351,9 @@ class CRScheduler:
         qubit_frequency = extract_qubit_frequency(qubit_models)
 
         # Load MUX configuration
-        wiring_config = self._load_wiring_config()
-        mux_conflict_map = build_mux_conflict_map(wiring_config)
-        qid_to_mux = build_qubit_to_mux_map(wiring_config)
+        wiring = self._compile_wiring(self._load_wiring_config())
+        mux_conflict_map = wiring.mux_conflict_map()
+        qid_to_mux = dict(wiring.qid_to_mux)
 
         # Determine grid size
         grid_size = 12 if "144Q" in self.chip_id else 8
@@ -610,9 +607,9 @@ class CRScheduler:
             raise ValueError(msg)
 
         # Load MUX configuration
-        wiring_config = self._load_wiring_config()
-        mux_conflict_map = build_mux_conflict_map(wiring_config)
-        qid_to_mux = build_qubit_to_mux_map(wiring_config)
+        wiring = self._compile_wiring(self._load_wiring_config())
+        mux_conflict_map = wiring.mux_conflict_map()
+        qid_to_mux = dict(wiring.qid_to_mux)
 
         # Filter out CR pairs that have qubits without MUX mappings
         pairs_before_mux_filter = len(cr_pairs)
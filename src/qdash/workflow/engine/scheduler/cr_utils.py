@@ -10,10 +10,13 @@ from __future__ import annotations
 import itertools
 import logging
 from collections import defaultdict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import networkx as nx
 
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+
 logger = logging.getLogger(__name__)
 
 
@@ -166,6 +169,94 @@ def build_qubit_to_mux_map(yaml_mux_list: list[dict[str, Any]]) -> dict[str, int
     return qid_to_mux
 
 
+def mux_of(qid: str, qid_to_mux: Mapping[str, int] | None = None) -> int | str:
+    """Return the MUX ID of a qubit.
+
+    Uses the wiring's qubit-to-MUX map when it has the qubit, otherwise the
+    default layout of 4 qubits per MUX. A non-numeric qubit ID missing from
+    the map is returned as is, so it only shares a MUX with itself.
+    """
+    if qid_to_mux and qid in qid_to_mux:
+        return qid_to_mux[qid]
+    try:
+        return int(qid) // 4
+    except ValueError:
+        return qid
+
+
+def muxes_conflict(
+    muxes_a: Collection[int | str],
+    muxes_b: Collection[int | str],
+    mux_conflict_map: Mapping[int, Collection[int]] | None = None,
+) -> bool:
+    """Return True if qubits on two sets of MUXes cannot be driven at the same time.
+
+    The sets conflict when they share a MUX, or use MUXes that share a
+    readout or control module.
+    """
+    if any(mux in muxes_b for mux in muxes_a):
+        return True
+    if not mux_conflict_map:
+        return False
+    return any(
+        other in muxes_b
+        for mux in muxes_a
+        if isinstance(mux, int)
+        for other in mux_conflict_map.get(mux, ())
+    )
+
+
+def cr_pairs_conflict(
+    pair_a: str,
+    pair_b: str,
+    qid_to_mux: dict[str, int],
+    mux_conflict_map: dict[int, set[int]],
+) -> bool:
+    """Return True if two CR pairs cannot run in the same parallel group.
+
+    Pairs conflict when they share a qubit, use the same MUX, or use MUXes
+    that share a readout or control module.
+    """
+    q1a, q2a = pair_a.split("-")
+    q1b, q2b = pair_b.split("-")
+
+    # Conflict 1: Shared qubits
+    if {q1a, q2a} & {q1b, q2b}:
+        return True
+
+    # Conflict 2: Same MUX usage
+    mux_a1, mux_a2 = qid_to_mux[q1a], qid_to_mux[q2a]
+    mux_b1, mux_b2 = qid_to_mux[q1b], qid_to_mux[q2b]
+    if mux_a1 in (mux_b1, mux_b2) or mux_a2 in (mux_b1, mux_b2):
+        return True
+
+    # Conflict 3: MUX resource conflicts
+    conflict_muxes = mux_conflict_map.get(mux_a1, set()) | mux_conflict_map.get(mux_a2, set())
+    return mux_b1 in conflict_muxes or mux_b2 in conflict_muxes
+
+
+def predict_makespan(
+    groups: list[list[str]], durations: dict[str, float], default_duration: float = 0.0
+) -> float:
+    """Predict the wall-clock time of a grouped schedule.
+
+    Groups run one after another and every group waits for its slowest pair,
+    so the makespan is the sum of the per-group maximum durations.
+
+    Args:
+        groups: Parallel groups of CR pair strings
+        durations: Predicted seconds per CR pair
+        default_duration: Seconds assumed for pairs missing from ``durations``
+
+    Returns:
+        Predicted makespan in seconds
+    """
+    return sum(
+        max((durations.get(pair, default_duration) for pair in group), default=0.0)
+        for group in groups
+    )
+
+
 def group_cr_pairs_by_conflict(
     cr_pairs: list[str],
     qid_to_mux: dict[str, int],
@@ -196,25 +287,7 @@ def group_cr_pairs_by_conflict(
     conflict_graph.add_nodes_from(cr_pairs)
 
     for pair_a, pair_b in itertools.combinations(cr_pairs, 2):
-        q1a, q2a = pair_a.split("-")
-        q1b, q2b = pair_b.split("-")
-
-        # Conflict 1: Shared qubits
-        if {q1a, q2a} & {q1b, q2b}:
-            conflict_graph.add_edge(pair_a, pair_b)
-            continue
-
-        # Conflict 2: Same MUX usage
-        mux_a1, mux_a2 = qid_to_mux[q1a], qid_to_mux[q2a]
-        mux_b1, mux_b2 = qid_to_mux[q1b], qid_to_mux[q2b]
-
-        if mux_a1 in (mux_b1, mux_b2) or mux_a2 in (mux_b1, mux_b2):
-            conflict_graph.add_edge(pair_a, pair_b)
-            continue
-
-        # Conflict 3: MUX resource conflicts
-        conflict_muxes = mux_conflict_map.get(mux_a1, set()) | mux_conflict_map.get(mux_a2, set())
-        if mux_b1 in conflict_muxes or mux_b2 in conflict_muxes:
+        if cr_pairs_conflict(pair_a, pair_b, qid_to_mux, mux_conflict_map):
             conflict_graph.add_edge(pair_a, pair_b)
 
     # Greedy graph coloring
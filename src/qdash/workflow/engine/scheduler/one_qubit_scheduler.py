@@ -46,13 +46,8 @@ Example:
 from __future__ import annotations
 
 import logging
-import re
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import yaml
-
-from qdash.workflow.engine.backend.qubex_paths import get_qubex_paths
 from qdash.workflow.engine.scheduler.one_qubit_types import (
     BOX_A,
     BOX_B,
@@ -64,8 +59,16 @@ from qdash.workflow.engine.scheduler.one_qubit_types import (
     SynchronizedOneQubitScheduleResult,
     SynchronizedStepInfo,
 )
+from qdash.workflow.engine.scheduler.topology_index import (
+    WiringIndex,
+    extract_box_type,
+    extract_module_id,
+    get_wiring_index,
+)
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from qdash.workflow.engine.scheduler.one_qubit_plugins import (
         MuxOrderingStrategy,
     )
@@ -113,33 +116,30 @@ class OneQubitScheduler:
         """
         self.chip_id = chip_id
         self.wiring_config_path = wiring_config_path
+        self._wiring_index: WiringIndex | None = None
         self._wiring_config: list[dict[str, Any]] | None = None
         self._mux_box_map: dict[int, set[str]] | None = None
         self._qid_to_mux: dict[str, int] | None = None
         self._box_b_module_to_muxes: dict[str, list[int]] | None = None
 
+    def _load_wiring_index(self) -> WiringIndex:
+        """Load the compiled wiring shared with other schedulers."""
+        if self._wiring_index is None:
+            self._wiring_index = get_wiring_index(self.chip_id, self.wiring_config_path)
+        return self._wiring_index
+
     def _load_wiring_config(self) -> list[dict[str, Any]]:
         """Load wiring configuration from YAML file."""
         if self._wiring_config is None:
-            if self.wiring_config_path is not None:
-                wiring_path = Path(self.wiring_config_path)
-            else:
-                wiring_path = get_qubex_paths().wiring_yaml(self.chip_id)
-
-            if not wiring_path.exists():
-                msg = f"Wiring config not found: {wiring_path}"
-                raise FileNotFoundError(msg)
-
-            yaml_data = yaml.safe_load(wiring_path.read_text())
-            if self.chip_id in yaml_data:
-                self._wiring_config = yaml_data[self.chip_id]
-            else:
-                # New YAML format: top-level keys are group names (e.g., "A2"),
-                # each mapping to a list of MUX configs. Flatten all lists.
-                self._wiring_config = [entry for group in yaml_data.values() for entry in group]
-
+            self._wiring_config = self._load_wiring_index().wiring_config_list()
         return self._wiring_config
 
+    def _compile_wiring(self, wiring_config: list[dict[str, Any]]) -> WiringIndex:
+        """Return the compiled form of ``wiring_config``, reusing the shared index."""
+        if wiring_config is self._wiring_config and self._wiring_index is not None:
+            return self._wiring_index
+        return WiringIndex.compile(self.chip_id, wiring_config)
+
     @staticmethod
     def _extract_box_type(module_name: str) -> str | None:
         """Extract box type from module name.
@@ -154,21 +154,7 @@ class OneQubitScheduler:
         Returns:
             "A" for Box A, "B" for Box B, or None if unrecognized
         """
-        # Extract the module identifier (part before the channel number)
-        # e.g., "R21B-5" → "R21B", "Q73A-1" → "Q73A"
-        match = re.match(r"^([A-Za-z0-9]+)(?:-\d+)?$", module_name)
-        if not match:
-            return None
-
-        module_id = match.group(1)
-
-        # Check the last character of the module identifier
-        if module_id.endswith("A"):
-            return BOX_A
-        elif module_id.endswith("B"):
-            return BOX_B
-
-        return None
+        return extract_box_type(module_name)
 
     def _build_mux_box_map(self, wiring_config: list[dict[str, Any]]) -> dict[int, set[str]]:
         """Build mapping from MUX ID to box types used.
@@ -181,46 +167,9 @@ class OneQubitScheduler:
         Returns:
             Mapping from MUX ID to set of box types ("A", "B", or both)
         """
-        if self._mux_box_map is not None:
-            return self._mux_box_map
-
-        mux_box_map: dict[int, set[str]] = {}
-
-        for mux_entry in wiring_config:
-            mux_id = mux_entry["mux"]
-            box_types: set[str] = set()
-
-            # Check ctrl modules
-            for ctrl in mux_entry.get("ctrl", []):
-                box = self._extract_box_type(ctrl)
-                if box:
-                    box_types.add(box)
-
-            # Check read_out module
-            read_out = mux_entry.get("read_out")
-            if read_out:
-                box = self._extract_box_type(read_out)
-                if box:
-                    box_types.add(box)
-
-            # Check read_in module
-            read_in = mux_entry.get("read_in")
-            if read_in:
-                box = self._extract_box_type(read_in)
-                if box:
-                    box_types.add(box)
-
-            # Check pump module
-            pump = mux_entry.get("pump")
-            if pump:
-                box = self._extract_box_type(pump)
-                if box:
-                    box_types.add(box)
-
-            mux_box_map[mux_id] = box_types
-
-        self._mux_box_map = mux_box_map
-        return mux_box_map
+        if self._mux_box_map is None:
+            self._mux_box_map = self._compile_wiring(wiring_config).mux_box_map()
+        return self._mux_box_map
 
     def _build_qubit_to_mux_map(self, wiring_config: list[dict[str, Any]]) -> dict[str, int]:
         """Build mapping from qubit ID to MUX ID.
@@ -233,17 +182,9 @@ class OneQubitScheduler:
         Returns:
             Mapping from qubit ID (string) to MUX ID (int)
         """
-        if self._qid_to_mux is not None:
-            return self._qid_to_mux
-
-        qid_to_mux = {}
-        for entry in wiring_config:
-            mux_id = entry["mux"]
-            for offset in range(4):
-                qid_to_mux[str(mux_id * 4 + offset)] = mux_id
-
-        self._qid_to_mux = qid_to_mux
-        return qid_to_mux
+        if self._qid_to_mux is None:
+            self._qid_to_mux = dict(self._compile_wiring(wiring_config).qid_to_mux)
+        return self._qid_to_mux
 
     @staticmethod
     def _extract_module_id(module_name: str) -> str | None:
@@ -255,10 +196,7 @@ class OneQubitScheduler:
         Returns:
             Module identifier without channel (e.g., "R21B", "Q73A")
         """
-        match = re.match(r"^([A-Za-z0-9]+)(?:-\d+)?$", module_name)
-        if match:
-            return match.group(1)
-        return None
+        return extract_module_id(module_name)
 
     def _build_box_b_module_map(self, wiring_config: list[dict[str, Any]]) -> dict[str, list[int]]:
         """Build mapping from Box B module to MUX IDs that use it.
@@ -275,29 +213,9 @@ class OneQubitScheduler:
         Example:
             {"R21B": [0, 4], "U10B": [3, 7], "U13B": [10, 14]}
         """
-        if self._box_b_module_to_muxes is not None:
-            return self._box_b_module_to_muxes
-
-        box_b_to_muxes: dict[str, list[int]] = {}
-
-        for mux_entry in wiring_config:
-            mux_id = mux_entry["mux"]
-
-            # Check ctrl modules for Box B
-            for ctrl in mux_entry.get("ctrl", []):
-                module_id = self._extract_module_id(ctrl)
-                if module_id and module_id.endswith("B"):
-                    if module_id not in box_b_to_muxes:
-                        box_b_to_muxes[module_id] = []
-                    if mux_id not in box_b_to_muxes[module_id]:
-                        box_b_to_muxes[module_id].append(mux_id)
-
-        # Sort MUX IDs for deterministic ordering
-        for module_id, mux_ids in box_b_to_muxes.items():
-            mux_ids.sort()
-
-        self._box_b_module_to_muxes = box_b_to_muxes
-        return box_b_to_muxes
+        if self._box_b_module_to_muxes is None:
+            self._box_b_module_to_muxes = self._compile_wiring(wiring_config).box_b_module_map()
+        return self._box_b_module_to_muxes
 
     def _group_mixed_muxes_by_box_b(
         self,
@@ -6,6 +6,7 @@ users to customize filtering and scheduling strategies.
 Architecture:
     - CRPairFilter: Base class for filtering CR pairs
     - CRSchedulingStrategy: Base class for scheduling strategies
+    - MakespanScheduler: Duration-aware strategy fed by task_result_history
     - FilterContext/ScheduleContext: Context objects passed to plugins
 
 Example:
@@ -53,6 +54,10 @@ from qdash.workflow.engine.scheduler.plugins.frequency_directionality_filter imp
 from qdash.workflow.engine.scheduler.plugins.intra_then_inter_mux_scheduler import (
     IntraThenInterMuxScheduler,
 )
+from qdash.workflow.engine.scheduler.plugins.makespan_scheduler import (
+    MakespanScheduler,
+    load_cr_pair_durations,
+)
 from qdash.workflow.engine.scheduler.plugins.mux_conflict_scheduler import MuxConflictScheduler
 from qdash.workflow.engine.scheduler.plugins.mux_membership_filter import MuxMembershipFilter
 
@@ -64,7 +69,9 @@ __all__ = [
     "FilterContext",
     "FrequencyDirectionalityFilter",
     "IntraThenInterMuxScheduler",
+    "MakespanScheduler",
     "MuxConflictScheduler",
     "MuxMembershipFilter",
     "ScheduleContext",
+    "load_cr_pair_durations",
 ]
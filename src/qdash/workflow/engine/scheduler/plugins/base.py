@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from qdash.datamodel.chip import ChipModel
 
 
@@ -29,7 +31,7 @@ class FilterContext:
     qubit_frequency: dict[str, float] = field(default_factory=dict)
     qid_to_mux: dict[str, int] = field(default_factory=dict)
     qubit_models: dict[str, Any] = field(default_factory=dict)
-    topology_directions: set[str] | None = None
+    topology_directions: Collection[str] | None = None
 
 
 @dataclass
@@ -0,0 +1,328 @@
+"""Makespan-optimizing scheduler for CR pair scheduling."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import statistics
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from qdash.workflow.engine.scheduler.cr_utils import cr_pairs_conflict, predict_makespan
+from qdash.workflow.engine.scheduler.plugins.base import CRSchedulingStrategy, ScheduleContext
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from qdash.repository.protocols import TaskResultHistoryRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CR_TASK_NAMES = ["CheckCrossResonance", "CreateZX90", "CheckZX90"]
+
+# Improvements smaller than this (seconds) are treated as noise.
+_EPSILON = 1e-9
+
+
+def load_cr_pair_durations(
+    project_id: str,
+    chip_id: str,
+    task_names: list[str] | None = None,
+    *,
+    cutoff_time: datetime | None = None,
+    repository: TaskResultHistoryRepository | None = None,
+) -> dict[str, float]:
+    """Predict per-pair CR calibration time from recorded task durations.
+
+    The predicted duration of a pair is the sum over ``task_names`` of the
+    mean ``elapsed_time`` recorded for that (task, coupling). If a pair has
+    history for some tasks but not others, the missing tasks are filled with
+    the median over all couplings for that task. Pairs without any history
+    are left out so the scheduler can apply its own default.
+
+    Args:
+        project_id: Project identifier
+        chip_id: Chip identifier
+        task_names: Tasks run per CR pair (defaults to the CR/ZX90 sequence)
+        cutoff_time: Only use results started at or after this time
+        repository: Task result history repository.
+            If None, uses MongoTaskResultHistoryRepository.
+
+    Returns:
+        Mapping from coupling ID (e.g. "0-1") to predicted seconds
+    """
+    if repository is None:
+        from qdash.repository import MongoTaskResultHistoryRepository
+
+        repository = MongoTaskResultHistoryRepository()
+    task_names = task_names or DEFAULT_CR_TASK_NAMES
+
+    rows = repository.aggregate_elapsed_times(
+        project_id=project_id,
+        chip_id=chip_id,
+        task_names=task_names,
+        cutoff_time=cutoff_time,
+    )
+    per_pair: dict[str, dict[str, float]] = defaultdict(dict)
+    per_task: dict[str, list[float]] = defaultdict(list)
+    for row in rows:
+        if "-" not in row["qid"]:
+            continue
+        per_pair[row["qid"]][row["name"]] = row["mean_seconds"]
+        per_task[row["name"]].append(row["mean_seconds"])
+
+    task_fallback = {name: statistics.median(values) for name, values in per_task.items()}
+    return {
+        pair: sum(measured.get(name, task_fallback.get(name, 0.0)) for name in task_names)
+        for pair, measured in per_pair.items()
+    }
+
+
+class MakespanScheduler(CRSchedulingStrategy):
+    """Schedule CR pairs to minimize predicted wall-clock time.
+
+    Groups run one after another and each group waits for its slowest pair,
+    so mixing slow and fast pairs wastes time even when the number of groups
+    is minimal. This scheduler places pairs longest-first into the first
+    conflict-free group (LPT), then applies relocate and swap moves between
+    groups while they reduce the predicted makespan. Conflicts are the same
+    qubit and MUX rules used by ``MuxConflictScheduler``.
+
+    Example:
+        ```python
+        scheduler = MakespanScheduler.from_history(
+            project_id="proj-1", chip_id="64Qv3", max_parallel_ops=10
+        )
+        groups = scheduler.schedule(["0-1", "2-3", "4-5"], context)
+        ```
+    """
+
+    def __init__(
+        self,
+        durations: dict[str, float],
+        max_parallel_ops: int | None = 10,
+        default_duration: float | None = None,
+        max_passes: int = 20,
+    ):
+        """Initialize makespan scheduler.
+
+        Args:
+            durations: Predicted seconds per CR pair (see ``load_cr_pair_durations``)
+            max_parallel_ops: Maximum parallel operations per group (None for no limit)
+            default_duration: Seconds assumed for pairs without a prediction.
+                If None, uses the median of ``durations`` (or 1.0 if empty).
+            max_passes: Maximum local search passes over all pairs
+        """
+        self.durations = durations
+        self.max_parallel_ops = max_parallel_ops
+        if default_duration is None:
+            default_duration = statistics.median(durations.values()) if durations else 1.0
+        self.default_duration = default_duration
+        self.max_passes = max_passes
+        self._num_groups = 0
+        self._known_pairs = 0
+        self._lpt_makespan = 0.0
+        self._predicted_makespan = 0.0
+        self._passes = 0
+
+    @classmethod
+    def from_history(
+        cls,
+        project_id: str,
+        chip_id: str,
+        task_names: list[str] | None = None,
+        *,
+        cutoff_time: datetime | None = None,
+        repository: TaskResultHistoryRepository | None = None,
+        **kwargs: Any,
+    ) -> MakespanScheduler:
+        """Build a scheduler from durations recorded in task_result_history.
+
+        Args:
+            project_id: Project identifier
+            chip_id: Chip identifier
+            task_names: Tasks run per CR pair (defaults to the CR/ZX90 sequence)
+            cutoff_time: Only use results started at or after this time
+            repository: Task result history repository
+            **kwargs: Passed to ``MakespanScheduler.__init__``
+
+        Returns:
+            Scheduler using the recorded durations
+        """
+        durations = load_cr_pair_durations(
+            project_id,
+            chip_id,
+            task_names,
+            cutoff_time=cutoff_time,
+            repository=repository,
+        )
+        return cls(durations, **kwargs)
+
+    def _recorded_duration(self, pair: str) -> float | None:
+        """Return the recorded prediction for a pair, trying the reversed coupling too."""
+        if pair in self.durations:
+            return self.durations[pair]
+        control, target = pair.split("-")
+        return self.durations.get(f"{target}-{control}")
+
+    def predicted_duration(self, pair: str) -> float:
+        """Return the predicted seconds for a pair, falling back to ``default_duration``."""
+        recorded = self._recorded_duration(pair)
+        return self.default_duration if recorded is None else recorded
+
+    def schedule(self, pairs: list[str], context: ScheduleContext) -> list[list[str]]:
+        """Schedule pairs by LPT placement followed by local search."""
+        durations = {pair: self.predicted_duration(pair) for pair in pairs}
+        conflicts: dict[str, set[str]] = {pair: set() for pair in pairs}
+        for pair_a, pair_b in itertools.combinations(pairs, 2):
+            if cr_pairs_conflict(pair_a, pair_b, context.qid_to_mux, context.mux_conflict_map):
+                conflicts[pair_a].add(pair_b)
+                conflicts[pair_b].add(pair_a)
+
+        groups = self._place_longest_first(pairs, durations, conflicts)
+        self._lpt_makespan = _makespan(groups, durations)
+        self._passes = self._improve(groups, durations, conflicts)
+
+        ordered = sorted(
+            (sorted(group, key=lambda p: (-durations[p], p)) for group in groups if group),
+            key=lambda group: (-durations[group[0]], group[0]),
+        )
+        self._num_groups = len(ordered)
+        self._known_pairs = sum(1 for pair in pairs if self._recorded_duration(pair) is not None)
+        self._predicted_makespan = predict_makespan(ordered, durations)
+        logger.info(
+            f"MakespanScheduler: {len(pairs)} pairs → {self._num_groups} groups, "
+            f"predicted {self._predicted_makespan:.1f}s (LPT {self._lpt_makespan:.1f}s)"
+        )
+        return ordered
+
+    def _fits(self, pair: str, group: set[str], conflicts: dict[str, set[str]]) -> bool:
+        """Return True if ``pair`` can join ``group``."""
+        if self.max_parallel_ops is not None and len(group) >= self.max_parallel_ops:
+            return False
+        return not (conflicts[pair] & group)
+
+    def _place_longest_first(
+        self,
+        pairs: list[str],
+        durations: dict[str, float],
+        conflicts: dict[str, set[str]],
+    ) -> list[set[str]]:
+        """Place pairs longest-first into the first group they fit.
+
+        Every group is opened by a pair at least as long as any pair placed
+        later, so joining an existing group never lengthens it.
+        """
+        groups: list[set[str]] = []
+        for pair in sorted(pairs, key=lambda p: (-durations[p], p)):
+            for group in groups:
+                if self._fits(pair, group, conflicts):
+                    group.add(pair)
+                    break
+            else:
+                groups.append({pair})
+        return groups
+
+    def _improve(
+        self,
+        groups: list[set[str]],
+        durations: dict[str, float],
+        conflicts: dict[str, set[str]],
+    ) -> int:
+        """Apply improving relocate/swap moves in place; return passes used."""
+        passes = 0
+        improved = True
+        while improved and passes < self.max_passes:
+            passes += 1
+            improved = False
+            for a, b in itertools.permutations(range(len(groups)), 2):
+                if self._relocate(groups[a], groups[b], durations, conflicts):
+                    improved = True
+            for a, b in itertools.combinations(range(len(groups)), 2):
+                if self._swap(groups[a], groups[b], durations, conflicts):
+                    improved = True
+            groups[:] = [group for group in groups if group]
+        return passes
+
+    def _relocate(
+        self,
+        source: set[str],
+        target: set[str],
+        durations: dict[str, float],
+        conflicts: dict[str, set[str]],
+    ) -> bool:
+        """Move the pair from ``source`` to ``target`` that saves the most time."""
+        if not source or not target:
+            return False
+        before = _span(source, durations) + _span(target, durations)
+        best: tuple[float, str] | None = None
+        for pair in sorted(source):
+            if not self._fits(pair, target, conflicts):
+                continue
+            after = _span(source - {pair}, durations) + max(
+                _span(target, durations), durations[pair]
+            )
+            if after < before - _EPSILON and (best is None or after < best[0]):
+                best = (after, pair)
+        if best is None:
+            return False
+        source.discard(best[1])
+        target.add(best[1])
+        return True
+
+    def _swap(
+        self,
+        group_a: set[str],
+        group_b: set[str],
+        durations: dict[str, float],
+        conflicts: dict[str, set[str]],
+    ) -> bool:
+        """Exchange one pair between two groups if that saves time."""
+        before = _span(group_a, durations) + _span(group_b, durations)
+        for pair_a in sorted(group_a):
+            rest_a = group_a - {pair_a}
+            for pair_b in sorted(group_b):
+                if durations[pair_a] == durations[pair_b]:
+                    continue
+                rest_b = group_b - {pair_b}
+                if conflicts[pair_a] & rest_b or conflicts[pair_b] & rest_a:
+                    continue
+                after = max(_span(rest_a, durations), durations[pair_b]) + max(
+                    _span(rest_b, durations), durations[pair_a]
+                )
+                if after < before - _EPSILON:
+                    group_a.discard(pair_a)
+                    group_b.discard(pair_b)
+                    group_a.add(pair_b)
+                    group_b.add(pair_a)
+                    return True
+        return False
+
+    def get_metadata(self) -> dict[str, Any]:
+        """Return scheduler metadata."""
+        return {
+            "scheduler_name": "makespan",
+            "max_parallel_ops": self.max_parallel_ops,
+            "num_groups": self._num_groups,
+            "known_pairs": self._known_pairs,
+            "default_duration": self.default_duration,
+            "lpt_makespan": self._lpt_makespan,
+            "predicted_makespan": self._predicted_makespan,
+            "local_search_passes": self._passes,
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"MakespanScheduler(max_ops={self.max_parallel_ops}, known_pairs={len(self.durations)})"
+        )
+
+
+def _span(group: set[str], durations: dict[str, float]) -> float:
+    """Return the duration of a group (its slowest pair)."""
+    return max((durations[pair] for pair in group), default=0.0)
+
+
+def _makespan(groups: list[set[str]], durations: dict[str, float]) -> float:
+    """Return the predicted makespan of set-based groups."""
+    return sum(_span(group, durations) for group in groups)
@@ -0,0 +1,240 @@
+"""Stage-level retry scheduling for parallel 1-qubit calibration groups.
+
+A stage runs its qubit groups in parallel, each group running its qubits
+one after another. Retrying a failed qubit inside its group keeps the whole
+group busy while the other groups are already idle. ``RetryScheduler``
+instead runs every qubit once, collects the failures of all groups, and
+runs the retry attempts as new parallel groups at the end of the stage,
+one round per attempt.
+
+Retry groups keep the grouping rule of the stage: qubits of the same MUX,
+or of MUXes sharing a readout or control module, never run in parallel, so
+each set of such MUXes is a lane of its own. Lanes are packed into at most
+as many groups as the stage had, longest lane first.
+
+A retry resumes at the task that failed; tasks that already succeeded for
+the qubit are not repeated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from qdash.workflow.engine.scheduler.cr_utils import mux_of
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+
+DEFAULT_RETRY_OFFSETS = [0.0, 0.001, -0.001]
+
+
+@dataclass
+class RetryPolicy:
+    """Per-task retry budgets and qubit frequency offsets.
+
+    Attempt ``n`` (1-based) of a task uses offset ``n - 1`` of its list; the
+    last offset is reused when the budget is larger than the list. The
+    first attempt of every qubit runs all tasks at ``offsets[0]``.
+
+    Attributes:
+        offsets: Frequency offsets in GHz per attempt (e.g., [0, 0.001, -0.001])
+        max_attempts: Attempts per task including the first (default: len(offsets))
+        task_offsets: Per-task override of ``offsets``
+        task_max_attempts: Per-task override of ``max_attempts``
+    """
+
+    offsets: list[float] = field(default_factory=lambda: list(DEFAULT_RETRY_OFFSETS))
+    max_attempts: int | None = None
+    task_offsets: dict[str, list[float]] = field(default_factory=dict)
+    task_max_attempts: dict[str, int] = field(default_factory=dict)
+
+    def budget(self, task_name: str) -> int:
+        """Return the number of attempts allowed for a task."""
+        limit = self.task_max_attempts.get(task_name, self.max_attempts)
+        if limit is None:
+            limit = len(self.task_offsets.get(task_name, self.offsets))
+        return max(limit, 1)
+
+    def offset(self, task_name: str, attempt: int) -> float:
+        """Return the frequency offset of a task's ``attempt`` (1-based)."""
+        offsets = self.task_offsets.get(task_name, self.offsets) or [0.0]
+        return offsets[min(attempt, len(offsets)) - 1]
+
+
+@dataclass(frozen=True)
+class RetryAttempt:
+    """One run of a qubit's remaining tasks.
+
+    Attributes:
+        qid: Qubit ID
+        start_task: Index of the first task to run
+        attempt: Attempt number of the task at ``start_task`` (1-based)
+        offset: Frequency offset in GHz applied to every task of the run
+    """
+
+    qid: str
+    start_task: int = 0
+    attempt: int = 1
+    offset: float = 0.0
+
+
+class RetryScheduler:
+    """Track qubit attempts of a stage and group retries across groups.
+
+    Example:
+        ```python
+        scheduler = RetryScheduler(tasks, RetryPolicy(), max_groups=len(groups))
+        round_groups = scheduler.initial_groups(groups)
+        while round_groups:
+            results = run_in_parallel(round_groups)
+            round_groups = scheduler.record(results)
+        final = scheduler.results
+        ```
+    """
+
+    def __init__(
+        self,
+        tasks: list[str],
+        policy: RetryPolicy | None = None,
+        max_groups: int | None = None,
+        qid_to_mux: Mapping[str, int] | None = None,
+        mux_conflict_map: Mapping[int, Collection[int]] | None = None,
+    ):
+        """Initialize retry scheduler.
+
+        Args:
+            tasks: Task names run per qubit, in order
+            policy: Retry budgets and offsets (default: RetryPolicy())
+            max_groups: Maximum parallel retry groups (None for one per MUX)
+            qid_to_mux: Mapping from qubit ID to MUX ID from the wiring
+                (default: 4 qubits per MUX)
+            mux_conflict_map: MUX ID to the MUXes sharing a readout or control
+                module, from the wiring (default: no conflicts)
+        """
+        self.tasks = tasks
+        self.policy = policy or RetryPolicy()
+        self.max_groups = max_groups
+        self.qid_to_mux = qid_to_mux or {}
+        self.mux_conflict_map = mux_conflict_map or {}
+        self.results: dict[str, dict[str, Any]] = {}
+        self.rounds = 0
+        self._attempts: dict[str, RetryAttempt] = {}
+
+    def initial_groups(self, groups: list[list[str]]) -> list[list[RetryAttempt]]:
+        """Return the first round: every qubit once, in its original group."""
+        offset = self.policy.offsets[0] if self.policy.offsets else 0.0
+        round_groups = [[RetryAttempt(qid=qid, offset=offset) for qid in group] for group in groups]
+        round_groups = [group for group in round_groups if group]
+        if self.max_groups is None:
+            self.max_groups = len(round_groups)
+        for group in round_groups:
+            for attempt in group:
+                self._attempts[attempt.qid] = attempt
+        return round_groups
+
+    def record(self, round_results: dict[str, dict[str, Any]]) -> list[list[RetryAttempt]]:
+        """Fold one round's results and return the next round's groups.
+
+        Args:
+            round_results: Results keyed by qubit ID. A failed result names the
+                task that failed in ``failed_task``.
+
+        Returns:
+            Parallel groups of retry attempts (empty when the stage is done)
+        """
+        self.rounds += 1
+        retries: list[RetryAttempt] = []
+        for qid, result in round_results.items():
+            attempt = self._attempts.pop(qid, RetryAttempt(qid=qid))
+            merged = self.results.setdefault(qid, {})
+            merged.update({key: value for key, value in result.items() if key in self.tasks})
+            merged["attempt"] = attempt.attempt
+            if result.get("status") != "failed":
+                merged.pop("error", None)
+                merged.pop("error_details", None)
+                merged.pop("failed_task", None)
+                merged["status"] = "success"
+                continue
+
+            merged.update(
+                {
+                    key: result[key]
+                    for key in ("status", "error", "error_details", "failed_task")
+                    if key in result
+                }
+            )
+            retry = self._next_attempt(attempt, result.get("failed_task"))
+            if retry is not None:
+                self._attempts[qid] = retry
+                retries.append(retry)
+        return self.group(retries)
+
+    def group(self, attempts: list[RetryAttempt]) -> list[list[RetryAttempt]]:
+        """Group attempts into parallel groups, keeping each MUX in one group.
+
+        Attempts on conflicting MUXes share a lane. Lanes are packed into at
+        most ``max_groups`` groups, longest lane (most remaining task runs)
+        first, each into the currently shortest group.
+        """
+        lanes: dict[str, list[RetryAttempt]] = {}
+        lane_of = self._lanes({mux_of(attempt.qid, self.qid_to_mux) for attempt in attempts})
+        for attempt in attempts:
+            lanes.setdefault(lane_of[mux_of(attempt.qid, self.qid_to_mux)], []).append(attempt)
+        if not lanes:
+            return []
+
+        limit = self.max_groups or len(lanes)
+        ordered = sorted(lanes.items(), key=lambda item: (-self._lane_cost(item[1]), item[0]))
+        groups: list[list[RetryAttempt]] = []
+        costs: list[int] = []
+        for _, lane in ordered:
+            if len(groups) < limit:
+                groups.append(list(lane))
+                costs.append(self._lane_cost(lane))
+                continue
+            target = min(range(len(groups)), key=lambda i: (costs[i], i))
+            groups[target].extend(lane)
+            costs[target] += self._lane_cost(lane)
+        return groups
+
+    def _next_attempt(self, attempt: RetryAttempt, failed_task: str | None) -> RetryAttempt | None:
+        """Return the retry of a failed attempt, or None if its budget is spent."""
+        if failed_task not in self.tasks:
+            return None
+        start = self.tasks.index(failed_task)
+        number = attempt.attempt + 1 if start == attempt.start_task else 2
+        if number > self.policy.budget(failed_task):
+            return None
+        return RetryAttempt(
+            qid=attempt.qid,
+            start_task=start,
+            attempt=number,
+            offset=self.policy.offset(failed_task, number),
+        )
+
+    def _lanes(self, muxes: set[int | str]) -> dict[int | str, str]:
+        """Return the lane key of each MUX, joining MUXes that conflict."""
+        parent = {mux: mux for mux in muxes}
+
+        def root(mux: int | str) -> int | str:
+            while parent[mux] != mux:
+                parent[mux] = parent[parent[mux]]
+                mux = parent[mux]
+            return mux
+
+        for mux in muxes:
+            if not isinstance(mux, int):
+                continue
+            for other in self.mux_conflict_map.get(mux, ()):
+                if other in parent:
+                    parent[root(other)] = root(mux)
+        members: dict[int | str, list[int | str]] = {}
+        for mux in muxes:
+            members.setdefault(root(mux), []).append(mux)
+        return {
+            mux: ",".join(sorted(map(str, group))) for group in members.values() for mux in group
+        }
+
+    def _lane_cost(self, lane: list[RetryAttempt]) -> int:
+        return sum(len(self.tasks) - attempt.start_task for attempt in lane)
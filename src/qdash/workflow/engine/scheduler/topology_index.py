@@ -0,0 +1,382 @@
+"""Compiled wiring and topology indexes shared by the schedulers.
+
+``OneQubitScheduler`` and ``CRScheduler`` need the chip wiring (MUX
+membership, MUX conflicts, box types) and, for CR scheduling, the chip
+topology. Flows create schedulers once per stage and per parallel call, so
+parsing the YAML files and rebuilding the maps per scheduler repeats the
+same work many times. This module compiles each file once per process and
+hands the same frozen index to every scheduler.
+
+Caching:
+    Wiring and topology indexes are cached by file path. A cached index is
+    reused while the file's modification time and size are unchanged.
+    Otherwise the file is read and hashed (SHA-256), and recompiled only if
+    the hash changed, so a touched but unchanged file keeps its index and an
+    edited one is picked up without a restart.
+
+Immutability:
+    Index maps are read-only mappings of tuples and frozensets, and wiring
+    entries are frozen recursively. Schedulers
+    copy them into plain dicts and sets where they hand them out (schedule
+    results, plugin contexts), so callers may still modify those.
+
+Example:
+    ```python
+    from qdash.workflow.engine.scheduler.topology_index import get_wiring_index
+
+    wiring = get_wiring_index("64Qv3")
+    wiring.qid_to_mux["5"]  # 1
+    wiring.mux_conflicts[0]  # frozenset({4, ...})
+    ```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import yaml
+
+from qdash.workflow.engine.backend.qubex_paths import get_qubex_paths
+from qdash.workflow.engine.scheduler.cr_utils import (
+    build_mux_conflict_map,
+    build_qubit_to_mux_map,
+)
+from qdash.workflow.engine.scheduler.one_qubit_types import BOX_A, BOX_B
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from qdash.common.config.topology import TopologyDefinition
+
+T = TypeVar("T")
+
+_MODULE_NAME_PATTERN = re.compile(r"^([A-Za-z0-9]+)(?:-\d+)?$")
+
+
+def extract_module_id(module_name: str) -> str | None:
+    """Extract the module identifier from a module name.
+
+    Args:
+        module_name: Full module name (e.g., "R21B-5", "Q73A-1")
+
+    Returns:
+        Module identifier without channel (e.g., "R21B", "Q73A"), or None
+    """
+    match = _MODULE_NAME_PATTERN.match(module_name)
+    if match:
+        return match.group(1)
+    return None
+
+
+def extract_box_type(module_name: str) -> str | None:
+    """Extract the box type from a module name.
+
+    Args:
+        module_name: Module name from wiring config (e.g., "R21B-5", "Q73A-1")
+
+    Returns:
+        "A" for Box A, "B" for Box B, or None if unrecognized
+    """
+    module_id = extract_module_id(module_name)
+    if module_id is None:
+        return None
+    if module_id.endswith("A"):
+        return BOX_A
+    if module_id.endswith("B"):
+        return BOX_B
+    return None
+
+
+def build_mux_box_map(wiring_config: list[dict[str, Any]]) -> dict[int, set[str]]:
+    """Build mapping from MUX ID to the box types of its modules.
+
+    Args:
+        wiring_config: List of MUX configurations from wiring.yaml
+
+    Returns:
+        Mapping from MUX ID to set of box types ("A", "B", or both)
+    """
+    mux_box_map: dict[int, set[str]] = {}
+    for mux_entry in wiring_config:
+        modules = list(mux_entry.get("ctrl", []))
+        modules.extend(
+            mux_entry[key] for key in ("read_out", "read_in", "pump") if mux_entry.get(key)
+        )
+        box_types = {box for box in map(extract_box_type, modules) if box}
+        mux_box_map[mux_entry["mux"]] = box_types
+    return mux_box_map
+
+
+def build_box_b_module_map(wiring_config: list[dict[str, Any]]) -> dict[str, list[int]]:
+    """Build mapping from Box B control module to the MUX IDs using it.
+
+    Args:
+        wiring_config: List of MUX configurations from wiring.yaml
+
+    Returns:
+        Mapping from Box B module ID to sorted list of MUX IDs
+    """
+    box_b_to_muxes: dict[str, list[int]] = {}
+    for mux_entry in wiring_config:
+        mux_id = mux_entry["mux"]
+        for ctrl in mux_entry.get("ctrl", []):
+            module_id = extract_module_id(ctrl)
+            if module_id and module_id.endswith("B"):
+                mux_ids = box_b_to_muxes.setdefault(module_id, [])
+                if mux_id not in mux_ids:
+                    mux_ids.append(mux_id)
+    for mux_ids in box_b_to_muxes.values():
+        mux_ids.sort()
+    return box_b_to_muxes
+
+
+def parse_wiring_yaml(data: str | bytes, chip_id: str) -> list[dict[str, Any]]:
+    """Return the MUX entries of a chip from wiring.yaml content.
+
+    The legacy format keys the MUX list by chip ID. In the newer format the
+    top-level keys are group names (e.g., "A2"), each mapping to a list of
+    MUX configs; all lists are flattened.
+    """
+    yaml_data = yaml.safe_load(data)
+    if chip_id in yaml_data:
+        return list(yaml_data[chip_id])
+    return [entry for group in yaml_data.values() for entry in group]
+
+
+@dataclass(frozen=True)
+class WiringIndex:
+    """Compiled wiring configuration of a chip.
+
+    Attributes:
+        chip_id: Chip ID the MUX entries were selected for
+        path: Wiring file path
+        digest: SHA-256 of the file content
+        wiring_config: MUX entries from wiring.yaml
+        qid_to_mux: Qubit ID to MUX ID
+        mux_qids: MUX ID to its qubit IDs (MUX membership)
+        mux_conflicts: MUX ID to the MUXes sharing a readout or control module
+        mux_box_types: MUX ID to the box types of its modules
+        box_b_module_muxes: Box B control module to the MUX IDs using it
+    """
+
+    chip_id: str
+    path: str
+    digest: str
+    wiring_config: tuple[Mapping[str, Any], ...]
+    qid_to_mux: Mapping[str, int]
+    mux_qids: Mapping[int, tuple[str, ...]]
+    mux_conflicts: Mapping[int, frozenset[int]]
+    mux_box_types: Mapping[int, frozenset[str]]
+    box_b_module_muxes: Mapping[str, tuple[int, ...]]
+
+    @classmethod
+    def compile(
+        cls, chip_id: str, wiring_config: list[dict[str, Any]], path: str = "", digest: str = ""
+    ) -> WiringIndex:
+        """Compile MUX entries into an index."""
+        qid_to_mux = build_qubit_to_mux_map(wiring_config)
+        mux_qids: dict[int, list[str]] = defaultdict(list)
+        for qid, mux_id in qid_to_mux.items():
+            mux_qids[mux_id].append(qid)
+        return cls(
+            chip_id=chip_id,
+            path=path,
+            digest=digest,
+            wiring_config=tuple(_deep_freeze(entry) for entry in wiring_config),
+            qid_to_mux=MappingProxyType(qid_to_mux),
+            mux_qids=_frozen_map(mux_qids, tuple),
+            mux_conflicts=_frozen_map(build_mux_conflict_map(wiring_config), frozenset),
+            mux_box_types=_frozen_map(build_mux_box_map(wiring_config), frozenset),
+            box_b_module_muxes=_frozen_map(build_box_b_module_map(wiring_config), tuple),
+        )
+
+    def wiring_config_list(self) -> list[dict[str, Any]]:
+        """Return a mutable deep copy of the MUX entries."""
+        return [_thaw(entry) for entry in self.wiring_config]
+
+    def mux_conflict_map(self) -> dict[int, set[int]]:
+        """Return a mutable copy of the MUX conflict map."""
+        return {mux_id: set(muxes) for mux_id, muxes in self.mux_conflicts.items()}
+
+    def mux_box_map(self) -> dict[int, set[str]]:
+        """Return a mutable copy of the MUX box types."""
+        return {mux_id: set(boxes) for mux_id, boxes in self.mux_box_types.items()}
+
+    def box_b_module_map(self) -> dict[str, list[int]]:
+        """Return a mutable copy of the Box B module map."""
+        return {module: list(muxes) for module, muxes in self.box_b_module_muxes.items()}
+
+
+@dataclass(frozen=True)
+class TopologyIndex:
+    """Compiled topology definition.
+
+    Attributes:
+        topology: Parsed topology definition
+        path: Topology file path
+        digest: SHA-256 of the file content
+        neighbours: Qubit ID to the IDs of its coupled qubits
+        cr_directions: Couplings as "control-target" strings, in file order
+        inverse_cr_directions: Couplings as "target-control" strings
+    """
+
+    topology: TopologyDefinition
+    path: str
+    digest: str
+    neighbours: Mapping[str, frozenset[str]]
+    cr_directions: frozenset[str]
+    inverse_cr_directions: frozenset[str]
+
+    @classmethod
+    def compile(
+        cls, topology: TopologyDefinition, path: str = "", digest: str = ""
+    ) -> TopologyIndex:
+        """Compile a topology definition into an index."""
+        neighbours: dict[str, set[str]] = defaultdict(set)
+        for coupling in topology.couplings:
+            control, target = str(coupling[0]), str(coupling[1])
+            neighbours[control].add(target)
+            neighbours[target].add(control)
+        return cls(
+            topology=topology,
+            path=path,
+            digest=digest,
+            neighbours=_frozen_map(neighbours, frozenset),
+            cr_directions=frozenset(f"{c[0]}-{c[1]}" for c in topology.couplings),
+            inverse_cr_directions=frozenset(f"{c[1]}-{c[0]}" for c in topology.couplings),
+        )
+
+    def directions(self, inverse: bool = False) -> frozenset[str]:
+        """Return the valid CR directions ("control-target")."""
+        return self.inverse_cr_directions if inverse else self.cr_directions
+
+
+def _frozen_map(source: Mapping[Any, Any], freeze: Callable[[Any], Any]) -> Mapping[Any, Any]:
+    return MappingProxyType({key: freeze(value) for key, value in source.items()})
+
+
+def _deep_freeze(value: Any) -> Any:
+    """Turn parsed YAML into read-only mappings and tuples, recursively."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _deep_freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_deep_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of :func:`_deep_freeze`: fresh dicts and lists, recursively."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass
+class _Entry(Generic[T]):
+    stamp: tuple[int, int]
+    digest: str
+    value: T
+
+
+class _CompiledFileCache(Generic[T]):
+    """Per-process cache of values compiled from files, keyed by path."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, ...], _Entry[T]] = {}
+        self._lock = threading.Lock()
+        self.compiles = 0
+
+    def get(self, path: Path, key: tuple[str, ...], compile_file: Callable[[bytes, str], T]) -> T:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                return entry.value
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.digest == digest:
+                entry.stamp = stamp
+                return entry.value
+
+        value = compile_file(data, digest)
+        with self._lock:
+            self._entries[key] = _Entry(stamp=stamp, digest=digest, value=value)
+            self.compiles += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.compiles = 0
+
+
+_wiring_cache: _CompiledFileCache[WiringIndex] = _CompiledFileCache()
+_topology_cache: _CompiledFileCache[TopologyIndex] = _CompiledFileCache()
+
+
+def get_wiring_index(chip_id: str, wiring_config_path: str | Path | None = None) -> WiringIndex:
+    """Return the compiled wiring of a chip.
+
+    Args:
+        chip_id: Chip ID (selects the MUX list in legacy wiring files)
+        wiring_config_path: Path to wiring.yaml.
+            If None, uses the default QubexPaths wiring path.
+
+    Returns:
+        WiringIndex shared with every other caller of the same file
+
+    Raises:
+        FileNotFoundError: If the wiring file does not exist
+    """
+    if wiring_config_path is not None:
+        wiring_path = Path(wiring_config_path)
+    else:
+        wiring_path = get_qubex_paths().wiring_yaml(chip_id)
+    if not wiring_path.exists():
+        msg = f"Wiring config not found: {wiring_path}"
+        raise FileNotFoundError(msg)
+
+    def compile_file(data: bytes, digest: str) -> WiringIndex:
+        wiring_config = parse_wiring_yaml(data, chip_id)
+        return WiringIndex.compile(chip_id, wiring_config, str(wiring_path), digest)
+
+    return _wiring_cache.get(wiring_path, (str(wiring_path.resolve()), chip_id), compile_file)
+
+
+def get_topology_index(topology_id: str) -> TopologyIndex:
+    """Return the compiled topology definition of a topology ID.
+
+    Raises:
+        FileNotFoundError: If the topology file does not exist
+    """
+    from qdash.common.config.topology import get_topology_path, parse_topology
+
+    topology_path = get_topology_path(topology_id)
+    if not topology_path.exists():
+        msg = f"Topology file not found: {topology_path}"
+        raise FileNotFoundError(msg)
+
+    def compile_file(data: bytes, digest: str) -> TopologyIndex:
+        return TopologyIndex.compile(parse_topology(data), str(topology_path), digest)
+
+    return _topology_cache.get(topology_path, (str(topology_path.resolve()),), compile_file)
+
+
+def clear_index_cache() -> None:
+    """Drop all cached wiring and topology indexes."""
+    _wiring_cache.clear()
+    _topology_cache.clear()
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
-from concurrent.futures import ThreadPoolExecutor
-from threading import Lock
-from typing import TYPE_CHECKING, cast
+import threading
+from typing import TYPE_CHECKING, Any, cast
 
 from qdash.copilot.review import (
     apply_ai_review_config as _shared_ai_review_config,
@@ -30,7 +30,9 @@ from qdash.copilot.review import (
 if TYPE_CHECKING:
     from qdash.copilot.config import CopilotConfig, ModelConfig
     from qdash.datamodel.execution import ExecutionModel
+    from qdash.datamodel.job import JobModel
     from qdash.datamodel.task import BaseTaskResultModel
+    from qdash.repository.protocols import JobQueueRepository
 
 logger = logging.getLogger(__name__)
 
@@ -39,12 +41,17 @@ AI_REVIEW_HEADER = "## AI review"
 AI_REVIEW_SEPARATOR = "\n\n---\n\n"
 AI_REVIEW_SECTION_RE = re.compile(r"^## AI review\n\n.*?(?:\n\n---\n\n|$)", re.DOTALL)
 MAX_AI_REVIEW_NOTE_CHARS = 4500
-AI_REVIEW_WORKERS = 2
 AI_REVIEW_ELIGIBLE_STATUSES = frozenset({"completed", "failed"})
+AI_REVIEW_JOB_KIND = "ai_review"
+# In-process drainer threads started by the enqueueing process. Set to 0 when
+# a dedicated ``qdash.agent.worker`` process serves the queue.
+AI_REVIEW_WORKERS = int(os.getenv("QDASH_AI_REVIEW_LOCAL_WORKERS", "2"))
 
-_EXECUTOR = ThreadPoolExecutor(max_workers=AI_REVIEW_WORKERS, thread_name_prefix="ai-review")
-_IN_FLIGHT_TASK_IDS: set[str] = set()
-_IN_FLIGHT_LOCK = Lock()
+_TASK_PAYLOAD_FIELDS = {"task_id", "name", "task_type", "status", "qid", "mux_id"}
+
+_drain_lock = threading.Lock()
+_drain_threads: list[threading.Thread] = []
+_drain_requested = False
 
 
 def enqueue_ai_review_note(
@@ -93,55 +100,172 @@ def enqueue_ai_review_note(
             )
             return
 
-        with _IN_FLIGHT_LOCK:
-            if task.task_id in _IN_FLIGHT_TASK_IDS:
-                _log_debug(
-                    "AI review enqueue skipped: task=%s task_id=%s already_in_flight=true",
-                    task.name,
-                    task.task_id,
-                )
-                return
-            _IN_FLIGHT_TASK_IDS.add(task.task_id)
-
-        task_snapshot = task.model_copy(deep=True)
-        execution_snapshot = execution_model.model_copy(deep=True)
-        try:
-            _EXECUTOR.submit(
-                _run_enqueued_ai_review,
-                task_snapshot,
-                execution_snapshot,
-                overwrite_existing,
+        job = _job_queue().enqueue(
+            AI_REVIEW_JOB_KIND,
+            execution_model.project_id or "",
+            _ai_review_job_payload(task, execution_model, overwrite_existing),
+            dedupe_key=f"{AI_REVIEW_JOB_KIND}:{task.task_id}",
+        )
+        if job is None:
+            _log_debug(
+                "AI review enqueue skipped: task=%s task_id=%s already_queued=true",
+                task.name,
+                task.task_id,
             )
-        except Exception:
-            with _IN_FLIGHT_LOCK:
-                _IN_FLIGHT_TASK_IDS.discard(task.task_id)
-            raise
+            return
         _log_info(
-            "AI review enqueued: task=%s task_id=%s qid=%s execution_id=%s",
+            "AI review enqueued: task=%s task_id=%s qid=%s execution_id=%s job_id=%s",
             task.name,
             task.task_id,
             getattr(task, "qid", ""),
             execution_model.execution_id,
+            job.job_id,
         )
+        _request_local_drain()
     except Exception as exc:
         _log_warning("AI review enqueue failed for task %s (%s): %s", task.name, task.task_id, exc)
 
 
-def _run_enqueued_ai_review(
+def _job_queue() -> JobQueueRepository:
+    """Return the durable queue AI review jobs are written to."""
+    from qdash.repository.job_queue import MongoJobQueueRepository
+
+    return MongoJobQueueRepository()
+
+
+def _ai_review_job_payload(
     task: BaseTaskResultModel,
     execution_model: ExecutionModel,
     overwrite_existing: bool,
-) -> None:
-    """Run queued AI review and clear the in-flight marker."""
+) -> dict[str, Any]:
+    """Return the fields the review needs, instead of snapshotting whole models."""
+    return {
+        "task": task.model_dump(mode="json", include=_TASK_PAYLOAD_FIELDS),
+        "execution": {
+            "execution_id": execution_model.execution_id,
+            "project_id": execution_model.project_id,
+            "chip_id": execution_model.chip_id,
+        },
+        "overwrite_existing": overwrite_existing,
+    }
+
+
+def _ai_review_job_models(job: JobModel) -> tuple[BaseTaskResultModel, ExecutionModel]:
+    """Rebuild the task and execution identifiers stored in a job payload."""
+    from pydantic import ValidationError
+
+    from qdash.common.job_worker import JobPermanentError
+    from qdash.datamodel.execution import ExecutionModel
+    from qdash.datamodel.task import (
+        CouplingTaskModel,
+        GlobalTaskModel,
+        MuxTaskModel,
+        QubitTaskModel,
+        SystemTaskModel,
+    )
+
+    task_models: dict[str, type[BaseTaskResultModel]] = {
+        "qubit": QubitTaskModel,
+        "coupling": CouplingTaskModel,
+        "mux": MuxTaskModel,
+        "system": SystemTaskModel,
+        "global": GlobalTaskModel,
+    }
+    payload = job.payload
     try:
-        maybe_attach_ai_review_note(
-            task,
-            execution_model,
-            overwrite_existing=overwrite_existing,
+        task_data = payload["task"]
+        task = task_models.get(
+            task_data.get("task_type", "global"), GlobalTaskModel
+        ).model_validate(task_data)
+        # The review only reads the identifiers, so skip validating the full model.
+        execution_model = ExecutionModel.model_construct(**payload["execution"])
+    except (KeyError, TypeError, AttributeError, ValidationError) as exc:
+        raise JobPermanentError(f"invalid AI review payload: {exc}") from exc
+    return task, execution_model
+
+
+def run_ai_review_job(job: JobModel) -> None:
+    """Job handler: run one queued AI review.
+
+    Errors propagate so the worker retries the job with backoff;
+    :func:`on_ai_review_job_dead` records the failure once it gives up.
+    """
+    task, execution_model = _ai_review_job_models(job)
+    _attach_ai_review_note(
+        task,
+        execution_model,
+        overwrite_existing=bool(job.payload.get("overwrite_existing", False)),
+    )
+
+
+def on_ai_review_job_dead(job: JobModel) -> None:
+    """Dead handler: record the final AI review failure on the task result."""
+    try:
+        task, execution_model = _ai_review_job_models(job)
+    except Exception as exc:
+        _log_warning("AI review job %s died with an unreadable payload: %s", job.job_id, exc)
+        return
+    _set_ai_review_failure(task, execution_model, job.last_error)
+    _log_warning(
+        "AI review gave up for task %s (%s) after %d attempt(s): %s",
+        task.name,
+        task.task_id,
+        job.attempts,
+        job.last_error,
+    )
+
+
+def _request_local_drain() -> None:
+    """Make sure an in-process drainer picks up newly enqueued reviews.
+
+    Drainer threads exit once no job can be leased; a request that arrives
+    while a drainer is finishing sets ``_drain_requested`` so it runs another
+    pass instead of leaving the new job to the next enqueue. The threads are
+    daemons so they never hold up process exit: a review cut short loses its
+    lease, which the queue reclaims for the standalone worker.
+    """
+    global _drain_requested
+    if AI_REVIEW_WORKERS <= 0:
+        return
+    with _drain_lock:
+        _drain_requested = True
+        _drain_threads[:] = [t for t in _drain_threads if t.is_alive()]
+        if len(_drain_threads) >= AI_REVIEW_WORKERS:
+            return
+        thread = threading.Thread(
+            target=_drain_local_queue,
+            name=f"ai-review-{len(_drain_threads)}",
+            daemon=True,
         )
-    finally:
-        with _IN_FLIGHT_LOCK:
-            _IN_FLIGHT_TASK_IDS.discard(task.task_id)
+        _drain_threads.append(thread)
+    thread.start()
+
+
+def _drain_local_queue() -> None:
+    """Run the AI reviews this process can lease now, then exit.
+
+    Backoff retries and jobs leased by other workers are left to the
+    standalone ``qdash.agent.worker``, so the drainer never waits on them.
+    """
+    global _drain_requested
+    from qdash.common.job_worker import JobWorker
+
+    worker = JobWorker(
+        _job_queue(),
+        {AI_REVIEW_JOB_KIND: run_ai_review_job},
+        dead_handlers={AI_REVIEW_JOB_KIND: on_ai_review_job_dead},
+    )
+    while True:
+        with _drain_lock:
+            _drain_requested = False
+        try:
+            worker.drain()
+        except Exception as exc:
+            _log_warning("AI review drainer stopped: %s", exc)
+            return
+        with _drain_lock:
+            if not _drain_requested:
+                return
 
 
 def maybe_attach_ai_review_note(
@@ -152,76 +276,94 @@ def maybe_attach_ai_review_note(
 ) -> None:
     """Attach an AI-generated review section to a task-result note.
 
-    This is a best-effort side effect. It must never fail calibration execution.
+    This is a best-effort side effect. It must never fail calibration execution,
+    so failures are recorded on the task result instead of raised.
     """
     try:
-        from qdash.copilot.config import load_copilot_config
+        _attach_ai_review_note(task, execution_model, overwrite_existing=overwrite_existing)
+    except Exception as exc:
+        _set_ai_review_failure(task, execution_model, str(exc))
+        _log_warning("AI review failed for task %s (%s): %s", task.name, task.task_id, exc)
 
-        config = load_copilot_config()
-        if not config.enabled or not config.analysis.enabled:
-            _log_info(
-                "AI review skipped: task=%s task_id=%s copilot_enabled=%s analysis_enabled=%s",
-                task.name,
-                task.task_id,
-                config.enabled,
-                config.analysis.enabled,
-            )
-            return
-        if task.name not in config.analysis.ai_review_tasks:
-            _log_debug(
-                "AI review skipped: task=%s task_id=%s not in ai_review_tasks=%s",
-                task.name,
-                task.task_id,
-                config.analysis.ai_review_tasks,
-            )
-            return
-        if not _is_terminal_ai_review_result(task):
-            _log_info(
-                "AI review skipped: task=%s task_id=%s status=%s non_terminal=true",
-                task.name,
-                task.task_id,
-                _task_status_value(task),
-            )
-            return
-        if _is_non_representative_mux_result(task):
-            _log_info(
-                "AI review skipped: task=%s task_id=%s qid=%s non_representative_mux=true",
-                task.name,
-                task.task_id,
-                getattr(task, "qid", ""),
-            )
-            return
-        if not overwrite_existing and _has_ai_review_note(task, execution_model):
-            _log_info(
-                "AI review skipped: task=%s task_id=%s existing_note=true",
-                task.name,
-                task.task_id,
-            )
-            return
 
-        selected_model = _select_analysis_model(config)
+def _attach_ai_review_note(
+    task: BaseTaskResultModel,
+    execution_model: ExecutionModel,
+    *,
+    overwrite_existing: bool = False,
+) -> None:
+    """Generate and save the AI review note, raising on failure.
+
+    The generation time is stored as the task's ``ai_review`` phase timing.
+    """
+    from qdash.copilot.config import load_copilot_config
+    from qdash.datamodel.task import TaskPhase
+    from qdash.workflow.engine.task.phase_timer import timed_phase
+
+    config = load_copilot_config()
+    if not config.enabled or not config.analysis.enabled:
+        _log_info(
+            "AI review skipped: task=%s task_id=%s copilot_enabled=%s analysis_enabled=%s",
+            task.name,
+            task.task_id,
+            config.enabled,
+            config.analysis.enabled,
+        )
+        return
+    if task.name not in config.analysis.ai_review_tasks:
+        _log_debug(
+            "AI review skipped: task=%s task_id=%s not in ai_review_tasks=%s",
+            task.name,
+            task.task_id,
+            config.analysis.ai_review_tasks,
+        )
+        return
+    if not _is_terminal_ai_review_result(task):
         _log_info(
-            "AI review starting: task=%s task_id=%s qid=%s execution_id=%s model=%s/%s",
+            "AI review skipped: task=%s task_id=%s status=%s non_terminal=true",
+            task.name,
+            task.task_id,
+            _task_status_value(task),
+        )
+        return
+    if _is_non_representative_mux_result(task):
+        _log_info(
+            "AI review skipped: task=%s task_id=%s qid=%s non_representative_mux=true",
             task.name,
             task.task_id,
             getattr(task, "qid", ""),
-            execution_model.execution_id,
-            selected_model.provider,
-            selected_model.name,
         )
+        return
+    if not overwrite_existing and _has_ai_review_note(task, execution_model):
+        _log_info(
+            "AI review skipped: task=%s task_id=%s existing_note=true",
+            task.name,
+            task.task_id,
+        )
+        return
+
+    selected_model = _select_analysis_model(config)
+    _log_info(
+        "AI review starting: task=%s task_id=%s qid=%s execution_id=%s model=%s/%s",
+        task.name,
+        task.task_id,
+        getattr(task, "qid", ""),
+        execution_model.execution_id,
+        selected_model.provider,
+        selected_model.name,
+    )
+    task.phase_timings.pop(TaskPhase.AI_REVIEW.value, None)
+    with timed_phase(task.phase_timings, TaskPhase.AI_REVIEW):
         markdown = _run_ai_review(task, execution_model, config)
-        if not markdown:
-            _log_info(
-                "AI review produced empty output: task=%s task_id=%s",
-                task.name,
-                task.task_id,
-            )
-            return
-        _upsert_ai_review_note(task, execution_model, markdown, selected_model)
-        _log_info("AI review note saved: task=%s task_id=%s", task.name, task.task_id)
-    except Exception as exc:
-        _set_ai_review_failure(task, execution_model, str(exc))
-        _log_warning("AI review failed for task %s (%s): %s", task.name, task.task_id, exc)
+    if not markdown:
+        _log_info(
+            "AI review produced empty output: task=%s task_id=%s",
+            task.name,
+            task.task_id,
+        )
+        return
+    _upsert_ai_review_note(task, execution_model, markdown, selected_model)
+    _log_info("AI review note saved: task=%s task_id=%s", task.name, task.task_id)
 
 
 def _prefect_logger() -> logging.Logger | None:
@@ -387,6 +529,7 @@ def _set_ai_review_note_content(
 ) -> None:
     """Persist the AI-generated review note directly on history."""
     from qdash.common.utils.datetime import now
+    from qdash.datamodel.task import TaskPhase
     from qdash.dbmodel.task_result_history import TaskResultHistoryDocument
 
     timestamp = now()
@@ -403,6 +546,9 @@ def _set_ai_review_note_content(
     doc.ai_review.model_name = model.name
     doc.ai_review.completed_at = timestamp
     doc.ai_review.error = ""
+    review_seconds = task.phase_timings.get(TaskPhase.AI_REVIEW.value)
+    if review_seconds is not None:
+        doc.phase_timings[TaskPhase.AI_REVIEW.value] = review_seconds
     doc.save()
 
 
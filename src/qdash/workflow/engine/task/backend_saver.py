@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING, Any
 from qdash.workflow.engine.params_updater import get_params_updater
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from qdash.workflow.engine.backend.base import BaseBackend
     from qdash.workflow.engine.execution.service import ExecutionService
     from qdash.workflow.engine.task.state_manager import TaskStateManager
@@ -46,6 +48,9 @@ class BackendSaver:
         Whether to update backend parameters when R² validation fails
     persist_output_parameters : bool, default=True
         Whether to persist output parameters to the database and backend
+    write_fence : Callable[[], None] | None
+        Called before every save; raises to abort it, e.g. when the session's
+        execution lease was lost while the experiment ran
     """
 
     def __init__(
@@ -56,6 +61,7 @@ class BackendSaver:
         task_manager_id: str,
         force_update_params: bool = False,
         persist_output_parameters: bool = True,
+        write_fence: Callable[[], None] | None = None,
     ) -> None:
         self._state_manager = state_manager
         self._username = username
@@ -63,6 +69,12 @@ class BackendSaver:
         self._task_manager_id = task_manager_id
         self._force_update_params = force_update_params
         self._persist_output_parameters = persist_output_parameters
+        self._write_fence = write_fence
+
+    def check_write_fence(self) -> None:
+        """Raise if the session may no longer write results (see ``write_fence``)."""
+        if self._write_fence is not None:
+            self._write_fence()
 
     def save(
         self,
@@ -87,6 +99,7 @@ class BackendSaver:
         success : bool
             Whether backend updates should be applied
         """
+        self.check_write_fence()
         if task.backend == "qubex":
             self._save_qubex(task, execution_service, qid, backend, success)
         elif task.backend == "fake":
@@ -123,6 +136,7 @@ class BackendSaver:
         if not output_parameters or not self._persist_output_parameters:
             return
 
+        self.check_write_fence()
         from qdash.repository import MongoQubitCalibrationRepository
 
         qubit_repo = MongoQubitCalibrationRepository()
@@ -12,6 +12,7 @@ The key difference from TaskManager:
 import json
 import logging
 import uuid
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -95,6 +96,7 @@ class TaskContext:
         source_task_id: str | None = None,
         force_update_params: bool = False,
         persist_output_parameters: bool = True,
+        write_fence: Callable[[], None] | None = None,
     ) -> None:
         self.id = context_id or str(uuid.uuid4())
         self.username = username
@@ -122,6 +124,7 @@ class TaskContext:
             source_task_id=source_task_id,
             force_update_params=force_update_params,
             persist_output_parameters=persist_output_parameters,
+            write_fence=write_fence,
         )
 
         # Initialize containers for coupling qids (only if state_manager was not injected)
@@ -8,17 +8,21 @@ The TaskExecutor is responsible for the complete task execution lifecycle:
 - Result validation via TaskResultProcessor
 - History recording via TaskHistoryRecorder
 - Backend-specific save processing
+- Per-phase wall-clock timings (``BaseTaskResultModel.phase_timings``)
 """
 
 import logging
 import traceback
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from qdash.datamodel.task import TaskPhase
 from qdash.repository import FilesystemCalibDataSaver
 from qdash.workflow.calibtasks.results import PostProcessResult, PreProcessResult, RunResult
 from qdash.workflow.engine.task.backend_saver import BackendSaver
 from qdash.workflow.engine.task.history_recorder import TaskHistoryRecorder
 from qdash.workflow.engine.task.mux_distributor import MuxDistributor
+from qdash.workflow.engine.task.phase_timer import timed_phase
 from qdash.workflow.engine.task.result_processor import (
     FidelityValidationError,
     R2ValidationError,
@@ -84,6 +88,7 @@ class TaskExecutor:
         source_task_id: str | None = None,
         force_update_params: bool = False,
         persist_output_parameters: bool = True,
+        write_fence: Callable[[], None] | None = None,
     ) -> None:
         self.state_manager = state_manager
         self.execution_id = execution_id
@@ -102,6 +107,7 @@ class TaskExecutor:
             task_manager_id=task_manager_id,
             force_update_params=force_update_params,
             persist_output_parameters=persist_output_parameters,
+            write_fence=write_fence,
         )
         self._mux_distributor = MuxDistributor(
             state_manager=state_manager,
@@ -258,7 +264,7 @@ class TaskExecutor:
 
         try:
             # 0. Ensure task exists
-            self.state_manager.ensure_task_exists(task_name, task_type, qid)
+            timings = self.state_manager.ensure_task_exists(task_name, task_type, qid).phase_timings
 
             # 1. Start task
             self.state_manager.start_task(task_name, task_type, qid)
@@ -290,7 +296,8 @@ class TaskExecutor:
                 execution_service = self._update_execution(execution_service)
 
             # 2. Preprocess
-            preprocess_result = self._run_preprocess(task, backend, qid)
+            with timed_phase(timings, TaskPhase.PREPROCESS):
+                preprocess_result = self._run_preprocess(task, backend, qid)
             if preprocess_result:
                 self.state_manager.put_input_parameters(
                     task_name, preprocess_result.input_parameters, task_type, qid
@@ -307,7 +314,10 @@ class TaskExecutor:
                 self._apply_user_overrides_only(task, task_name, task_type, qid)
 
             # 3. Run
-            run_result = self._run_task(task, backend, qid)
+            with timed_phase(timings, TaskPhase.RUN):
+                run_result = self._run_task(task, backend, qid)
+            # The experiment may outlive the session's lease; stop before writing results.
+            self._backend_saver.check_write_fence()
             result.r2 = run_result.r2 if run_result else None
             if run_result is not None and run_result.r2 is not None:
                 r2_value = run_result.r2.get(qid)
@@ -322,7 +332,8 @@ class TaskExecutor:
                 return execution_service, result
 
             # 4. Postprocess
-            postprocess_result = self._run_postprocess(task, backend, run_result, qid)
+            with timed_phase(timings, TaskPhase.POSTPROCESS):
+                postprocess_result = self._run_postprocess(task, backend, run_result, qid)
 
             if postprocess_result:
                 # 5a. Validate fidelity
@@ -349,7 +360,8 @@ class TaskExecutor:
                     )
 
                 # 5c. Save figures and raw data
-                self._save_artifacts(postprocess_result, task_name, task_type, qid)
+                with timed_phase(timings, TaskPhase.ARTIFACTS):
+                    self._save_artifacts(postprocess_result, task_name, task_type, qid)
 
                 # 5c.1 Check for postprocess validation error (after artifacts are saved)
                 if postprocess_result.validation_error:
@@ -518,7 +530,15 @@ class TaskExecutor:
             if execution_service is not None:
                 execution_service = self._update_execution(execution_service)
 
-            run_result = self._run_batch_task(task, backend, qids)
+            # The batch experiment is shared, so each qubit is charged an equal share.
+            batch_timings: dict[str, float] = {}
+            with timed_phase(batch_timings, TaskPhase.RUN):
+                run_result = self._run_batch_task(task, backend, qids)
+            self._backend_saver.check_write_fence()
+            run_share = round(batch_timings[TaskPhase.RUN.value] / len(qids), 6)
+            for qid in qids:
+                task_model = self.state_manager.get_task(task_name, task_type, qid)
+                task_model.phase_timings[TaskPhase.RUN.value] = run_share
             for qid, result in results.items():
                 r2_value = run_result.r2.get(qid) if run_result and run_result.r2 else None
                 result.r2 = {qid: r2_value} if r2_value is not None else None
@@ -534,8 +554,10 @@ class TaskExecutor:
                 return execution_service, results
 
             for qid, result in results.items():
+                timings = self.state_manager.get_task(task_name, task_type, qid).phase_timings
                 try:
-                    postprocess_result = self._run_postprocess(task, backend, run_result, qid)
+                    with timed_phase(timings, TaskPhase.POSTPROCESS):
+                        postprocess_result = self._run_postprocess(task, backend, run_result, qid)
 
                     if postprocess_result.output_parameters:
                         try:
@@ -557,7 +579,8 @@ class TaskExecutor:
                             task_name, processed_params, task_type, qid
                         )
 
-                    self._save_artifacts(postprocess_result, task_name, task_type, qid)
+                    with timed_phase(timings, TaskPhase.ARTIFACTS):
+                        self._save_artifacts(postprocess_result, task_name, task_type, qid)
 
                     if postprocess_result.validation_error:
                         if postprocess_result.output_parameters:
@@ -623,7 +646,7 @@ class TaskExecutor:
                     result.success = True
                     result.message = "Completed"
 
-                except (R2ValidationError, FidelityValidationError, ValueError) as e:  # noqa: PERF203
+                except (R2ValidationError, FidelityValidationError, ValueError) as e:
                     tb = traceback.format_exc()
                     self._fail_task(task_name, task_type, qid, str(e), tb)
                     result.message = str(e)
@@ -783,7 +806,7 @@ class TaskExecutor:
             self.state_manager.put_run_parameters(task_name, run_params_dict, task_type, qid)
 
     def _update_execution(self, execution_service: "ExecutionService") -> "ExecutionService":
-        """Update execution service with current calibration data."""
+        """Merge calibration data written since the last update into the execution."""
         return execution_service.merge_calib_data(
-            calib_data=self.state_manager.calib_data,
+            calib_data=self.state_manager.calib_data.take_changes(),
         )
@@ -9,11 +9,13 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
+from qdash.datamodel.task import TaskPhase, TaskStatusModel
 from qdash.repository import (
     MongoChipHistoryRepository,
     MongoChipRepository,
     MongoTaskResultHistoryRepository,
 )
+from qdash.workflow.engine.task.phase_timer import timed_phase
 
 if TYPE_CHECKING:
     from qdash.datamodel.execution import ExecutionModel
@@ -22,6 +24,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_TERMINAL_STATUSES = frozenset(
+    {
+        TaskStatusModel.COMPLETED,
+        TaskStatusModel.FAILED,
+        TaskStatusModel.SKIPPED,
+        TaskStatusModel.CANCELLED,
+    }
+)
+
 
 @runtime_checkable
 class TaskResultHistoryRepoProtocol(Protocol):
@@ -37,6 +48,12 @@ class TaskResultHistoryRepoProtocol(Protocol):
         """Set source_task_id on a task result document."""
         ...
 
+    def set_phase_timings(
+        self, *, project_id: str | None, task_id: str, phase_timings: dict[str, float]
+    ) -> None:
+        """Set the given phase timings on a task result document."""
+        ...
+
 
 @runtime_checkable
 class ChipRepoProtocol(Protocol):
@@ -114,7 +131,9 @@ class TaskHistoryRecorder:
         """Record a task result to the history.
 
         This method saves the task result to history and optionally
-        records provenance for data lineage tracking.
+        records provenance for data lineage tracking. The time spent is added
+        to ``task.phase_timings``; for a terminal task the timings of this
+        final write are persisted with a small follow-up update.
 
         Parameters
         ----------
@@ -125,7 +144,8 @@ class TaskHistoryRecorder:
 
         """
         try:
-            self.task_result_history_repo.save(task, execution_model)
+            with timed_phase(task.phase_timings, TaskPhase.HISTORY):
+                self.task_result_history_repo.save(task, execution_model)
         except Exception as e:
             logger.error(f"Failed to record task result: {e}")
             raise
@@ -133,7 +153,8 @@ class TaskHistoryRecorder:
         # Record provenance if enabled (non-blocking)
         if self.provenance_recorder is not None:
             try:
-                self.provenance_recorder.record_from_task(task, execution_model)
+                with timed_phase(task.phase_timings, TaskPhase.PROVENANCE):
+                    self.provenance_recorder.record_from_task(task, execution_model)
             except Exception as e:
                 # Log but don't fail the task - provenance is optional
                 logger.warning(f"Failed to record provenance for task {task.name}: {e}")
@@ -148,6 +169,22 @@ class TaskHistoryRecorder:
         except Exception as e:
             logger.warning(f"Failed to attach AI review note for task {task.name}: {e}")
 
+        if task.status in _TERMINAL_STATUSES:
+            self._persist_phase_timings(task, execution_model)
+
+    def _persist_phase_timings(
+        self, task: BaseTaskResultModel, execution_model: ExecutionModel
+    ) -> None:
+        """Write timings measured after the last save; best-effort."""
+        try:
+            self.task_result_history_repo.set_phase_timings(
+                project_id=execution_model.project_id,
+                task_id=task.task_id,
+                phase_timings=task.phase_timings,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record phase timings for task {task.name}: {e}")
+
     def set_source_task_id(
         self,
         project_id: str | None,
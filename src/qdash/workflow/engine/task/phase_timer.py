@@ -0,0 +1,39 @@
+"""Wall-clock timing of task execution phases.
+
+Timings are accumulated in seconds on ``BaseTaskResultModel.phase_timings``
+(keyed by ``TaskPhase`` value) and persisted with the task result, so slow
+runs can be attributed to the experiment, post-processing, artifact saving
+or bookkeeping writes.
+
+Example
+-------
+    >>> with timed_phase(task.phase_timings, TaskPhase.RUN):
+    ...     run_result = task.run(backend, qid)
+
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from qdash.datamodel.task import TaskPhase
+
+
+@contextmanager
+def timed_phase(timings: dict[str, float], phase: TaskPhase) -> Iterator[None]:
+    """Add the time spent in the ``with`` block to ``timings[phase]``.
+
+    Repeated phases (e.g. several history writes) accumulate. The time is
+    recorded even if the block raises, so failing phases are visible too.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings[phase.value] = round(timings.get(phase.value, 0.0) + elapsed, 6)
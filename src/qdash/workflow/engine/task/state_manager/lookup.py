@@ -2,9 +2,15 @@
 
 These functions encapsulate the task_type-based routing logic for finding,
 adding, iterating, and creating tasks in the appropriate containers.
+
+``TaskIndex`` maps (task_type, qid, task_name) to a task's position in its
+container, so repeated lookups do not scan long task lists. The lists stay
+the serialized source of truth; the index is rebuilt per container when
+the list is replaced or changes length.
 """
 
 from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import cast
 
 from qdash.datamodel.task import (
@@ -17,9 +23,118 @@ from qdash.datamodel.task import (
     TaskTypes,
 )
 
+# Containers up to this length are scanned; below it a scan is cheaper
+# than checking and maintaining a bucket.
+LINEAR_SCAN_MAX_TASKS = 8
+
+
+@dataclass
+class _Bucket:
+    """Positions of the tasks of one container, by task name."""
+
+    tasks: list[BaseTaskResultModel]
+    positions: dict[str, int] = field(default_factory=dict)
+    size: int = 0
+
+
+class TaskIndex:
+    """Index of tasks by (task_type, qid, task_name).
+
+    Containers of at most ``LINEAR_SCAN_MAX_TASKS`` tasks are scanned.
+    Longer ones get a bucket, built lazily and rebuilt when the container
+    list is a different object (e.g. after deserialization or when
+    ``task_result`` is replaced) or has a different length (e.g. a task
+    appended directly to the list). Hits are checked against the task at
+    the stored position, so list elements replaced in place are picked up.
+    Misses are confirmed by a scan; they happen once per task, when it is
+    created, and cost no more than the scan they replace.
+    """
+
+    def __init__(self) -> None:
+        self._source: TaskResultModel | None = None
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+
+    def find(
+        self, task_result: TaskResultModel, task_name: str, task_type: str, qid: str
+    ) -> BaseTaskResultModel | None:
+        """Find a task by name (same result as a linear scan of its container)."""
+        container = _container(task_result, task_type, qid)
+        if container is None:
+            return None
+        if len(container) <= LINEAR_SCAN_MAX_TASKS:
+            return _scan(container, task_name)
+        if task_result is not self._source:
+            self._buckets.clear()
+            self._source = task_result
+        bucket = self._buckets.get((task_type, qid))
+        if bucket is None or bucket.tasks is not container or bucket.size != len(container):
+            bucket = self._rebuild(task_type, qid, container)
+        position = bucket.positions.get(task_name)
+        if position is not None and container[position].name == task_name:
+            return container[position]
+        task = _scan(container, task_name)
+        if task is not None or position is not None:
+            # A list element was replaced in place
+            self._rebuild(task_type, qid, container)
+        return task
+
+    def added(
+        self, task_result: TaskResultModel, task: BaseTaskResultModel, task_type: str, qid: str
+    ) -> None:
+        """Record a task just appended to its container by ``add_task``."""
+        bucket = self._buckets.get((task_type, qid))
+        if (
+            task_result is not self._source
+            or bucket is None
+            or bucket.size != len(bucket.tasks) - 1
+            or bucket.tasks[-1] is not task
+        ):
+            return  # Rebuilt on the next lookup
+        bucket.positions.setdefault(task.name, bucket.size)
+        bucket.size += 1
+
+    def clear(self) -> None:
+        """Drop all buckets."""
+        self._source = None
+        self._buckets.clear()
+
+    def _rebuild(self, task_type: str, qid: str, container: list[BaseTaskResultModel]) -> _Bucket:
+        bucket = _Bucket(tasks=container, size=len(container))
+        for position, task in enumerate(container):
+            # First match wins, as in a linear scan
+            bucket.positions.setdefault(task.name, position)
+        self._buckets[(task_type, qid)] = bucket
+        return bucket
+
+
+def _scan(container: list[BaseTaskResultModel], task_name: str) -> BaseTaskResultModel | None:
+    for task in container:
+        if task.name == task_name:
+            return task
+    return None
+
+
+def _container(
+    task_result: TaskResultModel, task_type: str, qid: str
+) -> list[BaseTaskResultModel] | None:
+    """Return the container list of a task type, or None if it does not exist."""
+    if task_type == TaskTypes.QUBIT:
+        return cast("list[BaseTaskResultModel] | None", task_result.qubit_tasks.get(qid))
+    if task_type == TaskTypes.COUPLING:
+        return cast("list[BaseTaskResultModel] | None", task_result.coupling_tasks.get(qid))
+    if task_type == TaskTypes.GLOBAL:
+        return cast("list[BaseTaskResultModel]", task_result.global_tasks)
+    if task_type == TaskTypes.SYSTEM:
+        return cast("list[BaseTaskResultModel]", task_result.system_tasks)
+    return None
+
 
 def find_task(
-    task_result: TaskResultModel, task_name: str, task_type: str, qid: str
+    task_result: TaskResultModel,
+    task_name: str,
+    task_type: str,
+    qid: str,
+    index: TaskIndex | None = None,
 ) -> BaseTaskResultModel | None:
     """Find a task by name in the appropriate container.
 
@@ -33,6 +148,8 @@ def find_task(
         Type of task (qubit, coupling, global, system)
     qid : str
         Qubit ID (empty for global/system tasks)
+    index : TaskIndex | None
+        Index to look the task up in instead of scanning the container
 
     Returns
     -------
@@ -40,6 +157,8 @@ def find_task(
         The found task, or None if not found
 
     """
+    if index is not None:
+        return index.find(task_result, task_name, task_type, qid)
     for task in iter_tasks(task_result, task_type, qid):
         if task.name == task_name:
             return task
@@ -47,7 +166,11 @@ def find_task(
 
 
 def add_task(
-    task_result: TaskResultModel, task: BaseTaskResultModel, task_type: str, qid: str
+    task_result: TaskResultModel,
+    task: BaseTaskResultModel,
+    task_type: str,
+    qid: str,
+    index: TaskIndex | None = None,
 ) -> None:
     """Add a task to the appropriate container.
 
@@ -61,6 +184,8 @@ def add_task(
         Type of task (qubit, coupling, global, system)
     qid : str
         Qubit ID (empty for global/system tasks)
+    index : TaskIndex | None
+        Index to keep up to date with the new task
 
     """
     if task_type == TaskTypes.QUBIT:
@@ -77,6 +202,8 @@ def add_task(
         task_result.global_tasks.append(cast("GlobalTaskModel", task))
     elif task_type == TaskTypes.SYSTEM:
         task_result.system_tasks.append(cast("SystemTaskModel", task))
+    if index is not None:
+        index.added(task_result, task, task_type, qid)
 
 
 def iter_tasks(
@@ -149,6 +276,7 @@ def ensure_task_exists(
     task_type: str,
     qid: str,
     upstream_id: str = "",
+    index: TaskIndex | None = None,
 ) -> BaseTaskResultModel:
     """Ensure a task exists in the appropriate container.
 
@@ -164,6 +292,8 @@ def ensure_task_exists(
         Qubit ID (empty for global/system tasks)
     upstream_id : str
         Upstream task ID for dependency tracking
+    index : TaskIndex | None
+        Index used for the lookup and updated with a created task
 
     Returns
     -------
@@ -171,17 +301,21 @@ def ensure_task_exists(
         The existing or newly created task
 
     """
-    existing = find_task(task_result, task_name, task_type, qid)
+    existing = find_task(task_result, task_name, task_type, qid, index)
     if existing:
         return existing
 
     task = create_task(task_name, task_type, qid, upstream_id)
-    add_task(task_result, task, task_type, qid)
+    add_task(task_result, task, task_type, qid, index)
     return task
 
 
 def get_task(
-    task_result: TaskResultModel, task_name: str, task_type: str, qid: str
+    task_result: TaskResultModel,
+    task_name: str,
+    task_type: str,
+    qid: str,
+    index: TaskIndex | None = None,
 ) -> BaseTaskResultModel:
     """Get an existing task.
 
@@ -195,6 +329,8 @@ def get_task(
         Type of task
     qid : str
         Qubit ID
+    index : TaskIndex | None
+        Index to look the task up in instead of scanning the container
 
     Returns
     -------
@@ -207,7 +343,7 @@ def get_task(
         If task not found
 
     """
-    task = find_task(task_result, task_name, task_type, qid)
+    task = find_task(task_result, task_name, task_type, qid, index)
     if task is None:
         raise ValueError(f"Task '{task_name}' not found for {task_type}/{qid}")
     return task
@@ -1,9 +1,9 @@
 """TaskStateManager class for managing task state and lifecycle."""
 
 from collections.abc import Iterator
-from typing import Any
+from typing import Any, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from qdash.common.utils.datetime import now
 from qdash.datamodel.task import (
@@ -35,12 +35,18 @@ class TaskStateManager(BaseModel):
         Container for calibration data
     _upstream_task_id : str
         Upstream task ID for dependency tracking
+    _task_index : lookup.TaskIndex
+        (task_type, qid, task_name) index over ``task_result`` (not serialized;
+        rebuilt lazily). Read through ``_index``: a plain private attribute
+        read goes through ``BaseModel.__getattr__``, which costs more than a
+        lookup in a short task list.
 
     """
 
     task_result: TaskResultModel = TaskResultModel()
     calib_data: CalibDataModel = CalibDataModel(qubit={}, coupling={})
     _upstream_task_id: str = ""
+    _task_index: lookup.TaskIndex = PrivateAttr(default_factory=lookup.TaskIndex)
 
     def __init__(self, qids: list[str] | None = None, **data: Any) -> None:
         super().__init__(**data)
@@ -66,13 +72,19 @@ class TaskStateManager(BaseModel):
     # Lookup delegation
     # ------------------------------------------------------------------ #
 
+    @property
+    def _index(self) -> lookup.TaskIndex:
+        """Task index, read without going through ``BaseModel.__getattr__``."""
+        private = cast("dict[str, Any]", self.__pydantic_private__)
+        return cast("lookup.TaskIndex", private["_task_index"])
+
     def _find_task(self, task_name: str, task_type: str, qid: str) -> BaseTaskResultModel | None:
         """Find a task by name in the appropriate container."""
-        return lookup.find_task(self.task_result, task_name, task_type, qid)
+        return lookup.find_task(self.task_result, task_name, task_type, qid, self._index)
 
     def _add_task(self, task: BaseTaskResultModel, task_type: str, qid: str) -> None:
         """Add a task to the appropriate container."""
-        lookup.add_task(self.task_result, task, task_type, qid)
+        lookup.add_task(self.task_result, task, task_type, qid, self._index)
 
     def _iter_tasks(self, task_type: str, qid: str) -> Iterator[BaseTaskResultModel]:
         """Iterate over tasks in the appropriate container (read-only)."""
@@ -85,12 +97,17 @@ class TaskStateManager(BaseModel):
     def _ensure_task_exists(self, task_name: str, task_type: str, qid: str) -> BaseTaskResultModel:
         """Ensure a task exists in the appropriate container."""
         return lookup.ensure_task_exists(
-            self.task_result, task_name, task_type, qid, self._upstream_task_id
+            self.task_result,
+            task_name,
+            task_type,
+            qid,
+            self._upstream_task_id,
+            self._index,
         )
 
     def get_task(self, task_name: str, task_type: str, qid: str) -> BaseTaskResultModel:
         """Get an existing task, raising ValueError if not found."""
-        return lookup.get_task(self.task_result, task_name, task_type, qid)
+        return lookup.get_task(self.task_result, task_name, task_type, qid, self._index)
 
     def ensure_task_exists(self, task_name: str, task_type: str, qid: str) -> BaseTaskResultModel:
         """Ensure a task exists, creating it if needed."""
@@ -73,6 +73,7 @@ from qdash.workflow.service.steps import (
     GenerateCRSchedule,
     OneQubitCheck,
     OneQubitFineTune,
+    OnTargets,
     Pipeline,
     Step,
     StepContext,
@@ -115,6 +116,7 @@ __all__ = [
     "GitHubIntegration",
     "GitHubPushConfig",
     "MuxTargets",
+    "OnTargets",
     "OneQubitCheck",
     "OneQubitFineTune",
     "Pipeline",
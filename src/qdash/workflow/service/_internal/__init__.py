@@ -8,6 +8,7 @@ from qdash.workflow.service._internal.scheduling_tasks import (
     calibrate_group_with_retry,
     calibrate_mux_qubits,
     calibrate_parallel_group,
+    calibrate_retry_group,
     calibrate_single_qubit,
     calibrate_step_qubits_parallel,
     execute_coupling_pair,
@@ -21,6 +22,7 @@ __all__ = [
     "calibrate_group_with_retry",
     "calibrate_mux_qubits",
     "calibrate_parallel_group",
+    "calibrate_retry_group",
     "calibrate_single_qubit",
     "calibrate_step_qubits_parallel",
     "execute_coupling_pair",
@@ -9,11 +9,13 @@ Tasks:
     calibrate_step_qubits_parallel: Execute tasks for synchronized step in parallel
     execute_coupling_pair: Execute tasks for a single coupling pair
     calibrate_parallel_group: Execute coupling tasks for a parallel group
+    calibrate_retry_group: Execute one round of qubit attempts for a retry group
 
 Multiprocess Parallel Execution (using Dask):
     For parallel execution with isolated sessions, use the multiprocess versions:
     - run_mux_calibrations_parallel: Run multiple MUX groups in parallel processes
     - run_qubit_calibrations_parallel: Run multiple qubits in parallel processes
+    - run_groups_with_retry_parallel: Run qubit groups, then retry failures in new groups
 
     These use DaskTaskRunner with processes=True to spawn separate Python processes,
     each with its own memory space. This avoids qubex's global state issues
@@ -29,6 +31,12 @@ from typing import TYPE_CHECKING, Any, cast
 
 from prefect import flow, get_run_logger, task
 
+from qdash.workflow.engine.scheduler.retry_scheduler import (
+    RetryAttempt,
+    RetryPolicy,
+    RetryScheduler,
+)
+
 # DaskTaskRunner is optional - only needed for multiprocess parallel execution
 DaskTaskRunner: Any
 try:
@@ -161,6 +169,7 @@ def _create_isolated_session(
             - project_id: Project ID (optional)
             - muxes: List of MUX IDs (optional)
             - execution_id: Parent's execution_id (to share Execution document)
+            - lease: Parent's execution lease; writes are fenced on it (optional)
         qids: List of qubit IDs for this session
 
     Returns:
@@ -177,6 +186,7 @@ def _create_isolated_session(
         project_id=session_config.get("project_id"),
         muxes=session_config.get("muxes"),
         use_lock=False,  # Parent session holds the lock
+        parent_lease=session_config.get("lease"),  # Fence writes on the parent's lease
         skip_execution=True,  # Don't create new Execution, use parent's
         enable_github_pull=False,  # Parent session handles GitHub pull
         enable_github=False,  # No GitHub operations for isolated sessions
@@ -276,6 +286,14 @@ def _group_retry_task_run_name() -> str:
     return "retry-group"
 
 
+def _retry_round_task_run_name(parameters: dict[str, Any]) -> str:
+    attempts = parameters.get("attempts", [])
+    if not attempts:
+        return "retry-group"
+    prefix = "retry" if any(attempt.attempt > 1 for attempt in attempts) else "group"
+    return f"{prefix}-Q{attempts[0].qid}-{attempts[-1].qid}"
+
+
 # =============================================================================
 # MUX-level Tasks (for scheduled/strategy execution)
 # =============================================================================
@@ -792,7 +810,9 @@ def calibrate_group_with_retry(
     """Calibrate a group of qubits sequentially with retry logic.
 
     Each qubit in the group runs sequentially, with retry on failure
-    using frequency offsets.
+    using frequency offsets. Retries hold the group until they finish; to
+    retry the failures of several parallel groups together, use
+    ``run_groups_with_retry_parallel``.
 
     Args:
         qids: Qubit IDs in this group (run sequentially)
@@ -871,64 +891,161 @@ def calibrate_group_with_retry(
     return results
 
 
+def _execute_attempts_with_session(
+    session: CalibService,
+    attempts: list[RetryAttempt],
+    tasks: list[str],
+    logger: Any,
+) -> dict[str, Any]:
+    """Run each attempt's remaining tasks, stopping a qubit at its first failure."""
+    results: dict[str, Any] = {}
+    for attempt in attempts:
+        qid = attempt.qid
+        remaining = tasks[attempt.start_task :]
+        if attempt.attempt > 1:
+            logger.info(
+                f"Q{qid}: Attempt {attempt.attempt} of {remaining[0]} "
+                f"with {attempt.offset * 1000:+.0f} MHz offset"
+            )
+        result: dict[str, Any] = {"status": "success"}
+        for task_name in remaining:
+            task_details = None
+            if attempt.offset != 0:
+                task_details = {
+                    task_name: {
+                        "input_parameters": {"qubit_frequency_offset": {"value": attempt.offset}}
+                    }
+                }
+            try:
+                result[task_name] = session.execute_task(task_name, qid, task_details=task_details)
+            except Exception as e:
+                error_details = _format_exception_details(e)
+                logger.warning(f"Q{qid}: {task_name} attempt {attempt.attempt} failed")
+                result.update(
+                    status="failed",
+                    error=str(e),
+                    error_details=error_details,
+                    failed_task=task_name,
+                )
+                break
+        results[qid] = result
+    return results
+
+
+@task(task_run_name=cast("Any", _retry_round_task_run_name), log_prints=True)
+def calibrate_retry_group(
+    attempts: list[RetryAttempt],
+    tasks: list[str],
+    session_config: dict[str, Any],
+) -> dict[str, Any]:
+    """Run one round of qubit attempts for a group in an isolated session.
+
+    Args:
+        attempts: Qubit attempts in this group (run sequentially)
+        tasks: Task names run per qubit; each attempt starts at its ``start_task``
+        session_config: Configuration for creating isolated session
+
+    Returns:
+        Results dict keyed by qubit ID. Failed results name the ``failed_task``.
+    """
+    _ensure_prefect_logging()
+    logger = get_run_logger()
+    session = _create_isolated_session(session_config, [attempt.qid for attempt in attempts])
+    try:
+        return _execute_attempts_with_session(session, attempts, tasks, logger)
+    finally:
+        session.finish_calibration(update_chip_history=False, push_to_github=False)
+        _flush_prefect_logs()
+
+
 def run_groups_with_retry_parallel(
     groups: list[list[str]],
     tasks: list[str],
-    offsets: list[float],
+    offsets: list[float] | None,
     session_config: dict[str, Any],
+    retry_policy: RetryPolicy | None = None,
+    qid_to_mux: dict[str, int] | None = None,
+    mux_conflict_map: dict[int, set[int]] | None = None,
 ) -> dict[str, Any]:
-    """Run multiple qubit groups with retry logic in parallel using separate processes.
+    """Run multiple qubit groups in parallel processes and retry failures across groups.
 
-    Each group runs in its own process with isolated memory space.
-    Within each group, qubits are processed sequentially with retry logic.
+    Every qubit first runs once in its group. Failed qubits of all groups
+    are then regrouped by ``RetryScheduler`` (qubits of the same or
+    conflicting MUXes stay in one group, at most ``len(groups)`` groups) and retried in parallel rounds
+    until they succeed or their task's retry budget is spent. A retry
+    resumes at the task that failed.
 
     Args:
         groups: List of qubit groups, where each group is a list of qubit IDs
         tasks: List of task names to execute
-        offsets: Frequency offsets to try on failure (e.g., [0, 0.001, -0.001])
+        offsets: Frequency offsets per attempt (e.g., [0, 0.001, -0.001]).
+            Ignored when ``retry_policy`` is given.
         session_config: Configuration for creating isolated sessions
+        retry_policy: Per-task retry budgets and offsets
+        qid_to_mux: Mapping from qubit ID to MUX ID from the wiring
+            (default: 4 qubits per MUX)
+        mux_conflict_map: MUX ID to the MUXes sharing a readout or control
+            module, from the wiring (default: no conflicts)
 
     Returns:
         Dictionary mapping qid to results (combined from all groups)
     """
+    if retry_policy is None:
+        retry_policy = RetryPolicy(offsets=offsets) if offsets else RetryPolicy()
 
     # Define flow dynamically to avoid import errors when prefect-dask not installed
     @flow(task_runner=_get_dask_task_runner())
     def _run_groups_retry_parallel_flow(
         groups: list[list[str]],
         tasks: list[str],
-        offsets: list[float],
+        retry_policy: RetryPolicy,
         session_config: dict[str, Any],
     ) -> dict[str, Any]:
         logger = get_run_logger()
         logger.info(f"Running {len(groups)} groups with retry in parallel processes")
 
-        # Submit all groups to run in parallel processes
-        futures = [
-            calibrate_group_with_retry.submit(
-                qids=group,
-                tasks=tasks,
-                offsets=offsets,
-                session_config=session_config,
-            )
-            for group in groups
-        ]
-
-        # Collect results and log any errors from subprocesses
-        all_results: dict[str, Any] = {}
-        for future in futures:
-            group_result = future.result()
-            # Log error details from subprocess (since subprocess logs don't propagate)
-            for qid, qid_result in group_result.items():
-                if qid_result.get("status") == "failed" and "error_details" in qid_result:
-                    logger.error(
-                        f"[From subprocess] Failed to calibrate qubit {qid}:\n{qid_result['error_details']}"
-                    )
-            all_results.update(group_result)
+        scheduler = RetryScheduler(
+            tasks,
+            retry_policy,
+            max_groups=len(groups),
+            qid_to_mux=qid_to_mux,
+            mux_conflict_map=mux_conflict_map,
+        )
+        round_groups = scheduler.initial_groups(groups)
+        while round_groups:
+            if scheduler.rounds:
+                logger.info(
+                    f"Retry round {scheduler.rounds}: "
+                    f"{sum(len(group) for group in round_groups)} qubits "
+                    f"in {len(round_groups)} groups"
+                )
+            futures = [
+                calibrate_retry_group.submit(
+                    attempts=group,
+                    tasks=tasks,
+                    session_config=session_config,
+                )
+                for group in round_groups
+            ]
+
+            # Collect results and log any errors from subprocesses
+            round_results: dict[str, Any] = {}
+            for future in futures:
+                group_result = future.result()
+                # Log error details from subprocess (since subprocess logs don't propagate)
+                for qid, qid_result in group_result.items():
+                    if qid_result.get("status") == "failed" and "error_details" in qid_result:
+                        logger.error(
+                            f"[From subprocess] Failed to calibrate qubit {qid}:\n{qid_result['error_details']}"
+                        )
+                round_results.update(group_result)
+            round_groups = scheduler.record(round_results)
 
-        return all_results
+        return scheduler.results
 
-    result: dict[str, Any] = _run_groups_retry_parallel_flow(groups, tasks, offsets, session_config)
+    result: dict[str, Any] = _run_groups_retry_parallel_flow(
+        groups, tasks, retry_policy, session_config
+    )
     return result
 
 
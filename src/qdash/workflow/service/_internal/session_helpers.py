@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from qdash.datamodel.execution_lock import ExecutionLeaseModel
     from qdash.workflow.service.calib_service import CalibService
     from qdash.workflow.service.github import GitHubPushConfig
 
@@ -33,6 +34,7 @@ def init_calibration(
     github_push_config: GitHubPushConfig | None = None,
     muxes: list[int] | None = None,
     project_id: str | None = None,
+    parent_lease: ExecutionLeaseModel | None = None,
 ) -> CalibService:
     """Initialize a session and set it in global context (internal use)."""
     from qdash.workflow.service.calib_service import CalibService
@@ -51,6 +53,7 @@ def init_calibration(
         github_push_config=github_push_config,
         muxes=muxes,
         project_id=project_id,
+        parent_lease=parent_lease,
     )
     set_current_session(session)
     return session
@@ -35,8 +35,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 
+    from qdash.datamodel.execution_lock import ExecutionLeaseModel
     from qdash.repository.protocols import (
         ExecutionCounterRepository,
         ExecutionLockRepository,
@@ -45,12 +46,13 @@ if TYPE_CHECKING:
     from qdash.workflow.engine.backend.base import BaseBackend
     from qdash.workflow.engine.execution.service import ExecutionService
     from qdash.workflow.engine.task.context import TaskContext
-    from qdash.workflow.service.steps import Step
+    from qdash.workflow.service.steps import Step, StepGraph
     from qdash.workflow.service.targets import Target
 
 from prefect import get_run_logger
 
 from qdash.common.config.backend import get_default_backend
+from qdash.common.execution_lease import ExecutionLeaseManager, lease_qids
 from qdash.common.utils.datetime import now
 from qdash.workflow.engine import CalibConfig, CalibOrchestrator
 from qdash.workflow.engine.params_updater import get_params_updater
@@ -168,9 +170,15 @@ def _cancel_executions_by_flow_run_id(
             task_count,
         )
 
-    # Also release execution lock
+    # Also release the cancelled executions' leases (and the legacy project lock)
     try:
         from qdash.dbmodel.execution_lock import ExecutionLockDocument
+        from qdash.repository import MongoExecutionLockRepository
+
+        lock_repo = MongoExecutionLockRepository()
+        for execution in executions:
+            if lock_repo.release_owner_leases(project_id, execution.execution_id):
+                _logger.info("Released execution lease of %s", execution.execution_id)
 
         lock_doc = ExecutionLockDocument.find_one({"project_id": project_id}).run()
         if lock_doc and lock_doc.locked:
@@ -245,6 +253,7 @@ class CalibService:
         source_task_id: str | None = None,
         force_update_params: bool = False,
         persist_output_parameters: bool = True,
+        parent_lease: ExecutionLeaseModel | None = None,
         *,
         user_repo: UserRepository | None = None,
         lock_repo: ExecutionLockRepository | None = None,
@@ -277,7 +286,8 @@ class CalibService:
             name: Human-readable name for the execution (deprecated, use flow_name)
             flow_name: Flow name for display in execution list (auto-injected by API)
             tags: List of tags for categorization
-            use_lock: Whether to use ExecutionLock to prevent concurrent calibrations (default: True)
+            use_lock: Whether to lease the chip (or just ``qids`` on it) so overlapping
+                calibrations cannot run concurrently (default: True)
             note: Additional notes to store with execution (default: {})
             enable_github_pull: Whether to pull latest config from GitHub before starting
             enable_github: Enable GitHub integration (default: True). Sets both pull and push.
@@ -287,12 +297,16 @@ class CalibService:
                 from username's default_project_id.
             skip_execution: Skip Execution document creation (for wrapper/parent sessions
                 where child sessions will create their own Executions). Default: False.
+            parent_lease: Lease held by the parent session of a worker session
+                (``use_lock=False``). Writes are fenced on it, so a worker does not
+                persist results after the parent's lease was lost.
             user_repo: Repository for user lookup (DI). If None, uses MongoUserRepository.
             lock_repo: Repository for lock operations (DI). If None, uses MongoExecutionLockRepository.
             counter_repo: Repository for counter operations (DI). If None, uses MongoExecutionCounterRepository.
 
         Raises:
-            RuntimeError: If use_lock=True and another calibration is already running
+            ExecutionLockConflictError: If use_lock=True and another calibration holds
+                an overlapping lease (raised when the session is initialized)
 
         """
         self.username = username
@@ -303,7 +317,8 @@ class CalibService:
         self.use_lock = use_lock
         self.skip_execution = skip_execution
         self.default_run_parameters = default_run_parameters or {}
-        self._lock_acquired = False
+        self._lease_manager: ExecutionLeaseManager | None = None
+        self._parent_lease = parent_lease
 
         # Resolve source_execution_id from Prefect runtime context if not provided
         if source_execution_id is None:
@@ -471,18 +486,27 @@ class CalibService:
         elif self.github_push_config is None:
             self.github_push_config = GitHubPushConfig()
 
-        # Acquire lock if requested
-        if self.use_lock:
+        # Lease the hardware if requested. System-level (MUX) sessions may touch
+        # any qubit, so they lease the whole chip. Worker sessions fence their
+        # writes on the parent's lease instead.
+        if self.use_lock or self._parent_lease is not None:
             if self._lock_repo is None:
                 from qdash.repository import MongoExecutionLockRepository
 
                 self._lock_repo = MongoExecutionLockRepository()
 
-            if self._lock_repo.is_locked(project_id=self.project_id):
-                msg = "Calibration is already running. Cannot start a new session."
-                raise RuntimeError(msg)
-            self._lock_repo.lock(project_id=self.project_id)
-            self._lock_acquired = True
+            lease_manager = ExecutionLeaseManager(self._lock_repo)
+            if self.use_lock:
+                lease_manager.acquire(
+                    project_id=self.project_id,
+                    chip_id=self.chip_id,
+                    owner=self.execution_id,
+                    qids=None if self.muxes else lease_qids(qids),
+                )
+            else:
+                assert self._parent_lease is not None
+                lease_manager.adopt(self._parent_lease)
+            self._lease_manager = lease_manager
 
         # Wrap all initialization in try/except to ensure lock is released on failure
         try:
@@ -528,6 +552,7 @@ class CalibService:
                 config=config,
                 github_integration=self.github_integration,
                 snapshot_loader=snapshot_loader,
+                write_fence=self._check_lease,
             )
             self._orchestrator._source_task_id = self._source_task_id
             self._orchestrator.initialize()
@@ -538,9 +563,7 @@ class CalibService:
             self._initialized = True
         except Exception:
             # Release lock if initialization fails
-            if self._lock_acquired and self._lock_repo is not None:
-                self._lock_repo.unlock(project_id=self.project_id)
-                self._lock_acquired = False
+            self._release_lock_if_acquired()
             raise
 
     @property
@@ -602,6 +625,7 @@ class CalibService:
             ```
         """
         assert self._orchestrator is not None, "Session not initialized"
+        self._check_lease()
         result: dict[str, Any] = self._orchestrator.run_task(
             task_name, qid, task_details, upstream_id
         )
@@ -616,6 +640,7 @@ class CalibService:
     ) -> dict[str, dict[str, Any]]:
         """Execute one calibration task with a single batch_run over qids."""
         assert self._orchestrator is not None, "Session not initialized"
+        self._check_lease()
         return self._orchestrator.run_task_batch(task_name, qids, task_details, upstream_id)
 
     def get_parameter(self, qid: str, param_name: str) -> Any:
@@ -1010,6 +1035,9 @@ class CalibService:
             # Finalize any tasks still in RUNNING status before completing execution.
             self._finalize_stale_running_tasks(logger)
 
+            # Chip history and GitHub writes below require a live lease.
+            self._check_lease()
+
             # Reload and complete execution
             self.execution_service = self.execution_service.reload().complete()
 
@@ -1103,11 +1131,26 @@ class CalibService:
             logger.warning("GitHub credentials not configured, skipping push")
             return None
 
+    @property
+    def execution_lease(self) -> ExecutionLeaseModel | None:
+        """The lease this session's writes are fenced on, if any.
+
+        Pass it as ``"lease"`` in the ``session_config`` of worker sessions.
+        """
+        if self._lease_manager is None:
+            return None
+        return self._lease_manager.lease
+
+    def _check_lease(self) -> None:
+        """Fence writes: raise ExecutionLeaseLostError if this session's lease lapsed."""
+        if self._lease_manager is not None:
+            self._lease_manager.check()
+
     def _release_lock_if_acquired(self) -> None:
-        """Release the execution lock if it was acquired by this session."""
-        if self.use_lock and self._lock_acquired and self._lock_repo is not None:
-            self._lock_repo.unlock(project_id=self.project_id)
-            self._lock_acquired = False
+        """Release the execution lease if it was acquired by this session."""
+        if self._lease_manager is not None:
+            self._lease_manager.release()
+            self._lease_manager = None
 
     def fail_calibration(self, error_message: str = "") -> None:
         """Mark the calibration as failed and cleanup.
@@ -1177,12 +1220,24 @@ class CalibService:
         self,
         targets: Target,
         steps: Sequence[Step],
+        *,
+        max_workers: int = 1,
+        dry_run: bool = False,
+        step_durations: Mapping[str, float] | None = None,
     ) -> dict[str, Any]:
         """Run calibration pipeline with targets and steps.
 
+        With ``max_workers`` > 1, independent steps (disjoint context keys and
+        MUXes, see ``steps.dag``) run concurrently. Use ``OnTargets`` to run a
+        step on a region of the chip.
+
         Args:
             targets: Target specification (MuxTargets, QubitTargets, etc.)
             steps: List of Step objects defining the calibration pipeline
+            max_workers: Maximum number of steps running at once (1 runs in order)
+            dry_run: Only log the step dependencies and critical path, and
+                return them as ``{"plan": DagPlan}`` without running anything
+            step_durations: Estimated duration per step name for the critical path
 
         Returns:
             Results dictionary. Structure depends on the steps executed.
@@ -1209,18 +1264,66 @@ class CalibService:
             ])
             ```
         """
-        return self._run_pipeline(targets, steps)
+        if dry_run:
+            return self._plan_pipeline(targets, steps, step_durations)
+        return self._run_pipeline(
+            targets, steps, max_workers=max_workers, step_durations=step_durations
+        )
+
+    def _plan_pipeline(
+        self,
+        targets: Target,
+        steps: Sequence[Step],
+        step_durations: Mapping[str, float] | None = None,
+    ) -> dict[str, Any]:
+        """Build and log the dependency plan of a pipeline without running it."""
+        from qdash.workflow.service.steps import Pipeline
+
+        logger = get_run_logger()
+        pipeline = Pipeline(steps)
+        graph = self._build_step_graph(
+            pipeline.steps, targets.to_qids(self.chip_id), step_durations
+        )
+        plan = graph.plan()
+        logger.info(plan.format())
+        return {"plan": plan}
+
+    def _build_step_graph(
+        self,
+        steps: Sequence[Step],
+        qids: list[str],
+        step_durations: Mapping[str, float] | None = None,
+    ) -> StepGraph:
+        """Build the step dependency graph with the chip's MUX wiring.
+
+        Without a wiring file, MUXes are assumed to hold 4 qubits each and
+        not to conflict with each other.
+        """
+        from qdash.workflow.engine.scheduler.topology_index import get_wiring_index
+        from qdash.workflow.service.steps import StepGraph
+
+        try:
+            wiring = get_wiring_index(self.chip_id)
+        except FileNotFoundError:
+            logger.warning(f"No wiring config for chip {self.chip_id}; using 4 qubits per MUX")
+            wiring = None
+        return StepGraph(steps, qids, self.chip_id, durations=step_durations, wiring=wiring)
 
     def _run_pipeline(
         self,
         targets: Target,
         steps: Sequence[Step],
+        *,
+        max_workers: int = 1,
+        step_durations: Mapping[str, float] | None = None,
     ) -> dict[str, Any]:
         """Execute a calibration pipeline with steps.
 
         Args:
             targets: Target specification
             steps: List of steps to execute
+            max_workers: Maximum number of steps running at once
+            step_durations: Estimated duration per step name for the critical path
 
         Returns:
             Dictionary with typed results from each step
@@ -1229,7 +1332,7 @@ class CalibService:
             clear_current_session,
             set_current_session,
         )
-        from qdash.workflow.service.steps import Pipeline, StepContext
+        from qdash.workflow.service.steps import DagExecutor, Pipeline, StepContext
 
         logger = get_run_logger()
 
@@ -1250,14 +1353,20 @@ class CalibService:
             ctx = StepContext()
             ctx.candidate_qids = qids
 
-            # Execute steps sequentially
-            for i, step in enumerate(pipeline):
-                logger.info(f"Step {i + 1}/{len(pipeline)}: {step.name}")
-                try:
-                    ctx = step.execute(self, targets, ctx)
-                except Exception as e:
-                    logger.error(f"Step {step.name} failed: {e}")
-                    raise
+            if max_workers > 1:
+                # Execute independent steps concurrently
+                graph = self._build_step_graph(pipeline.steps, qids, step_durations)
+                logger.info(graph.plan().format())
+                ctx = DagExecutor(graph, max_workers=max_workers).run(self, targets, ctx)
+            else:
+                # Execute steps sequentially
+                for i, step in enumerate(pipeline):
+                    logger.info(f"Step {i + 1}/{len(pipeline)}: {step.name}")
+                    try:
+                        ctx = step.execute(self, targets, ctx)
+                    except Exception as e:
+                        logger.error(f"Step {step.name} failed: {e}")
+                        raise
 
             logger.info("Pipeline completed successfully")
 
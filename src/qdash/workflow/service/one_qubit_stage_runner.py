@@ -13,6 +13,7 @@ from qdash.workflow.service._internal.scheduling_tasks import (
 from qdash.workflow.service.calib_service import get_session
 
 if TYPE_CHECKING:
+    from qdash.datamodel.execution_lock import ExecutionLeaseModel
     from qdash.workflow.service.calib_service import CalibService
 
 
@@ -23,8 +24,17 @@ class OneQubitStageRunner:
         self.cal_service = cal_service
         self.project_id = project_id or cal_service.project_id
 
-    def build_session_config(self, *, execution_id: str, flow_name: str | None) -> dict[str, Any]:
-        """Build isolated-worker session config for the current parent execution."""
+    def build_session_config(
+        self,
+        *,
+        execution_id: str,
+        flow_name: str | None,
+        lease: ExecutionLeaseModel | None = None,
+    ) -> dict[str, Any]:
+        """Build isolated-worker session config for the current parent execution.
+
+        ``lease`` is the parent's execution lease; workers fence their writes on it.
+        """
         return {
             "username": self.cal_service.username,
             "chip_id": self.cal_service.chip_id,
@@ -36,6 +46,7 @@ class OneQubitStageRunner:
             "tags": self.cal_service.tags,
             "flow_name": flow_name,
             "note": self.cal_service.note,
+            "lease": lease,
         }
 
     def collect_scheduled_qids(
@@ -28,6 +28,9 @@ Example:
     ]
 
     results = service.run(targets, steps=steps)
+
+Independent steps can run concurrently with ``service.run(..., max_workers=2)``;
+``dry_run=True`` only reports the step dependencies and critical path.
 """
 
 # Base classes
@@ -48,6 +51,15 @@ from qdash.workflow.service.steps.bringup import (
     ExperimentalSimultaneousBringUp,
 )
 
+# DAG-parallel execution
+from qdash.workflow.service.steps.dag import (
+    DagExecutor,
+    DagPlan,
+    OnTargets,
+    StepGraph,
+    StepNode,
+)
+
 # Filter steps
 from qdash.workflow.service.steps.filters import (
     FilterByMetric,
@@ -85,11 +97,15 @@ __all__ = [
     "CustomOneQubit",
     # 2-Qubit steps
     "CustomTwoQubit",
+    # DAG-parallel execution
+    "DagExecutor",
+    "DagPlan",
     "ExperimentalSimultaneousBringUp",
     # Filter steps
     "FilterByMetric",
     "FilterByStatus",
     "GenerateCRSchedule",
+    "OnTargets",
     "OneQubitCheck",
     "OneQubitFineTune",
     "Pipeline",
@@ -98,6 +114,8 @@ __all__ = [
     "Step",
     # Context and Pipeline
     "StepContext",
+    "StepGraph",
+    "StepNode",
     "TransformStep",
     "TwoQubitCalibration",
 ]
@@ -49,6 +49,18 @@ class Step(ABC):
         """
         return {self.name}
 
+    def qubits(self, target_qids: list[str], chip_id: str) -> frozenset[str]:
+        """Qubits this step occupies on the hardware.
+
+        Used by the DAG executor to keep steps on shared hardware apart.
+        Override to narrow the set. Default: all pipeline target qubits.
+
+        Args:
+            target_qids: Qubit IDs of the pipeline targets
+            chip_id: Chip ID for resolving targets
+        """
+        return frozenset(target_qids)
+
     @abstractmethod
     def execute(
         self,
@@ -89,3 +101,7 @@ class TransformStep(Step):
 
     Examples: FilterByMetric, FilterByStatus, GenerateCRSchedule
     """
+
+    def qubits(self, target_qids: list[str], chip_id: str) -> frozenset[str]:
+        """TransformSteps do not occupy hardware."""
+        return frozenset()
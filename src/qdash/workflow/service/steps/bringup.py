@@ -162,6 +162,7 @@ class BringUp(CalibrationStep):
             "tags": service.tags,
             "flow_name": service.flow_name,
             "note": service.note,
+            "lease": service.execution_lease,
         }
 
         results = run_qubit_calibrations_parallel(
@@ -361,6 +362,7 @@ class ExperimentalSimultaneousBringUp(CalibrationStep):
                 tags=service.tags,
                 project_id=service.project_id,
                 use_lock=False,
+                parent_lease=service.execution_lease,
                 enable_github_pull=True,
                 github_push_config=GitHubPushConfig(
                     enabled=True,
@@ -384,6 +386,7 @@ class ExperimentalSimultaneousBringUp(CalibrationStep):
         session_config = runner.build_session_config(
             execution_id=session.execution_id,
             flow_name=stage_flow_name,
+            lease=session.execution_lease,
         )
 
         logger.info("[%s] Running resonator spectroscopy", self.name)
@@ -0,0 +1,423 @@
+"""DAG-parallel execution of pipeline steps.
+
+Pipeline runs its steps in order. DagExecutor instead builds a dependency
+graph from each step's ``requires``/``provides`` and the qubits it occupies,
+and runs steps whose dependencies are done concurrently on a bounded pool.
+
+Step ``j`` depends on an earlier step ``i`` when:
+- ``j`` requires a key ``i`` provides, or one of them provides a key the
+  other requires or provides, so every step sees what it would see in a
+  sequential run, or
+- their qubits are on the same MUX, or on MUXes sharing a readout or
+  control module in the chip wiring, since such qubits cannot be driven by
+  two steps at once.
+
+Each running step gets its own copy of the context. When it finishes, the
+values it changed are merged back into the shared context. Concurrent steps
+never change the same value, and filter results are kept in pipeline
+order, so the merged context does not depend on completion order.
+
+``OnTargets`` runs a step on a region of the chip. It sees and changes only
+its region's share of ``candidate_qids`` and 1-qubit results, so steps on
+disjoint regions (e.g. fine calibration on one region, benchmarking on
+another) can run at the same time.
+
+Example:
+    ```python
+    wiring = get_wiring_index("64Qv3")
+    graph = StepGraph(steps, target_qids=qids, chip_id="64Qv3", wiring=wiring)
+    print(graph.plan().format())  # dry run: dependencies and critical path
+    ctx = DagExecutor(graph, max_workers=2).run(service, targets, ctx)
+    ```
+"""
+
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from prefect import get_run_logger
+
+from qdash.workflow.engine.scheduler.cr_utils import mux_of, muxes_conflict
+from qdash.workflow.service.results import OneQubitResult
+from qdash.workflow.service.steps.base import Step, TransformStep
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from qdash.workflow.engine.scheduler.topology_index import WiringIndex
+    from qdash.workflow.service.calib_service import CalibService
+    from qdash.workflow.service.results import FilterResult
+    from qdash.workflow.service.steps.pipeline import StepContext
+    from qdash.workflow.service.targets import Target
+
+DEFAULT_MAX_WORKERS = 2
+
+# Context values that OnTargets steps share per qubit.
+_REGION_KEYS = frozenset({"candidate_qids", "one_qubit_check", "one_qubit_fine_tune"})
+_QUBIT_RESULT_FIELDS = ("one_qubit_check", "one_qubit_fine_tune")
+
+
+@dataclass
+class OnTargets(Step):
+    """Run a step on a region of the chip instead of the pipeline targets.
+
+    The wrapped step sees only the region's share of ``candidate_qids`` and
+    1-qubit results, and its changes to them replace only that share.
+
+    Example:
+        steps = [
+            OnTargets(OneQubitFineTune(), MuxTargets([0, 1])),
+            OnTargets(CustomOneQubit(step_name="rb", tasks=["RandomizedBenchmarking"]),
+                      MuxTargets([2, 3])),
+        ]
+    """
+
+    step: Step
+    targets: Target
+    _region: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def name(self) -> str:
+        return self.step.name
+
+    @property
+    def requires(self) -> set[str]:
+        return self.step.requires
+
+    @property
+    def provides(self) -> set[str]:
+        return self.step.provides
+
+    def region(self, chip_id: str) -> frozenset[str]:
+        """Qubit IDs of the region."""
+        if self._region is None:
+            self._region = frozenset(self.targets.to_qids(chip_id))
+        return self._region
+
+    def qubits(self, target_qids: list[str], chip_id: str) -> frozenset[str]:
+        if isinstance(self.step, TransformStep):
+            return frozenset()
+        return self.region(chip_id)
+
+    def execute(
+        self,
+        service: CalibService,
+        targets: Target,
+        ctx: StepContext,
+    ) -> StepContext:
+        """Execute the wrapped step on the region's share of the context."""
+        region = self.region(service.chip_id)
+        view = _restrict(ctx.fork(), region)
+        before = view.fork()
+        output = self.step.execute(service, self.targets, view)
+        ctx.filters.extend(_merge_output(ctx, before, output, region))
+        return ctx
+
+
+@dataclass(frozen=True)
+class StepNode:
+    """A step in the dependency graph.
+
+    Attributes:
+        index: Position of the step in the pipeline
+        step: The step
+        qubits: Qubits the step occupies on the hardware
+        region: Region of an OnTargets step (None for the whole context)
+        weight: Estimated duration used for the critical path
+        predecessors: Indices of the steps that must finish first
+    """
+
+    index: int
+    step: Step
+    qubits: frozenset[str]
+    region: frozenset[str] | None
+    weight: float
+    predecessors: frozenset[int]
+
+
+@dataclass(frozen=True)
+class DagPlan:
+    """Dry-run view of a step graph.
+
+    Attributes:
+        nodes: Steps with their dependencies
+        critical_path: Indices of the longest dependency chain
+        critical_path_length: Summed weight of the critical path
+        total_weight: Summed weight of all steps (the sequential duration)
+    """
+
+    nodes: list[StepNode]
+    critical_path: list[int]
+    critical_path_length: float
+    total_weight: float
+
+    def format(self) -> str:
+        """Render the plan as text."""
+        lines = [
+            f"Pipeline plan: {len(self.nodes)} steps, "
+            f"critical path {self.critical_path_length:g} of {self.total_weight:g} sequential"
+        ]
+        for node in self.nodes:
+            after = ", ".join(str(i) for i in sorted(node.predecessors)) or "-"
+            marker = "*" if node.index in self.critical_path else " "
+            lines.append(
+                f" {marker}[{node.index}] {node.step.name} "
+                f"(qubits={len(node.qubits)}, weight={node.weight:g}, after={after})"
+            )
+        path = " -> ".join(f"[{i}] {self.nodes[i].step.name}" for i in self.critical_path)
+        lines.append(f"Critical path: {path or '-'}")
+        return "\n".join(lines)
+
+
+class StepGraph:
+    """Dependency graph of pipeline steps."""
+
+    def __init__(
+        self,
+        steps: Sequence[Step],
+        target_qids: list[str],
+        chip_id: str,
+        durations: Mapping[str, float] | None = None,
+        wiring: WiringIndex | None = None,
+    ):
+        """Build the graph.
+
+        Args:
+            steps: Pipeline steps, in order
+            target_qids: Qubit IDs of the pipeline targets
+            chip_id: Chip ID for resolving step targets
+            durations: Estimated duration per step name for the critical path
+                (default: 1 for steps on hardware, 0 otherwise)
+            wiring: Compiled chip wiring for MUX membership and conflicts
+                (default: 4 qubits per MUX, no conflicts between MUXes)
+        """
+        durations = durations or {}
+        qid_to_mux = wiring.qid_to_mux if wiring is not None else None
+        mux_conflicts = wiring.mux_conflicts if wiring is not None else None
+        self.nodes: list[StepNode] = []
+        muxes: list[frozenset[int | str]] = []
+        for index, step in enumerate(steps):
+            qubits = step.qubits(target_qids, chip_id)
+            region = step.region(chip_id) if isinstance(step, OnTargets) else None
+            node_muxes = frozenset(mux_of(qid, qid_to_mux) for qid in qubits)
+            predecessors = frozenset(
+                earlier.index
+                for earlier in self.nodes
+                if muxes_conflict(muxes[earlier.index], node_muxes, mux_conflicts)
+                or _key_conflict(earlier.step, earlier.region, step, region)
+            )
+            weight = durations.get(step.name, 1.0 if qubits else 0.0)
+            self.nodes.append(StepNode(index, step, qubits, region, weight, predecessors))
+            muxes.append(node_muxes)
+
+        # Longest remaining chain from each step, used to start critical steps first
+        successors: list[list[int]] = [[] for _ in self.nodes]
+        for node in self.nodes:
+            for i in node.predecessors:
+                successors[i].append(node.index)
+        self.bottom_levels = [0.0] * len(self.nodes)
+        for node in reversed(self.nodes):
+            self.bottom_levels[node.index] = node.weight + max(
+                (self.bottom_levels[j] for j in successors[node.index]), default=0.0
+            )
+
+    def plan(self) -> DagPlan:
+        """Return the dry-run plan with the critical path."""
+        finish: list[float] = []
+        via: list[int | None] = []
+        for node in self.nodes:
+            previous = max(node.predecessors, key=lambda i: (finish[i], -i), default=None)
+            start = finish[previous] if previous is not None else 0.0
+            finish.append(start + node.weight)
+            via.append(previous)
+
+        path: list[int] = []
+        if self.nodes:
+            current: int | None = max(range(len(self.nodes)), key=lambda i: (finish[i], -i))
+            while current is not None:
+                path.append(current)
+                current = via[current]
+        path.reverse()
+        return DagPlan(
+            nodes=list(self.nodes),
+            critical_path=path,
+            critical_path_length=finish[path[-1]] if path else 0.0,
+            total_weight=sum(node.weight for node in self.nodes),
+        )
+
+
+class DagExecutor:
+    """Run the steps of a StepGraph concurrently on a bounded thread pool."""
+
+    def __init__(self, graph: StepGraph, max_workers: int = DEFAULT_MAX_WORKERS):
+        """Initialize the executor.
+
+        Args:
+            graph: Step dependency graph
+            max_workers: Maximum number of steps running at once
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.graph = graph
+        self.max_workers = max_workers
+
+    def run(self, service: CalibService, targets: Target, ctx: StepContext) -> StepContext:
+        """Run all steps and merge their results into ``ctx``.
+
+        Ready steps start in order of their remaining critical path. After a
+        step fails, no further steps start; the running ones finish and the
+        failure of the earliest failed step is raised.
+
+        Args:
+            service: CalibService passed to every step
+            targets: Pipeline targets
+            ctx: Shared pipeline context
+
+        Returns:
+            The context with the results of all steps
+        """
+        logger = get_run_logger()
+        nodes = self.graph.nodes
+        base_filters = list(ctx.filters)
+        step_filters: dict[int, list[FilterResult]] = {}
+        done: set[int] = set()
+        pending = set(range(len(nodes)))
+        running: dict[Future[StepContext], tuple[StepNode, StepContext]] = {}
+        errors: dict[int, BaseException] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pipeline-step"
+        ) as pool:
+            while True:
+                if not errors:
+                    ready = sorted(
+                        (i for i in pending if nodes[i].predecessors <= done),
+                        key=lambda i: (-self.graph.bottom_levels[i], i),
+                    )
+                    for i in ready[: self.max_workers - len(running)]:
+                        node = nodes[i]
+                        pending.discard(i)
+                        logger.info(f"Step {i + 1}/{len(nodes)}: {node.step.name}")
+                        step_ctx = ctx.fork()
+                        before = step_ctx.fork()
+                        future = pool.submit(
+                            contextvars.copy_context().run,
+                            _execute_step,
+                            node.step,
+                            service,
+                            targets,
+                            step_ctx,
+                        )
+                        running[future] = (node, before)
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(finished, key=lambda f: running[f][0].index):
+                    node, before = running.pop(future)
+                    try:
+                        output = future.result()
+                    except Exception as e:
+                        logger.error(f"Step {node.step.name} failed: {e}")
+                        errors[node.index] = e
+                        continue
+                    step_filters[node.index] = _merge_output(ctx, before, output, node.region)
+                    ctx.filters = base_filters + [
+                        result for i in sorted(step_filters) for result in step_filters[i]
+                    ]
+                    done.add(node.index)
+
+        if errors:
+            raise errors[min(errors)]
+        return ctx
+
+
+def _execute_step(
+    step: Step, service: CalibService, targets: Target, ctx: StepContext
+) -> StepContext:
+    from qdash.workflow.service.session_context import set_current_session
+
+    # Worker threads have no thread-local session of their own
+    set_current_session(service)
+    return step.execute(service, targets, ctx)
+
+
+def _key_conflict(
+    first: Step,
+    first_region: frozenset[str] | None,
+    second: Step,
+    second_region: frozenset[str] | None,
+) -> bool:
+    """Return True if ``second`` must wait for ``first`` because of context keys."""
+    keys = (first.provides & (second.requires | second.provides)) | (
+        first.requires & second.provides
+    )
+    disjoint = (
+        first_region is not None
+        and second_region is not None
+        and not (first_region & second_region)
+    )
+    return any(not (disjoint and key in _REGION_KEYS) for key in keys)
+
+
+def _restrict(ctx: StepContext, region: frozenset[str]) -> StepContext:
+    """Narrow the per-qubit values of ``ctx`` to ``region`` (in place)."""
+    ctx.candidate_qids = [qid for qid in ctx.candidate_qids if qid in region]
+    for name in _QUBIT_RESULT_FIELDS:
+        result = getattr(ctx, name)
+        if result is not None:
+            qubits = {qid: data for qid, data in result.qubits.items() if qid in region}
+            setattr(ctx, name, OneQubitResult(qubits=qubits))
+    return ctx
+
+
+def _merge_output(
+    ctx: StepContext,
+    before: StepContext,
+    output: StepContext,
+    region: frozenset[str] | None,
+) -> list[FilterResult]:
+    """Apply what a step changed between ``before`` and ``output`` to ``ctx``.
+
+    Per-qubit values of a step with a region replace only the region's share.
+
+    Returns:
+        Filter results the step added (left to the caller to append in order)
+    """
+    if output.candidate_qids != before.candidate_qids:
+        if region is None:
+            ctx.candidate_qids = list(output.candidate_qids)
+        else:
+            # Keep the context's order; qubits the step added go last
+            selected = {qid for qid in output.candidate_qids if qid in region}
+            kept = [qid for qid in ctx.candidate_qids if qid not in region or qid in selected]
+            present = set(kept)
+            ctx.candidate_qids = kept + [
+                qid for qid in output.candidate_qids if qid in selected and qid not in present
+            ]
+    for name in _QUBIT_RESULT_FIELDS:
+        result = getattr(output, name)
+        if result is getattr(before, name):
+            continue
+        current = getattr(ctx, name)
+        if region is not None and current is not None and result is not None:
+            qubits = {qid: data for qid, data in current.qubits.items() if qid not in region}
+            qubits.update({qid: data for qid, data in result.qubits.items() if qid in region})
+            result = OneQubitResult(qubits=qubits)
+        setattr(ctx, name, result)
+    if output.two_qubit is not before.two_qubit:
+        ctx.two_qubit = output.two_qubit
+    if output.candidate_couplings != before.candidate_couplings:
+        ctx.candidate_couplings = list(output.candidate_couplings)
+    for key in before.metadata.keys() - output.metadata.keys():
+        ctx.metadata.pop(key, None)
+    for key, value in output.metadata.items():
+        if key not in before.metadata or before.metadata[key] is not value:
+            ctx.metadata[key] = value
+    return output.filters[len(before.filters) :]
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 
 from prefect import get_run_logger
 
+from qdash.datamodel.execution import ExecutionPlanModel
 from qdash.workflow.service.results import OneQubitResult
 from qdash.workflow.service.steps.base import CalibrationStep
 from qdash.workflow.service.tasks import CHECK_1Q_TASKS, FULL_1Q_TASKS_AFTER_CHECK
@@ -50,6 +51,7 @@ def _execute_direct_one_qubit(
         tags=service.tags,
         project_id=service.project_id,
         use_lock=False,
+        parent_lease=service.execution_lease,
         enable_github_pull=True,
         github_push_config=GitHubPushConfig(
             enabled=True,
@@ -59,6 +61,11 @@ def _execute_direct_one_qubit(
             "type": "1-qubit-direct",
             "stage": stage_name,
             "total_qubits": len(qids),
+            "plan": ExecutionPlanModel(
+                backend=service.backend_name,
+                tasks=tasks,
+                steps=[[[qid] for qid in qids]],
+            ).model_dump(),
         },
     )
 
@@ -72,6 +79,7 @@ def _execute_direct_one_qubit(
         "tags": service.tags,
         "flow_name": service.flow_name,
         "note": service.note,
+        "lease": session.execution_lease,
     }
 
     results = run_qubit_calibrations_parallel(
@@ -1,12 +1,13 @@
 """Step context and pipeline classes.
 
 This module defines StepContext for sharing state between steps,
-and Pipeline for validating step sequences.
+and Pipeline for validating step sequences. Independent steps can run
+concurrently with ``steps.dag.DagExecutor``.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -54,6 +55,20 @@ class StepContext:
         """Get the most recent 1-qubit result (fine_tune if available, else check)."""
         return self.one_qubit_fine_tune or self.one_qubit_check
 
+    def fork(self) -> StepContext:
+        """Return a copy whose lists and metadata can be changed independently.
+
+        Step results are shared with the original, since steps replace them
+        rather than modify them.
+        """
+        return replace(
+            self,
+            filters=list(self.filters),
+            candidate_qids=list(self.candidate_qids),
+            candidate_couplings=list(self.candidate_couplings),
+            metadata=dict(self.metadata),
+        )
+
 
 @dataclass
 class Pipeline:
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 
 from prefect import get_run_logger
 
+from qdash.datamodel.execution import ExecutionPlanModel
 from qdash.workflow.engine.backend.qubex_paths import get_qubex_paths
 from qdash.workflow.service.results import TwoQubitResult
 from qdash.workflow.service.steps.base import CalibrationStep, TransformStep
@@ -131,6 +132,7 @@ class CustomTwoQubit(CalibrationStep):
             tags=service.tags,
             project_id=service.project_id,
             use_lock=False,  # Parent pipeline already holds the lock
+            parent_lease=service.execution_lease,
             enable_github_pull=False,
             github_push_config=GitHubPushConfig(
                 enabled=True,
@@ -142,6 +144,11 @@ class CustomTwoQubit(CalibrationStep):
                 "tasks": self.tasks,
                 "candidate_qubits": candidate_qubits,
                 "schedule": coupling_groups,
+                "plan": ExecutionPlanModel(
+                    backend=service.backend_name,
+                    tasks=self.tasks,
+                    steps=[[[pair] for pair in group] for group in coupling_groups],
+                ).model_dump(),
             },
         )
 
@@ -157,6 +164,7 @@ class CustomTwoQubit(CalibrationStep):
             "tags": session.tags,
             "flow_name": session.flow_name,
             "note": session.note,
+            "lease": session.execution_lease,
         }
 
         # Execute groups sequentially (groups are scheduled to avoid resource conflicts)
@@ -452,6 +460,7 @@ class TwoQubitCalibration(CalibrationStep):
             tags=service.tags,
             project_id=service.project_id,
             use_lock=False,  # Parent pipeline already holds the lock
+            parent_lease=service.execution_lease,
             enable_github_pull=False,
             github_push_config=GitHubPushConfig(
                 enabled=True,
@@ -461,6 +470,11 @@ class TwoQubitCalibration(CalibrationStep):
                 "type": "2-qubit",
                 "candidate_qubits": candidate_qubits,
                 "schedule": coupling_groups,
+                "plan": ExecutionPlanModel(
+                    backend=service.backend_name,
+                    tasks=tasks,
+                    steps=[[[pair] for pair in group] for group in coupling_groups],
+                ).model_dump(),
             },
         )
 
@@ -476,6 +490,7 @@ class TwoQubitCalibration(CalibrationStep):
             "tags": session.tags,
             "flow_name": session.flow_name,
             "note": session.note,
+            "lease": session.execution_lease,
         }
 
         # Execute groups sequentially (groups are scheduled to avoid resource conflicts)
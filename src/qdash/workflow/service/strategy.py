@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 from prefect import get_run_logger
 
+from qdash.datamodel.execution import ExecutionPlanModel
 from qdash.workflow.engine import OneQubitScheduler
 from qdash.workflow.engine.backend.qubex_paths import get_qubex_paths
 from qdash.workflow.service._internal.scheduling_tasks import (
@@ -174,6 +175,7 @@ class OneQubitScheduledStrategy(OneQubitStrategy):
             tags=cal_service.tags,
             project_id=config.project_id,
             use_lock=False,
+            parent_lease=cal_service.execution_lease,
             enable_github_pull=True,
             github_push_config=GitHubPushConfig(
                 enabled=True,
@@ -183,6 +185,15 @@ class OneQubitScheduledStrategy(OneQubitStrategy):
                 "type": "1-qubit-scheduled",
                 "box_types": list(box_sequential_groups.keys()),
                 "total_qubits": len(all_qids),
+                "plan": ExecutionPlanModel(
+                    backend=cal_service.backend_name,
+                    tasks=config.tasks,
+                    steps=[
+                        parallel_groups
+                        for sequential_groups in box_sequential_groups.values()
+                        for parallel_groups in sequential_groups
+                    ],
+                ).model_dump(),
             },
         )
 
@@ -200,6 +211,7 @@ class OneQubitScheduledStrategy(OneQubitStrategy):
             "tags": cal_service.tags,
             "flow_name": cal_service.flow_name,
             "note": cal_service.note,
+            "lease": parent_session.execution_lease,
         }
 
         # Execute stages grouped by box type (sequentially between box types)
@@ -282,6 +294,7 @@ class OneQubitSynchronizedStrategy(OneQubitStrategy):
             tags=cal_service.tags,
             project_id=config.project_id,
             use_lock=False,
+            parent_lease=cal_service.execution_lease,
             enable_github_pull=True,
             github_push_config=GitHubPushConfig(
                 enabled=True,
@@ -291,6 +304,14 @@ class OneQubitSynchronizedStrategy(OneQubitStrategy):
                 "type": "1-qubit-synchronized",
                 "total_steps": schedule.total_steps,
                 "total_qubits": len(all_qids),
+                "plan": ExecutionPlanModel(
+                    backend=cal_service.backend_name,
+                    tasks=config.tasks,
+                    steps=[
+                        [[qid] for qid in self._filter_qids(step.parallel_qids, config.qids)]
+                        for step in schedule.steps
+                    ],
+                ).model_dump(),
             },
         )
 
@@ -308,6 +329,7 @@ class OneQubitSynchronizedStrategy(OneQubitStrategy):
             "tags": cal_service.tags,
             "flow_name": cal_service.flow_name,
             "note": cal_service.note,
+            "lease": parent_session.execution_lease,
         }
 
         all_results: dict[str, Any] = {}
@@ -372,6 +394,7 @@ class OneQubitSimultaneousSpectroscopyStrategy(OneQubitStrategy):
             tags=cal_service.tags,
             project_id=config.project_id,
             use_lock=False,
+            parent_lease=cal_service.execution_lease,
             enable_github_pull=True,
             github_push_config=GitHubPushConfig(
                 enabled=True,
@@ -382,6 +405,15 @@ class OneQubitSimultaneousSpectroscopyStrategy(OneQubitStrategy):
                 "strategy": schedule.metadata["strategy"],
                 "total_qubits": len(all_qids),
                 "total_steps": schedule.total_steps,
+                "plan": ExecutionPlanModel(
+                    backend=cal_service.backend_name,
+                    tasks=config.tasks,
+                    steps=[
+                        [self._filter_qids(step.parallel_qids, config.qids)]
+                        for step in schedule.steps
+                    ],
+                    batch=True,
+                ).model_dump(),
             },
         )
 
@@ -447,6 +479,7 @@ class OneQubitSerialStrategy(OneQubitStrategy):
             tags=cal_service.tags,
             project_id=config.project_id,
             use_lock=False,
+            parent_lease=cal_service.execution_lease,
             enable_github_pull=True,
             github_push_config=GitHubPushConfig(
                 enabled=True,
@@ -456,6 +489,11 @@ class OneQubitSerialStrategy(OneQubitStrategy):
                 "type": "1-qubit-serial",
                 "total_mux_groups": len(all_mux_groups),
                 "total_qubits": len(all_qids),
+                "plan": ExecutionPlanModel(
+                    backend=cal_service.backend_name,
+                    tasks=config.tasks,
+                    steps=[[mux_group] for mux_group in all_mux_groups],
+                ).model_dump(),
             },
         )
 
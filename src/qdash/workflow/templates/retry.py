@@ -14,7 +14,10 @@ Execution pattern:
     └─────────────────────────────────────────────────────────────┘
 
     Groups run in PARALLEL using separate processes (DaskTaskRunner).
-    Qubits within each group run SEQUENTIALLY with retry logic.
+    Qubits within each group run SEQUENTIALLY. Failed qubits of all groups
+    are then retried together in new parallel groups (qubits of the same or
+    conflicting MUXes in the chip wiring stay together), resuming at the
+    task that failed.
     Each process has isolated memory space, avoiding qubex state conflicts.
 
 Example:
@@ -28,6 +31,8 @@ from typing import Any
 
 from prefect import flow, get_run_logger
 
+from qdash.workflow.engine.scheduler.retry_scheduler import RetryPolicy
+from qdash.workflow.engine.scheduler.topology_index import get_wiring_index
 from qdash.workflow.service import CalibService
 from qdash.workflow.service.calib_service import on_flow_cancellation
 
@@ -80,6 +85,11 @@ def parallel_retry_calibration(
 
     # Frequency offsets for retry: default, +1MHz, -1MHz
     frequency_offsets = [0, 0.001, -0.001]
+    retry_policy = RetryPolicy(
+        offsets=frequency_offsets,
+        # Per-task budgets, e.g. T1 rarely recovers with an offset
+        task_max_attempts={"CheckT1": 1},
+    )
 
     # =========================================================================
     # Execution
@@ -108,6 +118,7 @@ def parallel_retry_calibration(
             "tags": cal.tags,
             "flow_name": cal.flow_name,
             "note": cal.note,
+            "lease": cal.execution_lease,
         }
 
         # === PARALLEL PROCESSES: Run groups using DaskTaskRunner ===
@@ -115,11 +126,16 @@ def parallel_retry_calibration(
             run_groups_with_retry_parallel,
         )
 
+        # Retry groups follow the MUX layout of the chip wiring
+        wiring = get_wiring_index(cal.chip_id)
         results = run_groups_with_retry_parallel(
             groups=groups,
             tasks=tasks,
             offsets=frequency_offsets,
             session_config=session_config,
+            retry_policy=retry_policy,
+            qid_to_mux=dict(wiring.qid_to_mux),
+            mux_conflict_map=wiring.mux_conflict_map(),
         )
 
         # Summary
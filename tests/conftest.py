@@ -62,6 +62,8 @@ os.environ.setdefault("CALIB_DATA_PATH", "/tmp/calib")
 os.environ.setdefault("QPU_DATA_PATH", "/tmp/qpu")
 os.environ.setdefault("SLACK_APP_TOKEN", "test-app-token")
 os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+# Run copilot sandbox code in-process; the worker pool has dedicated tests.
+os.environ.setdefault("QDASH_SANDBOX_POOL_SIZE", "0")
 
 
 def _patched_command(self: Any, command: dict[str, Any] | str, **kwargs: Any) -> dict[str, Any]:
@@ -105,9 +107,12 @@ def init_db() -> Generator[Database[Any], None, None]:
     """
     import qdash.api.db.session as db_session
     from qdash.api.db.session import set_test_client
+    from qdash.api.lib.response_cache import get_response_cache
 
     # Reset global database reference before setting up test database
     db_session._database = None
+    # Cached responses are validated against versions stored in the old database
+    get_response_cache().clear()
 
     # Create in-memory MongoDB client using mongomock
     client: mongomock.MongoClient = mongomock.MongoClient()  # type: ignore[type-arg]
@@ -2,10 +2,18 @@ import importlib
 from collections.abc import Sequence
 from types import SimpleNamespace
 
+import numpy as np
+
 from qdash.analysis.spectroscopy.estimate_qubit_frequency import (
     EstimateQubitFrequencyConfig,
+    QubitResponse,
     estimate_qubit_frequency,
 )
+from qdash.analysis.spectroscopy.representative_y import (
+    FirstPointMeetingWidthFromTipStrategy,
+    HorizontalRunLengthEstimator,
+    PeakRepresentativeYStrategy,
+)
 
 qubit_frequency = importlib.import_module("qdash.analysis.spectroscopy.estimate_qubit_frequency")
 
@@ -47,3 +55,68 @@ def test_retry_with_trim_retries_one_additional_top_row(monkeypatch) -> None:
         ([-40.0, -30.0, -20.0], -10.0),
         ([-40.0, -30.0], -20.0),
     ]
+
+
+def _synthetic_qubit_response() -> QubitResponse:
+    rng = np.random.default_rng(7)
+    xs = np.linspace(7.5, 8.5, 120)
+    ys = np.linspace(-40.0, -2.0, 20)
+    zs = rng.normal(0.0, 0.05, size=(ys.size, xs.size))
+    for center, width, depth in ((8.1, 0.01, 1.0), (7.9, 0.005, 0.6), (7.7, 0.003, 0.4)):
+        for i, power in enumerate(ys):
+            if power > -40.0 + 38.0 * (1 - depth):
+                zs[i] += np.exp(-0.5 * ((xs - center) / (width * (1 + i / 4))) ** 2)
+    return QubitResponse(xs.tolist(), ys.tolist(), zs.tolist(), EstimateQubitFrequencyConfig())
+
+
+def _reference_representative_y(response: QubitResponse, target: int) -> int:
+    """Full-size-mask implementation that predates bounding-box regions."""
+    repr_y_min = int(response.zs.shape[0])
+    strategy = FirstPointMeetingWidthFromTipStrategy(HorizontalRunLengthEstimator(), min_width=2)
+    for peak in sorted(response.peaks, key=lambda p: p.height, reverse=True):
+        idx_y = response.zs.shape[0] - peak.height
+        if idx_y > repr_y_min:
+            break
+        if response.zs_labeled[idx_y, peak.x_start] != target:
+            continue
+        mask = response.zs_labeled == target
+        repr_y_min = min(
+            repr_y_min, int(strategy.compute_representative_y(mask, peak.x_start, idx_y))
+        )
+    return repr_y_min
+
+
+def test_regions_match_full_mask_statistics() -> None:
+    response = _synthetic_qubit_response()
+
+    assert len(response.regions) >= 2
+    for label, region in response.regions.items():
+        full = response.compute_moment(
+            response.zs, response.zs_labeled, response.levers, response.y_diffs, label
+        )
+        assert region.moment == full
+        assert response.compute_representative_y(label) == _reference_representative_y(
+            response, label
+        )
+    assert response.f01 is not None
+    assert response.f01.moment == response.regions[response.f01.label].moment
+
+
+def test_compute_representative_y_is_cached_per_label(monkeypatch) -> None:
+    response = _synthetic_qubit_response()
+    label = next(iter(response.regions))
+    calls: list[tuple[int, int]] = []
+    strategy = response.peak_repr_y_strategy
+
+    class CountingStrategy(PeakRepresentativeYStrategy):
+        def compute_representative_y(self, mask, tip_x, tip_y):
+            calls.append((tip_x, tip_y))
+            return strategy.compute_representative_y(mask, tip_x, tip_y)
+
+    response.peak_repr_y_strategy = CountingStrategy()
+    first = response.compute_representative_y(label)
+    n_calls = len(calls)
+    second = response.compute_representative_y(label)
+
+    assert first == second
+    assert len(calls) == n_calls
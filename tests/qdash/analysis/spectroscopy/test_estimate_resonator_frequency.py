@@ -1,3 +1,12 @@
+from collections.abc import Sequence
+from operator import itemgetter
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+from scipy.ndimage import convolve1d
+from scipy.signal import find_peaks
+
 from qdash.analysis.spectroscopy import BareShiftBoundary
 from qdash.analysis.spectroscopy.estimate_resonator_frequency import (
     ComposeResonancesConfig,
@@ -6,6 +15,11 @@ from qdash.analysis.spectroscopy.estimate_resonator_frequency import (
     Peak,
     PeakGroup,
     Resonance,
+    _arg_closest,
+    _detect_complementary_peaks,
+    _detect_high_power_peak_groups,
+    _detect_peaks_rows,
+    _group_peaks,
     _needs_diverse_reselection,
     _refine_high_power_only_resonance_x,
     _select_diverse_resonances,
@@ -239,3 +253,121 @@ def test_resonator_assignment_order_from_named_patterns() -> None:
     assert resonator_assignment_order_from_pattern("default") == (3, 0, 2, 1)
     assert resonator_assignment_order_from_pattern("16q") == (0, 3, 1, 2)
     assert resolve_resonator_assignment_order() == (3, 0, 2, 1)
+
+
+def _reference_detect_peaks(
+    trace: Sequence[float] | npt.NDArray[np.float64],
+    *,
+    num_resonators: int,
+    smooth_sigma: float,
+    distance: int,
+    prominence: float,
+) -> tuple[list[int], list[float]]:
+    """Row-by-row peak detection as implemented before vectorization."""
+    _trace = np.asarray(trace)
+    if smooth_sigma and smooth_sigma > 0:
+        radius = int(3 * smooth_sigma)
+        x = np.arange(-radius, radius + 1)
+        kernel = np.exp(-0.5 * (x / smooth_sigma) ** 2)
+        kernel /= kernel.sum()
+        _trace = convolve1d(_trace, kernel, mode="nearest")
+    peaks, props = find_peaks(_trace, distance=distance, prominence=prominence)
+    if peaks.size == 0:
+        return [], []
+    sorted_peaks = sorted(zip(props["prominences"], peaks, strict=False), reverse=True)
+    top_peaks = sorted(sorted_peaks[:num_resonators], key=itemgetter(1))
+    prominences, indices = zip(*top_peaks, strict=False)
+    return [int(i) for i in indices], [float(p) for p in prominences]
+
+
+def _synthetic_spectroscopy(
+    seed: int, n_rows: int = 31, n_cols: int = 201
+) -> npt.NDArray[np.float64]:
+    rng = np.random.default_rng(seed)
+    xs = np.arange(n_cols)
+    zs = rng.normal(0.0, 0.15, size=(n_rows, n_cols))
+    for center in rng.uniform(10, n_cols - 10, size=5):
+        for y in range(n_rows):
+            shifted = center + 0.3 * max(0, y - n_rows // 2)
+            zs[y] += rng.uniform(0.5, 2.0) * np.exp(-0.5 * ((xs - shifted) / 2.0) ** 2)
+    # Plateaus and a flat row exercise scipy's flat-peak handling.
+    zs[3, 50:55] = 3.0
+    zs[4] = 0.0
+    return zs
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize(
+    ("smooth_sigma", "distance", "prominence"),
+    [(1.0, 10, 0.35), (0.0, 5, 0.05), (2.5, 3, 0.1), (1.0, 1, 0.0)],
+)
+def test_detect_peaks_rows_matches_row_by_row_detection(
+    seed: int, smooth_sigma: float, distance: int, prominence: float
+) -> None:
+    zs = _synthetic_spectroscopy(seed)
+    num_resonators = 8
+
+    rows = _detect_peaks_rows(
+        zs.tolist(),
+        num_resonators=num_resonators,
+        smooth_sigma=smooth_sigma,
+        distance=distance,
+        prominence=prominence,
+    )
+
+    expected = [
+        _reference_detect_peaks(
+            row,
+            num_resonators=num_resonators,
+            smooth_sigma=smooth_sigma,
+            distance=distance,
+            prominence=prominence,
+        )
+        for row in zs
+    ]
+    assert [idx for idx, _ in rows] == [idx for idx, _ in expected]
+    for (_, got), (_, want) in zip(rows, expected, strict=True):
+        np.testing.assert_allclose(got, want)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_detect_high_power_peak_groups_matches_row_by_row_grouping(seed: int) -> None:
+    zs = _synthetic_spectroscopy(seed)
+    ys = list(np.linspace(-40.0, 0.0, zs.shape[0]))
+    config = EstimateResonatorFrequencyConfig()
+    conf = config.find_peaks_conf_high
+    y_min, y_max = _arg_closest(ys, -20.0), _arg_closest(ys, 0.0)
+
+    expected_peaks: list[Peak] = []
+    for y_idx in range(y_min, y_max + 1):
+        idx, prom = _reference_detect_peaks(
+            zs[y_idx],
+            num_resonators=config.num_resonators * 2,
+            smooth_sigma=conf.smooth_sigma,
+            distance=conf.distance,
+            prominence=conf.prominence,
+        )
+        expected_peaks.extend(Peak(x, y_idx, p) for x, p in zip(idx, prom, strict=True))
+    expected = _group_peaks(expected_peaks, 2, 25)
+
+    groups = _detect_high_power_peak_groups(ys, zs.tolist(), config)
+
+    assert [[(p.x, p.y) for p in g.peaks] for g in groups] == [
+        [(p.x, p.y) for p in g.peaks] for g in expected
+    ]
+    complementary = _detect_complementary_peaks(ys, zs.tolist(), config, [])
+    assert sorted(complementary) == list(range(y_min, y_max + 1))
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        [-60.0, -55.0, -50.0, -45.0, -40.0],
+        [0.0, -5.0, -10.0, -15.0],
+        [1.0, 3.0, 2.0, 5.0],
+        [7.0],
+    ],
+)
+@pytest.mark.parametrize("v", [-100.0, -52.5, -50.0, -47.0, -7.5, 0.0, 2.5, 4.0, 100.0])
+def test_arg_closest_matches_argmin(arr: list[float], v: float) -> None:
+    assert _arg_closest(arr, v) == int(np.argmin([abs(x - v) for x in arr]))
@@ -0,0 +1,116 @@
+"""Tests for qdash.api.lib.chart_render and the metrics PDF chart pipeline."""
+
+from __future__ import annotations
+
+import io
+
+import plotly.graph_objects as go
+import pytest
+from PIL import Image
+
+from qdash.api.lib import chart_render
+from qdash.api.lib.chart_render import (
+    ChartImageCache,
+    ChartRenderer,
+    ChartStyle,
+    build_chart_request,
+)
+from qdash.api.lib.metrics_pdf import MetricsPDFGenerator
+from qdash.api.schemas.metrics import ChipMetricsResponse, MetricValue
+
+
+@pytest.fixture
+def render_calls(monkeypatch) -> list[str]:
+    """Replace Kaleido with a stub that records each rendered figure."""
+    calls: list[str] = []
+
+    def fake_render(figure_json: str, style: ChartStyle) -> bytes:
+        calls.append(figure_json)
+        buffer = io.BytesIO()
+        Image.new("RGB", (4 * style.scale, 3 * style.scale), (len(calls), 0, 0)).save(
+            buffer, format=style.format
+        )
+        return buffer.getvalue()
+
+    monkeypatch.setattr(chart_render, "render_figure_json", fake_render)
+    return calls
+
+
+def _figure(y: list[float]) -> go.Figure:
+    return go.Figure(go.Scatter(x=list(range(len(y))), y=y))
+
+
+class TestBuildChartRequest:
+    def test_key_depends_on_figure_content_and_style(self):
+        a = build_chart_request("chip", "t1", _figure([1.0, 2.0]))
+        b = build_chart_request("chip", "t1", _figure([1.0, 2.0]))
+        c = build_chart_request("chip", "t1", _figure([1.0, 3.0]))
+        d = build_chart_request("chip", "t1", _figure([1.0, 2.0]), ChartStyle(scale=1))
+
+        assert a.key == b.key
+        assert a.key.data_hash != c.key.data_hash
+        assert a.key != d.key
+
+
+class TestChartImageCache:
+    def test_evicts_least_recently_used(self):
+        cache = ChartImageCache(max_entries=2)
+        keys = [build_chart_request("chip", str(i), _figure([float(i)])).key for i in range(3)]
+        cache.put(keys[0], b"0")
+        cache.put(keys[1], b"1")
+        assert cache.get(keys[0]) == b"0"
+
+        cache.put(keys[2], b"2")
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == b"0"
+        assert len(cache) == 2
+
+
+class TestChartRenderer:
+    def test_render_many_deduplicates_and_caches(self, render_calls):
+        renderer = ChartRenderer(max_workers=0)
+        first = build_chart_request("chip", "t1", _figure([1.0]))
+        second = build_chart_request("chip", "t2", _figure([2.0]))
+
+        images = renderer.render_many([first, second, first])
+        again = renderer.render_many([first, second])
+
+        assert len(render_calls) == 2
+        assert images == again
+        assert set(images) == {first.key, second.key}
+
+
+def _metrics_response() -> ChipMetricsResponse:
+    values = {f"Q{i:02d}": MetricValue(value=float(i + 1)) for i in range(4)}
+    return ChipMetricsResponse(
+        chip_id="64Q",
+        username="alice",
+        qubit_count=4,
+        qubit_metrics={"t1": values, "qubit_frequency": values},
+        coupling_metrics={"zx90_gate_fidelity": {"0-1": MetricValue(value=0.99)}},
+    )
+
+
+class TestMetricsPDFGenerator:
+    def test_all_charts_are_rendered_before_drawing_and_reused(self, render_calls):
+        renderer = ChartRenderer(max_workers=0)
+        generator = MetricsPDFGenerator(_metrics_response())
+        n_charts = sum(page.chart is not None for page in generator._plan_pages())
+
+        renderer_calls: list[int] = []
+        original = renderer.render_many
+
+        def spy(requests):
+            requests = list(requests)
+            renderer_calls.append(len(requests))
+            return original(requests)
+
+        renderer.render_many = spy  # type: ignore[method-assign]
+        pdf = generator.generate_pdf(renderer=renderer)
+        generator.generate_pdf(renderer=renderer)
+
+        assert pdf.getvalue().startswith(b"%PDF")
+        assert n_charts > 0
+        assert renderer_calls == [n_charts, n_charts]
+        assert len(render_calls) == n_charts
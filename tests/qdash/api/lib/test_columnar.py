@@ -0,0 +1,45 @@
+"""Tests for columnar timeseries responses."""
+
+import json
+import sys
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from qdash.api.lib.columnar import ColumnarSeries, SeriesFormat, series_response
+
+
+def _series() -> ColumnarSeries:
+    series = ColumnarSeries()
+    series.add("0", datetime(2026, 1, 1), 1.5, float("nan"), "task-1")
+    series.add("0", datetime(2026, 1, 2, tzinfo=timezone.utc), 2.5, 0.1, "task-2")
+    series.set_meta("0", unit="us")
+    return series
+
+
+class TestSeriesResponse:
+    def test_columnar_json_has_one_array_per_field(self):
+        response = series_response(_series(), SeriesFormat.COLUMNAR, metric_name="t1")
+
+        assert response.media_type == "application/json"
+        assert json.loads(bytes(response.body)) == {
+            "metric_name": "t1",
+            "data": {
+                "0": {
+                    "t": ["2026-01-01T00:00:00+00:00", "2026-01-02T00:00:00+00:00"],
+                    "value": [1.5, 2.5],
+                    "error": [None, 0.1],
+                    "task_id": ["task-1", "task-2"],
+                    "unit": "us",
+                }
+            },
+        }
+
+    def test_arrow_without_pyarrow_is_service_unavailable(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            series_response(_series(), SeriesFormat.ARROW)
+        assert exc_info.value.status_code == 503
+        assert "pyarrow" in exc_info.value.detail
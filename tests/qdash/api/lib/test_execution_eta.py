@@ -0,0 +1,144 @@
+"""Tests for execution remaining-time estimation."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from qdash.api.lib.execution_eta import (
+    DurationEstimate,
+    DurationModel,
+    ExecutionTaskState,
+    estimate_progress,
+)
+from qdash.datamodel.execution import ExecutionPlanModel
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _stat(
+    name: str, mean: float, stddev: float = 0.0, batch_size: int = 1, count: int = 5
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "batch_size": batch_size,
+        "count": count,
+        "mean_seconds": mean,
+        "stddev_seconds": stddev,
+    }
+
+
+def _row(
+    name: str,
+    qid: str,
+    status: str,
+    start_at: datetime | None = None,
+    end_at: datetime | None = None,
+) -> dict[str, Any]:
+    return {"name": name, "qid": qid, "status": status, "start_at": start_at, "end_at": end_at}
+
+
+def _estimate(model: DurationModel, task_name: str, batch_size: int = 1) -> DurationEstimate:
+    estimate = model.estimate(task_name, batch_size)
+    assert estimate is not None
+    return estimate
+
+
+class TestDurationModel:
+    def test_nearest_batch_size_and_median_fallback(self):
+        model = DurationModel(
+            [
+                _stat("A", 10.0, batch_size=1),
+                _stat("A", 40.0, batch_size=4),
+                _stat("B", 30.0),
+            ]
+        )
+
+        assert _estimate(model, "A", 4).mean == 40.0
+        assert _estimate(model, "A", 3).mean == 40.0
+        assert _estimate(model, "A", 2).mean == 10.0
+        unknown = _estimate(model, "C")
+        assert unknown.mean == 30.0
+        assert unknown.variance == 900.0
+        assert unknown.samples == 0
+
+    def test_empty_model_has_no_estimate(self):
+        model = DurationModel([])
+
+        assert not model
+        assert model.estimate("A") is None
+
+
+class TestExecutionTaskState:
+    def test_finished_rows_replace_running_and_advance_watermark(self):
+        state = ExecutionTaskState()
+        state.apply([_row("A", "0", "running", start_at=NOW)])
+        state.apply([_row("A", "0", "completed", end_at=NOW), _row("A", "1", "pending")])
+
+        assert state.finished == {("A", "0")}
+        assert state.running == {}
+        assert state.watermark == NOW
+
+
+class TestEstimateProgress:
+    def test_steps_add_up_and_wait_for_slowest_lane(self):
+        plan = ExecutionPlanModel(tasks=["A", "B"], steps=[[["0"], ["1", "2"]], [["3"]]])
+        model = DurationModel([_stat("A", 10.0, stddev=3.0), _stat("B", 20.0, stddev=4.0)])
+
+        progress = estimate_progress(plan, ExecutionTaskState(), model, NOW)
+
+        assert progress.total_units == 8
+        assert progress.completed_units == 0
+        # Step 1: the two-qid lane takes 60s; step 2: 30s.
+        assert progress.remaining_seconds == pytest.approx(90.0)
+        assert progress.remaining_stddev == pytest.approx((3 * (9 + 16)) ** 0.5)
+        assert progress.samples == 10
+
+    def test_running_unit_is_credited_with_elapsed_time(self):
+        plan = ExecutionPlanModel(tasks=["A", "B"], steps=[[["0"]]])
+        model = DurationModel([_stat("A", 10.0), _stat("B", 20.0)])
+        state = ExecutionTaskState()
+        state.apply(
+            [
+                _row("A", "0", "completed", end_at=NOW - timedelta(seconds=5)),
+                _row("B", "0", "running", start_at=NOW - timedelta(seconds=15)),
+            ]
+        )
+
+        progress = estimate_progress(plan, state, model, NOW)
+
+        assert progress.completed_units == 1
+        assert progress.remaining_seconds == pytest.approx(5.0)
+
+    def test_started_later_units_mark_earlier_ones_done(self):
+        # Qid "1" never recorded task A (e.g. a MUX-level task run on "0" only).
+        plan = ExecutionPlanModel(tasks=["A", "B"], steps=[[["0", "1"]], [["2"]]])
+        model = DurationModel([_stat("A", 10.0), _stat("B", 20.0)])
+        state = ExecutionTaskState()
+        state.apply([_row("A", "2", "running", start_at=NOW)])
+
+        progress = estimate_progress(plan, state, model, NOW)
+
+        assert progress.completed_units == 4
+        assert progress.remaining_seconds == pytest.approx(30.0)
+
+    def test_batch_plan_runs_each_task_once_per_step(self):
+        plan = ExecutionPlanModel(tasks=["A"], steps=[[["0", "1", "2"]], [["3"]]], batch=True)
+        model = DurationModel([_stat("A", 60.0, batch_size=3), _stat("A", 25.0, batch_size=1)])
+
+        progress = estimate_progress(plan, ExecutionTaskState(), model, NOW)
+
+        assert progress.total_units == 2
+        assert progress.remaining_seconds == pytest.approx(85.0)
+
+    def test_progress_without_history_has_no_remaining_time(self):
+        plan = ExecutionPlanModel(tasks=["A"], steps=[[["0"], ["1"]]])
+        state = ExecutionTaskState()
+        state.apply([_row("A", "0", "completed", end_at=NOW)])
+
+        progress = estimate_progress(plan, state, DurationModel([]), NOW)
+
+        assert progress.completed_units == 1
+        assert progress.total_units == 2
+        assert progress.remaining_seconds is None
+        assert progress.remaining_stddev is None
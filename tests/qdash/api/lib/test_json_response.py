@@ -0,0 +1,50 @@
+"""Tests for the orjson-based response serialization."""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from qdash.api.lib.json_response import ORJSONResponse, dumps_json
+
+
+class _Point(BaseModel):
+    t: datetime
+    value: float | None = None
+
+
+class TestDumpsJson:
+    def test_model_matches_fastapi_encoding(self):
+        point = _Point(t=datetime(2026, 1, 1, tzinfo=timezone.utc), value=1.5)
+
+        assert json.loads(dumps_json(point)) == jsonable_encoder(point)
+
+    def test_numpy_and_python_extras(self):
+        content = {
+            "array": np.array([1.0, 2.0]),
+            "scalar": np.int64(3),
+            "decimal": Decimal("0.5"),
+            "set": {"a"},
+            "nan": float("nan"),
+            "naive": datetime(2026, 1, 1, 9, 0),
+            "model": _Point(t=datetime(2026, 1, 1, tzinfo=timezone.utc)),
+        }
+
+        assert json.loads(dumps_json(content)) == {
+            "array": [1.0, 2.0],
+            "scalar": 3,
+            "decimal": 0.5,
+            "set": ["a"],
+            "nan": None,
+            "naive": "2026-01-01T09:00:00+00:00",
+            "model": {"t": "2026-01-01T00:00:00Z", "value": None},
+        }
+
+    def test_response_renders_with_orjson(self):
+        response = ORJSONResponse({"value": np.float32(0.5)})
+
+        assert response.body == b'{"value":0.5}'
+        assert response.media_type == "application/json"
@@ -0,0 +1,79 @@
+"""Tests for the unread notification counter stream."""
+
+import pytest
+
+from qdash.api.lib.notification_stream import (
+    bump_counter_version,
+    counter_version,
+    unread_count_events,
+)
+
+
+class _Client:
+    """Reads a scripted unread count and disconnects after ``ticks`` polls."""
+
+    def __init__(self, counts: list[int], ticks: int) -> None:
+        self.counts = counts
+        self.reads = 0
+        self.ticks = ticks
+
+    def read_count(self) -> int:
+        self.reads += 1
+        return self.counts[min(self.reads, len(self.counts)) - 1]
+
+    async def is_disconnected(self) -> bool:
+        self.ticks -= 1
+        if self.ticks == 2:
+            bump_counter_version("user-stream")
+        return self.ticks < 0
+
+
+def test_counter_version_increments_per_user() -> None:
+    before = counter_version("user-a")
+    bump_counter_version("user-a")
+    assert counter_version("user-a") == before + 1
+    assert counter_version("user-never-bumped") == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_initial_count_and_changes_only() -> None:
+    client = _Client(counts=[3, 4], ticks=6)
+
+    frames = [
+        frame
+        async for frame in unread_count_events(
+            "user-stream",
+            client.read_count,
+            client.is_disconnected,
+            poll_seconds=0,
+            resync_seconds=3600,
+            heartbeat_seconds=3600,
+        )
+    ]
+
+    # One read on connect, one after the in-process bump; no reads in between.
+    assert client.reads == 2
+    assert frames == [
+        'event: unread_count\ndata: {"unread_count": 3}\n\n',
+        'event: unread_count\ndata: {"unread_count": 4}\n\n',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_resyncs_without_repeating_unchanged_count() -> None:
+    client = _Client(counts=[2], ticks=3)
+
+    frames = [
+        frame
+        async for frame in unread_count_events(
+            "user-resync",
+            client.read_count,
+            client.is_disconnected,
+            poll_seconds=0,
+            resync_seconds=0,
+            heartbeat_seconds=3600,
+        )
+    ]
+
+    assert client.reads == 3
+    assert frames == ['event: unread_count\ndata: {"unread_count": 2}\n\n']
@@ -0,0 +1,60 @@
+"""Tests for the ETag response cache."""
+
+from qdash.api.lib.response_cache import ResponseCache, compute_etag, etag_matches
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.current = 0.0
+
+    def __call__(self) -> float:
+        return self.current
+
+
+class TestResponseCache:
+    def test_entry_is_invalidated_by_version_change(self):
+        cache = ResponseCache(max_entries=4, ttl_seconds=60)
+        entry = cache.put(("p", "", "/chips/c"), 1, b'{"a":1}')
+
+        assert cache.get(("p", "", "/chips/c"), 1) == entry
+        assert cache.get(("p", "", "/chips/c"), 2) is None
+        assert len(cache) == 0
+
+    def test_entry_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = ResponseCache(max_entries=4, ttl_seconds=10, clock=clock)
+        cache.put(("k",), 0, b"{}")
+
+        clock.current = 10
+        assert cache.get(("k",), 0) is not None
+        clock.current = 10.5
+        assert cache.get(("k",), 0) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        cache.put(("a",), 0, b"a")
+        cache.put(("b",), 0, b"b")
+        cache.get(("a",), 0)
+        cache.put(("c",), 0, b"c")
+
+        assert cache.get(("b",), 0) is None
+        assert cache.get(("a",), 0) is not None
+        assert cache.get(("c",), 0) is not None
+
+
+class TestEtag:
+    def test_etag_is_strong_and_content_derived(self):
+        etag = compute_etag(b'{"a":1}')
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == compute_etag(b'{"a":1}')
+        assert etag != compute_etag(b'{"a":2}')
+
+    def test_if_none_match_parsing(self):
+        etag = compute_etag(b"x")
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
@@ -0,0 +1,79 @@
+"""Tests for qdash.api.lib.topology_plot."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from qdash.api.lib import topology_plot
+from qdash.api.lib.topology_plot import TopologyPlotCache, TopologyPlotStyle, topology_plot_key
+
+
+def _device(fidelity: float = 0.99, rzx90: int = 200) -> dict[str, Any]:
+    return {
+        "name": "anemone",
+        "device_id": "anemone",
+        "qubits": [
+            {"id": 0, "physical_id": 0, "fidelity": fidelity, "position": {"x": 0, "y": 0}},
+            {"id": 1, "physical_id": 1, "fidelity": 0.98, "position": {"x": 1, "y": 0}},
+        ],
+        "couplings": [
+            {"control": 0, "target": 1, "fidelity": 0.9, "gate_duration": {"rzx90": rzx90}},
+        ],
+    }
+
+
+@pytest.fixture
+def render_calls(monkeypatch) -> list[dict[str, Any]]:
+    """Replace matplotlib rendering with a stub that records each call."""
+    calls: list[dict[str, Any]] = []
+
+    def fake_render(data: dict[str, Any], style: TopologyPlotStyle) -> bytes:
+        calls.append(data)
+        return f"png-{len(calls)}".encode()
+
+    monkeypatch.setattr(topology_plot, "render_topology_plot", fake_render)
+    return calls
+
+
+def test_key_ignores_inputs_that_are_not_drawn() -> None:
+    style = TopologyPlotStyle()
+
+    assert topology_plot_key(_device(rzx90=200), style) == topology_plot_key(
+        _device(rzx90=400), style
+    )
+    assert topology_plot_key(_device(fidelity=0.99), style) != topology_plot_key(
+        _device(fidelity=0.97), style
+    )
+    assert topology_plot_key(_device(), style) != topology_plot_key(
+        _device(), TopologyPlotStyle(dpi=100)
+    )
+
+
+def test_cache_serves_memory_then_disk_without_rerendering(tmp_path, render_calls) -> None:
+    cache = TopologyPlotCache(cache_dir=tmp_path)
+
+    first = cache.get_or_render(_device())
+    assert cache.get_or_render(_device(rzx90=400)) == first
+
+    cache.clear()
+    key = topology_plot_key(_device(), TopologyPlotStyle())
+    assert cache.get_cached(key) is None
+    assert cache.get_or_render(_device()) == first
+    assert len(render_calls) == 1
+
+
+def test_disk_tier_is_bounded(tmp_path, render_calls) -> None:
+    cache = TopologyPlotCache(cache_dir=tmp_path, max_disk_entries=2)
+
+    for fidelity in (0.91, 0.92, 0.93):
+        cache.get_or_render(_device(fidelity=fidelity))
+
+    assert len(list(tmp_path.glob("*.png"))) == 2
+
+
+def test_render_topology_plot_returns_png() -> None:
+    image = topology_plot.render_topology_plot(_device(), TopologyPlotStyle(dpi=20))
+
+    assert image.startswith(b"\x89PNG")
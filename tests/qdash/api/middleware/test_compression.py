@@ -0,0 +1,107 @@
+"""Tests for the response compression middleware."""
+
+import gzip
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from qdash.api.middleware.compression import CompressionMiddleware, select_encoding
+
+LARGE = {"qubits": [{"qid": str(i), "status": "calibrated"} for i in range(200)]}
+
+
+def _client(minimum_size: int = 500) -> TestClient:
+    async def large(_request):
+        return JSONResponse(LARGE, headers={"ETag": '"abc"'})
+
+    async def small(_request):
+        return JSONResponse({"ok": True})
+
+    async def png(_request):
+        return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+    async def stream(_request):
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}," * 100
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def events(_request):
+        async def chunks():
+            yield "data: hello\n\n" * 200
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    app = Starlette(
+        routes=[
+            Route("/large", large),
+            Route("/small", small),
+            Route("/png", png),
+            Route("/stream", stream),
+            Route("/events", events),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+    return TestClient(app)
+
+
+def _raw_get(client: TestClient, path: str, accept_encoding: str = "gzip"):
+    # ``stream`` exposes the raw (still compressed) bytes.
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestSelectEncoding:
+    def test_prefers_gzip_without_brotli(self, monkeypatch):
+        monkeypatch.setattr("qdash.api.middleware.compression.brotli", None)
+        assert select_encoding("br, gzip") == "gzip"
+
+    def test_respects_zero_quality(self):
+        assert select_encoding("gzip;q=0") is None
+        assert select_encoding("identity") is None
+        assert select_encoding("*") in ("br", "gzip")
+
+
+class TestCompressionMiddleware:
+    def test_large_json_is_gzipped(self):
+        response, raw = _raw_get(_client(), "/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["content-length"] == str(len(raw))
+        assert response.headers["etag"] == '"abc"'
+        assert gzip.decompress(raw) == JSONResponse(LARGE).body
+        assert len(raw) < len(JSONResponse(LARGE).body) / 5
+
+    def test_small_body_is_sent_uncompressed(self):
+        response, raw = _raw_get(_client(), "/small")
+
+        assert "content-encoding" not in response.headers
+        assert raw == b'{"ok":true}'
+
+    def test_already_compressed_type_is_skipped(self):
+        response, raw = _raw_get(_client(), "/png")
+
+        assert "content-encoding" not in response.headers
+        assert raw.startswith(b"\x89PNG")
+
+    def test_event_stream_is_not_compressed(self):
+        response, _ = _raw_get(_client(), "/events")
+
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_body_is_compressed_incrementally(self):
+        response, raw = _raw_get(_client(), "/stream")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(raw).decode() == "".join(f"chunk-{i}," * 100 for i in range(3))
+
+    def test_client_without_accept_encoding_gets_identity(self):
+        response, raw = _raw_get(_client(), "/large", accept_encoding="identity")
+
+        assert "content-encoding" not in response.headers
+        assert raw == JSONResponse(LARGE).body
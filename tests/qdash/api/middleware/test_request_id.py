@@ -0,0 +1,58 @@
+"""Tests for the request ID middleware."""
+
+import logging
+from collections.abc import AsyncIterator
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from qdash.api.middleware.request_id import (
+    HEADER_NAME,
+    REQUEST_ID_CTX_VAR,
+    RequestIdFilter,
+    RequestIdMiddleware,
+)
+
+
+def _client() -> TestClient:
+    async def echo(_request: Request) -> Response:
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, "msg", None, None)
+        RequestIdFilter().filter(record)
+        return JSONResponse({"logged": record.__dict__["request_id"]})
+
+    async def stream(_request: Request) -> Response:
+        async def chunks() -> AsyncIterator[str]:
+            yield "a"
+            yield "b"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    app = Starlette(routes=[Route("/echo", echo), Route("/stream", stream)])
+    app.add_middleware(RequestIdMiddleware)
+    return TestClient(app)
+
+
+def test_incoming_request_id_is_propagated_to_logs_and_response() -> None:
+    response = _client().get("/echo", headers={HEADER_NAME: "req-123"})
+
+    assert response.headers[HEADER_NAME] == "req-123"
+    assert response.json() == {"logged": "req-123"}
+    assert REQUEST_ID_CTX_VAR.get() == ""
+
+
+def test_request_id_is_generated_when_missing() -> None:
+    response = _client().get("/echo")
+
+    request_id = response.headers.get(HEADER_NAME)
+    assert request_id is not None
+    assert len(request_id) == 8
+    assert response.json() == {"logged": request_id}
+
+
+def test_streaming_response_passes_through() -> None:
+    with _client().stream("GET", "/stream") as response:
+        assert response.headers[HEADER_NAME]
+        assert b"".join(response.iter_bytes()) == b"ab"
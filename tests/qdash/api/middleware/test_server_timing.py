@@ -0,0 +1,106 @@
+"""Tests for Server-Timing collection."""
+
+import logging
+import time
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from pymongo.monitoring import CommandFailedEvent, CommandSucceededEvent
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from qdash.api.lib.json_response import dumps_json
+from qdash.api.lib.request_timing import (
+    REQUEST_TIMINGS_CTX_VAR,
+    MongoCommandTimer,
+    RequestTimings,
+    timed,
+)
+from qdash.api.middleware.server_timing import ServerTimingMiddleware, format_server_timing
+
+
+def _succeeded(duration_micros: int) -> CommandSucceededEvent:
+    return cast("CommandSucceededEvent", SimpleNamespace(duration_micros=duration_micros))
+
+
+def _client() -> TestClient:
+    listener = MongoCommandTimer()
+
+    def sync_endpoint(_request: Request) -> Response:
+        # Sync endpoints run in the thread pool with the request context copied.
+        listener.succeeded(_succeeded(4000))
+        listener.failed(cast("CommandFailedEvent", SimpleNamespace(duration_micros=1000)))
+        return JSONResponse({"ok": True})
+
+    async def serializing_endpoint(_request: Request) -> Response:
+        with timed("render"):
+            time.sleep(0.002)
+        return JSONResponse(dumps_json({"value": 1}).decode())
+
+    app = Starlette(routes=[Route("/db", sync_endpoint), Route("/serialize", serializing_endpoint)])
+    app.add_middleware(ServerTimingMiddleware)
+    return TestClient(app)
+
+
+def _entries(header: str | None) -> dict[str, str]:
+    assert header is not None
+    return {entry.split(";")[0]: entry for entry in header.split(", ")}
+
+
+def test_db_time_from_command_listener_is_reported() -> None:
+    response = _client().get("/db")
+
+    entries = _entries(response.headers.get("server-timing"))
+    assert entries["db"] == 'db;dur=5.0;desc="2 commands"'
+    assert set(entries) == {"db", "handler", "app"}
+
+
+def test_recorded_phases_are_reported_separately() -> None:
+    response = _client().get("/serialize")
+
+    entries = _entries(response.headers.get("server-timing"))
+    assert {"db", "render", "serialize", "handler", "app"} <= set(entries)
+    assert float(entries["render"].split("dur=")[1]) >= 2.0
+
+
+def test_request_is_logged_with_timings(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO, logger="qdash.api.timing"):
+        _client().get("/db")
+
+    record = next(r for r in caplog.records if r.name == "qdash.api.timing")
+    fields = record.__dict__
+    assert fields["path"] == "/db"
+    assert fields["status"] == 200
+    assert fields["db_commands"] == 2
+    assert fields["db_ms"] == 5.0
+    assert fields["duration_ms"] >= fields["app_ms"]
+
+
+def test_nothing_is_recorded_outside_a_request() -> None:
+    MongoCommandTimer().succeeded(_succeeded(1000))
+    with timed("serialize"):
+        pass
+
+    assert REQUEST_TIMINGS_CTX_VAR.get() is None
+
+
+def test_handler_time_excludes_db_and_recorded_phases() -> None:
+    timings = RequestTimings()
+    timings.add_db(0.010)
+    timings.add_phase("serialize", 0.015)
+
+    assert format_server_timing(timings, 0.040) == (
+        'db;dur=10.0;desc="1 commands", serialize;dur=15.0, handler;dur=15.0, app;dur=40.0'
+    )
+
+
+def test_handler_time_is_clamped_at_zero() -> None:
+    timings = RequestTimings()
+    timings.add_db(0.030)
+    timings.add_phase("serialize", 0.015)
+
+    assert "handler;dur=0.0" in format_server_timing(timings, 0.040)
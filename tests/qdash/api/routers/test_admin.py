@@ -379,6 +379,46 @@ class TestAdminProjectsEndpoints:
         assert "total" in data
         assert data["total"] >= 1
 
+    def test_list_all_projects_member_counts_and_cursor(
+        self, test_client, admin_user, project_owner, test_project, admin_headers
+    ):
+        """Member counts come from the listing; cursors page through every project."""
+        for username in ("alice", "bob"):
+            ProjectMembershipDocument(
+                project_id="proj-owner",
+                user_id=f"uid-{username}",
+                username=username,
+                role=ProjectRole.VIEWER,
+                status="active",
+            ).insert()
+        ProjectDocument(
+            project_id="proj-zzz",
+            name="Another Project",
+            owner_user_id=admin_user.user_id,
+            owner_username="admin",
+            system_info=SystemInfoModel(),
+        ).insert()
+
+        first = test_client.get(
+            "/admin/projects", params={"limit": 1, "cursor": ""}, headers=admin_headers
+        ).json()
+        assert [p["project_id"] for p in first["projects"]] == ["proj-owner"]
+        assert first["projects"][0]["member_count"] == 2
+        assert first["total"] == 2
+
+        second = test_client.get(
+            "/admin/projects",
+            params={"limit": 1, "cursor": first["next_cursor"]},
+            headers=admin_headers,
+        ).json()
+        assert [p["project_id"] for p in second["projects"]] == ["proj-zzz"]
+        assert second["projects"][0]["member_count"] == 0
+
+        invalid = test_client.get(
+            "/admin/projects", params={"cursor": "not-a-cursor"}, headers=admin_headers
+        )
+        assert invalid.status_code == 400
+
     def test_list_projects_requires_admin(
         self, test_client, admin_user, project_owner, test_project, user_headers
     ):
@@ -448,3 +448,170 @@ class TestChipRouter:
         )
 
         assert response.status_code == 403
+
+
+class TestBulkMetrics:
+    """Tests for POST /chips/metrics/bulk."""
+
+    def test_returns_scaled_matrix_for_requested_chips(
+        self, test_client, test_project, auth_headers
+    ):
+        for chip_id, fidelity in (("chip_a", 0.99), ("chip_b", 0.98)):
+            QubitDocument(
+                project_id="test_project",
+                username="test_user",
+                chip_id=chip_id,
+                qid="0",
+                data={
+                    "t1": {"value": 50.0, "unit": "μs"},
+                    "x90_gate_fidelity": {"value": fidelity, "unit": ""},
+                },
+                system_info=SystemInfoModel(),
+            ).insert()
+
+        response = test_client.post(
+            "/chips/metrics/bulk",
+            json={"chip_ids": ["chip_a", "chip_b"], "fields": ["t1", "x90_gate_fidelity"]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["fields"] == ["t1", "x90_gate_fidelity"]
+        assert body["units"] == ["μs", "%"]
+        assert [(r["chip_id"], r["qid"]) for r in body["rows"]] == [
+            ("chip_a", "0"),
+            ("chip_b", "0"),
+        ]
+        assert body["rows"][0]["values"] == pytest.approx([50.0, 99.0])
+
+    def test_rejects_invalid_field(self, test_client, test_project, auth_headers):
+        response = test_client.post(
+            "/chips/metrics/bulk",
+            json={"chip_ids": ["chip_a"], "fields": ["data.t1.value"]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
+
+class TestChipResponseCaching:
+    """Tests for ETag/conditional-GET handling on cached chip endpoints."""
+
+    @pytest.fixture
+    def chip_with_qubit(self, test_project):
+        ChipDocument(
+            project_id="test_project",
+            chip_id="cached_chip",
+            username="test_user",
+            size=64,
+            topology_id="square-lattice-mux-64",
+            system_info=SystemInfoModel(),
+        ).insert()
+        QubitDocument(
+            project_id="test_project",
+            username="test_user",
+            chip_id="cached_chip",
+            qid="0",
+            data={"t1": {"value": 10.0}},
+            system_info=SystemInfoModel(),
+        ).insert()
+
+    def test_calibration_write_invalidates_cached_qubits(
+        self, test_client, chip_with_qubit, auth_headers
+    ):
+        url = "/chips/cached_chip/qubits"
+        first = test_client.get(url, headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        not_modified = test_client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.content == b""
+
+        QubitDocument.update_calib_data(
+            username="test_user",
+            qid="0",
+            chip_id="cached_chip",
+            output_parameters={"t1": {"value": 42.0}},
+            project_id="test_project",
+        )
+
+        refreshed = test_client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["etag"] != etag
+        assert refreshed.json()["qubits"][0]["data"]["t1"]["value"] == 42.0
+
+    def test_query_parameters_are_part_of_the_cache_key(
+        self, test_client, chip_with_qubit, auth_headers
+    ):
+        QubitDocument(
+            project_id="test_project",
+            username="test_user",
+            chip_id="cached_chip",
+            qid="1",
+            data={},
+            system_info=SystemInfoModel(),
+        ).insert()
+
+        everything = test_client.get("/chips/cached_chip/qubits", headers=auth_headers)
+        only_one = test_client.get(
+            "/chips/cached_chip/qubits", params={"qids": ["1"]}, headers=auth_headers
+        )
+
+        assert everything.json()["total"] == 2
+        assert [q["qid"] for q in only_one.json()["qubits"]] == ["1"]
+        assert everything.headers["etag"] != only_one.headers["etag"]
+
+    def test_chip_update_invalidates_cached_chip(self, test_client, chip_with_qubit, auth_headers):
+        etag = test_client.get("/chips/cached_chip", headers=auth_headers).headers["etag"]
+
+        test_client.patch(
+            "/chips/cached_chip", json={"activity_status": "inactive"}, headers=auth_headers
+        )
+        response = test_client.get(
+            "/chips/cached_chip", headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["activity_status"] == "inactive"
+
+    def test_note_edit_invalidates_cached_chip(self, test_client, chip_with_qubit, auth_headers):
+        first = test_client.get("/chips/cached_chip", headers=auth_headers)
+        etag = first.headers["etag"]
+        assert first.json()["note"]["content"] == ""
+
+        edited = test_client.put(
+            "/chips/cached_chip/note", json={"content": "retuned"}, headers=auth_headers
+        )
+        response = test_client.get(
+            "/chips/cached_chip", headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert edited.status_code == 200
+        assert response.status_code == 200
+        assert response.json()["note"]["content"] == "retuned"
+
+    def test_fields_projection_omits_unrequested_fields(
+        self, test_client, chip_with_qubit, auth_headers
+    ):
+        projected = test_client.get(
+            "/chips/cached_chip/qubits",
+            params={"cursor": "", "fields": ["data.t1", "note"]},
+            headers=auth_headers,
+        )
+        everything = test_client.get("/chips/cached_chip/qubits", headers=auth_headers)
+
+        body = projected.json()
+        assert body["next_cursor"] is None
+        assert body["qubits"] == [
+            {
+                "qid": "0",
+                "chip_id": "cached_chip",
+                "data": {"t1": {"value": 10.0}},
+                "note": {"content": "", "updated_by": "", "updated_at": None},
+            }
+        ]
+        assert everything.json()["qubits"][0]["status"] == "pending"
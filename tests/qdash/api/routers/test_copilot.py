@@ -1,4 +1,4 @@
-"""Tests for copilot provenance lineage graph tool and data store."""
+"""Tests for copilot tools (provenance lineage graph, chip comparison) and data store."""
 
 from __future__ import annotations
 
@@ -6,6 +6,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from qdash.api.lib.ai_labels import TOOL_LABELS
 from qdash.copilot.agent import (
     _wrap_tool_executors,
@@ -14,6 +16,9 @@ from qdash.copilot.agent_runtime.rendering import build_llm_summary, legacy_to_b
 from qdash.copilot.contracts import AnalysisResponse
 from qdash.copilot.runtime import CopilotRuntime
 from qdash.copilot.tooling.schemas import AGENT_TOOLS
+from qdash.datamodel.system_info import SystemInfoModel
+from qdash.dbmodel.chip import ChipDocument
+from qdash.dbmodel.qubit import QubitDocument
 
 if TYPE_CHECKING:
     from qdash.api.schemas.provenance import LineageResponse
@@ -240,6 +245,89 @@ class TestToolRegistration:
         assert "code" in props
 
 
+class TestCompareChips:
+    """Tests for the compare_chips tool against the bulk metrics read."""
+
+    @staticmethod
+    def _insert_chip(chip_id: str, qubits: dict[str, dict[str, Any]]) -> None:
+        ChipDocument(
+            project_id="project-1",
+            chip_id=chip_id,
+            username="tester",
+            size=len(qubits),
+            system_info=SystemInfoModel(),
+        ).insert()
+        for qid, data in qubits.items():
+            QubitDocument(
+                project_id="project-1",
+                username="tester",
+                qid=qid,
+                chip_id=chip_id,
+                data=data,
+                system_info=SystemInfoModel(),
+            ).insert()
+
+    def test_compares_chips_in_display_units(self, init_db):
+        self._insert_chip(
+            "chip_a",
+            {
+                "10": {"t1": {"value": 40.0, "unit": "μs"}, "x90_gate_fidelity": {"value": 0.99}},
+                "2": {"t1": {"value": 60.0, "unit": "μs"}},
+            },
+        )
+        self._insert_chip("chip_b", {"0": {"x90_gate_fidelity": {"value": 0.98}}})
+        executor = CopilotRuntime().build_tool_executors()["compare_chips"]
+
+        result = executor(
+            {
+                "chip_ids": ["chip_b", "chip_a", "missing"],
+                "param_names": ["t1", "x90_gate_fidelity"],
+            }
+        )
+
+        assert result["chip_ids"] == ["chip_b", "chip_a"]
+        assert result["missing_chip_ids"] == ["missing"]
+        assert result["units"] == {"t1": "μs", "x90_gate_fidelity": "%"}
+        assert [(row["chip_id"], row["qid"]) for row in result["qubits"]] == [
+            ("chip_b", "0"),
+            ("chip_a", "2"),
+            ("chip_a", "10"),
+        ]
+        assert result["qubits"][1]["x90_gate_fidelity"] is None
+        assert result["qubits"][2]["x90_gate_fidelity"] == pytest.approx(99.0)
+        assert result["statistics"]["chip_a"]["t1"]["mean"] == 50
+        assert result["statistics"]["chip_b"] == {
+            "x90_gate_fidelity": {
+                "mean": 98,
+                "median": 98,
+                "stdev": 0.0,
+                "min": 98,
+                "max": 98,
+                "count": 1,
+            }
+        }
+
+    def test_rejects_non_metric_parameter(self, init_db):
+        self._insert_chip("chip_a", {"0": {}})
+        executor = CopilotRuntime().build_tool_executors()["compare_chips"]
+
+        result = executor({"chip_ids": ["chip_a"], "param_names": ["t1\n"]})
+
+        assert "Unknown field" in result["error"]
+
+    def test_tool_is_registered_and_stored(self):
+        assert "compare_chips" in [tool["name"] for tool in AGENT_TOOLS]
+        assert "compare_chips" in TOOL_LABELS
+
+        data_store: dict[str, Any] = {}
+        wrapped, _ = _wrap_tool_executors(
+            {"compare_chips": lambda args: {"qubits": [{"chip_id": "c", "qid": "0"}]}},
+            data_store,
+        )
+        assert wrapped["compare_chips"]({})["data_key"] == "chip_comparison"
+        assert "chip_comparison" in data_store
+
+
 class TestBuildLlmSummary:
     """Tests for build_llm_summary."""
 
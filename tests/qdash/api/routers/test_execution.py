@@ -15,7 +15,10 @@ from qdash.dbmodel.execution_history import ExecutionHistoryDocument
 from qdash.dbmodel.flow import FlowDocument
 from qdash.dbmodel.project import ProjectDocument
 from qdash.dbmodel.project_membership import ProjectMembershipDocument
+from qdash.dbmodel.task_result_history import TaskResultHistoryDocument
 from qdash.dbmodel.user import UserDocument
+from qdash.repository.execution_lock import MongoExecutionLockRepository
+from qdash.repository.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -543,6 +546,66 @@ class TestListExecutions:
         data = response.json()
         assert len(data["executions"]) == 1
         assert data["executions"][0]["execution_id"] == "exec-001"
+        # Listing rows are projected; the note is served by the detail endpoint.
+        assert "note" not in data["executions"][0]
+        assert data["executions"][0]["elapsed_time"] == "0:00:10"
+
+    def test_list_executions_keyset_pages(
+        self,
+        test_client: TestClient,
+        test_project: ProjectDocument,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Following next_cursor returns every execution once, newest first."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        # exec-1 and exec-2 share a start_at, so execution_id must break the tie.
+        for execution_id, day in (("exec-0", 1), ("exec-1", 2), ("exec-2", 2), ("exec-3", 3)):
+            ExecutionHistoryDocument(
+                project_id="test_project",
+                execution_id=execution_id,
+                name="test_flow",
+                status="completed",
+                chip_id="chip-1",
+                username="test_user",
+                tags=[],
+                note={},
+                calib_data_path="/tmp/calib",
+                message="",
+                system_info=SystemInfoModel(),
+                start_at=start.replace(day=day),
+            ).insert()
+
+        seen: list[str] = []
+        cursor = ""
+        while cursor is not None:
+            response = test_client.get(
+                "/executions",
+                headers=auth_headers,
+                params={"chip_id": "chip-1", "limit": 2, "cursor": cursor},
+            )
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(e["execution_id"] for e in data["executions"])
+            cursor = data["next_cursor"]
+
+        assert seen == ["exec-3", "exec-2", "exec-1", "exec-0"]
+
+    def test_list_executions_rejects_foreign_cursor(
+        self,
+        test_client: TestClient,
+        test_project: ProjectDocument,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """A cursor issued for another chip is a 400, not a silently wrong page."""
+        response = test_client.get(
+            "/executions",
+            headers=auth_headers,
+            params={
+                "chip_id": "chip-1",
+                "cursor": encode_cursor("executions:test_project:chip-2", [None, "e"]),
+            },
+        )
+        assert response.status_code == 400
 
 
 class TestGetExecution:
@@ -560,3 +623,102 @@ class TestGetExecution:
             headers=auth_headers,
         )
         assert response.status_code == 404
+
+    def test_get_execution_summarizes_phase_timings(
+        self,
+        test_client: TestClient,
+        sample_execution: ExecutionHistoryDocument,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Per-task phase timings are returned and summed per phase in execution order."""
+        for qid, timings in (("0", {"history": 0.5, "run": 2.0}), ("1", {"run": 4.0})):
+            TaskResultHistoryDocument.get_motor_collection().insert_one(
+                {
+                    "project_id": "test_project",
+                    "username": "test_user",
+                    "task_id": f"task-{qid}",
+                    "name": "CheckRabi",
+                    "upstream_id": "",
+                    "status": "completed",
+                    "message": "",
+                    "input_parameters": {},
+                    "output_parameters": {},
+                    "output_parameter_names": [],
+                    "note": {},
+                    "figure_path": [],
+                    "start_at": datetime.now(tz=timezone.utc),
+                    "end_at": datetime.now(tz=timezone.utc),
+                    "elapsed_time": 1.0,
+                    "phase_timings": timings,
+                    "task_type": "qubit",
+                    "system_info": SystemInfoModel().model_dump(),
+                    "qid": qid,
+                    "execution_id": "exec-001",
+                    "tags": [],
+                    "chip_id": "chip-1",
+                }
+            )
+
+        response = test_client.get("/executions/exec-001", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert {task["qid"]: task["phase_timings"] for task in data["task"]} == {
+            "0": {"history": 0.5, "run": 2.0},
+            "1": {"run": 4.0},
+        }
+        assert data["phase_timings"] == [
+            {
+                "phase": "run",
+                "count": 2,
+                "total_seconds": 6.0,
+                "mean_seconds": 3.0,
+                "max_seconds": 4.0,
+            },
+            {
+                "phase": "history",
+                "count": 1,
+                "total_seconds": 0.5,
+                "mean_seconds": 0.5,
+                "max_seconds": 0.5,
+            },
+        ]
+
+
+class TestExecutionLockStatus:
+    """Tests for GET /executions/lock-status endpoint."""
+
+    def test_lock_status_lists_active_leases(
+        self,
+        test_client: TestClient,
+        test_project: ProjectDocument,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Leases are reported per chip and do not set the project-wide flag."""
+        repo = MongoExecutionLockRepository()
+        repo.acquire_lease("test_project", "chip-1", "exec-1", qids=["1", "0"], lease_seconds=60)
+        repo.acquire_lease("test_project", "chip-2", "exec-2", lease_seconds=60)
+
+        response = test_client.get("/executions/lock-status", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["lock"] is False
+        assert sorted(
+            (lease["chip_id"], lease["qids"], lease["owner"]) for lease in data["leases"]
+        ) == [("chip-1", ["0", "1"], "exec-1"), ("chip-2", None, "exec-2")]
+        assert all(lease["expires_at"] for lease in data["leases"])
+
+    def test_lock_status_reports_legacy_lock(
+        self,
+        test_client: TestClient,
+        test_project: ProjectDocument,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """The legacy project-wide lock is still reported as ``lock``."""
+        MongoExecutionLockRepository().lock("test_project")
+
+        response = test_client.get("/executions/lock-status", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == {"lock": True, "leases": []}
@@ -0,0 +1,147 @@
+"""Tests for admin listings against a synthetic installation.
+
+mongomock joins by scanning, so the dataset is kept small here; run
+``scripts/benchmark_admin_listings.py`` against MongoDB for the 1k-project,
+10k-membership timings.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NoReturn
+
+import pytest
+from fastapi import HTTPException
+
+from qdash.api.services.admin_service import AdminService
+from qdash.common.utils.datetime import now
+from qdash.dbmodel.project import ProjectDocument
+from qdash.dbmodel.project_membership import ProjectMembershipDocument
+from qdash.dbmodel.user import UserDocument
+
+if TYPE_CHECKING:
+    from pymongo.database import Database
+
+    from qdash.api.schemas.admin import UserListItem
+
+N_PROJECTS = 100
+MEMBERS_PER_PROJECT = 10
+
+
+@pytest.fixture
+def synthetic_installation(init_db: Database[Any]) -> Database[Any]:
+    """Projects with 10 memberships each and one owner per project."""
+    timestamp = now()
+    users: list[dict[str, Any]] = []
+    projects: list[dict[str, Any]] = []
+    memberships: list[dict[str, Any]] = []
+    for i in range(N_PROJECTS):
+        owner = f"user{i:04d}"
+        users.append(
+            {
+                "user_id": f"uid-{i:04d}",
+                "username": owner,
+                "hashed_password": "hashed",
+                "access_token": f"token-{i:04d}",
+                "disabled": False,
+                "system_role": "user",
+                "default_project_id": None,
+                "must_change_password": False,
+            }
+        )
+        projects.append(
+            {
+                "project_id": f"proj-{i:04d}",
+                "name": f"Project {i}",
+                "owner_user_id": f"uid-{i:04d}",
+                "owner_username": owner,
+                "system_info": {"created_at": timestamp, "updated_at": timestamp},
+            }
+        )
+        memberships.extend(
+            {
+                "project_id": f"proj-{i:04d}",
+                "user_id": f"uid-{(i + j) % N_PROJECTS:04d}",
+                "username": f"user{(i + j) % N_PROJECTS:04d}",
+                "role": "viewer",
+                "status": "active",
+            }
+            for j in range(MEMBERS_PER_PROJECT)
+        )
+    UserDocument.get_motor_collection().insert_many(users)
+    ProjectDocument.get_motor_collection().insert_many(projects)
+    ProjectMembershipDocument.get_motor_collection().insert_many(memberships)
+    return init_db
+
+
+@pytest.fixture
+def no_per_row_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail if a listing falls back to one membership/project query per row."""
+
+    def forbidden(*args: Any, **kwargs: Any) -> NoReturn:
+        raise AssertionError("listing issued a per-row query")
+
+    monkeypatch.setattr(ProjectMembershipDocument, "find", forbidden)
+    monkeypatch.setattr(ProjectDocument, "find", forbidden)
+
+
+def test_list_projects_keyset_walk_counts_members(
+    synthetic_installation: Database[Any], no_per_row_queries: None
+) -> None:
+    service = AdminService()
+    seen: list[str] = []
+    cursor: str | None = ""
+    while cursor is not None:
+        page = service.list_projects(limit=30, cursor=cursor)
+        assert page.total == N_PROJECTS
+        assert all(p.member_count == MEMBERS_PER_PROJECT for p in page.projects)
+        seen.extend(p.project_id for p in page.projects)
+        cursor = page.next_cursor
+
+    assert seen == [f"proj-{i:04d}" for i in range(N_PROJECTS)]
+
+
+def test_list_projects_offset_mode_matches_keyset(
+    synthetic_installation: Database[Any], no_per_row_queries: None
+) -> None:
+    service = AdminService()
+    offset = service.list_projects(skip=40, limit=30)
+    first = service.list_projects(limit=40, cursor="")
+    keyset = service.list_projects(limit=30, cursor=first.next_cursor)
+
+    assert offset.next_cursor is None
+    assert [p.project_id for p in offset.projects] == [p.project_id for p in keyset.projects]
+
+
+def test_full_last_page_has_no_next_cursor(synthetic_installation: Database[Any]) -> None:
+    service = AdminService()
+    first = service.list_projects(limit=N_PROJECTS - 10, cursor="")
+    last = service.list_projects(limit=10, cursor=first.next_cursor)
+
+    assert len(last.projects) == 10
+    assert last.next_cursor is None
+    assert service.list_users(limit=N_PROJECTS, cursor="").next_cursor is None
+
+
+def test_list_users_keyset_walk_resolves_owned_project(
+    synthetic_installation: Database[Any], no_per_row_queries: None
+) -> None:
+    service = AdminService()
+    users: list[UserListItem] = []
+    cursor: str | None = ""
+    while cursor is not None:
+        page = service.list_users(limit=32, cursor=cursor)
+        users.extend(page.users)
+        cursor = page.next_cursor
+
+    assert len(users) == N_PROJECTS
+    assert [u.username for u in users] == sorted(u.username for u in users)
+    assert all(u.default_project_id == f"proj-{u.username[4:]}" for u in users)
+
+
+def test_list_projects_rejects_foreign_cursor(synthetic_installation: Database[Any]) -> None:
+    service = AdminService()
+    users_cursor = service.list_users(limit=10, cursor="").next_cursor
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.list_projects(cursor=users_cursor)
+    assert exc_info.value.status_code == 400
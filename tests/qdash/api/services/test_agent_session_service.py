@@ -21,7 +21,12 @@ from qdash.api.schemas.agent_session import (
     ExecuteAgentActionRequest,
     SubmitAgentActionRequest,
 )
-from qdash.api.services.agent_session_service import AgentSessionService
+from qdash.api.services.agent_session_service import (
+    AGENT_ACTION_JOB_KIND,
+    AgentSessionService,
+    run_agent_action_job,
+)
+from qdash.common.job_worker import JobPermanentError
 from qdash.datamodel.agent_session import (
     AgentActionDecision,
     AgentActionType,
@@ -34,6 +39,7 @@ from qdash.dbmodel.chip import ChipDocument
 from qdash.dbmodel.execution_history import ExecutionHistoryDocument
 from qdash.dbmodel.qubit import QubitDocument
 from qdash.dbmodel.task_result_history import TaskResultHistoryDocument
+from qdash.repository.inmemory.job_queue import InMemoryJobQueueRepository
 
 
 @pytest.fixture
@@ -903,3 +909,63 @@ async def test_execute_authorized_action_dispatches_single_task(
         service.get_session(project_id="project-1", session_id=session.session_id).state_version
         == 1
     )
+
+
+def test_enqueue_action_queues_once_for_agent_worker(init_db) -> None:
+    """Authorized actions are queued for the worker instead of dispatched inline."""
+    ChipDocument(
+        project_id="project-1",
+        chip_id="chip-001",
+        username="tester",
+        size=4,
+        system_info=SystemInfoModel(),
+    ).insert()
+    queue = InMemoryJobQueueRepository()
+    service = AgentSessionService(job_queue=queue)
+    session = _create_session(service)
+    action = service.submit_action(
+        project_id="project-1",
+        session_id=session.session_id,
+        body=_run_task_action(),
+    )
+    body = ExecuteAgentActionRequest(source_execution_id="execution-1")
+
+    first = service.enqueue_action(
+        project_id="project-1",
+        session_id=session.session_id,
+        action_id=action.action_id,
+        body=body,
+    )
+    service.enqueue_action(
+        project_id="project-1",
+        session_id=session.session_id,
+        action_id=action.action_id,
+        body=body,
+    )
+
+    assert first.execution_status == "not_started"
+    job = queue.lease("worker", [AGENT_ACTION_JOB_KIND], lease_seconds=60)
+    assert job is not None
+    assert job.project_id == "project-1"
+    assert job.payload["action_id"] == action.action_id
+    assert job.payload["body"]["source_execution_id"] == "execution-1"
+    assert queue.lease("worker", [AGENT_ACTION_JOB_KIND], lease_seconds=60) is None
+
+
+def test_run_agent_action_job_treats_client_errors_as_permanent(init_db) -> None:
+    """A job for a missing action is not retried."""
+    queue = InMemoryJobQueueRepository()
+    queue.enqueue(
+        AGENT_ACTION_JOB_KIND,
+        "project-1",
+        {
+            "session_id": "missing",
+            "action_id": "missing",
+            "body": {"source_execution_id": "execution-1"},
+        },
+    )
+    job = queue.lease("worker", [AGENT_ACTION_JOB_KIND], lease_seconds=60)
+    assert job is not None
+
+    with pytest.raises(JobPermanentError, match="not found"):
+        run_agent_action_job(job)
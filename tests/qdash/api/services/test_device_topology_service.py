@@ -45,7 +45,7 @@ def test_build_couplings_filters_by_cr_direction(
     couplings = _service()._build_couplings(
         request=request,
         cr_params=cr_params,
-        coupling_models={},
+        coupling_data={},
         topology=_topology(),
         id_mapping={"0": 0, "1": 1},
     )
@@ -0,0 +1,162 @@
+"""Tests for the execution ETA service."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from qdash.api.schemas.execution import Task
+from qdash.api.services.execution_eta_service import ExecutionEtaService
+from qdash.api.services.execution_service import ExecutionService
+from qdash.datamodel.execution import ExecutionPlanModel
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+PLAN = ExecutionPlanModel(backend="fake", tasks=["A", "B"], steps=[[["0"], ["1"]]])
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.current = 0.0
+
+    def __call__(self) -> float:
+        return self.current
+
+
+class _TaskResultRepo:
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = []
+        self.queries: list[dict[str, Any]] = []
+        self.stats_calls = 0
+
+    def iter_raw(self, query: dict[str, Any], projection: dict[str, Any], **kwargs: Any):
+        self.queries.append(query)
+        return iter(self.rows)
+
+    def aggregate_duration_stats(self, **kwargs: Any) -> list[dict[str, Any]]:
+        self.stats_calls += 1
+        return [
+            {"name": "A", "batch_size": 1, "count": 4, "mean_seconds": 10.0, "stddev_seconds": 2.0},
+            {"name": "B", "batch_size": 1, "count": 6, "mean_seconds": 20.0, "stddev_seconds": 0.0},
+        ]
+
+
+class _HistoryRepo:
+    def __init__(self, note: dict[str, Any]) -> None:
+        self.note = note
+        self.calls = 0
+
+    def find_by_id(self, project_id: str, execution_id: str) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(note=self.note)
+
+
+def _service(note: dict[str, Any] | None = None):
+    clock = FakeClock()
+    task_repo = _TaskResultRepo()
+    history_repo = _HistoryRepo({"plan": PLAN.model_dump()} if note is None else note)
+    service = ExecutionEtaService(
+        task_repo, history_repo, stats_ttl_seconds=600, refresh_seconds=10, clock=clock
+    )
+    return service, task_repo, history_repo, clock
+
+
+def _estimate(service: ExecutionEtaService, status: str = "running", **kwargs: Any):
+    return service.estimate("proj", "chip", "exec-1", status, current_time=NOW, **kwargs)
+
+
+class TestExecutionEtaService:
+    def test_estimate_reports_interval_and_eta(self):
+        service, task_repo, _, _ = _service()
+        task_repo.rows = [
+            {"name": "A", "qid": "0", "status": "completed", "end_at": NOW},
+            {"name": "B", "qid": "0", "status": "running", "start_at": NOW},
+        ]
+
+        progress = _estimate(service)
+
+        assert progress is not None
+        assert (progress.completed_tasks, progress.total_tasks) == (1, 4)
+        assert progress.fraction == 0.25
+        assert progress.remaining_seconds == 30.0
+        assert progress.remaining_seconds_low == pytest.approx(30.0 - 1.645 * 2.0, abs=0.1)
+        assert progress.eta == NOW + timedelta(seconds=30)
+        assert progress.eta_earliest < progress.eta < progress.eta_latest
+        assert progress.confidence == 0.9
+        assert progress.history_samples == 10
+
+    def test_refresh_is_throttled_and_incremental(self):
+        service, task_repo, history_repo, clock = _service()
+        task_repo.rows = [{"name": "A", "qid": "0", "status": "completed", "end_at": NOW}]
+
+        _estimate(service)
+        clock.current = 5
+        _estimate(service)
+        assert len(task_repo.queries) == 1
+        assert "$or" not in task_repo.queries[0]
+
+        clock.current = 11
+        task_repo.rows = [{"name": "B", "qid": "0", "status": "completed", "end_at": NOW}]
+        progress = _estimate(service)
+
+        assert len(task_repo.queries) == 2
+        assert task_repo.queries[1]["$or"][0] == {"end_at": {"$gte": NOW - timedelta(seconds=60)}}
+        assert progress.completed_tasks == 2
+        assert history_repo.calls == 1
+        assert task_repo.stats_calls == 1
+
+    def test_loaded_tasks_are_used_without_queries(self):
+        service, task_repo, history_repo, _ = _service()
+        tasks = [Task(name="A", qid="0", status="completed", end_at=NOW)]
+
+        progress = _estimate(service, note={"plan": PLAN.model_dump()}, tasks=tasks)
+
+        assert progress.completed_tasks == 1
+        assert task_repo.queries == []
+        assert history_repo.calls == 0
+
+    def test_finished_execution_is_not_estimated_and_dropped(self):
+        service, _, history_repo, clock = _service()
+        _estimate(service)
+
+        assert _estimate(service, status="completed") is None
+        clock.current = 1
+        _estimate(service)
+        assert history_repo.calls == 2
+
+    def test_execution_service_drops_tracker_of_finished_execution(self):
+        service, _, _, _ = _service()
+        execution_service = ExecutionService(None, None, eta_service=service)
+
+        assert execution_service._estimate_progress("proj", "chip", "exec-1", "running")
+        assert list(service._trackers) == [("proj", "exec-1")]
+
+        assert execution_service._estimate_progress("proj", "chip", "exec-1", "completed") is None
+        assert not service._trackers
+
+    def test_trackers_beyond_the_limit_are_evicted(self):
+        service = ExecutionEtaService(_TaskResultRepo(), _HistoryRepo({}), max_executions=2)
+
+        for execution_id in ("exec-1", "exec-2", "exec-1", "exec-3"):
+            service.estimate("proj", "chip", execution_id, "running", current_time=NOW)
+
+        assert list(service._trackers) == [("proj", "exec-1"), ("proj", "exec-3")]
+
+    def test_missing_plan_is_rechecked_after_refresh_interval(self):
+        service, _, history_repo, clock = _service(note={})
+
+        assert _estimate(service) is None
+        assert _estimate(service) is None
+        assert history_repo.calls == 1
+
+        history_repo.note = {"plan": PLAN.model_dump()}
+        clock.current = 10
+        assert _estimate(service) is not None
+        assert history_repo.calls == 2
+
+    def test_invalid_plan_is_ignored(self):
+        service, _, _, _ = _service(note={"plan": {"steps": "not-a-list"}})
+
+        assert _estimate(service) is None
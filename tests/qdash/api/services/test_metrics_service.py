@@ -1,11 +1,17 @@
 """Tests for metrics_service helpers."""
 
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi import HTTPException as FastAPIHTTPException
 from starlette.exceptions import HTTPException
 
-from qdash.api.services.metrics_service import _parse_date_range
+from qdash.api.services import metrics_service
+from qdash.api.services.metrics_service import MetricsService, _parse_date_range
+from qdash.dbmodel.metrics_pdf_job import MetricsPdfJobDocument
 
 
 class TestParseDateRange:
@@ -58,3 +64,198 @@ class TestParseDateRange:
             )
         assert exc_info.value.status_code == 400
         assert "start_at must be on or before end_at" in exc_info.value.detail
+
+
+def _wait_for_job(service: MetricsService, project_id: str, job_id: str):
+    for _ in range(200):
+        job = service.get_metrics_pdf_job(project_id, job_id)
+        if job.status in ("completed", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("PDF job did not finish")
+
+
+class TestMetricsPdfJobs:
+    """Tests for background metrics PDF report jobs."""
+
+    @pytest.fixture(autouse=True)
+    def _storage(self, init_db, monkeypatch, tmp_path):
+        monkeypatch.setattr(metrics_service, "METRICS_PDF_DIR", tmp_path / "metrics_pdf")
+
+    def _service(self) -> MetricsService:
+        chip_repo = MagicMock()
+        chip_repo.find_one_document.return_value = MagicMock(topology_id=None)
+        return MetricsService(task_result_repository=MagicMock(), chip_repository=chip_repo)
+
+    def test_completed_job_exposes_download(self, monkeypatch):
+        service = self._service()
+        monkeypatch.setattr(
+            service,
+            "generate_metrics_pdf",
+            lambda **_: (BytesIO(b"%PDF-1.4"), "report.pdf", None),
+        )
+
+        job = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+        done = _wait_for_job(service, "proj", job.job_id)
+        buffer, filename = service.get_metrics_pdf_job_file("proj", job.job_id)
+
+        assert done.status == "completed"
+        assert done.download_url == f"/metrics/pdf/jobs/{job.job_id}/download"
+        assert filename == "report.pdf"
+        assert buffer.read() == b"%PDF-1.4"
+
+    def test_failed_job_records_error_and_rejects_download(self, monkeypatch):
+        service = self._service()
+
+        def fail(**_):
+            raise FastAPIHTTPException(status_code=500, detail="PDF generation failed: boom")
+
+        monkeypatch.setattr(service, "generate_metrics_pdf", fail)
+
+        job = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+        done = _wait_for_job(service, "proj", job.job_id)
+
+        assert done.status == "failed"
+        assert done.error == "PDF generation failed: boom"
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_metrics_pdf_job_file("proj", job.job_id)
+        assert exc_info.value.status_code == 409
+
+    def test_job_is_scoped_to_project(self, monkeypatch):
+        service = self._service()
+        monkeypatch.setattr(
+            service,
+            "generate_metrics_pdf",
+            lambda **_: (BytesIO(b"%PDF"), "report.pdf", None),
+        )
+        job = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_metrics_pdf_job("other", job.job_id)
+        assert exc_info.value.status_code == 404
+
+    def test_job_is_visible_to_another_service_instance(self, monkeypatch):
+        service = self._service()
+        monkeypatch.setattr(
+            service,
+            "generate_metrics_pdf",
+            lambda **_: (BytesIO(b"%PDF"), "report.pdf", None),
+        )
+        job = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+        _wait_for_job(service, "proj", job.job_id)
+
+        buffer, _ = self._service().get_metrics_pdf_job_file("proj", job.job_id)
+
+        assert buffer.read() == b"%PDF"
+
+    def test_only_finished_jobs_are_evicted(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(metrics_service, "PDF_JOB_MAX_RETAINED", 1)
+        service = self._service()
+        monkeypatch.setattr(
+            service,
+            "generate_metrics_pdf",
+            lambda **_: (BytesIO(b"%PDF"), "report.pdf", None),
+        )
+        running = MetricsPdfJobDocument(job_id="running", project_id="proj", chip_id="64Q")
+        running.status = "running"
+        running.insert()
+
+        first = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+        _wait_for_job(service, "proj", first.job_id)
+        second = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+        _wait_for_job(service, "proj", second.job_id)
+        third = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+        _wait_for_job(service, "proj", third.job_id)
+
+        assert service.get_metrics_pdf_job("proj", "running").status == "running"
+        assert service.get_metrics_pdf_job("proj", second.job_id).status == "completed"
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_metrics_pdf_job("proj", first.job_id)
+        assert exc_info.value.status_code == 404
+        assert not (tmp_path / "metrics_pdf" / f"{first.job_id}.pdf").exists()
+
+    def test_stalled_jobs_are_failed_and_then_evicted(self, monkeypatch):
+        monkeypatch.setattr(metrics_service, "PDF_JOB_MAX_RETAINED", 0)
+        service = self._service()
+        monkeypatch.setattr(
+            service,
+            "generate_metrics_pdf",
+            lambda **_: (BytesIO(b"%PDF"), "report.pdf", None),
+        )
+        submitted = datetime.now(timezone.utc) - timedelta(
+            seconds=metrics_service.PDF_JOB_TIMEOUT_SECONDS + 60
+        )
+        MetricsPdfJobDocument(
+            job_id="stalled",
+            project_id="proj",
+            chip_id="64Q",
+            status="running",
+            created_at=submitted,
+        ).insert()
+        MetricsPdfJobDocument(
+            job_id="abandoned", project_id="proj", chip_id="64Q", created_at=submitted
+        ).insert()
+        MetricsPdfJobDocument(
+            job_id="fresh", project_id="proj", chip_id="64Q", status="running"
+        ).insert()
+
+        stalled = service.get_metrics_pdf_job("proj", "stalled")
+
+        assert stalled.status == "failed"
+        assert stalled.error is not None and "did not finish" in stalled.error
+        assert service.get_metrics_pdf_job("proj", "abandoned").status == "failed"
+        assert service.get_metrics_pdf_job("proj", "fresh").status == "running"
+
+        job = service.submit_metrics_pdf_job("64Q", "proj", "alice")
+        _wait_for_job(service, "proj", job.job_id)
+
+        for job_id in ("stalled", "abandoned"):
+            with pytest.raises(HTTPException) as exc_info:
+                service.get_metrics_pdf_job("proj", job_id)
+            assert exc_info.value.status_code == 404
+        assert service.get_metrics_pdf_job("proj", "fresh").status == "running"
+
+
+class TestMetricHistoryColumnar:
+    """Tests for the columnar metric history."""
+
+    def test_builds_columns_from_raw_rows(self):
+        t0 = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        task_result_repo = MagicMock()
+        task_result_repo.iter_raw.return_value = [
+            {
+                "task_id": "task-2",
+                "execution_id": "exec-2",
+                "start_at": t0,
+                "excluded": True,
+                "output_parameters": {"t1": {"value": 20.0, "error": 1.0}},
+            },
+            {"task_id": "task-x", "output_parameters": {"t1": {"value": None}}},
+            {
+                "task_id": "task-1",
+                "execution_id": "exec-1",
+                "start_at": None,
+                "system_info": {"created_at": "2026-01-01T00:00:00+00:00"},
+                "output_parameters": {"t1": {"value": 10.0, "task_id": "task-1b"}},
+            },
+        ]
+        service = MetricsService(
+            task_result_repository=task_result_repo, chip_repository=MagicMock()
+        )
+
+        series = service.get_metric_history_columnar(
+            chip_id="64Q", qid="Q01", project_id="proj", metric="t1", entity_type="qubit"
+        )
+
+        query = task_result_repo.iter_raw.call_args.args[0]
+        assert set(query["qid"]["$in"]) >= {"1", "Q01"}
+        assert series.series == {
+            "Q01": {
+                "t": [t0, datetime(2026, 1, 1, tzinfo=timezone.utc)],
+                "value": [20.0, 10.0],
+                "error": [1.0, None],
+                "task_id": ["task-2", "task-1b"],
+                "execution_id": ["exec-2", "exec-1"],
+                "excluded": [True, False],
+            }
+        }
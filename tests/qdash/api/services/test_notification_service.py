@@ -1,9 +1,15 @@
-"""Tests for notification mention handling."""
+"""Tests for notification mention handling, counters and inbox paging."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
 
 from qdash.api.services.notification_service import NotificationService
+from qdash.common.utils.datetime import now
 from qdash.datamodel.project import ProjectRole
 from qdash.datamodel.system_info import SystemInfoModel
-from qdash.dbmodel.notification import NotificationDocument
+from qdash.dbmodel.notification import NotificationCounterDocument, NotificationDocument
 from qdash.dbmodel.project_membership import ProjectMembershipDocument
 from qdash.dbmodel.user import UserDocument
 
@@ -81,3 +87,219 @@ def test_project_and_direct_mentions_are_deduplicated(init_db) -> None:
     notifications = NotificationDocument.find({"recipient_username": "active"}).to_list()
     assert len(notifications) == 1
     assert notifications[0].kind == "forum_mention"
+
+
+def _counter(user: UserDocument, project_id: str = "test_project") -> tuple[int, int]:
+    doc = NotificationCounterDocument.find_one(
+        {"recipient_user_id": user.user_id, "project_id": project_id}
+    ).run()
+    assert doc is not None
+    return doc.unread, doc.total
+
+
+def test_fan_out_inserts_in_one_batch_and_counts_unread(init_db, monkeypatch) -> None:
+    service = NotificationService()
+    _create_user("actor")
+    alice = _create_user("alice")
+    bob = _create_user("bob")
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("fan-out inserted notifications one at a time")
+
+    monkeypatch.setattr(NotificationDocument, "insert", forbidden)
+    for _ in range(2):  # the second event is a duplicate and must not be counted
+        service.notify_forum_event(
+            project_id="test_project",
+            post_id="post_1",
+            root_post_id="root_1",
+            actor_username="actor",
+            content="@project please review",
+            title="Forum thread",
+            parent_author="alice",
+        )
+
+    assert NotificationDocument.find({}).count() == 2
+    assert _counter(alice) == (1, 1)
+    assert _counter(bob) == (1, 1)
+    assert service.unread_count(username="alice", project_id=None).unread_count == 1
+
+
+def test_mark_read_decrements_counter_once(init_db) -> None:
+    service = NotificationService()
+    _create_user("actor")
+    alice = _create_user("alice")
+    service.notify_note_mentions(
+        project_id="test_project",
+        note_event_id="event_1",
+        actor_username="actor",
+        content="@alice look",
+        target_url="/notes/1",
+        title="Note",
+    )
+    notification = NotificationDocument.find_one({"recipient_username": "alice"}).run()
+    assert notification is not None
+
+    for _ in range(2):
+        response = service.mark_read(notification_id=str(notification.id), username="alice")
+        assert response.read_at is not None
+
+    assert _counter(alice) == (0, 1)
+
+
+def test_mark_all_read_updates_counters_per_project(init_db) -> None:
+    service = NotificationService()
+    alice = _create_user("alice")
+    for project_id in ("test_project", "other_project"):
+        for n in range(3):
+            service.create_notification(
+                project_id=project_id,
+                recipient_username="alice",
+                actor_username="actor",
+                kind="mention",
+                source_type="issue",
+                source_id=f"{project_id}-{n}",
+                target_url="/issues/1",
+                title="Mention",
+                excerpt="",
+                dedupe_key=f"{project_id}-{n}",
+            )
+
+    assert service.unread_count(username="alice", project_id=None).unread_count == 6
+    assert service.mark_all_read(username="alice", project_id="other_project") == {"updated": 3}
+    assert _counter(alice, "other_project") == (0, 3)
+    assert service.mark_all_read(username="alice", project_id=None) == {"updated": 3}
+    assert _counter(alice) == (0, 3)
+    assert service.unread_count(username="alice", project_id=None).unread_count == 0
+
+
+def test_list_notifications_keyset_pages_use_counters(init_db) -> None:
+    service = NotificationService()
+    _create_user("alice")
+    for n in range(5):
+        service.create_notification(
+            project_id="test_project",
+            recipient_username="alice",
+            actor_username="actor",
+            kind="mention",
+            source_type="issue",
+            source_id=f"issue-{n}",
+            target_url="/issues/1",
+            title=f"Mention {n}",
+            excerpt="",
+            dedupe_key=f"issue-{n}",
+        )
+    offset_ids = [
+        n.id
+        for n in service.list_notifications(
+            username="alice", project_id="test_project", unread_only=False, skip=0, limit=5
+        ).notifications
+    ]
+
+    keyset_ids: list[str] = []
+    cursor: str | None = ""
+    while cursor is not None:
+        page = service.list_notifications(
+            username="alice",
+            project_id="test_project",
+            unread_only=False,
+            skip=0,
+            limit=2,
+            cursor=cursor,
+        )
+        assert (page.total, page.unread_count) == (5, 5)
+        keyset_ids.extend(n.id for n in page.notifications)
+        cursor = page.next_cursor
+
+    assert keyset_ids == offset_ids
+    assert len(set(keyset_ids)) == 5
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.list_notifications(
+            username="alice", project_id=None, unread_only=True, skip=0, limit=2, cursor="bogus"
+        )
+    assert exc_info.value.status_code == 400
+
+
+def test_first_read_backfills_counters_for_older_notifications(init_db) -> None:
+    service = NotificationService()
+    _create_user("actor")
+    alice = _create_user("alice")
+    for n in range(3):  # created before the counters existed
+        NotificationDocument.get_motor_collection().insert_one(
+            {
+                "project_id": "test_project",
+                "recipient_user_id": alice.user_id,
+                "recipient_username": "alice",
+                "actor_username": "actor",
+                "kind": "mention",
+                "source_type": "issue",
+                "source_id": f"old-{n}",
+                "target_url": "/issues/1",
+                "title": f"Old {n}",
+                "read_at": now() if n == 0 else None,
+                "created_at": now(),
+                "dedupe_key": f"old-{n}",
+            }
+        )
+    service.create_notification(
+        project_id="test_project",
+        recipient_username="alice",
+        actor_username="actor",
+        kind="mention",
+        source_type="issue",
+        source_id="new",
+        target_url="/issues/1",
+        title="New",
+        excerpt="",
+        dedupe_key="new",
+    )
+    assert _counter(alice) == (1, 1)
+
+    assert service.unread_count(username="alice", project_id="test_project").unread_count == 3
+    assert _counter(alice) == (3, 4)
+    page = service.list_notifications(
+        username="alice", project_id=None, unread_only=False, skip=0, limit=10
+    )
+    assert (page.total, page.unread_count) == (4, 3)
+
+
+def test_recipient_without_notifications_is_backfilled_once(init_db) -> None:
+    service = NotificationService()
+    alice = _create_user("alice")
+
+    with patch.object(
+        NotificationService,
+        "_backfill_counters",
+        wraps=NotificationService._backfill_counters,
+    ) as backfill:
+        for _ in range(2):
+            assert service.unread_count(username="alice", project_id=None).unread_count == 0
+
+    backfill.assert_called_once()
+    assert _counter(alice, "") == (0, 0)
+
+
+def test_project_scoped_first_read_backfills_every_project(init_db) -> None:
+    service = NotificationService()
+    alice = _create_user("alice")
+    for n, project_id in enumerate(["project_a", "project_b", "project_b"]):
+        NotificationDocument.get_motor_collection().insert_one(
+            {
+                "project_id": project_id,
+                "recipient_user_id": alice.user_id,
+                "recipient_username": "alice",
+                "actor_username": "actor",
+                "kind": "mention",
+                "source_type": "issue",
+                "source_id": f"old-{n}",
+                "target_url": "/issues/1",
+                "title": f"Old {n}",
+                "read_at": None,
+                "created_at": now(),
+                "dedupe_key": f"old-{n}",
+            }
+        )
+
+    assert service.unread_count(username="alice", project_id="project_a").unread_count == 1
+    assert service.unread_count(username="alice", project_id=None).unread_count == 3
+    assert _counter(alice, "project_b") == (2, 2)
@@ -42,6 +42,7 @@ class _ChipRepo:
 class _TaskResultRepo:
     def __init__(self, docs: list[_TaskResultDoc]) -> None:
         self.docs = docs
+        self.raw_rows: list[dict[str, Any]] = []
         self.last_query: dict[str, Any] | None = None
         self.last_latest_call: dict[str, Any] | None = None
 
@@ -54,6 +55,16 @@ class _TaskResultRepo:
         self.last_query = query
         return self.docs
 
+    def iter_raw(
+        self,
+        query: dict[str, Any],
+        projection: dict[str, Any],
+        sort: list[tuple[str, Any]] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        self.last_query = query
+        return self.raw_rows
+
     def find_with_projection(
         self,
         query: dict[str, Any],
@@ -789,3 +800,48 @@ def test_get_timeseries_filters_by_tag() -> None:
     assert repo.last_query["project_id"] == "proj-1"
     assert repo.last_query["chip_id"] == "chip-1"
     assert repo.last_query["output_parameter_names"] == "t1"
+
+
+def test_get_timeseries_columnar_groups_columns_by_qid() -> None:
+    t0 = datetime(2026, 5, 5, tzinfo=timezone.utc)
+    repo = _TaskResultRepo([])
+    repo.raw_rows = [
+        {
+            "qid": "0",
+            "start_at": t0,
+            "task_id": "task-a",
+            "output_parameters": {
+                "t1": {"value": 10.0, "error": 0.5, "unit": "us", "calibrated_at": t0}
+            },
+        },
+        {"qid": "1", "start_at": t0, "task_id": "task-b", "output_parameters": {}},
+        {
+            "qid": "0",
+            "start_at": t0 + timedelta(hours=1),
+            "task_id": "task-c",
+            "output_parameters": {"t1": {"value": 12.0, "unit": "us"}},
+        },
+    ]
+
+    series = _service(repo).get_timeseries_columnar(
+        chip_id="chip-1",
+        tag=None,
+        parameter="t1",
+        project_id="proj-1",
+        target_qid="0",
+        start_at=(t0 - timedelta(days=1)).isoformat(),
+        end_at=t0.isoformat(),
+    )
+
+    assert repo.last_query is not None
+    assert repo.last_query["qid"] == "0"
+    assert series.series == {
+        "0": {
+            "t": [t0, t0 + timedelta(hours=1)],
+            "value": [10.0, 12.0],
+            "error": [0.5, None],
+            "task_id": ["task-a", "task-c"],
+            "unit": "us",
+            "description": "",
+        }
+    }
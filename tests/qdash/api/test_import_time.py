@@ -0,0 +1,88 @@
+"""Import-time checks for the API entrypoint.
+
+Runs ``python -X importtime -c "import qdash.api.main"`` in a fresh
+interpreter so the measurement is not polluted by modules the test session
+has already loaded (or mocked, as ``tests/conftest.py`` does for prefect).
+Wall-clock import time varies too much between machines to gate on by
+default, so the budget check only runs when ``QDASH_API_IMPORT_BUDGET_MS``
+is set.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Heavy dependencies that must load on first use, not at API startup.
+DEFERRED_MODULES = (
+    "git",
+    "kaleido",
+    "matplotlib",
+    "networkx",
+    "openai",
+    "plotly",
+    "prefect",
+    "qdash.analysis",
+    "qdash.copilot.agent",
+    "reportlab",
+    "scipy",
+)
+
+# Opt-in budget for the cumulative import time of qdash.api.main in
+# milliseconds, e.g. QDASH_API_IMPORT_BUDGET_MS=10000.
+IMPORT_BUDGET_ENV = "QDASH_API_IMPORT_BUDGET_MS"
+
+
+def _import_api_main() -> dict[str, int]:
+    """Return the cumulative import time in microseconds for each module.
+
+    The ``""`` key holds the total over top-level imports, which also covers
+    parent packages such as ``qdash.api`` that load before ``qdash.api.main``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import qdash.api.main"],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=False,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative: dict[str, int] = {"": 0}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        cumulative[name.strip()] = int(cumulative_us)
+        if name == f" {name.strip()}":
+            cumulative[""] += int(cumulative_us)
+    return cumulative
+
+
+@pytest.fixture(scope="module")
+def api_import_times() -> dict[str, int]:
+    return _import_api_main()
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_api_startup_does_not_import_heavy_module(
+    api_import_times: dict[str, int], module: str
+) -> None:
+    loaded = sorted(
+        name for name in api_import_times if name == module or name.startswith(f"{module}.")
+    )
+    assert not loaded, f"importing qdash.api.main loaded {module}: {loaded[:5]}"
+
+
+@pytest.mark.skipif(
+    not os.environ.get(IMPORT_BUDGET_ENV), reason=f"set {IMPORT_BUDGET_ENV} to check"
+)
+def test_api_startup_import_time_within_budget(api_import_times: dict[str, int]) -> None:
+    budget_ms = int(os.environ[IMPORT_BUDGET_ENV])
+    elapsed_ms = api_import_times[""] / 1000
+
+    assert elapsed_ms <= budget_ms, (
+        f"importing qdash.api.main took {elapsed_ms:.0f} ms (budget {budget_ms} ms)"
+    )
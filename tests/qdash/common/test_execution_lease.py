@@ -0,0 +1,74 @@
+"""Tests for the calibration session lease manager."""
+
+import time
+
+import pytest
+
+from qdash.common.execution_lease import (
+    ExecutionLeaseLostError,
+    ExecutionLeaseManager,
+    ExecutionLockConflictError,
+    lease_qids,
+)
+from qdash.repository.inmemory.execution_lock import InMemoryExecutionLockRepository
+
+
+class TestExecutionLeaseManager:
+    """Tests for ExecutionLeaseManager with the in-memory repository."""
+
+    def test_lease_qids_expands_couplings(self):
+        assert lease_qids(["3", "0-1", "1-2"]) == ["0", "1", "2", "3"]
+        assert lease_qids([]) is None
+        assert lease_qids(None) is None
+
+    def test_conflict_names_the_holder(self):
+        repo = InMemoryExecutionLockRepository()
+        holder = ExecutionLeaseManager(repo)
+        holder.acquire("p1", "chip-a", "exec-1", qids=["0", "1"])
+
+        with pytest.raises(ExecutionLockConflictError, match="exec-1"):
+            ExecutionLeaseManager(repo).acquire("p1", "chip-a", "exec-2", qids=["1"])
+
+        ExecutionLeaseManager(repo).acquire("p1", "chip-a", "exec-3", qids=["2"])
+        holder.release()
+        assert holder.lease is None
+
+    def test_heartbeat_renews_until_release(self):
+        repo = InMemoryExecutionLockRepository()
+        manager = ExecutionLeaseManager(repo, lease_seconds=0.2)
+        lease = manager.acquire("p1", "chip-a", "exec-1")
+
+        time.sleep(0.5)
+        manager.check()
+        manager.release()
+
+        assert not repo.is_lease_held(lease)
+        assert repo.list_active_leases("p1") == []
+
+    def test_check_fences_writes_after_lease_is_lost(self):
+        repo = InMemoryExecutionLockRepository()
+        manager = ExecutionLeaseManager(repo)
+        manager.acquire("p1", "chip-a", "exec-1")
+
+        repo.release_owner_leases("p1", "exec-1")
+
+        with pytest.raises(ExecutionLeaseLostError):
+            manager.check()
+        assert repo.acquire_lease("p1", "chip-a", "exec-2", lease_seconds=60) is not None
+        manager.release()
+
+    def test_adopted_lease_is_checked_but_not_released(self):
+        repo = InMemoryExecutionLockRepository()
+        parent = ExecutionLeaseManager(repo)
+        lease = parent.acquire("p1", "chip-a", "exec-1", qids=["0"])
+
+        worker = ExecutionLeaseManager(repo)
+        worker.adopt(lease)
+        worker.check()
+        worker.release()
+        assert repo.is_lease_held(lease)
+
+        worker.adopt(lease)
+        parent.release()
+        with pytest.raises(ExecutionLeaseLostError):
+            worker.check()
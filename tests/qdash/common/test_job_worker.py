@@ -0,0 +1,121 @@
+"""Tests for the job queue worker loop."""
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from qdash.common.job_worker import JobPermanentError, JobWorker
+from qdash.datamodel.job import JobModel, JobStatus
+from qdash.repository.inmemory.job_queue import InMemoryJobQueueRepository
+
+
+def _get(queue: InMemoryJobQueueRepository, job: JobModel | None) -> JobModel:
+    assert job is not None
+    stored = queue.get(job.job_id)
+    assert stored is not None
+    return stored
+
+
+class TestJobWorker:
+    """Tests for JobWorker with the in-memory queue."""
+
+    def test_drain_runs_each_kind_with_its_handler(self) -> None:
+        queue = InMemoryJobQueueRepository()
+        seen: list[tuple[str, dict[str, Any]]] = []
+        queue.enqueue("ai_review", "p1", {"task_id": "t1"})
+        queue.enqueue("agent_action", "p1", {"action_id": "a1"}, priority=10)
+        queue.enqueue("unknown", "p1", {})
+
+        worker = JobWorker(
+            queue,
+            {
+                "ai_review": lambda job: seen.append(("ai_review", job.payload)),
+                "agent_action": lambda job: seen.append(("agent_action", job.payload)),
+            },
+            project_concurrency=0,
+        )
+
+        assert worker.drain() == 2
+        assert seen == [("agent_action", {"action_id": "a1"}), ("ai_review", {"task_id": "t1"})]
+
+    def test_handler_error_requeues_and_permanent_error_kills(self) -> None:
+        queue = InMemoryJobQueueRepository()
+        retried = queue.enqueue("flaky", "p1", {})
+        dead = queue.enqueue("broken", "p1", {})
+
+        def flaky(_job: JobModel) -> None:
+            raise RuntimeError("model unavailable")
+
+        def broken(_job: JobModel) -> None:
+            raise JobPermanentError("action not found")
+
+        JobWorker(queue, {"flaky": flaky, "broken": broken}).drain()
+
+        assert _get(queue, retried).status == JobStatus.QUEUED
+        assert _get(queue, retried).last_error == "RuntimeError: model unavailable"
+        assert _get(queue, dead).status == JobStatus.DEAD
+        assert _get(queue, dead).last_error == "action not found"
+
+    def test_heartbeat_extends_lease_of_slow_job(self) -> None:
+        queue = InMemoryJobQueueRepository()
+        job = queue.enqueue("slow", "p1", {})
+
+        reclaimed: list[int] = []
+
+        def slow(_job: JobModel) -> None:
+            time.sleep(0.3)
+            reclaimed.append(queue.requeue_expired())
+
+        worker = JobWorker(queue, {"slow": slow}, lease_seconds=0.1)
+
+        assert worker.run_once()
+        assert reclaimed == [0]
+        finished = _get(queue, job)
+        assert finished.status == JobStatus.COMPLETED
+        assert finished.attempts == 1
+
+    def test_run_forever_stops_on_event(self) -> None:
+        queue = InMemoryJobQueueRepository()
+        done = threading.Event()
+        queue.enqueue("ai_review", "p1", {})
+        stop = threading.Event()
+
+        def handler(_job: JobModel) -> None:
+            done.set()
+            stop.set()
+
+        worker = JobWorker(queue, {"ai_review": handler}, poll_interval=0.01)
+
+        thread = threading.Thread(target=worker.run_forever, args=(stop,))
+        thread.start()
+        thread.join(timeout=5)
+
+        assert done.is_set()
+        assert not thread.is_alive()
+
+    def test_dead_handler_runs_only_when_job_gives_up(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            "qdash.repository.inmemory.job_queue.job_retry_delay_seconds", lambda _attempts: 0.0
+        )
+        queue = InMemoryJobQueueRepository()
+        job = queue.enqueue("flaky", "p1", {}, max_attempts=2)
+        dead: list[tuple[int, str]] = []
+
+        def flaky(_job: JobModel) -> None:
+            raise RuntimeError("model unavailable")
+
+        worker = JobWorker(
+            queue,
+            {"flaky": flaky},
+            dead_handlers={"flaky": lambda died: dead.append((died.attempts, died.last_error))},
+        )
+
+        assert worker.run_once()
+        assert dead == []
+        assert worker.run_once()
+        assert dead == [(2, "RuntimeError: model unavailable")]
+        assert _get(queue, job).status == JobStatus.DEAD
@@ -0,0 +1,94 @@
+"""Tests for the pre-started copilot sandbox worker pool."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qdash.copilot.tooling.sandbox import execute_python_analysis
+from qdash.copilot.tooling.sandbox_pool import SandboxPool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[SandboxPool]:
+    pool = SandboxPool(size=1, max_runs_per_worker=100, memory_limit_mb=256, timeout_seconds=1)
+    yield pool
+    pool.close()
+
+
+class TestSandboxPool:
+    def test_runs_code_with_preimported_modules_and_data(self, pool):
+        result = pool.run(
+            "import numpy as np\nresult = {'output': str(np.mean(data['values']))}",
+            {"values": [1.0, 2.0, 3.0]},
+        )
+
+        assert result == {"output": "2.0", "chart": None, "error": None}
+
+    def test_chart_spec_is_returned(self, pool):
+        result = pool.run(
+            "import plotly.graph_objects as go\n"
+            "result = {'output': 'ok', 'chart': go.Figure(go.Scatter(y=[1, 2]))}"
+        )
+
+        assert result["error"] is None
+        assert isinstance(result["chart"], dict)
+        assert "data" in result["chart"]
+
+    def test_memory_limit_is_reported_and_worker_survives(self, pool):
+        result = pool.run("import numpy as np\nx = np.ones(10**10)")
+
+        assert result["error"] == "Memory limit exceeded"
+        assert pool.run("result = {'output': 'alive'}")["output"] == "alive"
+
+    def test_metrics_track_runs_and_latency(self, pool):
+        pool.run("result = {'output': 'x'}")
+
+        metrics = pool.metrics()
+
+        assert metrics["runs"] >= 1
+        assert metrics["size"] == 1
+        assert metrics["latency_ms_p50"] is not None
+
+
+def test_stuck_worker_is_killed_and_replaced():
+    pool = SandboxPool(size=1, timeout_seconds=0.2)
+    try:
+        result = pool.run("while True:\n    pass")
+        after = pool.run("result = {'output': 'fresh'}")
+    finally:
+        pool.close()
+
+    assert result["error"] is not None
+    assert "timed out" in result["error"] or "terminated" in result["error"]
+    assert after["output"] == "fresh"
+    assert pool.metrics()["timeouts"] + pool.metrics()["crashes"] == 1
+
+
+def test_workers_are_recycled_after_max_runs():
+    pool = SandboxPool(size=1, max_runs_per_worker=2)
+    try:
+        outputs = [pool.run(f"result = {{'output': '{i}'}}")["output"] for i in range(3)]
+    finally:
+        pool.close()
+
+    assert outputs == ["0", "1", "2"]
+    assert pool.metrics()["recycled"] == 1
+
+
+def test_execute_python_analysis_validates_before_dispatch(monkeypatch):
+    from qdash.copilot.tooling import sandbox_pool
+
+    class ExplodingPool:
+        def run(self, *_args):
+            raise AssertionError("invalid code must not reach the pool")
+
+    monkeypatch.setattr(sandbox_pool, "get_sandbox_pool", ExplodingPool)
+
+    result = execute_python_analysis("import os")
+
+    assert result["error"] == "Import of 'os' is not allowed"
@@ -1,6 +1,11 @@
 """Tests for task datamodel, focusing on BaseTaskResultModel."""
 
-from qdash.datamodel.task import QubitTaskModel, RunParameterModel
+from qdash.datamodel.task import (
+    CalibDataModel,
+    ParameterModel,
+    QubitTaskModel,
+    RunParameterModel,
+)
 
 
 class TestBaseTaskResultModelRunParameters:
@@ -81,3 +86,57 @@ class TestRunParameterModelDump:
         assert dumped["value"] == (0, 100, 50)
         assert dumped["value_type"] == "np.linspace"
         assert dumped["unit"] == "ns"
+
+
+class TestCalibDataModelTakeChanges:
+    """Test change tracking used to merge calib_data into executions incrementally."""
+
+    def test_first_call_returns_everything(self):
+        """Test entries present before tracking starts are all reported once."""
+        calib_data = CalibDataModel(
+            qubit={"0": {"freq": ParameterModel(value=5.0)}},
+            coupling={"0-1": {"cr_amp": ParameterModel(value=0.5)}},
+        )
+
+        delta = calib_data.take_changes()
+
+        assert delta.qubit == calib_data.qubit
+        assert delta.coupling == calib_data.coupling
+        assert calib_data.take_changes() == CalibDataModel()
+
+    def test_returns_only_entries_written_since_last_call(self):
+        """Test a delta carries just the parameters put since the previous call."""
+        calib_data = CalibDataModel(qubit={"0": {"freq": ParameterModel(value=5.0)}})
+        calib_data.take_changes()
+
+        t1 = ParameterModel(value=100.0)
+        cr_amp = ParameterModel(value=0.5)
+        calib_data.put_qubit_data("0", "t1", t1)
+        calib_data.put_coupling_data("0-1", "cr_amp", cr_amp)
+
+        delta = calib_data.take_changes()
+        assert delta.qubit == {"0": {"t1": t1}}
+        assert delta.coupling == {"0-1": {"cr_amp": cr_amp}}
+
+    def test_removed_entries_are_not_reported(self):
+        """Test a parameter popped after being put is left out of the delta."""
+        calib_data = CalibDataModel()
+        calib_data.take_changes()
+        calib_data.put_qubit_data("0", "t1", ParameterModel(value=100.0))
+        calib_data.qubit["0"].pop("t1")
+
+        assert calib_data.take_changes() == CalibDataModel()
+
+    def test_delta_size_is_independent_of_history(self):
+        """Test merging after each of 500 tasks touches only that task's output."""
+        calib_data = CalibDataModel()
+        calib_data.take_changes()
+
+        sizes = []
+        for i in range(500):
+            calib_data.put_qubit_data(str(i % 64), f"param_{i}", ParameterModel(value=float(i)))
+            delta = calib_data.take_changes()
+            sizes.append(sum(len(params) for params in delta.qubit.values()))
+
+        assert sizes == [1] * 500
+        assert sum(len(params) for params in calib_data.qubit.values()) == 500
@@ -3,12 +3,15 @@ from typing import cast
 import pytest
 from pymongo.errors import DuplicateKeyError
 
+from qdash.common.utils.datetime import now
 from qdash.dbmodel.forum import ForumCounterDocument, ForumPostDocument
 from qdash.dbmodel.migration import (
     MigrationError,
     migrate_backfill_forum_thread_numbers,
+    migrate_backfill_notification_counters,
     migrate_forum_status,
 )
+from qdash.dbmodel.notification import NotificationCounterDocument, NotificationDocument
 
 
 def _forum_post(post_id) -> ForumPostDocument:
@@ -167,3 +170,40 @@ def test_migrate_forum_status_moves_closed_and_legacy_labels(init_db):
     assert "is_closed" not in closed_doc
     assert review_doc["labels"] == ["review"]
     assert plain_doc["status"] == "open"
+
+
+def _notification(key: str, project_id: str, *, read: bool) -> None:
+    NotificationDocument(
+        project_id=project_id,
+        recipient_user_id="uid-alice",
+        recipient_username="alice",
+        actor_username="bob",
+        kind="mention",
+        source_type="issue",
+        source_id=key,
+        target_url="/issues/1",
+        title="Mention",
+        dedupe_key=key,
+        read_at=now() if read else None,
+    ).insert()
+
+
+def test_backfill_notification_counters_recomputes_and_resets(init_db):
+    _notification("n1", "project-a", read=False)
+    _notification("n2", "project-a", read=True)
+    _notification("n3", "project-b", read=False)
+    NotificationCounterDocument(
+        recipient_user_id="uid-alice", project_id="project-c", unread=4, total=4
+    ).insert()
+
+    dry_run = migrate_backfill_notification_counters(dry_run=True)
+    assert dry_run["counters_to_update"] == 3
+    assert NotificationCounterDocument.find({}).count() == 1
+
+    migrate_backfill_notification_counters(dry_run=False)
+    counters = {
+        doc.project_id: (doc.unread, doc.total)
+        for doc in NotificationCounterDocument.find({"recipient_user_id": "uid-alice"}).run()
+    }
+    assert counters == {"project-a": (1, 2), "project-b": (1, 1), "project-c": (0, 0)}
+    assert migrate_backfill_notification_counters(dry_run=True)["counters_to_update"] == 0
@@ -1,5 +1,7 @@
 """Tests for chip repository entity model loaders."""
 
+import pytest
+
 from qdash.datamodel.system_info import SystemInfoModel
 from qdash.dbmodel.coupling import CouplingDocument
 from qdash.dbmodel.qubit import QubitDocument
@@ -56,3 +58,86 @@ def test_get_all_coupling_models_filters_by_username(init_db) -> None:
     assert set(result) == {"20-21"}
     assert result["20-21"].username == "admin"
     assert "zx90_gate_fidelity" in result["20-21"].data
+
+
+def _insert_qubits(qids: list[str]) -> None:
+    for qid in qids:
+        QubitDocument(
+            project_id="project-1",
+            username="admin",
+            qid=qid,
+            chip_id="64Qv3",
+            data={"t1": {"value": float(qid)}, "t2_echo": {"value": 1.0}},
+            system_info=SystemInfoModel(),
+        ).insert()
+
+
+def test_list_qubits_keyset_pages_cover_every_qubit_once(init_db) -> None:
+    """Following next_cursor walks the chip in qid order without gaps or repeats."""
+    _insert_qubits([str(i) for i in range(7)])
+    repo = MongoChipRepository()
+
+    seen: list[str] = []
+    totals: list[tuple[int | None, bool]] = []
+    cursor: str | None = ""
+    while cursor is not None:
+        page = repo.list_qubits("project-1", "64Qv3", limit=3, cursor=cursor, estimated_total=True)
+        seen.extend(q["qid"] for q in page.items)
+        totals.append((page.total, page.total_estimated))
+        cursor = page.next_cursor
+
+    assert seen == [str(i) for i in range(7)]
+    assert totals == [(7, False), (7, True), (7, True)]
+
+
+def test_list_qubits_projects_requested_fields(init_db) -> None:
+    """Only the requested fields are fetched; qid and chip_id are always present."""
+    _insert_qubits(["0", "1"])
+
+    page = MongoChipRepository().list_qubits("project-1", "64Qv3", fields=["data.t1"])
+
+    assert page.items[0] == {"qid": "0", "chip_id": "64Qv3", "data": {"t1": {"value": 0.0}}}
+    assert page.total == 2
+    assert page.next_cursor is None
+
+
+def test_list_qubits_rejects_unknown_field(init_db) -> None:
+    with pytest.raises(ValueError, match="Unknown field"):
+        MongoChipRepository().list_qubits("project-1", "64Qv3", fields=["system_info"])
+
+
+def test_aggregate_bulk_metrics_reads_several_chips_in_qid_order(init_db) -> None:
+    _insert_qubits(["1", "0"])
+    QubitDocument(
+        project_id="project-1",
+        username="admin",
+        qid="0",
+        chip_id="144Qv1",
+        data={"t1": {"value": 5.0, "unit": "μs"}},
+        system_info=SystemInfoModel(),
+    ).insert()
+
+    rows = MongoChipRepository().aggregate_bulk_metrics(
+        "project-1", ["64Qv3", "144Qv1"], ["t1", "data.t2_echo"], qids=["0"]
+    )
+
+    assert rows == [
+        {"chip_id": "144Qv1", "qid": "0", "values": [5.0, None], "units": ["μs", None]},
+        {"chip_id": "64Qv3", "qid": "0", "values": [0.0, 1.0], "units": [None, None]},
+    ]
+
+
+@pytest.mark.parametrize("field", ["$where", "t1\n", "data.t1.value"])
+def test_aggregate_bulk_metrics_rejects_non_metric_field(init_db, field: str) -> None:
+    with pytest.raises(ValueError, match="Unknown field"):
+        MongoChipRepository().aggregate_bulk_metrics("project-1", ["64Qv3"], [field])
+
+
+def test_find_metric_data_projects_requested_metrics_only(init_db) -> None:
+    _insert_qubits(["0", "1", "2"])
+
+    result = MongoChipRepository().find_metric_data(
+        "project-1", "64Qv3", ["0", "2", "9"], ["t1", "x90_gate_fidelity"], username="admin"
+    )
+
+    assert result == {"0": {"t1": {"value": 0.0}}, "2": {"t1": {"value": 2.0}}}
@@ -0,0 +1,38 @@
+"""Tests for MongoExecutionHistoryRepository."""
+
+from datetime import datetime, timezone
+
+from qdash.dbmodel.execution_history import ExecutionHistoryDocument, ExecutionHistorySummary
+from qdash.repository.execution_history import MongoExecutionHistoryRepository
+
+
+def test_list_by_chip_reads_only_listing_columns(init_db) -> None:
+    """Listings are projected to ExecutionHistorySummary; legacy elapsed strings still parse."""
+    ExecutionHistoryDocument.get_motor_collection().insert_one(
+        {
+            "project_id": "proj-1",
+            "execution_id": "exec-1",
+            "name": "calibrate",
+            "status": "completed",
+            "chip_id": "chip-1",
+            "username": "alice",
+            "tags": ["daily"],
+            "note": {"flow_run_id": "run-1", "large": "x" * 10_000},
+            "message": "done",
+            "calib_data_path": "/calib",
+            "system_info": {},
+            "start_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "end_at": None,
+            "elapsed_time": "0:02:30",
+        }
+    )
+
+    page = MongoExecutionHistoryRepository().list_by_chip(project_id="proj-1", chip_id="chip-1")
+
+    (summary,) = page.items
+    assert isinstance(summary, ExecutionHistorySummary)
+    assert summary.execution_id == "exec-1"
+    assert summary.tags == ["daily"]
+    assert summary.elapsed_time == 150.0
+    assert summary.start_at == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert not hasattr(summary, "note")
@@ -0,0 +1,153 @@
+"""Tests for execution leases (MongoDB and in-memory implementations)."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from qdash.dbmodel.execution_lock import ExecutionLeaseDocument
+from qdash.repository.execution_lock import MongoExecutionLockRepository
+from qdash.repository.inmemory.execution_lock import InMemoryExecutionLockRepository
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.current = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: float) -> None:
+        self.current += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(params=["mongo", "inmemory"])
+def repo(request, clock):
+    if request.param == "mongo":
+        request.getfixturevalue("init_db")
+        return MongoExecutionLockRepository(clock=clock)
+    return InMemoryExecutionLockRepository(clock=clock)
+
+
+class TestExecutionLeases:
+    """Contract shared by every ExecutionLockRepository implementation."""
+
+    def test_disjoint_qubits_and_chips_lease_concurrently(self, repo):
+        first = repo.acquire_lease("p1", "chip-a", "exec-1", qids=["0", "1"], lease_seconds=60)
+        second = repo.acquire_lease("p1", "chip-a", "exec-2", qids=["2", "3"], lease_seconds=60)
+        other_chip = repo.acquire_lease("p1", "chip-b", "exec-3", lease_seconds=60)
+
+        assert first is not None and second is not None and other_chip is not None
+        assert second.fencing_token > first.fencing_token
+        assert {lease.owner for lease in repo.list_active_leases("p1")} == {
+            "exec-1",
+            "exec-2",
+            "exec-3",
+        }
+        # Leases never set the legacy project-wide lock.
+        assert not repo.is_locked("p1")
+
+    def test_overlapping_and_whole_chip_requests_conflict(self, repo):
+        held = repo.acquire_lease("p1", "chip-a", "exec-1", qids=["0", "1"], lease_seconds=60)
+
+        assert repo.acquire_lease("p1", "chip-a", "exec-2", qids=["1"], lease_seconds=60) is None
+        assert repo.acquire_lease("p1", "chip-a", "exec-2", lease_seconds=60) is None
+
+        repo.release_lease(held)
+        whole = repo.acquire_lease("p1", "chip-a", "exec-2", lease_seconds=60)
+        assert whole is not None
+        assert repo.acquire_lease("p1", "chip-a", "exec-3", qids=["9"], lease_seconds=60) is None
+
+    def test_expired_lease_frees_hardware_and_fences_stale_holder(self, repo, clock):
+        stale = repo.acquire_lease("p1", "chip-a", "exec-1", qids=["0"], lease_seconds=10)
+
+        clock.advance(11)
+        assert repo.list_active_leases("p1") == []
+        fresh = repo.acquire_lease("p1", "chip-a", "exec-2", qids=["0"], lease_seconds=10)
+
+        assert fresh is not None
+        assert fresh.fencing_token > stale.fencing_token
+        assert not repo.is_lease_held(stale)
+        assert not repo.renew_lease(stale, lease_seconds=10)
+        assert repo.is_lease_held(fresh)
+
+    def test_renew_keeps_lease_alive(self, repo, clock):
+        lease = repo.acquire_lease("p1", "chip-a", "exec-1", lease_seconds=10)
+
+        clock.advance(8)
+        assert repo.renew_lease(lease, lease_seconds=10)
+        clock.advance(8)
+
+        assert repo.is_lease_held(lease)
+        assert repo.acquire_lease("p1", "chip-a", "exec-2", qids=["0"], lease_seconds=10) is None
+
+    def test_release_owner_leases(self, repo):
+        repo.acquire_lease("p1", "chip-a", "exec-1", qids=["0"], lease_seconds=60)
+        repo.acquire_lease("p1", "chip-b", "exec-1", lease_seconds=60)
+        kept = repo.acquire_lease("p1", "chip-a", "exec-2", qids=["1"], lease_seconds=60)
+
+        assert repo.release_owner_leases("p1", "exec-1") == 2
+        assert [lease.lease_id for lease in repo.list_active_leases("p1")] == [kept.lease_id]
+
+
+class _RacingCollection:
+    """Lease collection where another session wins the first upsert on the chip."""
+
+    def __init__(self, collection, race) -> None:
+        self._collection = collection
+        self._race = race
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    def find_one_and_update(self, *args, **kwargs):
+        if kwargs.get("upsert") and self._race is not None:
+            race, self._race = self._race, None
+            race()
+            raise DuplicateKeyError("E11000 duplicate key error")
+        return self._collection.find_one_and_update(*args, **kwargs)
+
+
+class TestMongoFirstLeaseRace:
+    """Two sessions racing to create a chip's lease document."""
+
+    def _racing_repo(self, clock, monkeypatch, race):
+        repo = MongoExecutionLockRepository(clock=clock)
+        racing = _RacingCollection(ExecutionLeaseDocument.get_motor_collection(), race)
+        monkeypatch.setattr(repo, "_collection", lambda: racing)
+        return repo
+
+    def test_disjoint_request_is_granted_after_losing_the_upsert(self, init_db, clock, monkeypatch):
+        other = MongoExecutionLockRepository(clock=clock)
+        repo = self._racing_repo(
+            clock,
+            monkeypatch,
+            lambda: other.acquire_lease("p1", "chip-a", "exec-1", qids=["0"], lease_seconds=60),
+        )
+
+        lease = repo.acquire_lease("p1", "chip-a", "exec-2", qids=["1"], lease_seconds=60)
+
+        assert lease is not None
+        assert lease.fencing_token == 2
+        assert {held.owner for held in other.list_active_leases("p1", "chip-a")} == {
+            "exec-1",
+            "exec-2",
+        }
+
+    def test_overlapping_request_still_conflicts(self, init_db, clock, monkeypatch):
+        other = MongoExecutionLockRepository(clock=clock)
+        repo = self._racing_repo(
+            clock,
+            monkeypatch,
+            lambda: other.acquire_lease("p1", "chip-a", "exec-1", qids=["0"], lease_seconds=60),
+        )
+
+        assert repo.acquire_lease("p1", "chip-a", "exec-2", qids=["0"], lease_seconds=60) is None
+        assert [held.owner for held in other.list_active_leases("p1")] == ["exec-1"]
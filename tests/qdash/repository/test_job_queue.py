@@ -0,0 +1,144 @@
+"""Tests for the durable job queue (MongoDB and in-memory implementations)."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from qdash.datamodel.job import JobStatus
+from qdash.repository.inmemory.job_queue import InMemoryJobQueueRepository
+from qdash.repository.job_queue import MongoJobQueueRepository
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.current = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: float) -> None:
+        self.current += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(params=["mongo", "inmemory"])
+def queue(request, clock):
+    if request.param == "mongo":
+        request.getfixturevalue("init_db")
+        return MongoJobQueueRepository(clock=clock)
+    return InMemoryJobQueueRepository(clock=clock)
+
+
+class TestJobQueue:
+    """Contract shared by every JobQueueRepository implementation."""
+
+    def test_lease_orders_by_priority_then_age(self, queue, clock):
+        low = queue.enqueue("ai_review", "p1", {"n": 1})
+        clock.advance(1)
+        high = queue.enqueue("ai_review", "p1", {"n": 2}, priority=10)
+        clock.advance(1)
+
+        first = queue.lease("w", ["ai_review"], lease_seconds=60)
+        second = queue.lease("w", ["ai_review"], lease_seconds=60)
+
+        assert first.job_id == high.job_id
+        assert second.job_id == low.job_id
+        assert first.status == JobStatus.LEASED
+        assert first.attempts == 1
+        assert queue.lease("w", ["ai_review"], lease_seconds=60) is None
+
+    def test_lease_filters_by_kind_and_delay(self, queue, clock):
+        queue.enqueue("agent_action", "p1", {})
+        delayed = queue.enqueue("ai_review", "p1", {}, delay_seconds=30)
+
+        assert queue.lease("w", ["ai_review"], lease_seconds=60) is None
+        clock.advance(31)
+        assert queue.lease("w", ["ai_review"], lease_seconds=60).job_id == delayed.job_id
+
+    def test_dedupe_key_allows_one_active_job(self, queue):
+        first = queue.enqueue("ai_review", "p1", {}, dedupe_key="ai_review:t1")
+        assert queue.enqueue("ai_review", "p1", {}, dedupe_key="ai_review:t1") is None
+
+        job = queue.lease("w", ["ai_review"], lease_seconds=60)
+        assert job.job_id == first.job_id
+        assert queue.enqueue("ai_review", "p1", {}, dedupe_key="ai_review:t1") is None
+
+        assert queue.complete(job.job_id, job.lease_token)
+        assert queue.enqueue("ai_review", "p1", {}, dedupe_key="ai_review:t1") is not None
+
+    def test_expired_lease_is_reclaimed_and_stale_token_rejected(self, queue, clock):
+        queue.enqueue("ai_review", "p1", {})
+        stale = queue.lease("w1", ["ai_review"], lease_seconds=10)
+
+        clock.advance(11)
+        assert queue.requeue_expired() == 1
+        reclaimed = queue.get(stale.job_id)
+        assert reclaimed.status == JobStatus.QUEUED
+        assert "lease expired" in reclaimed.last_error
+
+        clock.advance(3600)
+        fresh = queue.lease("w2", ["ai_review"], lease_seconds=10)
+        assert fresh.job_id == stale.job_id
+        assert fresh.attempts == 2
+        assert not queue.complete(stale.job_id, stale.lease_token)
+        assert not queue.heartbeat(stale.job_id, stale.lease_token, lease_seconds=10)
+        assert queue.complete(fresh.job_id, fresh.lease_token)
+        assert queue.get(fresh.job_id).status == JobStatus.COMPLETED
+
+    def test_heartbeat_keeps_lease_alive(self, queue, clock):
+        queue.enqueue("ai_review", "p1", {})
+        job = queue.lease("w", ["ai_review"], lease_seconds=10)
+
+        clock.advance(8)
+        assert queue.heartbeat(job.job_id, job.lease_token, lease_seconds=10)
+        clock.advance(8)
+
+        assert queue.requeue_expired() == 0
+        assert queue.get(job.job_id).status == JobStatus.LEASED
+
+    def test_fail_retries_with_backoff_then_dies(self, queue, clock):
+        queue.enqueue("ai_review", "p1", {}, max_attempts=2, dedupe_key="k")
+        job = queue.lease("w", ["ai_review"], lease_seconds=60)
+
+        retried = queue.fail(job.job_id, job.lease_token, "boom")
+        assert retried.status == JobStatus.QUEUED
+        assert retried.available_at > clock()
+        assert queue.lease("w", ["ai_review"], lease_seconds=60) is None
+
+        clock.advance(3600)
+        job = queue.lease("w", ["ai_review"], lease_seconds=60)
+        dead = queue.fail(job.job_id, job.lease_token, "boom again")
+
+        assert dead.status == JobStatus.DEAD
+        assert dead.last_error == "boom again"
+        assert queue.enqueue("ai_review", "p1", {}, dedupe_key="k") is not None
+
+    def test_permanent_failure_skips_retries(self, queue):
+        queue.enqueue("ai_review", "p1", {}, max_attempts=5)
+        job = queue.lease("w", ["ai_review"], lease_seconds=60)
+
+        assert queue.fail(job.job_id, job.lease_token, "bad", retry=False).status == JobStatus.DEAD
+
+    def test_project_concurrency_limit(self, queue):
+        busy = [queue.enqueue("ai_review", "busy", {"n": n}, priority=5) for n in range(3)]
+        other = queue.enqueue("ai_review", "other", {})
+
+        leased = [
+            queue.lease("w", ["ai_review"], lease_seconds=60, project_concurrency=2)
+            for _ in range(4)
+        ]
+
+        leased_ids = [job.job_id for job in leased if job is not None]
+        assert leased_ids[:2] == [busy[0].job_id, busy[1].job_id]
+        assert leased_ids[2] == other.job_id
+        assert leased[3] is None
+
+        queue.complete(leased[0].job_id, leased[0].lease_token)
+        third = queue.lease("w", ["ai_review"], lease_seconds=60, project_concurrency=2)
+        assert third.job_id == busy[2].job_id
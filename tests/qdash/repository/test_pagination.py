@@ -0,0 +1,78 @@
+"""Tests for keyset pagination helpers."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pymongo import ASCENDING, DESCENDING
+
+from qdash.repository.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+)
+
+
+def test_cursor_round_trips_datetimes_and_total() -> None:
+    start = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    cursor = encode_cursor("executions:p:c", [start, "exec-9"], total=42)
+    values, total = decode_cursor(cursor, "executions:p:c")
+
+    assert values[0].replace(tzinfo=timezone.utc) == start
+    assert values[1] == "exec-9"
+    assert total == 42
+    assert "=" not in cursor
+
+
+def test_cursor_from_another_scope_is_rejected() -> None:
+    cursor = encode_cursor("qubits:p:chip-a", ["3", "alice"])
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "qubits:p:chip-b")
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", "bm90IGpzb24"])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "qubits:p:c")
+
+
+def test_keyset_filter_ascending_breaks_ties_on_later_keys() -> None:
+    sort = [("qid", ASCENDING), ("username", ASCENDING)]
+
+    assert keyset_filter(sort, ["3", "alice"]) == {
+        "$or": [
+            {"qid": {"$gt": "3"}},
+            {"$and": [{"qid": "3"}, {"username": {"$gt": "alice"}}]},
+        ]
+    }
+
+
+def test_keyset_filter_descending_keeps_null_keys_last() -> None:
+    sort = [("start_at", DESCENDING), ("execution_id", DESCENDING)]
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert keyset_filter(sort, [start, "e1"]) == {
+        "$or": [
+            {"$or": [{"start_at": {"$lt": start}}, {"start_at": None}]},
+            {
+                "$and": [
+                    {"start_at": start},
+                    {"$or": [{"execution_id": {"$lt": "e1"}}, {"execution_id": None}]},
+                ]
+            },
+        ]
+    }
+    # A null start_at sorts last, so only equal-null rows can follow it.
+    assert keyset_filter(sort, [None, "e1"]) == {
+        "$and": [
+            {"start_at": None},
+            {"$or": [{"execution_id": {"$lt": "e1"}}, {"execution_id": None}]},
+        ]
+    }
+
+
+def test_keyset_filter_rejects_wrong_arity() -> None:
+    with pytest.raises(InvalidCursorError):
+        keyset_filter([("qid", ASCENDING)], ["1", "extra"])
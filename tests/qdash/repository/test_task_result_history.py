@@ -140,6 +140,114 @@ def test_find_latest_by_chip_and_qids_coerces_null_upstream_id(init_db) -> None:
     assert results[0].upstream_id == ""
 
 
+def test_set_phase_timings_keeps_other_phases(init_db) -> None:
+    """Setting timings does not drop phases recorded elsewhere (e.g. the AI review)."""
+    _insert_task_result_row(_seq=1, phase_timings={"ai_review": 12.0, "run": 1.0})
+
+    MongoTaskResultHistoryRepository().set_phase_timings(
+        project_id="proj-1", task_id="task-1", phase_timings={"run": 2.0, "history": 0.1}
+    )
+
+    doc = TaskResultHistoryDocument.find_one({"task_id": "task-1"}).run()
+    assert doc is not None
+    assert doc.phase_timings == {"ai_review": 12.0, "run": 2.0, "history": 0.1}
+
+
+def test_aggregate_phase_timings_groups_by_task_and_phase(init_db) -> None:
+    """Phase timings are summed per (task name, phase) within the time window."""
+    dt = lambda d: datetime(2026, 1, d, tzinfo=timezone.utc)  # noqa: E731
+    _insert_task_result_row(_seq=1, start_at=dt(2), phase_timings={"run": 1.0, "history": 0.5})
+    _insert_task_result_row(_seq=2, start_at=dt(3), phase_timings={"run": 3.0})
+    _insert_task_result_row(_seq=3, start_at=dt(3), name="CheckT1", phase_timings={"run": 2.0})
+    _insert_task_result_row(_seq=4, start_at=dt(1), phase_timings={"run": 100.0})
+    _insert_task_result_row(_seq=5, start_at=dt(3))
+
+    rows = MongoTaskResultHistoryRepository().aggregate_phase_timings(
+        project_id="proj-1", chip_id="chip-1", cutoff_time=dt(2)
+    )
+
+    assert rows == [
+        {
+            "name": "CheckRabi",
+            "phase": "history",
+            "count": 1,
+            "total_seconds": 0.5,
+            "max_seconds": 0.5,
+        },
+        {"name": "CheckRabi", "phase": "run", "count": 2, "total_seconds": 4.0, "max_seconds": 3.0},
+        {"name": "CheckT1", "phase": "run", "count": 1, "total_seconds": 2.0, "max_seconds": 2.0},
+    ]
+
+
+def test_aggregate_elapsed_times_groups_completed_runs(init_db) -> None:
+    """Completed durations are averaged per (task name, qid) for the requested tasks."""
+    dt = lambda d: datetime(2026, 1, d, tzinfo=timezone.utc)  # noqa: E731
+    cr = "CheckCrossResonance"
+    _insert_task_result_row(_seq=1, start_at=dt(2), name=cr, qid="0-1", elapsed_time=30.0)
+    _insert_task_result_row(_seq=2, start_at=dt(3), name=cr, qid="0-1", elapsed_time=50.0)
+    _insert_task_result_row(_seq=3, start_at=dt(3), name=cr, qid="2-3", elapsed_time=20.0)
+    _insert_task_result_row(
+        _seq=4, start_at=dt(3), name=cr, qid="2-3", elapsed_time=5.0, status="failed"
+    )
+    _insert_task_result_row(_seq=5, start_at=dt(1), name=cr, qid="2-3", elapsed_time=900.0)
+    _insert_task_result_row(_seq=6, start_at=dt(3), name="CheckRabi", qid="0", elapsed_time=4.0)
+
+    rows = MongoTaskResultHistoryRepository().aggregate_elapsed_times(
+        project_id="proj-1", chip_id="chip-1", task_names=[cr], cutoff_time=dt(2)
+    )
+
+    assert rows == [
+        {"name": cr, "qid": "0-1", "count": 2, "mean_seconds": 40.0, "max_seconds": 50.0},
+        {"name": cr, "qid": "2-3", "count": 1, "mean_seconds": 20.0, "max_seconds": 20.0},
+    ]
+
+
+def test_aggregate_duration_stats_counts_batch_runs_once(init_db) -> None:
+    """Rows sharing execution, task and start time form one run of that batch size."""
+    dt = lambda d, h=0: datetime(2026, 1, d, h, tzinfo=timezone.utc)  # noqa: E731
+    for seq, qid in enumerate(["0", "1", "2"]):
+        _insert_task_result_row(
+            _seq=seq, start_at=dt(2), name="CheckQubitFrequencies", qid=qid, elapsed_time=60.0
+        )
+    _insert_task_result_row(
+        _seq=3, start_at=dt(3), name="CheckQubitFrequencies", qid="0", elapsed_time=10.0
+    )
+    _insert_task_result_row(_seq=4, start_at=dt(2, 1), name="CheckRabi", elapsed_time=4.0)
+    _insert_task_result_row(
+        _seq=5, start_at=dt(2, 2), name="CheckRabi", elapsed_time=8.0, status="failed"
+    )
+    _insert_task_result_row(_seq=6, start_at=dt(2, 3), name="CheckRabi", status="running")
+    _insert_task_result_row(_seq=7, start_at=dt(1), name="CheckRabi", elapsed_time=900.0)
+
+    rows = MongoTaskResultHistoryRepository().aggregate_duration_stats(
+        project_id="proj-1", chip_id="chip-1", cutoff_time=dt(2)
+    )
+
+    assert rows == [
+        {
+            "name": "CheckQubitFrequencies",
+            "batch_size": 1,
+            "count": 1,
+            "mean_seconds": 10.0,
+            "stddev_seconds": 0.0,
+        },
+        {
+            "name": "CheckQubitFrequencies",
+            "batch_size": 3,
+            "count": 1,
+            "mean_seconds": 60.0,
+            "stddev_seconds": 0.0,
+        },
+        {
+            "name": "CheckRabi",
+            "batch_size": 1,
+            "count": 2,
+            "mean_seconds": 6.0,
+            "stddev_seconds": 2.0,
+        },
+    ]
+
+
 @patch("qdash.workflow.engine.task.ai_review.enqueue_ai_review_note")
 @patch("qdash.repository.task_result_history.TaskResultHistoryDocument")
 def test_save_continues_when_ai_review_fails(
@@ -157,3 +265,24 @@ def test_save_continues_when_ai_review_fails(
         task=task,
         execution_model=execution_model,
     )
+
+
+def test_iter_raw_projects_and_sorts_rows(init_db) -> None:
+    """Raw iteration returns only the projected fields, in the requested order."""
+    dt = lambda d: datetime(2026, 1, d, tzinfo=timezone.utc)  # noqa: E731
+    _insert_task_result_row(_seq=1, start_at=dt(3), output_parameters={"t1": {"value": 3.0}})
+    _insert_task_result_row(_seq=2, start_at=dt(1), output_parameters={"t1": {"value": 1.0}})
+    _insert_task_result_row(_seq=3, start_at=dt(2), output_parameters={"t2": {"value": 9.0}})
+
+    rows = list(
+        MongoTaskResultHistoryRepository().iter_raw(
+            {"project_id": "proj-1", "output_parameters.t1": {"$exists": True}},
+            {"_id": 0, "task_id": 1, "output_parameters.t1": 1},
+            sort=[("start_at", 1)],
+        )
+    )
+
+    assert rows == [
+        {"task_id": "task-2", "output_parameters": {"t1": {"value": 1.0}}},
+        {"task_id": "task-1", "output_parameters": {"t1": {"value": 3.0}}},
+    ]
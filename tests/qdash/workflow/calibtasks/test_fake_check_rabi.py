@@ -1,8 +1,9 @@
 import numpy as np
+import pytest
 
 from qdash.workflow.calibtasks.base import RunResult
 from qdash.workflow.calibtasks.fake.fake_check_rabi import FakeCheckRabi
-from qdash.workflow.engine.backend.fake import FakeBackend
+from qdash.workflow.engine.backend.fake import FakeBackend, InjectedFailureError
 
 
 def test_fake_check_rabi_outputs_control_amplitude():
@@ -33,3 +34,12 @@ def test_fake_check_rabi_outputs_control_amplitude():
     assert maximum_rabi_frequency.value == 960.0
     assert control_amplitude.value == 0.0125 / 0.96
     assert control_amplitude.execution_id == "exec-1"
+
+
+def test_fake_check_rabi_raises_injected_failure():
+    """Fake tasks should raise failures injected through the fake backend before running."""
+    backend = FakeBackend({"inject_failures": {"CheckRabi": {"0": [0.0]}}})
+
+    with pytest.raises(InjectedFailureError):
+        FakeCheckRabi().run(backend, "0")
+    assert FakeCheckRabi().run(backend, "1").raw_result
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from qdash.datamodel.task import RunParameterModel
+from qdash.workflow.engine.backend.fake import (
+    FAKE_FAILURES_ENV,
+    FakeBackend,
+    InjectedFailureError,
+)
+
+
+def _offset(value: float) -> dict[str, RunParameterModel]:
+    return {"qubit_frequency_offset": RunParameterModel(value=value, unit="GHz")}
+
+
+def test_failure_rule_matches_qid_and_offset() -> None:
+    backend = FakeBackend({"inject_failures": {"CheckRabi": {"3": [0.0], "*": [0.001]}}})
+
+    with pytest.raises(InjectedFailureError, match="CheckRabi on Q3 at \\+0 MHz"):
+        backend.check_injected_failure("CheckRabi", "3", {})
+    backend.check_injected_failure("CheckRabi", "3", _offset(0.001))
+    with pytest.raises(InjectedFailureError):
+        backend.check_injected_failure("CheckRabi", "4", _offset(0.001))
+    backend.check_injected_failure("CheckRabi", "4", {})
+    backend.check_injected_failure("CheckT1", "3", {})
+
+
+def test_null_rule_fails_every_offset() -> None:
+    backend = FakeBackend({"inject_failures": {"CheckT1": {"5": None}}})
+
+    for value in (0.0, 0.001, -0.001):
+        with pytest.raises(InjectedFailureError):
+            backend.check_injected_failure("CheckT1", "5", _offset(value))
+
+
+def test_rules_are_read_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(FAKE_FAILURES_ENV, json.dumps({"CheckRabi": {"*": None}}))
+
+    with pytest.raises(InjectedFailureError):
+        FakeBackend({}).check_injected_failure("CheckRabi", "0", {})
+    FakeBackend({"inject_failures": {}}).check_injected_failure("CheckRabi", "0", {})
@@ -143,6 +143,19 @@ class TestCalibDataMerging:
         assert "freq" in manager.calib_data.qubit["0"]
         assert "t1" in manager.calib_data.qubit["0"]
 
+    def test_merging_deltas_matches_merging_full_state(self):
+        """Test merging take_changes() deltas yields the same data as full merges."""
+        source = CalibDataModel()
+        incremental = ExecutionStateManager(execution_id="exec-001")
+        full = ExecutionStateManager(execution_id="exec-002")
+
+        for i in range(20):
+            source.put_qubit_data(str(i % 4), f"param_{i % 7}", ParameterModel(value=float(i)))
+            incremental.merge_calib_data(source.take_changes())
+            full.merge_calib_data(source)
+
+        assert incremental.calib_data.qubit == full.calib_data.qubit
+
 
 class TestDatamodelConversion:
     """Test conversion to/from ExecutionModel."""
@@ -20,6 +20,8 @@ from qdash.workflow.engine.scheduler.cr_utils import (
     extract_qubit_frequency,
     group_cr_pairs_by_conflict,
     infer_direction_from_design,
+    mux_of,
+    muxes_conflict,
     qid_to_coords,
     split_fast_slow_pairs,
 )
@@ -145,6 +147,20 @@ def test_build_qubit_to_mux_map(mock_wiring_config):
     assert qid_to_mux["5"] == 1
 
 
+def test_mux_of_and_muxes_conflict(mock_wiring_config):
+    """Test MUX lookup and conflicts of MUX sets from the wiring."""
+    qid_to_mux = build_qubit_to_mux_map(mock_wiring_config)
+    conflict_map = build_mux_conflict_map(mock_wiring_config)
+
+    assert mux_of("5", qid_to_mux) == 1
+    assert mux_of("21") == 5  # Default: 4 qubits per MUX
+    assert mux_of("Q00") == "Q00"
+    assert muxes_conflict({0}, {0, 3})
+    assert not muxes_conflict({0}, {1})
+    assert muxes_conflict({0}, {1}, conflict_map)  # Shared readout module
+    assert not muxes_conflict({0}, {3}, conflict_map)
+
+
 # Coordinate conversion tests
 def test_qid_to_coords():
     """Test qubit ID to coordinate conversion."""
@@ -12,14 +12,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from qdash.workflow.engine.scheduler.cr_scheduler import CRScheduler
+from qdash.workflow.engine.scheduler.cr_utils import cr_pairs_conflict, predict_makespan
 from qdash.workflow.engine.scheduler.plugins import (
     CandidateQubitFilter,
     FidelityFilter,
     FilterContext,
     FrequencyDirectionalityFilter,
     IntraThenInterMuxScheduler,
+    MakespanScheduler,
     MuxConflictScheduler,
     ScheduleContext,
+    load_cr_pair_durations,
 )
 
 
@@ -341,6 +344,110 @@ def test_generate_with_plugins_custom_scheduler(
     assert "inter_mux_pairs" in schedule.metadata["scheduler"]
 
 
+@pytest.fixture
+def independent_context():
+    """Eight MUXes with one qubit pair each and no shared modules."""
+    return ScheduleContext(
+        qid_to_mux={str(q): q // 2 for q in range(16)},
+        mux_conflict_map={},
+    )
+
+
+def test_makespan_scheduler_groups_slow_pairs_together(independent_context):
+    """Slow pairs share groups instead of each stretching a group of fast ones."""
+    pairs = ["0-1", "2-3", "4-5", "6-7"]
+    durations = {"0-1": 100.0, "2-3": 1.0, "4-5": 100.0, "6-7": 1.0}
+
+    greedy = MuxConflictScheduler(max_parallel_ops=2).schedule(pairs, independent_context)
+    scheduler = MakespanScheduler(durations, max_parallel_ops=2)
+    groups = scheduler.schedule(pairs, independent_context)
+
+    assert predict_makespan(greedy, durations) == 200.0
+    assert groups == [["0-1", "4-5"], ["2-3", "6-7"]]
+    metadata = scheduler.get_metadata()
+    assert metadata["scheduler_name"] == "makespan"
+    assert metadata["predicted_makespan"] == 101.0
+    assert metadata["known_pairs"] == 4
+
+
+def test_makespan_scheduler_respects_conflicts(schedule_context):
+    """Every group is conflict-free and every pair is scheduled exactly once."""
+    pairs = ["0-1", "2-3", "4-5", "0-4", "1-2"]
+    durations = {"0-1": 30.0, "2-3": 5.0, "4-5": 20.0, "0-4": 50.0, "1-2": 10.0}
+
+    groups = MakespanScheduler(durations).schedule(pairs, schedule_context)
+
+    assert sorted(p for g in groups for p in g) == sorted(pairs)
+    for group in groups:
+        for i, pair_a in enumerate(group):
+            for pair_b in group[i + 1 :]:
+                assert not cr_pairs_conflict(
+                    pair_a,
+                    pair_b,
+                    schedule_context.qid_to_mux,
+                    schedule_context.mux_conflict_map,
+                )
+
+
+def test_makespan_scheduler_beats_greedy_on_lattice():
+    """On a 4x4-MUX lattice with a slow tail, LPT + local search beats colouring."""
+    qid_to_mux = {str(q): q // 4 for q in range(64)}
+    mux_conflict_map = {m: {n for n in range(16) if n // 4 == m // 4} - {m} for m in range(16)}
+    context = ScheduleContext(qid_to_mux=qid_to_mux, mux_conflict_map=mux_conflict_map)
+    intra = [f"{4 * m}-{4 * m + 1}" for m in range(16)]
+    inter = [f"{4 * m + 1}-{4 * m + 4}" for m in range(15)]
+    pairs = intra + inter
+    durations = {pair: (400.0 if i % 5 == 0 else 60.0 + i) for i, pair in enumerate(pairs)}
+
+    greedy = MuxConflictScheduler(max_parallel_ops=4).schedule(pairs, context)
+    scheduler = MakespanScheduler(durations, max_parallel_ops=4)
+    groups = scheduler.schedule(pairs, context)
+
+    assert sorted(p for g in groups for p in g) == sorted(pairs)
+    assert all(len(g) <= 4 for g in groups)
+    assert predict_makespan(groups, durations) < predict_makespan(greedy, durations)
+    metadata = scheduler.get_metadata()
+    assert metadata["predicted_makespan"] <= metadata["lpt_makespan"]
+
+
+def test_makespan_scheduler_default_and_reversed_durations(independent_context):
+    """Reversed couplings reuse recorded durations; unknown pairs use the median."""
+    scheduler = MakespanScheduler({"1-0": 10.0, "2-3": 20.0, "4-5": 90.0})
+
+    assert scheduler.predicted_duration("0-1") == 10.0
+    assert scheduler.predicted_duration("6-7") == 20.0
+    scheduler.schedule(["0-1", "6-7"], independent_context)
+    assert scheduler.get_metadata()["known_pairs"] == 1
+
+
+def test_load_cr_pair_durations_fills_missing_tasks():
+    """Pair durations sum task means; missing tasks use the per-task median."""
+    repository = MagicMock()
+    repository.aggregate_elapsed_times.return_value = [
+        {"name": "CheckCrossResonance", "qid": "0-1", "mean_seconds": 30.0},
+        {"name": "CheckCrossResonance", "qid": "2-3", "mean_seconds": 50.0},
+        {"name": "CheckCrossResonance", "qid": "4-5", "mean_seconds": 70.0},
+        {"name": "CreateZX90", "qid": "0-1", "mean_seconds": 5.0},
+        {"name": "CreateZX90", "qid": "4-5", "mean_seconds": 7.0},
+        {"name": "CheckCrossResonance", "qid": "0", "mean_seconds": 999.0},
+    ]
+
+    durations = load_cr_pair_durations(
+        "proj-1",
+        "chip-1",
+        ["CheckCrossResonance", "CreateZX90"],
+        repository=repository,
+    )
+
+    assert durations == {"0-1": 35.0, "2-3": 56.0, "4-5": 77.0}
+    repository.aggregate_elapsed_times.assert_called_once_with(
+        project_id="proj-1",
+        chip_id="chip-1",
+        task_names=["CheckCrossResonance", "CreateZX90"],
+        cutoff_time=None,
+    )
+
+
 # ============================================================================
 # Filter Repr Tests
 # ============================================================================
@@ -362,3 +469,5 @@ def test_scheduler_repr():
 
     intra_inter_scheduler = IntraThenInterMuxScheduler(inner_scheduler=mux_scheduler)
     assert "IntraThenInterMuxScheduler" in repr(intra_inter_scheduler)
+
+    assert "MakespanScheduler(max_ops=10, known_pairs=1)" in repr(MakespanScheduler({"0-1": 1.0}))
@@ -0,0 +1,116 @@
+"""Tests for stage-level retry scheduling."""
+
+from qdash.workflow.engine.scheduler.retry_scheduler import (
+    RetryAttempt,
+    RetryPolicy,
+    RetryScheduler,
+)
+
+TASKS = ["CheckRabi", "CheckT1", "CheckT2Echo"]
+
+
+def _failed(task_name: str, **outputs):
+    return {"status": "failed", "failed_task": task_name, "error": "boom", **outputs}
+
+
+class TestRetryPolicy:
+    def test_budget_defaults_to_offsets_and_can_be_overridden_per_task(self):
+        policy = RetryPolicy(offsets=[0.0, 0.001], task_max_attempts={"CheckT1": 1})
+
+        assert policy.budget("CheckRabi") == 2
+        assert policy.budget("CheckT1") == 1
+
+    def test_offset_reuses_last_entry_beyond_list(self):
+        policy = RetryPolicy(
+            offsets=[0.0, 0.001],
+            max_attempts=4,
+            task_offsets={"CheckT1": [0.0, -0.002]},
+        )
+
+        assert policy.offset("CheckRabi", 2) == 0.001
+        assert policy.offset("CheckRabi", 4) == 0.001
+        assert policy.offset("CheckT1", 2) == -0.002
+
+
+class TestRetryScheduler:
+    def test_initial_groups_keep_stage_grouping(self):
+        scheduler = RetryScheduler(TASKS)
+
+        groups = scheduler.initial_groups([["0", "1"], [], ["4"]])
+
+        assert [[a.qid for a in group] for group in groups] == [["0", "1"], ["4"]]
+        assert scheduler.max_groups == 2
+
+    def test_retry_resumes_at_failed_task_with_next_offset(self):
+        scheduler = RetryScheduler(TASKS, RetryPolicy(offsets=[0.0, 0.001, -0.001]))
+        scheduler.initial_groups([["0"]])
+
+        groups = scheduler.record({"0": _failed("CheckT1", CheckRabi={"ok": 1})})
+
+        assert groups == [[RetryAttempt(qid="0", start_task=1, attempt=2, offset=0.001)]]
+        assert scheduler.results["0"]["CheckRabi"] == {"ok": 1}
+        assert scheduler.results["0"]["status"] == "failed"
+
+    def test_success_after_retry_clears_error_and_keeps_earlier_outputs(self):
+        scheduler = RetryScheduler(TASKS)
+        scheduler.initial_groups([["0"]])
+        scheduler.record({"0": _failed("CheckT1", CheckRabi={"ok": 1})})
+
+        groups = scheduler.record(
+            {"0": {"status": "success", "CheckT1": {"ok": 2}, "CheckT2Echo": {"ok": 3}}}
+        )
+
+        assert groups == []
+        result = scheduler.results["0"]
+        assert result["status"] == "success"
+        assert result["attempt"] == 2
+        assert "error" not in result and "failed_task" not in result
+        assert set(result) >= set(TASKS)
+
+    def test_budget_is_per_task(self):
+        scheduler = RetryScheduler(TASKS, RetryPolicy(offsets=[0.0, 0.001]))
+        scheduler.initial_groups([["0"]])
+
+        # Attempt 2 of CheckRabi fails at CheckT1: CheckT1 starts its own budget.
+        assert scheduler.record({"0": _failed("CheckRabi")})[0][0].attempt == 2
+        assert scheduler.record({"0": _failed("CheckT1")})[0][0].attempt == 2
+        assert scheduler.record({"0": _failed("CheckT1")}) == []
+        assert scheduler.results["0"]["failed_task"] == "CheckT1"
+
+    def test_unknown_failure_is_not_retried(self):
+        scheduler = RetryScheduler(TASKS)
+        scheduler.initial_groups([["0"]])
+
+        assert scheduler.record({"0": {"status": "failed", "error": "session"}}) == []
+
+    def test_retries_keep_mux_lanes_together_within_group_limit(self):
+        scheduler = RetryScheduler(TASKS, max_groups=2)
+        failed = {qid: _failed("CheckRabi") for qid in ["0", "1", "4", "8", "9", "12"]}
+        scheduler.initial_groups([list(failed)])
+
+        groups = scheduler.record(failed)
+
+        assert len(groups) == 2
+        by_qid = {a.qid: i for i, group in enumerate(groups) for a in group}
+        assert by_qid["0"] == by_qid["1"]
+        assert by_qid["8"] == by_qid["9"]
+        assert sorted(len(group) for group in groups) == [3, 3]
+
+    def test_explicit_mux_mapping_is_used(self):
+        scheduler = RetryScheduler(TASKS, max_groups=4, qid_to_mux={"0": 1, "7": 1})
+
+        groups = scheduler.group([RetryAttempt(qid="0"), RetryAttempt(qid="7")])
+
+        assert len(groups) == 1
+
+    def test_conflicting_muxes_share_a_lane(self):
+        scheduler = RetryScheduler(TASKS, max_groups=4, mux_conflict_map={0: {2}, 2: {0}})
+
+        groups = scheduler.group(
+            [RetryAttempt(qid="0"), RetryAttempt(qid="4"), RetryAttempt(qid="8")]
+        )
+
+        by_qid = {a.qid: i for i, group in enumerate(groups) for a in group}
+        assert len(groups) == 2
+        assert by_qid["0"] == by_qid["8"]
+        assert by_qid["4"] != by_qid["0"]
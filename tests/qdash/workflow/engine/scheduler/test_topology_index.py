@@ -0,0 +1,170 @@
+"""Tests for the compiled wiring and topology indexes."""
+
+import os
+
+import pytest
+import yaml
+
+from qdash.common.config.loader import ConfigLoader
+from qdash.workflow.engine.scheduler import topology_index
+from qdash.workflow.engine.scheduler.cr_scheduler import CRScheduler
+from qdash.workflow.engine.scheduler.one_qubit_scheduler import OneQubitScheduler
+from qdash.workflow.engine.scheduler.topology_index import (
+    clear_index_cache,
+    get_topology_index,
+    get_wiring_index,
+)
+
+WIRING = [
+    {"mux": 0, "ctrl": ["R21B-5", "R21B-0"], "read_out": "Q73A-1"},
+    {"mux": 1, "ctrl": ["Q73A-2", "Q73A-4"], "read_out": "Q73A-8"},
+    {"mux": 4, "ctrl": ["R21B-7", "R21B-11"], "read_out": "Q2A-8"},
+]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_index_cache()
+    yield
+    clear_index_cache()
+
+
+@pytest.fixture
+def wiring_file(tmp_path):
+    path = tmp_path / "wiring.yaml"
+    path.write_text(yaml.dump({"test_chip": WIRING}))
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestWiringIndex:
+    def test_compiles_maps(self, wiring_file):
+        index = get_wiring_index("test_chip", wiring_file)
+
+        assert index.qid_to_mux["17"] == 4
+        assert index.mux_qids[1] == ("4", "5", "6", "7")
+        assert index.mux_conflicts[0] == frozenset({1, 4})
+        assert index.mux_box_types[0] == frozenset({"A", "B"})
+        assert index.box_b_module_muxes["R21B"] == (0, 4)
+
+    def test_index_is_immutable(self, wiring_file):
+        index = get_wiring_index("test_chip", wiring_file)
+
+        with pytest.raises(TypeError):
+            index.qid_to_mux["0"] = 9  # type: ignore[index]
+        with pytest.raises(TypeError):
+            index.wiring_config[0]["mux"] = 9  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            index.wiring_config[0]["ctrl"].append("R21B-9")
+
+    def test_wiring_config_list_is_a_deep_copy(self, wiring_file):
+        index = get_wiring_index("test_chip", wiring_file)
+
+        entries = index.wiring_config_list()
+        entries[0]["ctrl"].append("R21B-9")
+
+        assert entries[0]["ctrl"] == ["R21B-5", "R21B-0", "R21B-9"]
+        assert index.wiring_config[0]["ctrl"] == ("R21B-5", "R21B-0")
+        assert index.wiring_config_list()[0]["ctrl"] == ["R21B-5", "R21B-0"]
+
+    def test_unchanged_file_is_compiled_once(self, wiring_file):
+        first = get_wiring_index("test_chip", wiring_file)
+        _bump_mtime(wiring_file)
+
+        assert get_wiring_index("test_chip", str(wiring_file)) is first
+        assert topology_index._wiring_cache.compiles == 1
+
+    def test_changed_file_is_recompiled(self, wiring_file):
+        first = get_wiring_index("test_chip", wiring_file)
+        wiring_file.write_text(yaml.dump({"test_chip": WIRING[:1]}))
+        _bump_mtime(wiring_file)
+
+        second = get_wiring_index("test_chip", wiring_file)
+
+        assert second is not first
+        assert second.digest != first.digest
+        assert set(second.mux_qids) == {0}
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Wiring config not found"):
+            get_wiring_index("test_chip", tmp_path / "missing.yaml")
+
+
+class TestSchedulersShareIndex:
+    def test_schedulers_reuse_compiled_wiring_and_copy_results(self, wiring_file):
+        first = OneQubitScheduler(chip_id="test_chip", wiring_config_path=str(wiring_file))
+        second = OneQubitScheduler(chip_id="test_chip", wiring_config_path=str(wiring_file))
+        cr = CRScheduler(username="u", chip_id="test_chip", wiring_config_path=str(wiring_file))
+
+        result = first.generate(qids=["0", "4", "16"])
+        second.generate(qids=["1"])
+        index = cr._compile_wiring(cr._load_wiring_config())
+
+        assert index is get_wiring_index("test_chip", wiring_file)
+        assert topology_index._wiring_cache.compiles == 1
+        result.qid_to_mux["0"] = 99
+        result.mux_box_map[0].add("C")
+        assert index.qid_to_mux["0"] == 0
+        assert index.mux_box_types[0] == frozenset({"A", "B"})
+
+
+TOPOLOGY = {
+    "id": "tiny",
+    "name": "Tiny",
+    "grid_size": 2,
+    "num_qubits": 3,
+    "direction_convention": "checkerboard_cr",
+    "qubits": {
+        0: {"row": 0, "col": 0},
+        1: {"row": 0, "col": 1},
+        2: {"row": 1, "col": 1},
+    },
+    "couplings": [[0, 1], [2, 1]],
+}
+
+
+@pytest.fixture
+def topology_file(monkeypatch, tmp_path):
+    topologies_dir = tmp_path / "domain" / "topologies"
+    topologies_dir.mkdir(parents=True)
+    path = topologies_dir / "tiny.yaml"
+    path.write_text(yaml.dump(TOPOLOGY))
+    monkeypatch.setattr(ConfigLoader, "_CONFIG_DIR", tmp_path)
+    return path
+
+
+class TestTopologyIndex:
+    def test_compiles_neighbours_and_directions(self, topology_file):
+        index = get_topology_index("tiny")
+
+        assert index.neighbours["1"] == frozenset({"0", "2"})
+        assert index.directions() == frozenset({"0-1", "2-1"})
+        assert index.directions(inverse=True) == frozenset({"1-0", "1-2"})
+        assert index.path == str(topology_file)
+
+    def test_unchanged_file_is_compiled_once(self, topology_file):
+        first = get_topology_index("tiny")
+        _bump_mtime(topology_file)
+
+        assert get_topology_index("tiny") is first
+        assert topology_index._topology_cache.compiles == 1
+
+    def test_changed_file_is_recompiled(self, topology_file):
+        first = get_topology_index("tiny")
+        topology_file.write_text(yaml.dump({**TOPOLOGY, "couplings": [[0, 1]]}))
+        _bump_mtime(topology_file)
+
+        second = get_topology_index("tiny")
+
+        assert second is not first
+        assert second.digest != first.digest
+        assert second.directions() == frozenset({"0-1"})
+        assert "2" not in second.neighbours
+
+    def test_missing_file_raises(self, topology_file):
+        with pytest.raises(FileNotFoundError, match="Topology file not found"):
+            get_topology_index("missing")
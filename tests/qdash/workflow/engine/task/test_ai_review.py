@@ -1,16 +1,24 @@
 """Tests for automatic AI review scheduling."""
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from qdash.copilot.config import AnalysisConfig, CopilotConfig, ModelConfig
 from qdash.datamodel.execution import ExecutionModel, ExecutionStatusModel
+from qdash.datamodel.job import JobModel, JobStatus
 from qdash.datamodel.note import AiReviewModel, NoteModel
 from qdash.datamodel.system_info import SystemInfoModel
 from qdash.datamodel.task import QubitTaskModel, TaskStatusModel
+from qdash.repository.inmemory.job_queue import InMemoryJobQueueRepository
 from qdash.workflow.engine.task.ai_review import (
+    AI_REVIEW_JOB_KIND,
     _ai_review_config,
     _forced_ai_review_markdown,
     enqueue_ai_review_note,
+    on_ai_review_job_dead,
+    run_ai_review_job,
 )
 
 
@@ -19,6 +27,7 @@ def _execution_model() -> ExecutionModel:
         username="test",
         name="test-execution",
         execution_id="test-exec-001",
+        project_id="test-project",
         chip_id="test-chip",
         calib_data_path="/tmp/calib",
         tags=[],
@@ -52,39 +61,86 @@ def _config() -> MagicMock:
     return config
 
 
-@patch("qdash.workflow.engine.task.ai_review._EXECUTOR")
+@pytest.fixture
+def job_queue() -> Iterator[InMemoryJobQueueRepository]:
+    """Route enqueued reviews to an in-memory queue without starting drainers."""
+    queue = InMemoryJobQueueRepository()
+    with (
+        patch("qdash.workflow.engine.task.ai_review._job_queue", return_value=queue),
+        patch("qdash.workflow.engine.task.ai_review._request_local_drain"),
+    ):
+        yield queue
+
+
+def _queued(queue: InMemoryJobQueueRepository) -> list[JobModel]:
+    jobs: list[JobModel] = []
+    while (job := queue.lease("test", [AI_REVIEW_JOB_KIND], lease_seconds=60)) is not None:
+        jobs.append(job)
+    return jobs
+
+
 @patch("qdash.copilot.config.load_copilot_config")
 def test_enqueue_skips_non_representative_resonator_spectroscopy(
     mock_load_config: MagicMock,
-    mock_executor: MagicMock,
+    job_queue: InMemoryJobQueueRepository,
 ) -> None:
     """Only the representative MUX resonator result should receive AI review."""
     mock_load_config.return_value = _config()
 
     enqueue_ai_review_note(_task("CheckResonatorSpectroscopy", "17"), _execution_model())
 
-    mock_executor.submit.assert_not_called()
+    assert _queued(job_queue) == []
 
 
-@patch("qdash.workflow.engine.task.ai_review._EXECUTOR")
 @patch("qdash.copilot.config.load_copilot_config")
 def test_enqueue_accepts_representative_resonator_spectroscopy(
     mock_load_config: MagicMock,
-    mock_executor: MagicMock,
+    job_queue: InMemoryJobQueueRepository,
 ) -> None:
-    """Representative MUX resonator result is scheduled asynchronously."""
+    """Representative MUX resonator result is queued with a compact payload."""
     mock_load_config.return_value = _config()
+    task = _task("CheckResonatorSpectroscopy", "16")
+
+    with patch("qdash.workflow.engine.task.ai_review._request_local_drain") as drain:
+        enqueue_ai_review_note(task, _execution_model())
+
+    drain.assert_called_once()
+    (job,) = _queued(job_queue)
+    assert job.project_id == "test-project"
+    assert job.dedupe_key == f"ai_review:{task.task_id}"
+    assert job.payload["task"] == {
+        "task_id": task.task_id,
+        "name": "CheckResonatorSpectroscopy",
+        "task_type": "qubit",
+        "status": "completed",
+        "qid": "16",
+    }
+    assert job.payload["execution"] == {
+        "execution_id": "test-exec-001",
+        "project_id": "test-project",
+        "chip_id": "test-chip",
+    }
 
-    enqueue_ai_review_note(_task("CheckResonatorSpectroscopy", "16"), _execution_model())
 
-    mock_executor.submit.assert_called_once()
+@patch("qdash.copilot.config.load_copilot_config")
+def test_enqueue_deduplicates_task_already_queued(
+    mock_load_config: MagicMock,
+    job_queue: InMemoryJobQueueRepository,
+) -> None:
+    """A task result is queued at most once while a review is pending."""
+    mock_load_config.return_value = _config()
+    task = _task("CheckQubitSpectroscopy", "4")
+
+    enqueue_ai_review_note(task, _execution_model())
+    enqueue_ai_review_note(task, _execution_model())
+
+    assert len(_queued(job_queue)) == 1
 
 
-@patch("qdash.workflow.engine.task.ai_review._EXECUTOR")
 @patch("qdash.copilot.config.load_copilot_config")
 def test_enqueue_accepts_failed_ai_review_task(
     mock_load_config: MagicMock,
-    mock_executor: MagicMock,
+    job_queue: InMemoryJobQueueRepository,
 ) -> None:
     """Configured AI review tasks are scheduled even when the result failed."""
     mock_load_config.return_value = _config()
@@ -94,14 +150,13 @@ def test_enqueue_accepts_failed_ai_review_task(
         _execution_model(),
     )
 
-    mock_executor.submit.assert_called_once()
+    assert len(_queued(job_queue)) == 1
 
 
-@patch("qdash.workflow.engine.task.ai_review._EXECUTOR")
 @patch("qdash.copilot.config.load_copilot_config")
 def test_enqueue_skips_running_ai_review_task(
     mock_load_config: MagicMock,
-    mock_executor: MagicMock,
+    job_queue: InMemoryJobQueueRepository,
 ) -> None:
     """Automatic AI review waits for a terminal task result."""
     mock_load_config.return_value = _config()
@@ -111,7 +166,94 @@ def test_enqueue_skips_running_ai_review_task(
         _execution_model(),
     )
 
-    mock_executor.submit.assert_not_called()
+    assert _queued(job_queue) == []
+
+
+@patch("qdash.workflow.engine.task.ai_review._attach_ai_review_note")
+@patch("qdash.copilot.config.load_copilot_config")
+def test_run_ai_review_job_rebuilds_task_and_execution(
+    mock_load_config: MagicMock,
+    mock_attach: MagicMock,
+    job_queue: InMemoryJobQueueRepository,
+) -> None:
+    """The worker handler reviews the queued task result."""
+    mock_load_config.return_value = _config()
+    task = _task("CheckQubitSpectroscopy", "4")
+    enqueue_ai_review_note(task, _execution_model(), overwrite_existing=True)
+    (job,) = _queued(job_queue)
+
+    run_ai_review_job(job)
+
+    reviewed_task, execution = mock_attach.call_args.args
+    assert isinstance(reviewed_task, QubitTaskModel)
+    assert reviewed_task.task_id == task.task_id
+    assert reviewed_task.qid == "4"
+    assert execution.project_id == "test-project"
+    assert execution.chip_id == "test-chip"
+    assert mock_attach.call_args.kwargs == {"overwrite_existing": True}
+
+
+@patch("qdash.workflow.engine.task.ai_review._attach_ai_review_note")
+def test_local_drain_runs_queued_reviews(mock_attach: MagicMock) -> None:
+    """The enqueueing process drains the queue in background threads."""
+    from qdash.workflow.engine.task import ai_review
+
+    queue = InMemoryJobQueueRepository()
+    payload = {
+        "task": {
+            "task_id": "t1",
+            "name": "CheckQubitSpectroscopy",
+            "task_type": "qubit",
+            "qid": "4",
+        },
+        "execution": {"execution_id": "e1", "project_id": "p1", "chip_id": "c1"},
+    }
+    job = queue.enqueue(AI_REVIEW_JOB_KIND, "p1", payload)
+    assert job is not None
+
+    with patch("qdash.workflow.engine.task.ai_review._job_queue", return_value=queue):
+        ai_review._request_local_drain()
+        for thread in list(ai_review._drain_threads):
+            thread.join(timeout=5)
+
+    mock_attach.assert_called_once()
+    assert all(thread.daemon for thread in ai_review._drain_threads)
+    finished = queue.get(job.job_id)
+    assert finished is not None
+    assert finished.status == JobStatus.COMPLETED
+
+
+@patch("qdash.workflow.engine.task.ai_review._set_ai_review_failure")
+@patch("qdash.workflow.engine.task.ai_review._attach_ai_review_note")
+@patch("qdash.copilot.config.load_copilot_config")
+def test_failed_review_is_retried_and_recorded_only_when_dead(
+    mock_load_config: MagicMock,
+    mock_attach: MagicMock,
+    mock_set_failure: MagicMock,
+    job_queue: InMemoryJobQueueRepository,
+) -> None:
+    """Review errors reach the queue; the failure is recorded once the job is dead."""
+    from qdash.common.job_worker import JobWorker
+
+    mock_load_config.return_value = _config()
+    mock_attach.side_effect = RuntimeError("model unavailable")
+    task = _task("CheckQubitSpectroscopy", "4")
+    enqueue_ai_review_note(task, _execution_model())
+    worker = JobWorker(
+        job_queue,
+        {AI_REVIEW_JOB_KIND: run_ai_review_job},
+        dead_handlers={AI_REVIEW_JOB_KIND: on_ai_review_job_dead},
+    )
+
+    with patch("qdash.repository.inmemory.job_queue.job_retry_delay_seconds", return_value=0.0):
+        assert worker.drain() == 3
+
+    assert mock_attach.call_count == 3
+    mock_set_failure.assert_called_once()
+    failed_task, execution, error = mock_set_failure.call_args.args
+    assert failed_task.task_id == task.task_id
+    assert execution.project_id == "test-project"
+    assert error == "RuntimeError: model unavailable"
 
 
 def test_ai_review_config_applies_local_vlm_defaults_only_to_review() -> None:
@@ -2,6 +2,9 @@ from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from qdash.common.execution_lease import ExecutionLeaseLostError
 from qdash.datamodel.task import ParameterModel
 from qdash.workflow.engine.task.backend_saver import BackendSaver
 
@@ -98,3 +101,42 @@ def test_save_qubex_stages_outputs_when_persistence_is_disabled() -> None:
     qubit_repo_cls.return_value.update_calib_data.assert_not_called()
     coupling_repo_cls.return_value.update_calib_data.assert_not_called()
     updater.update.assert_not_called()
+
+
+def test_write_fence_aborts_saves_after_lease_is_lost() -> None:
+    output_parameters = {
+        "drive_amplitude": ParameterModel(value=0.12, unit="a.u."),
+    }
+    state_manager = MagicMock()
+    state_manager.get_task.return_value = SimpleNamespace(output_parameters=output_parameters)
+    execution_service = cast(
+        "ExecutionService",
+        SimpleNamespace(execution_id="exec-1", chip_id="chip-1", project_id="proj-1"),
+    )
+    task = MagicMock()
+    task.backend = "qubex"
+    task.get_name.return_value = "CheckQubitSpectroscopy"
+    task.get_task_type.return_value = "qubit"
+    task.is_qubit_task.return_value = True
+    backend = MagicMock()
+    backend.name = "qubex"
+
+    def lost_lease() -> None:
+        raise ExecutionLeaseLostError("lease lost")
+
+    saver = BackendSaver(
+        state_manager=state_manager,
+        username="alice",
+        calib_dir="/tmp/calib",
+        task_manager_id="tm-1",
+        write_fence=lost_lease,
+    )
+
+    with patch("qdash.repository.MongoQubitCalibrationRepository") as qubit_repo_cls:
+        with pytest.raises(ExecutionLeaseLostError):
+            saver.save(task, execution_service, "1", backend, success=True)
+        with pytest.raises(ExecutionLeaseLostError):
+            saver.save_mux_qid(task, execution_service, "1", backend)
+
+    backend.update_note.assert_not_called()
+    qubit_repo_cls.return_value.update_calib_data.assert_not_called()
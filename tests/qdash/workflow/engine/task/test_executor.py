@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from qdash.common.execution_lease import ExecutionLeaseLostError
 from qdash.datamodel.task import ParameterModel, QubitTaskModel, RunParameterModel, TaskStatusModel
 from qdash.workflow.calibtasks.base import PostProcessResult, PreProcessResult, RunResult
 from qdash.workflow.engine.task.executor import TaskExecutor
@@ -238,6 +239,35 @@ class TestTaskExecutorExecuteTask:
         assert mock_state_manager.start_task.call_count == 2
         assert mock_state_manager.end_task.call_count == 2
 
+    def test_execute_task_records_phase_timings(
+        self, executor: TaskExecutor, mock_state_manager: MagicMock
+    ) -> None:
+        """Test execute_task records wall-clock time per phase on the task model."""
+        task_model = mock_state_manager.get_task.return_value
+        mock_state_manager.ensure_task_exists.return_value = task_model
+
+        session: Any = MockSession()
+
+        executor.execute_task(MockTask(), session, "0")
+
+        assert set(task_model.phase_timings) == {"preprocess", "run", "postprocess", "artifacts"}
+        assert all(seconds >= 0 for seconds in task_model.phase_timings.values())
+
+    def test_execute_batch_charges_each_qid_a_share_of_the_run(
+        self, executor: TaskExecutor, mock_state_manager: MagicMock
+    ) -> None:
+        """Test batch execution splits the shared batch_run time across qids."""
+        models = {
+            qid: QubitTaskModel(name="CheckRabi", qid=qid, task_id=f"task-{qid}") for qid in "04"
+        }
+        mock_state_manager.get_task.side_effect = lambda _name, _type, qid: models[qid]
+        session: Any = MockSession()
+
+        executor.execute_batch(MockTask(), session, ["0", "4"])
+
+        assert models["0"].phase_timings["run"] == models["4"].phase_timings["run"]
+        assert {"run", "postprocess", "artifacts"} <= set(models["0"].phase_timings)
+
     def test_execute_batch_continues_after_qid_validation_error(
         self, executor: TaskExecutor, mock_state_manager: MagicMock
     ) -> None:
@@ -370,6 +400,37 @@ class TestTaskExecutorExecuteTask:
         # end_task should always be called (in finally block)
         mock_state_manager.end_task.assert_called_once()
 
+    def test_execute_task_stops_before_persisting_when_lease_is_lost(
+        self,
+        mock_state_manager: MagicMock,
+        mock_result_processor: MagicMock,
+        mock_data_saver: MagicMock,
+    ) -> None:
+        """Test a lease lost during the run aborts the task before any result is saved."""
+
+        def lost_lease() -> None:
+            raise ExecutionLeaseLostError("lease lost")
+
+        executor = TaskExecutor(
+            state_manager=mock_state_manager,
+            calib_dir="/tmp/calib",
+            execution_id="exec-001",
+            task_manager_id="tm-001",
+            result_processor=mock_result_processor,
+            data_saver=mock_data_saver,
+            write_fence=lost_lease,
+        )
+        task = MockTask()
+        task.postprocess = MagicMock()  # type: ignore[method-assign]
+        session: Any = MockSession()
+
+        with pytest.raises(TaskExecutionError, match="lease lost"):
+            executor.execute_task(task, session, "0")
+
+        task.postprocess.assert_not_called()
+        mock_state_manager.put_output_parameters.assert_not_called()
+        mock_state_manager.update_task_status_to_failed.assert_called_once()
+
     def test_execute_task_saves_figures(
         self, executor: TaskExecutor, mock_data_saver: MagicMock
     ) -> None:
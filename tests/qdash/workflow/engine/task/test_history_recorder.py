@@ -74,6 +74,29 @@ class TestTaskHistoryRecorder:
             sample_task, sample_execution_model
         )
 
+    def test_record_task_result_persists_phase_timings_of_terminal_task(
+        self, recorder, mock_repos, sample_task, sample_execution_model
+    ):
+        """Test the final write's own timings are stored with a follow-up update."""
+        recorder.record_task_result(sample_task, sample_execution_model)
+
+        assert "history" in sample_task.phase_timings
+        mock_repos["task_result_history"].set_phase_timings.assert_called_once_with(
+            project_id=sample_execution_model.project_id,
+            task_id=sample_task.task_id,
+            phase_timings=sample_task.phase_timings,
+        )
+
+    def test_record_task_result_skips_timing_update_while_running(
+        self, recorder, mock_repos, sample_task, sample_execution_model
+    ):
+        """Test a running task's timings travel with its next save instead."""
+        sample_task.status = TaskStatusModel.RUNNING
+
+        recorder.record_task_result(sample_task, sample_execution_model)
+
+        mock_repos["task_result_history"].set_phase_timings.assert_not_called()
+
     @patch("qdash.workflow.engine.task.ai_review.enqueue_ai_review_note")
     def test_record_task_result_attaches_ai_review_note(
         self,
@@ -2,8 +2,8 @@
 
 import pytest
 
-from qdash.datamodel.task import ParameterModel, TaskStatusModel
-from qdash.workflow.engine.task.state_manager import TaskStateManager
+from qdash.datamodel.task import ParameterModel, QubitTaskModel, TaskResultModel, TaskStatusModel
+from qdash.workflow.engine.task.state_manager import TaskStateManager, lookup
 
 
 class TestTaskStateManagerInit:
@@ -86,6 +86,90 @@ class TestTaskCreation:
             tsm.get_task("Unknown", "qubit", "0")
 
 
+class TestTaskIndex:
+    """Test that indexed lookups stay consistent with the task lists."""
+
+    @pytest.fixture(autouse=True)
+    def _index_short_lists(self, monkeypatch):
+        """Index every list, not only those too long to scan."""
+        monkeypatch.setattr(lookup, "LINEAR_SCAN_MAX_TASKS", 0)
+
+    def test_short_list_is_scanned_without_a_bucket(self, monkeypatch):
+        """Test lists up to LINEAR_SCAN_MAX_TASKS are not indexed."""
+        monkeypatch.setattr(lookup, "LINEAR_SCAN_MAX_TASKS", 2)
+        tsm = TaskStateManager(qids=["0", "1"])
+        short = [tsm._ensure_task_exists(name, "qubit", "0") for name in ("CheckRabi", "CheckT1")]
+        long = [
+            tsm._ensure_task_exists(name, "qubit", "1")
+            for name in ("CheckRabi", "CheckT1", "CheckT2Echo")
+        ]
+
+        assert tsm.get_task("CheckT1", "qubit", "0") is short[1]
+        assert tsm.get_task("CheckT1", "qubit", "1") is long[1]
+        assert set(tsm._index._buckets) == {("qubit", "1")}
+
+    def test_task_appended_to_list_directly_is_found(self):
+        """Test a task appended outside the manager is found."""
+        tsm = TaskStateManager(qids=["0"])
+        tsm._ensure_task_exists("CheckRabi", "qubit", "0")
+        tsm.task_result.qubit_tasks["0"].append(QubitTaskModel(name="CheckT1", qid="0"))
+
+        assert tsm.get_task("CheckT1", "qubit", "0").name == "CheckT1"
+        assert tsm.get_task("CheckRabi", "qubit", "0").name == "CheckRabi"
+
+    def test_replaced_list_element_is_found(self):
+        """Test a task replaced in place is returned instead of the old one."""
+        tsm = TaskStateManager(qids=["0"])
+        tsm._ensure_task_exists("CheckRabi", "qubit", "0")
+        tsm._ensure_task_exists("CheckT1", "qubit", "0")
+        tsm.get_task("CheckT1", "qubit", "0")
+        replacement = QubitTaskModel(name="CheckT1", qid="0")
+        tsm.task_result.qubit_tasks["0"][1] = replacement
+        tsm.task_result.qubit_tasks["0"][0] = QubitTaskModel(name="CheckT2Echo", qid="0")
+
+        assert tsm.get_task("CheckT1", "qubit", "0") is replacement
+        assert tsm.get_task("CheckT2Echo", "qubit", "0").name == "CheckT2Echo"
+        with pytest.raises(ValueError, match="not found"):
+            tsm.get_task("CheckRabi", "qubit", "0")
+
+    def test_replaced_task_result_is_reindexed(self):
+        """Test assigning a new task_result drops the old index."""
+        tsm = TaskStateManager(qids=["0"])
+        tsm._ensure_task_exists("CheckRabi", "qubit", "0")
+        tsm.task_result = TaskResultModel(
+            qubit_tasks={"0": [QubitTaskModel(name="CheckT1", qid="0")]}
+        )
+
+        assert tsm.get_task("CheckT1", "qubit", "0").name == "CheckT1"
+        with pytest.raises(ValueError, match="not found"):
+            tsm.get_task("CheckRabi", "qubit", "0")
+
+    def test_index_is_rebuilt_after_deserialization(self):
+        """Test a deserialized manager finds tasks and does not duplicate them."""
+        tsm = TaskStateManager(qids=["0"])
+        tsm.start_task("CheckRabi", "qubit", "0")
+        tsm._ensure_task_exists("GlobalInit", "global", "")
+
+        restored = TaskStateManager.model_validate(tsm.model_dump())
+        restored.end_task("CheckRabi", "qubit", "0")
+        restored._ensure_task_exists("GlobalInit", "global", "")
+
+        assert len(restored.task_result.qubit_tasks["0"]) == 1
+        assert len(restored.task_result.global_tasks) == 1
+        assert restored.get_task("CheckRabi", "qubit", "0").end_at is not None
+
+    def test_first_task_with_name_wins(self):
+        """Test duplicate names resolve to the first task, like a linear scan."""
+        first = QubitTaskModel(name="CheckRabi", qid="0")
+        tsm = TaskStateManager(
+            task_result=TaskResultModel(
+                qubit_tasks={"0": [first, QubitTaskModel(name="CheckRabi", qid="0")]}
+            )
+        )
+
+        assert tsm.get_task("CheckRabi", "qubit", "0") is first
+
+
 class TestTaskStatusTransitions:
     """Test task status transitions."""
 
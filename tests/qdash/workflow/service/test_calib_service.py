@@ -3,10 +3,15 @@
 These tests verify the CalibService API and helper functions for custom calibration flows.
 """
 
+from collections.abc import Callable
+from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
 import pytest
 
+from qdash.common.execution_lease import ExecutionLeaseLostError
+from qdash.datamodel.execution_lock import ExecutionLeaseModel
+from qdash.repository.inmemory.execution_lock import InMemoryExecutionLockRepository
 from qdash.workflow.service.calib_service import (
     CalibService,
     finish_calibration,
@@ -82,8 +87,15 @@ class MockBackend:
 class MockCalibOrchestrator:
     """Mock CalibOrchestrator for testing."""
 
-    def __init__(self, config, github_integration=None, snapshot_loader=None):
+    def __init__(
+        self,
+        config,
+        github_integration=None,
+        snapshot_loader=None,
+        write_fence: Callable[[], None] | None = None,
+    ):
         self.config = config
+        self.write_fence = write_fence
         self._initialized = False
         self._execution_service = MockExecutionService(tags=config.tags or [])
         self._task_context = MockTaskContext()
@@ -138,6 +150,43 @@ class MockExecutionLockRepository:
     def unlock(self, project_id: str) -> None:
         pass
 
+    def acquire_lease(
+        self,
+        project_id: str,
+        chip_id: str,
+        owner: str,
+        *,
+        qids: list[str] | None = None,
+        lease_seconds: float,
+    ) -> ExecutionLeaseModel:
+        return ExecutionLeaseModel(
+            lease_id="lease-1",
+            project_id=project_id,
+            chip_id=chip_id,
+            owner=owner,
+            qids=qids,
+            fencing_token=1,
+            acquired_at=datetime(2026, 1, 1, tzinfo=UTC),
+            expires_at=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+
+    def renew_lease(self, lease: ExecutionLeaseModel, *, lease_seconds: float) -> bool:
+        return True
+
+    def is_lease_held(self, lease: ExecutionLeaseModel) -> bool:
+        return True
+
+    def release_lease(self, lease: ExecutionLeaseModel) -> bool:
+        return True
+
+    def release_owner_leases(self, project_id: str, owner: str) -> int:
+        return 0
+
+    def list_active_leases(
+        self, project_id: str, chip_id: str | None = None
+    ) -> list[ExecutionLeaseModel]:
+        return []
+
 
 class MockUserRepository:
     """Mock UserRepository for testing."""
@@ -412,6 +461,79 @@ class TestCalibServiceParameterManagement:
         assert merged.value == 0.25
 
 
+def _write_fence(session: CalibService) -> Callable[[], None]:
+    """Return the write fence the session handed to its orchestrator."""
+    orchestrator = session._orchestrator
+    assert isinstance(orchestrator, MockCalibOrchestrator)
+    assert orchestrator.write_fence is not None
+    return orchestrator.write_fence
+
+
+class TestCalibServiceLeaseFencing:
+    """Test that task result writes are fenced on the execution lease."""
+
+    def test_writes_are_fenced_on_the_session_lease(self, mock_flow_session_deps, mock_user_repo):
+        """The orchestrator's write fence fails once the session's lease is lost."""
+        repo = InMemoryExecutionLockRepository()
+        session = CalibService(
+            username="test_user",
+            execution_id="20240101-001",
+            chip_id="chip_1",
+            qids=["0"],
+            project_id="test_project",
+            lock_repo=repo,
+            user_repo=mock_user_repo,
+        )
+        write_fence = _write_fence(session)
+
+        write_fence()
+        repo.release_owner_leases("test_project", "20240101-001")
+        with pytest.raises(ExecutionLeaseLostError):
+            write_fence()
+
+    def test_worker_session_fences_writes_on_parent_lease(
+        self, mock_flow_session_deps, mock_user_repo
+    ):
+        """A worker session checks the parent's lease but leaves releasing it to the parent."""
+        repo = InMemoryExecutionLockRepository()
+        parent_lease = repo.acquire_lease(
+            "test_project", "chip_1", "20240101-001", qids=["0", "1"], lease_seconds=60
+        )
+        assert parent_lease is not None
+
+        worker = CalibService(
+            username="test_user",
+            execution_id="20240101-001",
+            chip_id="chip_1",
+            qids=["1"],
+            project_id="test_project",
+            use_lock=False,
+            parent_lease=parent_lease,
+            lock_repo=repo,
+            user_repo=mock_user_repo,
+        )
+        assert worker.execution_lease == parent_lease
+        _write_fence(worker)()
+
+        worker.finish_calibration(update_chip_history=False, push_to_github=False)
+        assert repo.is_lease_held(parent_lease)
+
+        worker = CalibService(
+            username="test_user",
+            execution_id="20240101-001",
+            chip_id="chip_1",
+            qids=["1"],
+            project_id="test_project",
+            use_lock=False,
+            parent_lease=parent_lease,
+            lock_repo=repo,
+            user_repo=mock_user_repo,
+        )
+        repo.release_lease(parent_lease)
+        with pytest.raises(ExecutionLeaseLostError):
+            _write_fence(worker)()
+
+
 class TestGlobalSessionHelpers:
     """Test global session helper functions."""
 
@@ -16,6 +16,7 @@ def test_custom_one_qubit_direct_targets_create_visible_execution(monkeypatch) -
     session = SimpleNamespace(
         execution_id="exec-visible",
         record_stage_result=lambda stage_name, result: recorded.append((stage_name, result)),
+        execution_lease="stage-lease",
     )
 
     def fake_init_calibration(*args, **kwargs):
@@ -57,6 +58,7 @@ def test_custom_one_qubit_direct_targets_create_visible_execution(monkeypatch) -
         tags=["simple"],
         flow_name="simple_calibration",
         note={"source": "test"},
+        execution_lease="parent-lease",
     )
     step = CustomOneQubit(step_name="simple_tasks", tasks=["CheckRabi"])
 
@@ -67,10 +69,17 @@ def test_custom_one_qubit_direct_targets_create_visible_execution(monkeypatch) -
     assert init_calls[0][0][:3] == ("alice", "64Qv3", ["1", "2"])
     assert init_calls[0][1]["flow_name"] == "simple_calibration_simple_tasks"
     assert init_calls[0][1]["project_id"] == "project-1"
+    assert init_calls[0][1]["parent_lease"] == "parent-lease"
     assert init_calls[0][1]["note"] == {
         "type": "1-qubit-direct",
         "stage": "simple_tasks",
         "total_qubits": 2,
+        "plan": {
+            "backend": "qubex",
+            "tasks": ["CheckRabi"],
+            "steps": [[["1"], ["2"]]],
+            "batch": False,
+        },
     }
     assert run_calls == [
         {
@@ -86,6 +95,7 @@ def test_custom_one_qubit_direct_targets_create_visible_execution(monkeypatch) -
                 "tags": ["simple"],
                 "flow_name": "simple_calibration",
                 "note": {"source": "test"},
+                "lease": "stage-lease",
             },
         }
     ]
@@ -173,6 +183,7 @@ def test_custom_one_qubit_direct_targets_do_not_fallback_tags_to_flow_name(monke
     session = SimpleNamespace(
         execution_id="exec-visible",
         record_stage_result=lambda stage_name, result: None,
+        execution_lease=None,
     )
 
     def fake_init_calibration(*args, **kwargs):
@@ -201,6 +212,7 @@ def test_custom_one_qubit_direct_targets_do_not_fallback_tags_to_flow_name(monke
         tags=[],
         flow_name="t1_simple_tasks",
         note={},
+        execution_lease=None,
     )
     step = CustomOneQubit(step_name="simple_tasks", tasks=["CheckRabi"])
 
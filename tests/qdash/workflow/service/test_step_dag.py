@@ -0,0 +1,245 @@
+"""Tests for DAG-parallel execution of pipeline steps."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Literal
+
+import pytest
+
+from qdash.workflow.engine.scheduler.topology_index import WiringIndex
+from qdash.workflow.service.results import FilterResult, OneQubitResult, QubitCalibData
+from qdash.workflow.service.steps import (
+    CalibrationStep,
+    DagExecutor,
+    FilterByStatus,
+    OnTargets,
+    StepContext,
+    StepGraph,
+    TransformStep,
+)
+from qdash.workflow.service.targets import QubitTargets
+
+if TYPE_CHECKING:
+    from qdash.workflow.service.calib_service import CalibService
+    from qdash.workflow.service.targets import Target
+
+CHIP = "64Qv3"
+SERVICE: Any = SimpleNamespace(chip_id=CHIP)
+
+
+@dataclass
+class FakeCheck(CalibrationStep):
+    """Marks every candidate qubit as calibrated, optionally failing some."""
+
+    failed: set[str] = field(default_factory=set)
+    barrier: threading.Barrier | None = None
+    error: Exception | None = None
+
+    @property
+    def name(self) -> str:
+        return "one_qubit_check"
+
+    @property
+    def provides(self) -> set[str]:
+        return {"one_qubit_check", "candidate_qids"}
+
+    def execute(self, service: CalibService, targets: Target, ctx: StepContext) -> StepContext:
+        if self.barrier is not None:
+            self.barrier.wait()
+        if self.error is not None:
+            raise self.error
+        result = OneQubitResult()
+        for qid in targets.to_qids(service.chip_id):
+            status: Literal["success", "failed"] = "failed" if qid in self.failed else "success"
+            result.add_qubit(qid, QubitCalibData(status=status))
+        ctx.one_qubit_check = result
+        return ctx
+
+
+@dataclass
+class FakeBenchmark(CalibrationStep):
+    step_name: str = "benchmark"
+    barrier: threading.Barrier | None = None
+
+    @property
+    def name(self) -> str:
+        return self.step_name
+
+    def execute(self, service: CalibService, targets: Target, ctx: StepContext) -> StepContext:
+        if self.barrier is not None:
+            self.barrier.wait()
+        ctx.metadata[self.step_name] = sorted(targets.to_qids(service.chip_id))
+        return ctx
+
+
+@dataclass
+class FakeReport(TransformStep):
+    @property
+    def name(self) -> str:
+        return "report"
+
+    @property
+    def requires(self) -> set[str]:
+        return {"one_qubit_check", "candidate_qids"}
+
+    def execute(self, service: CalibService, targets: Target, ctx: StepContext) -> StepContext:
+        ctx.metadata["report"] = list(ctx.candidate_qids)
+        return ctx
+
+
+def _region(*qids: str) -> QubitTargets:
+    return QubitTargets(list(qids))
+
+
+def _run(steps: list[Any], max_workers: int = 2, qids: list[str] | None = None) -> StepContext:
+    qids = qids or ["0", "1", "4", "5"]
+    graph = StepGraph(steps, qids, CHIP)
+    ctx = StepContext(candidate_qids=list(qids))
+    return DagExecutor(graph, max_workers=max_workers).run(SERVICE, _region(*qids), ctx)
+
+
+class TestStepGraph:
+    def test_disjoint_regions_are_independent(self):
+        steps = [
+            OnTargets(FakeCheck(), _region("0", "1")),
+            OnTargets(FakeBenchmark(), _region("4", "5")),
+            FakeReport(),
+        ]
+
+        graph = StepGraph(steps, ["0", "1", "4", "5"], CHIP)
+
+        assert [node.predecessors for node in graph.nodes] == [
+            frozenset(),
+            frozenset(),
+            frozenset({0}),
+        ]
+
+    def test_regions_sharing_a_mux_are_ordered(self):
+        steps = [
+            OnTargets(FakeCheck(), _region("0")),
+            OnTargets(FakeBenchmark(), _region("3")),
+        ]
+
+        graph = StepGraph(steps, ["0", "3"], CHIP)
+
+        assert graph.nodes[1].predecessors == {0}
+
+    def test_regions_on_conflicting_muxes_are_ordered(self):
+        wiring = WiringIndex.compile(
+            CHIP,
+            [
+                {"mux": 0, "ctrl": ["Q1A-0"], "read_out": "R1A-0"},
+                {"mux": 1, "ctrl": ["Q2A-0"], "read_out": "R1A-1"},
+                {"mux": 2, "ctrl": ["Q3A-0"], "read_out": "R2A-0"},
+            ],
+        )
+        steps = [
+            OnTargets(FakeCheck(), _region("0")),
+            OnTargets(FakeBenchmark(), _region("4")),
+            OnTargets(FakeBenchmark(step_name="rb"), _region("8")),
+        ]
+
+        graph = StepGraph(steps, ["0", "4", "8"], CHIP, wiring=wiring)
+
+        assert graph.nodes[1].predecessors == {0}  # MUX 0 and 1 share a readout module
+        assert graph.nodes[2].predecessors == frozenset()
+
+    def test_whole_target_steps_keep_pipeline_order_on_shared_keys(self):
+        steps = [FakeCheck(), FilterByStatus(), FakeReport()]
+
+        graph = StepGraph(steps, ["0", "1"], CHIP)
+
+        assert graph.nodes[1].predecessors == {0}
+        assert graph.nodes[2].predecessors == {0, 1}
+
+    def test_plan_reports_critical_path(self):
+        steps = [
+            OnTargets(FakeCheck(), _region("0", "1")),
+            OnTargets(FakeBenchmark(), _region("4", "5")),
+            FakeReport(),
+        ]
+
+        plan = StepGraph(steps, [], CHIP, durations={"benchmark": 3.0, "report": 0.5}).plan()
+
+        assert plan.critical_path == [1]
+        assert plan.critical_path_length == 3.0
+        assert plan.total_weight == 4.5
+        assert "Critical path: [1] benchmark" in plan.format()
+
+
+class TestDagExecutor:
+    def test_independent_steps_run_concurrently_and_merge_by_region(self):
+        barrier = threading.Barrier(2, timeout=5)
+        steps = [
+            OnTargets(FakeCheck(failed={"1"}, barrier=barrier), _region("0", "1")),
+            OnTargets(FakeCheck(barrier=barrier), _region("4", "5")),
+            OnTargets(FilterByStatus(), _region("0", "1")),
+            FakeReport(),
+        ]
+
+        ctx = _run(steps)
+
+        assert ctx.one_qubit_check is not None
+        assert ctx.one_qubit_check.all_qids() == ["0", "1", "4", "5"]
+        assert ctx.candidate_qids == ["0", "4", "5"]
+        assert ctx.metadata["report"] == ["0", "4", "5"]
+        assert [f.output_qids for f in ctx.filters] == [["0"]]
+
+    def test_result_matches_sequential_run(self):
+        def steps() -> list[Any]:
+            return [
+                OnTargets(FakeCheck(failed={"0"}), _region("0", "1")),
+                OnTargets(FakeBenchmark(step_name="rb"), _region("4", "5")),
+                OnTargets(FilterByStatus(), _region("0", "1")),
+                FakeReport(),
+            ]
+
+        sequential = _run(steps(), max_workers=1)
+        parallel = _run(steps(), max_workers=3)
+
+        assert parallel.candidate_qids == sequential.candidate_qids == ["1", "4", "5"]
+        assert parallel.metadata == sequential.metadata
+        assert parallel.filters == sequential.filters
+
+    def test_failure_stops_dependents_and_is_raised(self):
+        steps = [
+            OnTargets(FakeCheck(error=RuntimeError("boom")), _region("0", "1")),
+            OnTargets(FakeBenchmark(), _region("4", "5")),
+            FakeReport(),
+        ]
+        executor = DagExecutor(StepGraph(steps, ["0", "1", "4", "5"], CHIP), max_workers=2)
+        ctx = StepContext(candidate_qids=["0", "1", "4", "5"])
+
+        with pytest.raises(RuntimeError, match="boom"):
+            executor.run(SERVICE, _region("0", "1", "4", "5"), ctx)
+
+        assert ctx.metadata == {"benchmark": ["4", "5"]}
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError, match="max_workers"):
+            DagExecutor(StepGraph([], [], CHIP), max_workers=0)
+
+
+def test_on_targets_restricts_context_in_sequential_runs():
+    ctx = StepContext(candidate_qids=["0", "1", "4"])
+    ctx.filters.append(FilterResult(input_qids=["9"], output_qids=[]))
+
+    ctx = OnTargets(FakeCheck(failed={"4"}), _region("4")).execute(SERVICE, _region("4"), ctx)
+    ctx = OnTargets(FilterByStatus(), _region("4")).execute(SERVICE, _region("4"), ctx)
+
+    assert ctx.candidate_qids == ["0", "1"]
+    assert ctx.filters[-1].input_qids == ["4"]
+
+
+def test_on_targets_keeps_candidate_order():
+    ctx = StepContext(candidate_qids=["5", "10", "4", "0"])
+
+    ctx = OnTargets(FakeCheck(failed={"10"}), _region("10", "4")).execute(
+        SERVICE, _region("10", "4"), ctx
+    )
+    ctx = OnTargets(FilterByStatus(), _region("10", "4")).execute(SERVICE, _region("10", "4"), ctx)
+
+    assert ctx.candidate_qids == ["5", "4", "0"]
@@ -95,8 +95,8 @@ export function FlowExecuteConfirmModal({
               <div className="alert alert-warning">
                 <Lock className="h-5 w-5" />
                 <span>
-                  Execution is locked. Another calibration is currently running. Please wait until
-                  it completes.
+                  Execution is locked. Another calibration is currently running on this chip or
+                  its qubits. Please wait until it completes.
                 </span>
               </div>
             )}
@@ -63,6 +63,7 @@ import { FlowSchedulePanel } from "@/components/features/flow/FlowSchedulePanel"
 import { WorkflowEditorPageSkeleton } from "@/components/ui/Skeleton/PageSkeletons";
 import { buildAuthHeaders } from "@/lib/auth/session";
 import { formatDateTime } from "@/lib/utils/datetime";
+import { isExecutionBlocked, leaseQids } from "@/lib/utils/executionLease";
 
 // Monaco Editor is only available on client side
 const Editor = dynamic(() => import("@monaco-editor/react"), { ssr: false });
@@ -556,7 +557,16 @@ export function WorkflowEditorPageContent() {
     },
   });
 
-  const canCancel = !!lastExecutionId && !!lockStatus?.data.lock;
+  // A running calibration only blocks this flow if its lease overlaps the
+  // hardware this flow would lease: the whole chip, unless the flow's default
+  // parameters name its qubits.
+  const defaultQids = data?.data?.default_parameters?.qids;
+  const isExecutionLocked = isExecutionBlocked(
+    lockStatus?.data,
+    chipId,
+    leaseQids(Array.isArray(defaultQids) ? defaultQids.map(String) : null),
+  );
+  const canCancel = !!lastExecutionId && isExecutionLocked;
   const agentStatusLabel =
     agentRunStatus === "running"
       ? "Running"
@@ -772,7 +782,7 @@ export function WorkflowEditorPageContent() {
       shortcut: "",
       icon: Play,
       action: () => setShowExecuteConfirm(true),
-      enabled: !lockStatus?.data.lock,
+      enabled: !isExecutionLocked,
     },
     {
       id: "properties",
@@ -1210,7 +1220,7 @@ export function WorkflowEditorPageContent() {
             </button>
             <button
               onClick={() => setShowExecuteConfirm(true)}
-              className={`btn btn-sm ${lockStatus?.data.lock ? "btn-disabled" : "btn-success"}`}
+              className={`btn btn-sm ${isExecutionLocked ? "btn-disabled" : "btn-success"}`}
               disabled={
                 saveMutation.isPending ||
                 deleteMutation.isPending ||
@@ -1218,19 +1228,19 @@ export function WorkflowEditorPageContent() {
                 isLockStatusLoading
               }
               title={
-                lockStatus?.data.lock
-                  ? "Execution locked - another calibration is running"
+                isExecutionLocked
+                  ? "Execution locked - another calibration is running on this hardware"
                   : "Execute Flow"
               }
             >
               {executeMutation.isPending ? (
                 <span className="loading loading-spinner loading-xs"></span>
-              ) : lockStatus?.data.lock ? (
+              ) : isExecutionLocked ? (
                 <Lock size={16} />
               ) : (
                 <Play size={16} />
               )}
-              <span className="ml-1">{lockStatus?.data.lock ? "Locked" : "Execute"}</span>
+              <span className="ml-1">{isExecutionLocked ? "Locked" : "Execute"}</span>
             </button>
             {canCancel && (
               <button
@@ -1769,7 +1779,7 @@ export function WorkflowEditorPageContent() {
                     <div className="text-base-content/40">
                       <span className="text-info">[info]</span> Chip: {chipId} | User: {username}
                     </div>
-                    {lockStatus?.data.lock ? (
+                    {isExecutionLocked ? (
                       <div>
                         <span className="text-warning">[running]</span> Execution in progress...
                       </div>
@@ -2291,12 +2301,12 @@ export function WorkflowEditorPageContent() {
           {/* Execute Button */}
           <div className="flex items-center gap-2">
             <span className="text-sm font-medium bg-base-100 px-2 py-1 rounded shadow">
-              {lockStatus?.data.lock ? "Locked" : "Execute"}
+              {isExecutionLocked ? "Locked" : "Execute"}
             </span>
             <button
               onClick={() => setShowExecuteConfirm(true)}
               className={`btn btn-circle shadow-lg ${
-                lockStatus?.data.lock ? "btn-disabled" : "btn-success"
+                isExecutionLocked ? "btn-disabled" : "btn-success"
               }`}
               disabled={
                 saveMutation.isPending ||
@@ -2307,7 +2317,7 @@ export function WorkflowEditorPageContent() {
             >
               {executeMutation.isPending ? (
                 <span className="loading loading-spinner loading-sm"></span>
-              ) : lockStatus?.data.lock ? (
+              ) : isExecutionLocked ? (
                 <Lock size={20} />
               ) : (
                 <Play size={20} />
@@ -2565,7 +2575,7 @@ export function WorkflowEditorPageContent() {
             chipId={chipId}
             description={description}
             tags={tags}
-            isLocked={lockStatus?.data.lock ?? false}
+            isLocked={isExecutionLocked}
             isLockStatusLoading={isLockStatusLoading}
             onConfirm={() => {
               setShowExecuteConfirm(false);
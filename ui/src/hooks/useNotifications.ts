@@ -1,4 +1,6 @@
+import { useEffect, useSyncExternalStore } from "react";
 import { useQueryClient } from "@tanstack/react-query";
+import type { QueryClient } from "@tanstack/react-query";
 
 import {
   getGetUnreadNotificationCountQueryKey,
@@ -8,24 +10,172 @@ import {
   useMarkAllNotificationsRead,
   useMarkNotificationRead,
 } from "@/client/notification/notification";
+import { useProject } from "@/contexts/ProjectContext";
+import { buildHeaders, consumeSSEEvents } from "@/lib/sse-utils";
+
+// Polling is only a fallback while the unread-count stream is disconnected.
+const FALLBACK_REFETCH_INTERVAL = 60_000;
+const MAX_RECONNECT_DELAY = 60_000;
 
 export function useNotifications(unreadOnly = false) {
+  // Refreshed by the unread-count stream whenever the count changes.
   return useListNotifications(
     { unread_only: unreadOnly, limit: 100 },
     {
       query: {
         staleTime: 15_000,
-        refetchInterval: 60_000,
       },
     },
   );
 }
 
+type UnreadStream = {
+  projectId: string | null;
+  subscribers: number;
+  stop: () => void;
+};
+
+// One stream per tab, shared by every hook instance that needs the count.
+let activeStream: UnreadStream | null = null;
+let streamConnected = false;
+const connectionListeners = new Set<() => void>();
+
+function setStreamConnected(connected: boolean) {
+  if (streamConnected === connected) return;
+  streamConnected = connected;
+  connectionListeners.forEach((listener) => listener());
+}
+
+function subscribeStreamConnection(listener: () => void) {
+  connectionListeners.add(listener);
+  return () => {
+    connectionListeners.delete(listener);
+  };
+}
+
+/**
+ * Open the server-sent unread counter stream and write every count into the
+ * unread-count query cache, reconnecting with backoff until stopped.
+ */
+function startUnreadStream(queryClient: QueryClient, projectId: string | null): UnreadStream {
+  const controller = new AbortController();
+  const baseURL = process.env.NEXT_PUBLIC_API_URL || "/api";
+  let reconnectDelay = 2_000;
+  let timer: ReturnType<typeof setTimeout> | undefined;
+  let lastCount: number | null = null;
+
+  const setConnected = (connected: boolean) => {
+    if (!controller.signal.aborted) setStreamConnected(connected);
+  };
+
+  const applyCount = (unreadCount: number) => {
+    queryClient.setQueryData(
+      getGetUnreadNotificationCountQueryKey(),
+      (old: { data: { unread_count: number } } | undefined) =>
+        old ? { ...old, data: { ...old.data, unread_count: unreadCount } } : old,
+    );
+    if (lastCount !== null && lastCount !== unreadCount) {
+      queryClient.invalidateQueries({ queryKey: getListNotificationsQueryKey() });
+    }
+    lastCount = unreadCount;
+  };
+
+  const connect = async () => {
+    try {
+      const response = await fetch(`${baseURL}/notifications/unread-count/stream`, {
+        headers: buildHeaders(),
+        signal: controller.signal,
+      });
+      const reader = response.ok ? response.body?.getReader() : undefined;
+      if (!reader) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      setConnected(true);
+      reconnectDelay = 2_000;
+
+      const decoder = new TextDecoder();
+      let buffer = "";
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const { events, remainder } = consumeSSEEvents(buffer);
+        buffer = remainder;
+        for (const evt of events) {
+          if (evt.event === "unread_count") {
+            applyCount(JSON.parse(evt.data).unread_count);
+          }
+        }
+      }
+    } catch {
+      if (controller.signal.aborted) return;
+    }
+    setConnected(false);
+    timer = setTimeout(connect, reconnectDelay);
+    reconnectDelay = Math.min(reconnectDelay * 2, MAX_RECONNECT_DELAY);
+  };
+
+  connect();
+  return {
+    projectId,
+    subscribers: 0,
+    stop: () => {
+      controller.abort();
+      clearTimeout(timer);
+    },
+  };
+}
+
+/**
+ * Join the shared unread-count stream of ``projectId``, starting it for the
+ * first subscriber. Returns a function that leaves it; the last subscriber
+ * to leave closes the connection.
+ */
+function subscribeUnreadStream(queryClient: QueryClient, projectId: string | null) {
+  if (activeStream && activeStream.projectId !== projectId) {
+    activeStream.stop();
+    activeStream = null;
+    setStreamConnected(false);
+  }
+  if (!activeStream) {
+    activeStream = startUnreadStream(queryClient, projectId);
+  }
+  const stream = activeStream;
+  stream.subscribers += 1;
+  return () => {
+    stream.subscribers -= 1;
+    if (stream.subscribers > 0) return;
+    stream.stop();
+    if (activeStream === stream) {
+      activeStream = null;
+      setStreamConnected(false);
+    }
+  };
+}
+
+/**
+ * Subscribe to the shared unread-count stream. Returns true while the
+ * stream is connected.
+ */
+function useUnreadNotificationStream(): boolean {
+  const queryClient = useQueryClient();
+  const { projectId } = useProject();
+
+  useEffect(() => subscribeUnreadStream(queryClient, projectId), [queryClient, projectId]);
+
+  return useSyncExternalStore(
+    subscribeStreamConnection,
+    () => streamConnected,
+    () => false,
+  );
+}
+
 export function useUnreadNotificationCount() {
+  const streaming = useUnreadNotificationStream();
   return useGetUnreadNotificationCount({
     query: {
       staleTime: 15_000,
-      refetchInterval: 60_000,
+      refetchInterval: streaming ? false : FALLBACK_REFETCH_INTERVAL,
     },
   });
 }
@@ -0,0 +1,28 @@
+import { describe, it, expect } from "vitest";
+
+import { columnarToPlotSeries } from "../columnarTimeseries";
+
+describe("columnarToPlotSeries", () => {
+  it("returns empty arrays for a missing series", () => {
+    expect(columnarToPlotSeries(undefined)).toEqual({ x: [], y: [], error: [], taskIds: [] });
+  });
+
+  it("sorts points by time and drops points without a timestamp", () => {
+    const result = columnarToPlotSeries(
+      {
+        t: ["2026-01-02T00:00:00+00:00", null, "2026-01-01T00:00:00+00:00"],
+        value: [2, 9, 1],
+        error: [0.2, null, null],
+        task_id: ["b", "x", "a"],
+      },
+      "UTC",
+    );
+
+    expect(result).toEqual({
+      x: ["2026-01-01T00:00:00", "2026-01-02T00:00:00"],
+      y: [1, 2],
+      error: [null, 0.2],
+      taskIds: ["a", "b"],
+    });
+  });
+});
@@ -0,0 +1,56 @@
+import { describe, it, expect } from "vitest";
+
+import { findConflictingLeases, isExecutionBlocked, leaseQids } from "../executionLease";
+
+const lease = (chip_id: string, qids: string[] | null, owner = "exec-1") => ({
+  chip_id,
+  qids,
+  owner,
+  expires_at: "2026-01-01T00:00:00+00:00",
+});
+
+describe("leaseQids", () => {
+  it("leases the whole chip when no qubits are given", () => {
+    expect(leaseQids(undefined)).toBeNull();
+    expect(leaseQids([])).toBeNull();
+  });
+
+  it("splits coupling IDs into their qubits", () => {
+    expect(leaseQids(["0-1", "1", "4"])).toEqual(["0", "1", "4"]);
+  });
+});
+
+describe("findConflictingLeases", () => {
+  const leases = [lease("chip-a", ["0", "1"], "exec-1"), lease("chip-b", null, "exec-2")];
+
+  it("ignores leases on other chips and on disjoint qubits", () => {
+    expect(findConflictingLeases(leases, "chip-a", ["2", "3"])).toEqual([]);
+    expect(findConflictingLeases(leases, "chip-c", null)).toEqual([]);
+  });
+
+  it("reports overlapping and whole-chip leases", () => {
+    expect(findConflictingLeases(leases, "chip-a", ["1"]).map((l) => l.owner)).toEqual([
+      "exec-1",
+    ]);
+    expect(findConflictingLeases(leases, "chip-a", null).map((l) => l.owner)).toEqual([
+      "exec-1",
+    ]);
+    expect(findConflictingLeases(leases, "chip-b", ["7"]).map((l) => l.owner)).toEqual([
+      "exec-2",
+    ]);
+  });
+});
+
+describe("isExecutionBlocked", () => {
+  it("blocks on the legacy project-wide lock", () => {
+    expect(isExecutionBlocked({ lock: true, leases: [] }, "chip-a", ["0"])).toBe(true);
+  });
+
+  it("blocks only on overlapping leases", () => {
+    const status = { lock: false, leases: [lease("chip-a", ["0"])] };
+    expect(isExecutionBlocked(status, "chip-a", ["0"])).toBe(true);
+    expect(isExecutionBlocked(status, "chip-a", ["1"])).toBe(false);
+    expect(isExecutionBlocked(status, "chip-b", null)).toBe(false);
+    expect(isExecutionBlocked(undefined, "chip-a", null)).toBe(false);
+  });
+});
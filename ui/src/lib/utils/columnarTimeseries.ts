@@ -0,0 +1,61 @@
+import { formatDateTime } from "./datetime";
+
+/**
+ * One series of a `format=columnar` timeseries response: one array per field,
+ * all of the same length and in the server's order.
+ */
+export interface ColumnarSeries {
+  t: (string | null)[];
+  value: (number | null)[];
+  error: (number | null)[];
+  task_id: (string | null)[];
+  unit?: string;
+  description?: string;
+  execution_id?: (string | null)[];
+  excluded?: boolean[];
+}
+
+/**
+ * Body of `format=columnar` responses from the timeseries and metric history
+ * endpoints, keyed by qid (or coupling id).
+ */
+export interface ColumnarTimeseriesResponse {
+  data: Record<string, ColumnarSeries>;
+  chip_id?: string;
+  metric_name?: string;
+  username?: string;
+}
+
+export interface ColumnarPlotSeries {
+  x: string[];
+  y: (number | null)[];
+  error: (number | null)[];
+  taskIds: (string | null)[];
+}
+
+/**
+ * Convert a columnar series into Plotly-ready arrays sorted by time.
+ *
+ * Timestamps are formatted in the display timezone; points without a
+ * timestamp are dropped.
+ */
+export function columnarToPlotSeries(
+  series: ColumnarSeries | undefined,
+  timezone?: string,
+): ColumnarPlotSeries {
+  const result: ColumnarPlotSeries = { x: [], y: [], error: [], taskIds: [] };
+  if (!series) return result;
+
+  const order = series.t
+    .map((t, index) => ({ t, index }))
+    .filter((point): point is { t: string; index: number } => Boolean(point.t))
+    .sort((a, b) => Date.parse(a.t) - Date.parse(b.t));
+
+  for (const { t, index } of order) {
+    result.x.push(formatDateTime(t, "yyyy-MM-dd'T'HH:mm:ss", timezone));
+    result.y.push(series.value[index] ?? null);
+    result.error.push(series.error[index] ?? null);
+    result.taskIds.push(series.task_id[index] ?? null);
+  }
+  return result;
+}
@@ -0,0 +1,40 @@
+import type { ExecutionLeaseStatus, ExecutionLockStatusResponse } from "@/schemas";
+
+/**
+ * Qubits a calibration on `qids` would lease, or null for the whole chip.
+ * Mirrors the server: coupling IDs such as "0-1" lease both of their qubits.
+ */
+export function leaseQids(qids: readonly string[] | null | undefined): string[] | null {
+  if (!qids || qids.length === 0) return null;
+  return [...new Set(qids.flatMap((qid) => qid.split("-")))];
+}
+
+/**
+ * Active leases that would block a calibration on `chipId` leasing `qids`
+ * (null = the whole chip): leases on the same chip that cover the whole chip
+ * or share a qubit with the request.
+ */
+export function findConflictingLeases(
+  leases: readonly ExecutionLeaseStatus[] | undefined,
+  chipId: string,
+  qids: readonly string[] | null,
+): ExecutionLeaseStatus[] {
+  return (leases ?? []).filter((lease) => {
+    if (lease.chip_id !== chipId) return false;
+    if (lease.qids == null || qids === null) return true;
+    return lease.qids.some((qid) => qids.includes(qid));
+  });
+}
+
+/**
+ * Whether a new calibration on `chipId` / `qids` cannot start: the legacy
+ * project-wide lock is set, or an active lease overlaps the request.
+ */
+export function isExecutionBlocked(
+  status: ExecutionLockStatusResponse | undefined,
+  chipId: string,
+  qids: readonly string[] | null,
+): boolean {
+  if (!status) return false;
+  return status.lock || findConflictingLeases(status.leases, chipId, qids).length > 0;
+}
@@ -0,0 +1,25 @@
+/**
+ * Generated by orval v7.14.0 🍺
+ * Do not edit manually.
+ * QDash API
+ * API for QDash
+ * OpenAPI spec version: 0.0.1
+ */
+import type { ExecutionLeaseStatusQids } from './executionLeaseStatusQids';
+
+/**
+ * An active hardware lease held by a running calibration.
+
+Attributes
+----------
+    chip_id (str): Leased chip.
+    qids (list[str] | None): Leased qubits, or None for the whole chip.
+    owner (str): Holder of the lease, usually the execution ID.
+    expires_at (datetime): When the lease lapses unless renewed.
+ */
+export interface ExecutionLeaseStatus {
+  chip_id: string;
+  qids?: ExecutionLeaseStatusQids;
+  owner: string;
+  expires_at: string;
+}
@@ -6,4 +6,4 @@
  * OpenAPI spec version: 0.0.1
  */
 
-export type ExecutionResponseSummaryNote = { [key: string]: unknown };
+export type ExecutionLeaseStatusQids = string[] | null;
@@ -5,10 +5,17 @@
  * API for QDash
  * OpenAPI spec version: 0.0.1
  */
+import type { ExecutionLeaseStatus } from './executionLeaseStatus';
 
 /**
  * Response model for the fetch_execution_lock_status endpoint.
+
+``lock`` is the legacy project-wide lock. Calibrations that lease their
+hardware are listed in ``leases`` instead; a new calibration is only
+blocked by a lease on the same chip that covers the whole chip or shares
+a qubit with it.
  */
 export interface ExecutionLockStatusResponse {
   lock: boolean;
+  leases?: ExecutionLeaseStatus[];
 }
@@ -9,11 +9,14 @@ import type { ExecutionResponseSummaryUserId } from './executionResponseSummaryU
 import type { ExecutionResponseSummaryStartAt } from './executionResponseSummaryStartAt';
 import type { ExecutionResponseSummaryEndAt } from './executionResponseSummaryEndAt';
 import type { ExecutionResponseSummaryElapsedTime } from './executionResponseSummaryElapsedTime';
-import type { ExecutionResponseSummaryNote } from './executionResponseSummaryNote';
 
 /**
  * ExecutionResponseSummary is a Pydantic model that represents the summary of an execution response.
 
+It is the row model of execution listings and carries only the columns
+an execution table shows; notes, messages and task results are served by
+the execution detail endpoint.
+
 Attributes
 ----------
     name (str): The name of the execution.
@@ -25,7 +28,6 @@ Attributes
     user_id (str | None): Internal ID of the user who started the execution.
     username (str): Username snapshot of the user who started the execution.
     tags (list[str]): Tags associated with the execution.
-    note (dict): Notes for the execution.
  */
 export interface ExecutionResponseSummary {
   name: string;
@@ -37,5 +39,4 @@ export interface ExecutionResponseSummary {
   end_at?: ExecutionResponseSummaryEndAt;
   elapsed_time?: ExecutionResponseSummaryElapsedTime;
   tags: string[];
-  note: ExecutionResponseSummaryNote;
 }
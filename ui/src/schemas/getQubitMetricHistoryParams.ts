@@ -5,6 +5,7 @@
  * API for QDash
  * OpenAPI spec version: 0.0.1
  */
+import type { SeriesFormat } from './seriesFormat';
 
 export type GetQubitMetricHistoryParams = {
 /**
@@ -19,4 +20,8 @@ limit?: number | null;
  * Filter to last N days
  */
 within_days?: number | null;
+/**
+ * Response representation: rows, columnar or arrow
+ */
+format?: SeriesFormat;
 };
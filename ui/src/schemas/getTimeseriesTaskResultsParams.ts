@@ -5,6 +5,7 @@
  * API for QDash
  * OpenAPI spec version: 0.0.1
  */
+import type { SeriesFormat } from './seriesFormat';
 
 export type GetTimeseriesTaskResultsParams = {
 /**
@@ -31,4 +32,8 @@ tag?: string | null;
  * Optional qubit ID to filter by
  */
 qid?: string | null;
+/**
+ * Response representation: rows, columnar or arrow
+ */
+format?: SeriesFormat;
 };
@@ -212,6 +212,8 @@ export * from './executeFlowResponse';
 export * from './executionComparisonResponse';
 export * from './executionIdResponse';
 export * from './executionIdResponseValidFrom';
+export * from './executionLeaseStatus';
+export * from './executionLeaseStatusQids';
 export * from './executionLockStatusResponse';
 export * from './executionResponseDetail';
 export * from './executionResponseDetailElapsedTime';
@@ -222,7 +224,6 @@ export * from './executionResponseDetailUserId';
 export * from './executionResponseSummary';
 export * from './executionResponseSummaryElapsedTime';
 export * from './executionResponseSummaryEndAt';
-export * from './executionResponseSummaryNote';
 export * from './executionResponseSummaryStartAt';
 export * from './executionResponseSummaryUserId';
 export * from './expectedResultResponse';
@@ -627,6 +628,7 @@ export * from './seedImportResultItem';
 export * from './seedImportResultItemMessage';
 export * from './seedImportResultItemValue';
 export * from './seedImportSource';
+export * from './seriesFormat';
 export * from './settings';
 export * from './submitAgentActionRequest';
 export * from './submitAgentActionRequestParameterOverrides';
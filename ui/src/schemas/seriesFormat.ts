@@ -0,0 +1,20 @@
+/**
+ * Generated by orval v7.14.0 🍺
+ * Do not edit manually.
+ * QDash API
+ * API for QDash
+ * OpenAPI spec version: 0.0.1
+ */
+
+/**
+ * Representation of a timeseries response.
+ */
+export type SeriesFormat = typeof SeriesFormat[keyof typeof SeriesFormat];
+
+
+// eslint-disable-next-line @typescript-eslint/no-redeclare
+export const SeriesFormat = {
+  rows: 'rows',
+  columnar: 'columnar',
+  arrow: 'arrow',
+} as const;